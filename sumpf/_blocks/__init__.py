@@ -21,6 +21,13 @@ network.
 
 from ._concatenate import *
 from ._merge import *
+from ._mimo_convolution import *
+
+try:
+    from ._filter_bank import *
+    from ._sound_level_meter import *
+except ImportError:
+    pass
 
 try:
     from ._jack import *
@@ -0,0 +1,248 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.FractionalOctaveFilterBank` class."""
+
+import math
+import numpy
+import scipy.signal
+import connectors
+import sumpf
+import sumpf._internal as sumpf_internal
+
+__all__ = ("FractionalOctaveFilterBank",)
+
+_OCTAVE_RATIO = 10.0 ** 0.3     # the base ten octave ratio from IEC 61260-1
+_REFERENCE_FREQUENCY = 1000.0
+
+
+def _band_frequencies(fraction, lowest_frequency, highest_frequency):
+    """Computes the mid-band frequencies and the band edges of the fractional
+    octave bands according to IEC 61260-1.
+
+    :param fraction: the number of bands per octave
+    :param lowest_frequency: the lowest frequency, that shall be covered by the bands
+    :param highest_frequency: the highest frequency, that shall be covered by the bands
+    :returns: a tuple of three arrays ``(center_frequencies, lower_edges, upper_edges)``
+    """
+    first = math.floor(fraction * math.log(lowest_frequency / _REFERENCE_FREQUENCY, _OCTAVE_RATIO)) - 1
+    last = math.ceil(fraction * math.log(highest_frequency / _REFERENCE_FREQUENCY, _OCTAVE_RATIO)) + 1
+    indices = numpy.arange(first, last + 1)
+    if fraction % 2 == 0:
+        centers = _REFERENCE_FREQUENCY * _OCTAVE_RATIO ** ((2 * indices + 1) / (2 * fraction))
+    else:
+        centers = _REFERENCE_FREQUENCY * _OCTAVE_RATIO ** (indices / fraction)
+    factor = _OCTAVE_RATIO ** (1.0 / (2 * fraction))
+    lower, upper = centers / factor, centers * factor
+    mask = (upper > lowest_frequency) & (lower < highest_frequency)
+    return centers[mask], lower[mask], upper[mask]
+
+
+class FractionalOctaveFilterBank:
+    """Splits a signal into octave or fractional octave bands, whose mid-band
+    frequencies and band edges are defined according to IEC 61260-1.
+
+    Each band is filtered with a bandpass, that is transformed from a Butterworth
+    lowpass and discretized with the bilinear transform. The signal is decimated
+    by a factor of two for every octave, so that the bands for low frequencies are
+    filtered at a fraction of the signal's sampling rate. Compared to applying
+    a bandpass filter for each band to the full signal, this reduces the computational
+    effort by orders of magnitude, when analyzing long recordings with many bands.
+
+    The filter bank can output the band levels as a :class:`~sumpf.Bands` filter
+    or the filtered bands as a :class:`~sumpf.Signal`, for which the decimated
+    bands are resampled to the original sampling rate. Bands, whose upper edge
+    is not below the Nyquist frequency of the signal, are omitted.
+
+    The methods of this class are enhanced with the functionality of the *Connectors*
+    package, so that instances of this class can be connected in a processing network.
+    """
+
+    def __init__(self, signal=sumpf.Signal(), fraction=3, lowest_frequency=20.0, highest_frequency=20000.0, order=3):
+        """
+        :param signal: the input :class:`~sumpf.Signal`
+        :param fraction: the number of bands per octave, e.g. 1 for octave bands
+                         or 3 for third octave bands
+        :param lowest_frequency: the lowest frequency in Hz, that shall be covered by the bands
+        :param highest_frequency: the highest frequency in Hz, that shall be covered by the bands
+        :param order: the order of the Butterworth lowpass, from which the bandpass
+                      filters are transformed. The bandpass filters have twice
+                      this order.
+        """
+        self.__signal = signal
+        self.__fraction = fraction
+        self.__lowest_frequency = lowest_frequency
+        self.__highest_frequency = highest_frequency
+        self.__order = order
+
+    def center_frequencies(self):
+        """Returns the mid-band frequencies of the filter bank's bands for the
+        current input signal.
+
+        :returns: an array of frequencies in Hz
+        """
+        return self.__bands()[0]
+
+    @connectors.Output()
+    def output_levels(self):
+        """Computes the root-mean-square levels of the bands.
+
+        :returns: a :class:`~sumpf.Bands` filter with one channel for each channel
+                  of the input signal, whose supporting points are the levels at
+                  the mid-band frequencies
+        """
+        centers, _, _ = self.__bands()
+        levels = numpy.empty(shape=(len(self.__signal), len(centers)))
+        for indices, _, stage in self.__filter():
+            levels[:, indices] = (numpy.linalg.norm(stage, axis=-1) / math.sqrt(stage.shape[-1])).transpose()
+        return sumpf.Bands(bands=tuple(dict(zip(centers, l)) for l in levels),
+                           interpolations=sumpf.Bands.interpolations.STAIRS_LOG,
+                           extrapolations=sumpf.Bands.interpolations.STAIRS_LIN,
+                           labels=self.__signal.labels())
+
+    @connectors.Output()
+    def output_signal(self):
+        """Computes the filtered bands.
+
+        :returns: a :class:`~sumpf.Signal`, that has one channel for each band and
+                  each channel of the input signal. The bands of the first input
+                  channel come first, followed by those of the second channel and so on.
+        """
+        centers, _, _ = self.__bands()
+        length = self.__signal.length()
+        channels = sumpf_internal.allocate_array(shape=(len(self.__signal), len(centers), length),
+                                                 dtype=sumpf_internal.real_dtype(self.__signal.channels().dtype))
+        for indices, factor, stage in self.__filter():
+            if factor == 1:
+                channels[:, indices] = stage.transpose(1, 0, 2)
+            else:
+                resampled = scipy.signal.resample_poly(stage, factor, 1, axis=-1)
+                channels[:, indices] = resampled[:, :, 0:length].transpose(1, 0, 2)
+        labels = tuple(f"{l} {f:.5g}Hz" if l else f"{f:.5g}Hz" for l in self.__signal.labels() for f in centers)
+        return sumpf.Signal(channels=channels.reshape(len(self.__signal) * len(centers), length),
+                            sampling_rate=self.__signal.sampling_rate(),
+                            offset=self.__signal.offset(),
+                            labels=labels)
+
+    @connectors.Input(("output_levels", "output_signal"))
+    def set_signal(self, signal):
+        """Sets the input signal.
+
+        :param signal: a :class:`~sumpf.Signal`
+        :returns: self
+        """
+        self.__signal = signal
+        return self
+
+    @connectors.Input(("output_levels", "output_signal"))
+    def set_fraction(self, fraction):
+        """Sets the number of bands per octave.
+
+        :param fraction: an integer, e.g. 1 for octave bands or 3 for third octave bands
+        :returns: self
+        """
+        self.__fraction = fraction
+        return self
+
+    @connectors.Input(("output_levels", "output_signal"))
+    def set_lowest_frequency(self, frequency):
+        """Sets the lowest frequency, that shall be covered by the bands.
+
+        :param frequency: the frequency in Hz
+        :returns: self
+        """
+        self.__lowest_frequency = frequency
+        return self
+
+    @connectors.Input(("output_levels", "output_signal"))
+    def set_highest_frequency(self, frequency):
+        """Sets the highest frequency, that shall be covered by the bands.
+
+        :param frequency: the frequency in Hz
+        :returns: self
+        """
+        self.__highest_frequency = frequency
+        return self
+
+    @connectors.Input(("output_levels", "output_signal"))
+    def set_order(self, order):
+        """Sets the order of the Butterworth lowpass, from which the bandpass
+        filters are transformed.
+
+        :param order: an integer
+        :returns: self
+        """
+        self.__order = order
+        return self
+
+    def __bands(self):
+        """Computes the frequencies of the bands, that can be analyzed at the
+        sampling rate of the input signal.
+
+        :returns: a tuple of three arrays ``(center_frequencies, lower_edges, upper_edges)``
+        """
+        centers, lower, upper = _band_frequencies(fraction=self.__fraction,
+                                                  lowest_frequency=self.__lowest_frequency,
+                                                  highest_frequency=self.__highest_frequency)
+        mask = upper < self.__signal.sampling_rate() / 2.0
+        return centers[mask], lower[mask], upper[mask]
+
+    def __stage(self, frequency):
+        """Computes, how often the signal can be decimated by a factor of two, before
+        the given band has to be filtered. The band's upper edge must remain below
+        a quarter of the decimated sampling rate, so that it is not affected by
+        the anti-aliasing filter of the decimation.
+
+        :param frequency: the mid-band frequency of the band
+        :returns: an integer
+        """
+        upper = frequency * _OCTAVE_RATIO ** (1.0 / (2 * self.__fraction))
+        maximum = max(self.__signal.length().bit_length() - 1, 0)
+        stage = int(math.floor(math.log2(self.__signal.sampling_rate() / (4.0 * upper))))
+        return min(max(stage, 0), maximum)
+
+    def __filter(self):
+        """Decimates the input signal and filters the bands at the respective
+        sampling rates.
+
+        :returns: a generator, that yields tuples ``(indices, factor, stage)``, where
+                  ``indices`` is an array of the indices of the bands, that have
+                  been filtered at the same sampling rate, ``factor`` is the integer
+                  decimation factor of that sampling rate and ``stage`` is a three
+                  dimensional array with the filtered channels of these bands
+        """
+        centers, lower, upper = self.__bands()
+        stages = numpy.array([self.__stage(f) for f in centers], dtype=int)
+        prototype = sumpf.ButterworthFilter(cutoff_frequency=0.5 / math.pi, order=self.__order)
+        gain, zeros, poles = prototype.transfer_functions()[0].zero_pole_gain()
+        channels = self.__signal.channels()
+        for stage in range(max(stages, default=-1) + 1):
+            if stage:
+                channels = scipy.signal.resample_poly(channels, 1, 2, axis=-1)
+            indices = numpy.flatnonzero(stages == stage)
+            if len(indices):
+                sampling_rate = self.__signal.sampling_rate() / 2 ** stage
+                result = numpy.empty(shape=(len(indices),) + channels.shape)
+                for i, r in zip(indices, result):
+                    # prewarp the band edges, so that they are preserved by the bilinear transform
+                    omega1, omega2 = 2.0 * sampling_rate * numpy.tan(numpy.pi * numpy.array((lower[i], upper[i])) / sampling_rate)
+                    bandpass = scipy.signal.lp2bp_zpk(zeros, poles, numpy.real(gain),
+                                                      wo=math.sqrt(omega1 * omega2),
+                                                      bw=omega2 - omega1)
+                    sections = sumpf_internal.second_order_sections(zero_pole_gain=(bandpass[2], bandpass[0], bandpass[1]),
+                                                                    sampling_rate=sampling_rate)
+                    r[:] = scipy.signal.sosfilt(sections, channels, axis=-1)
+                yield indices, 2 ** stage, result
@@ -71,7 +71,8 @@ class Merge:
             if isinstance(first, sumpf.Signal):
                 merged_offset = min(s.offset() for s in self.__data.values())
                 length = max(s.offset() + s.length() for s in self.__data.values()) - merged_offset
-                channels = sumpf_internal.allocate_array(shape=(number_of_channels, length))
+                channels = sumpf_internal.allocate_array(shape=(number_of_channels, length),
+                                                         dtype=sumpf_internal.real_dtype(self.__dtype()))
                 for index, channel, offset, label in zip(self.__indices(),
                                                          (c for d in self.__data.values() for c in d.channels()),
                                                          (d.offset() for d in self.__data.values() for l in d.channels()),  # pylint: disable=line-too-long
@@ -88,7 +89,8 @@ class Merge:
                                     labels=labels)
             elif isinstance(first, sumpf.Spectrum):
                 length = max(s.length() for s in self.__data.values())
-                channels = sumpf_internal.allocate_array(shape=(number_of_channels, length), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=(number_of_channels, length),
+                                                         dtype=sumpf_internal.complex_dtype(self.__dtype()))
                 for index, channel, label in zip(self.__indices(),
                                                  (c for d in self.__data.values() for c in d.channels()),
                                                  (l for d in self.__data.values() for l in d.labels())):
@@ -103,7 +105,7 @@ class Merge:
                 length = max(s.offset() + s.length() for s in self.__data.values()) - merged_offset
                 number_of_frequencies = max(s.number_of_frequencies() for s in self.__data.values())
                 channels = sumpf_internal.allocate_array(shape=(number_of_channels, number_of_frequencies, length),
-                                                         dtype=numpy.complex128)
+                                                         dtype=sumpf_internal.complex_dtype(self.__dtype()))
                 channels[:] = 0.0
                 for index, channel, offset, label in zip(self.__indices(),
                                                          (c for d in self.__data.values() for c in d.channels()),
@@ -200,3 +202,9 @@ class Merge:
                     p += len(after[after > i]) + len(before[before > i + 1])
         else:
             raise ValueError(f"invalid merge mode: {self.__mode}")
+
+    def __dtype(self):
+        """Returns the dtype, that can hold the samples of all added data sets
+        without loss of precision.
+        """
+        return numpy.result_type(*(d.channels() for d in self.__data.values()))
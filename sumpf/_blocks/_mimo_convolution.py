@@ -0,0 +1,108 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.MIMOConvolution` class."""
+
+import numpy
+import connectors
+import sumpf
+import sumpf._internal as sumpf_internal
+
+__all__ = ("MIMOConvolution",)
+
+
+class MIMOConvolution:
+    """Convolves the channels of a signal with a matrix of impulse responses and
+    sums the results for each output. This is useful for rendering multiple sources
+    through a multi-loudspeaker setup or a simulated room, where each input is
+    transmitted to each output through its own impulse response.
+
+    The impulse response matrix is given as a sequence of signals, which has one
+    signal for each channel of the input signal. The channels of these signals
+    are the impulse responses from the respective input to the outputs, so the
+    output signal has as many channels as the impulse response signal with the
+    most channels. Missing impulse responses are treated as zero. The impulse
+    responses are aligned according to their offsets.
+
+    Compared to convolving each input with each impulse response and adding the
+    results, this class transforms each input and each impulse response only once
+    and accumulates the products in the frequency domain, so that only one inverse
+    transform is necessary for each output.
+
+    The methods of this class are enhanced with the functionality of the *Connectors*
+    package, so that instances of this class can be connected in a processing network.
+    """
+
+    def __init__(self, signal=sumpf.Signal(), impulse_responses=()):
+        """
+        :param signal: the input :class:`~sumpf.Signal`
+        :param impulse_responses: a sequence of :class:`~sumpf.Signal` instances
+                                  with one signal per channel of the input signal,
+                                  whose channels are the impulse responses from
+                                  that input to the outputs
+        """
+        self.__signal = signal
+        self.__impulse_responses = tuple(impulse_responses)
+
+    @connectors.Output()
+    def output(self):
+        """Computes the convolution and returns it.
+
+        :returns: a :class:`~sumpf.Signal` with one channel per output
+        """
+        if not self.__impulse_responses:
+            raise RuntimeError("No impulse responses have been given")
+        if len(self.__impulse_responses) != len(self.__signal):
+            raise ValueError(f"The signal has {len(self.__signal)} channels, but "
+                             f"{len(self.__impulse_responses)} impulse response signals have been given")
+        # align the impulse responses in a three dimensional array
+        offset = min(ir.offset() for ir in self.__impulse_responses)
+        length = max(ir.offset() + ir.length() for ir in self.__impulse_responses) - offset
+        number_of_outputs = max(len(ir) for ir in self.__impulse_responses)
+        dtype = numpy.result_type(*(ir.channels() for ir in self.__impulse_responses))
+        impulse_responses = numpy.zeros(shape=(len(self.__impulse_responses), number_of_outputs, length), dtype=dtype)
+        for matrix_row, ir in zip(impulse_responses, self.__impulse_responses):
+            start = ir.offset() - offset
+            matrix_row[0:len(ir), start:start + ir.length()] = ir.channels()
+        # compute the convolution
+        channels = sumpf_internal.mimo_convolution(self.__signal.channels(), impulse_responses)
+        return sumpf.Signal(channels=channels,
+                            sampling_rate=self.__signal.sampling_rate(),
+                            offset=self.__signal.offset() + offset,
+                            labels=("Convolution",) * number_of_outputs)
+
+    @connectors.Input("output")
+    def set_signal(self, signal):
+        """Sets the input signal.
+
+        :param signal: a :class:`~sumpf.Signal` with one channel per input
+        :returns: self
+        """
+        self.__signal = signal
+        return self
+
+    @connectors.Input("output")
+    def set_impulse_responses(self, impulse_responses):
+        """Sets the matrix of impulse responses.
+
+        :param impulse_responses: a sequence of :class:`~sumpf.Signal` instances
+                                  with one signal per channel of the input signal,
+                                  whose channels are the impulse responses from
+                                  that input to the outputs
+        :returns: self
+        """
+        self.__impulse_responses = tuple(impulse_responses)
+        return self
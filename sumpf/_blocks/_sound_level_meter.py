@@ -0,0 +1,270 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.SoundLevelMeter` class."""
+
+import numpy
+import scipy.signal
+import connectors
+import sumpf
+
+__all__ = ("SoundLevelMeter",)
+
+_FAST = 0.125   # the time constant of the time weighting F in seconds
+_SLOW = 1.0     # the time constant of the time weighting S in seconds
+
+
+def _weighting_filter(weighting, sampling_rate):
+    """Discretizes a frequency weighting filter.
+
+    The frequency axis is prewarped, so that the gain at 1kHz is preserved.
+    Towards the Nyquist frequency, the bilinear transform attenuates the discrete
+    filter, so that at a sampling rate of 48kHz, the A-weighting is about 1.2dB
+    lower at 10kHz than specified.
+
+    :param weighting: a single channel :class:`~sumpf.Filter`, whose transfer
+                      function is a rational function, or None for no weighting
+    :param sampling_rate: the sampling rate of the signal
+    :returns: a :class:`~sumpf._internal._biquad.BiquadCascade` instance or None
+    """
+    if weighting is None:
+        return None
+    return weighting.discretize(sampling_rate=sampling_rate, prewarp_frequency=min(1000.0, sampling_rate / 4.0))
+
+
+class SoundLevelMeter:
+    """Computes the levels of a signal like a sound level meter according to
+    IEC 61672-1. The signal can be passed block by block, so that recordings of
+    arbitrary duration can be monitored with a constant memory consumption and
+    a constant computational effort per block.
+
+    The signal is filtered with discretized frequency weighting filters, whose
+    state is kept between the blocks. For each interval of the given duration,
+    the following levels are computed:
+
+    * the level with the time weighting F (*Fast*) at the end of the interval, e.g. *LAF*
+    * the level with the time weighting S (*Slow*) at the end of the interval, e.g. *LAS*
+    * the equivalent continuous level of the interval, e.g. *LAeq*
+    * the peak level of the interval, e.g. *LCpeak*, for which a separate frequency
+      weighting can be specified.
+
+    Each output is a :class:`~sumpf.Signal` with one channel per channel of the
+    input signal, that contains the levels in dB of the intervals, which have
+    been completed by the last block. The sampling rate of these signals is the
+    reciprocal of the interval duration and their offset is the index of their
+    first interval since the start of the measurement.
+
+    The methods of this class are enhanced with the functionality of the *Connectors*
+    package, so that instances of this class can be connected in a processing network.
+    """
+
+    def __init__(self,
+                 signal=None,
+                 frequency_weighting=sumpf.AWeighting(),
+                 peak_weighting=sumpf.CWeighting(),
+                 interval=0.125,
+                 reference=20e-6):
+        """
+        :param signal: an optional :class:`~sumpf.Signal` with the first block, that shall be measured
+        :param frequency_weighting: a single channel :class:`~sumpf.Filter` for the
+                                    frequency weighting of the time weighted and
+                                    the equivalent continuous levels like :class:`~sumpf.AWeighting`,
+                                    or None for no frequency weighting (Z-weighting).
+                                    The filter's transfer function has to be a
+                                    rational function of the frequency variable.
+        :param peak_weighting: a single channel :class:`~sumpf.Filter` or None
+                               for the frequency weighting of the peak levels
+        :param interval: the duration of the intervals in seconds, for which the
+                         levels are computed
+        :param reference: the reference value for the computation of the levels
+                          in dB (e.g. 20µPa for sound pressure levels)
+        """
+        self.__frequency_weighting = frequency_weighting
+        self.__peak_weighting = peak_weighting
+        self.__interval = interval
+        self.__reference = reference
+        self.__state = None
+        self.__levels = None
+        if signal is not None:
+            self.set_signal(signal)
+
+    @connectors.Output()
+    def output_fast(self):
+        """Returns the levels with the time weighting F (*Fast*) at the end of
+        the intervals, that have been completed by the last block.
+
+        :returns: a :class:`~sumpf.Signal`
+        """
+        return self.__output(0, "Fast")
+
+    @connectors.Output()
+    def output_slow(self):
+        """Returns the levels with the time weighting S (*Slow*) at the end of
+        the intervals, that have been completed by the last block.
+
+        :returns: a :class:`~sumpf.Signal`
+        """
+        return self.__output(1, "Slow")
+
+    @connectors.Output()
+    def output_leq(self):
+        """Returns the equivalent continuous levels of the intervals, that have
+        been completed by the last block.
+
+        :returns: a :class:`~sumpf.Signal`
+        """
+        return self.__output(2, "Leq")
+
+    @connectors.Output()
+    def output_peak(self):
+        """Returns the peak levels of the intervals, that have been completed by
+        the last block.
+
+        :returns: a :class:`~sumpf.Signal`
+        """
+        return self.__output(3, "Peak")
+
+    @connectors.Input(("output_fast", "output_slow", "output_leq", "output_peak"),
+                      laziness=connectors.Laziness.ON_ANNOUNCE)
+    def set_signal(self, signal):
+        """Measures the next block of the signal. The block has to have the same
+        sampling rate and the same number of channels as the previous blocks,
+        unless :meth:`reset` has been called before.
+
+        :param signal: a :class:`~sumpf.Signal`
+        :returns: self
+        """
+        channels = signal.channels()
+        if self.__state is None:
+            self.__state = _State(frequency_weighting=self.__frequency_weighting,
+                                  peak_weighting=self.__peak_weighting,
+                                  interval=self.__interval,
+                                  sampling_rate=signal.sampling_rate(),
+                                  number_of_channels=len(channels),
+                                  labels=signal.labels())
+        elif signal.sampling_rate() != self.__state.sampling_rate or len(channels) != self.__state.number_of_channels:
+            raise ValueError("The sampling rate or the number of channels has changed since the previous block. "
+                             "Call reset() before measuring a new signal.")
+        self.__levels = self.__state.process(channels, self.__reference)
+        return self
+
+    @connectors.Input(("output_fast", "output_slow", "output_leq", "output_peak"),
+                      laziness=connectors.Laziness.ON_ANNOUNCE)
+    def reset(self, *args, **kwargs):   # noqa; pylint: disable=unused-argument; these ignored arguments are required to be compatible with other input connectors
+        """Discards the state of the measurement, so that the next block starts
+        a new measurement.
+
+        :param `*args,**kwargs`: ignored parameters for compatibility with other input connectors
+        :returns: self
+        """
+        self.__state = None
+        self.__levels = None
+        return self
+
+    def __output(self, index, label):
+        """Creates a signal from the levels of the last block.
+
+        :param index: the index of the requested levels in the tuple of computed levels
+        :param label: the label of the levels
+        :returns: a :class:`~sumpf.Signal`
+        """
+        if self.__levels is None:
+            return sumpf.Signal(channels=numpy.empty(shape=(1, 0)),
+                                sampling_rate=1.0 / self.__interval,
+                                labels=(label,))
+        offset, levels = self.__levels
+        return sumpf.Signal(channels=levels[index],
+                            sampling_rate=self.__state.sampling_rate / self.__state.interval_length,
+                            offset=offset,
+                            labels=tuple(f"{l} {label}" if l else label for l in self.__state.labels))
+
+
+class _State:
+    """Stores the state of a measurement with the :class:`~sumpf.SoundLevelMeter`
+    between the blocks of the signal.
+    """
+
+    def __init__(self, frequency_weighting, peak_weighting, interval, sampling_rate, number_of_channels, labels):
+        """
+        :param frequency_weighting: the filter for the frequency weighting or None
+        :param peak_weighting: the filter for the frequency weighting of the peak levels or None
+        :param interval: the duration of the intervals in seconds
+        :param sampling_rate: the sampling rate of the signal
+        :param number_of_channels: the number of channels of the signal
+        :param labels: the labels of the signal's channels
+        """
+        self.sampling_rate = sampling_rate
+        self.number_of_channels = number_of_channels
+        self.labels = labels
+        self.interval_length = max(int(round(interval * sampling_rate)), 1)
+        self.__weighting = _weighting_filter(frequency_weighting, sampling_rate)
+        self.__peak_weighting = _weighting_filter(peak_weighting, sampling_rate)
+        self.__coefficients = numpy.exp(-1.0 / (numpy.array((_FAST, _SLOW)) * sampling_rate))
+        self.__time_weighted = numpy.zeros(shape=(2, number_of_channels, 1))    # the states of the filters for the time weighting
+        self.__sum = numpy.zeros(number_of_channels)     # the sum of the squared samples in the current interval
+        self.__peak = numpy.zeros(number_of_channels)    # the maximum of the absolute samples in the current interval
+        self.__position = 0                                 # the number of samples in the current interval
+        self.__intervals = 0                                # the number of completed intervals
+
+    def process(self, channels, reference):
+        """Processes a block of the signal.
+
+        :param channels: a two dimensional array with the samples of the block
+        :param reference: the reference value for the computation of the levels
+        :returns: a tuple ``(offset, levels)``, where offset is the index of the
+                  first completed interval and levels is a tuple of two dimensional
+                  arrays with the fast, slow, equivalent continuous and peak levels
+                  of the completed intervals
+        """
+        length = channels.shape[1]
+        if length == 0:
+            empty = numpy.empty(shape=(self.number_of_channels, 0))
+            return self.__intervals, (empty,) * 4
+        weighted = channels if self.__weighting is None else self.__weighting.filter(channels)
+        peak_weighted = channels if self.__peak_weighting is None else self.__peak_weighting.filter(channels)
+        squared = numpy.square(weighted)
+        # find the ends of the intervals in this block
+        ends = numpy.arange(self.interval_length - self.__position - 1, length, self.interval_length)
+        starts = numpy.concatenate(((0,), ends[ends < length - 1] + 1))
+        # exponential time weighting
+        time_weighted = numpy.empty(shape=(2, len(ends), self.number_of_channels))
+        for i, c in enumerate(self.__coefficients):
+            filtered, self.__time_weighted[i] = scipy.signal.lfilter((1.0 - c,), (1.0, -c), squared, axis=-1, zi=self.__time_weighted[i])
+            time_weighted[i] = filtered[:, ends].transpose()
+        # equivalent continuous and peak levels of the intervals
+        sums = numpy.add.reduceat(squared, starts, axis=-1)
+        peaks = numpy.maximum.reduceat(numpy.abs(peak_weighted), starts, axis=-1)
+        sums[:, 0] += self.__sum
+        peaks[:, 0] = numpy.maximum(peaks[:, 0], self.__peak)
+        completed = len(ends)
+        if completed < sums.shape[1]:   # the last interval is continued in the next block
+            self.__sum = sums[:, -1].copy()
+            self.__peak = peaks[:, -1].copy()
+            self.__position = (self.__position + length) % self.interval_length
+        else:
+            self.__sum = numpy.zeros(self.number_of_channels)
+            self.__peak = numpy.zeros(self.number_of_channels)
+            self.__position = 0
+        offset = self.__intervals
+        self.__intervals += completed
+        # compute the levels
+        square_reference = reference ** 2
+        with numpy.errstate(divide="ignore"):
+            levels = (10.0 * numpy.log10(time_weighted[0].transpose() / square_reference),
+                      10.0 * numpy.log10(time_weighted[1].transpose() / square_reference),
+                      10.0 * numpy.log10(sums[:, 0:completed] / (self.interval_length * square_reference)),
+                      20.0 * numpy.log10(peaks[:, 0:completed] / reference))
+        return offset, levels
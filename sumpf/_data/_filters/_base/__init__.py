@@ -18,7 +18,7 @@
 
 from ._filter import *
 
-from ._functions import frequency_scaling
+from ._functions import frequency_scaling, scale_coefficients
 from ._iir import IIRFilter, RolloffFilter
 
 from ._s import S
@@ -45,6 +45,9 @@ class Filter:
       ``s = 2j * pi * f``. It expects a sequence of polynomial coefficients as
       constructor parameter, where the first coefficient is that of the highest
       power of ``s``.
+    * :attr:`~Filter.ZeroPoleGain` defines a rational function of the frequency
+      variable by sequences of its zeros and poles and a gain factor. Such terms
+      are usually created with :meth:`~Filter.compile`.
     * :attr:`~Filter.Exp` defines an exponential function with the multiplication
       of ``s`` and a coefficient in the exponent. The coefficient can be passed
       as constructor parameter.
@@ -107,6 +110,7 @@ class Filter:
     # terms for defining transfer functions
     Constant = terms.Constant.factory
     Polynomial = terms.Polynomial.factory
+    ZeroPoleGain = terms.ZeroPoleGain.factory
     Exp = terms.Exp.factory
     Bands = terms.Bands.factory
     Absolute = terms.Absolute.factory
@@ -116,6 +120,9 @@ class Filter:
     Product = terms.Product.factory
     Quotient = terms.Quotient.factory
 
+    # flags for the design of FIR filters
+    fir_phases = sumpf_internal.FIRPhase    #: an enumeration with flags for the phase response of the FIR filters, that are created with :meth:`~sumpf.Filter.to_fir`
+
     # supported file formats
     file_formats = sumpf_internal.filter_writers.FilterFormats  #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Filter.save`
 
@@ -126,6 +133,7 @@ class Filter:
         """
         self.__transfer_functions = transfer_functions
         self.__labels = sumpf_internal.sanitize_labels(labels=labels, number=len(transfer_functions))
+        self.__stacks = None
 
     ###########################################
     # overloaded operators (non math-related) #
@@ -145,16 +153,34 @@ class Filter:
     def __call__(self, frequencies):
         """Samples the transfer function of the filter at the given frequencies.
 
+        If the caching of sampled transfer functions has been enabled with
+        :func:`~sumpf._internal._cache.set_filter_cache`, the results for arrays
+        of frequencies are cached and returned as read-only arrays.
+
         :param frequencies: a number or a sequence of numbers
         :returns: a tuple of channels, where each channel is a number, if ``frequencies``
                   is a number or an array, if ``frequencies`` is a sequence.
         """
         if not numpy.shape(frequencies):    # create an array if frequencies is a scalar value
             s = S(numpy.reshape(frequencies, (1, 1)))
+            s.share(self.__transfer_functions)
             return tuple(tf(s)[0, 0] for tf in self.__transfer_functions)
         else:
+            cache = sumpf_internal.get_filter_cache()
+            if cache is not None:
+                grid = numpy.asarray(frequencies)
+                key = ("call", self.__structure(), grid.dtype.str, grid.shape, grid.tobytes())
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached[1]
             s = S(frequencies)
-            return tuple(tf(s) for tf in self.__transfer_functions)
+            channels = numpy.empty(shape=(len(self.__transfer_functions),) + numpy.shape(frequencies), dtype=numpy.complex128)
+            result = tuple(self.__evaluate(s, channels))
+            if cache is not None:
+                for r in result:
+                    r.flags.writeable = False
+                cache.put(key, (self.__transfer_functions, result), sum(r.nbytes for r in result))
+            return result
 
     def __len__(self):
         """Operator overload for retrieving the filter's number of channels with
@@ -408,16 +434,211 @@ class Filter:
         """Samples the transfer functions with the given resolution and given number
         of samples and returns the result as a spectrum.
 
+        If the caching of sampled transfer functions has been enabled with
+        :func:`~sumpf._internal._cache.set_filter_cache`, the sampled transfer
+        functions are looked up in the cache and the channels of the returned
+        spectrum are read-only. This avoids evaluating the transfer functions
+        again, when the same filter is applied to many spectrums or signals
+        of the same length.
+
         :param resolution: the frequency resolution of the resulting spectrum
         :param length: the number of samples per channel of the resulting spectrum
         :returns: a :class:`~sumpf.Spectrum` instance
         """
+        cache = sumpf_internal.get_filter_cache()
+        if cache is not None:
+            key = ("spectrum", self.__structure(), float(resolution), int(length))
+            cached = cache.get(key)
+            if cached is not None:
+                return sumpf.Spectrum(channels=cached[1], resolution=resolution, labels=self.__labels)
+        channels = self.__sample(resolution=resolution, length=length)
+        if cache is not None:
+            channels.flags.writeable = False
+            cache.put(key, (self.__transfer_functions, channels), channels.nbytes)
+        return sumpf.Spectrum(channels=channels, resolution=resolution, labels=self.__labels)
+
+    def compile(self):
+        """Creates an equivalent filter, whose transfer functions can be sampled
+        more efficiently.
+
+        The transfer functions of filters like the Butterworth filters or the
+        weighting filters are defined as products and quotients of polynomials.
+        Sampling them evaluates each polynomial separately and allocates temporary
+        arrays for the intermediate results. This method folds such products
+        and quotients into a single term, that is defined by the zeros, the poles
+        and the gain of the rational function, so that the transfer function is
+        computed in one pass into the output array. Terms, that are not rational
+        functions, such as :attr:`~Filter.Exp` or :attr:`~Filter.Bands`, are
+        kept unchanged.
+
+        The compiled filter is an instance of :class:`~sumpf.Filter` rather than
+        of the class of this filter, so the methods of the sub-classes, such as
+        the cutoff frequency of a Butterworth filter, are not available for it.
+
+        :returns: a :class:`~sumpf.Filter` instance
+        """
+        return Filter(transfer_functions=tuple(tf.compile() for tf in self.__transfer_functions),
+                      labels=self.__labels)
+
+    def second_order_sections(self, sampling_rate=48000.0, prewarp_frequency=None):
+        """Discretizes the transfer functions with the bilinear transform and factorizes
+        them into second order sections, with which a signal can be filtered in
+        the time domain.
+
+        This requires the transfer functions to be rational functions of the
+        frequency variable with at least as many poles as zeros, like products
+        and quotients of polynomials, which may also be lowpass-to-highpass-transformed.
+        The bilinear transform compresses the frequency axis, so that the frequency
+        response of the discrete filter deviates from that of this filter, the
+        closer the frequency comes to the Nyquist frequency. With the parameter
+        ``prewarp_frequency``, the discretization can be adjusted, so that the
+        frequency responses are equal at a given frequency, like the cutoff
+        frequency of a lowpass.
+
+        Since the coefficients of the sections are real, a complex gain of a
+        transfer function is replaced by its magnitude. For example, the weighting
+        filters like :class:`~sumpf.AWeighting` are normalized with a complex factor,
+        so that their phase is zero at 1kHz, while the phase of their discretization
+        only results from their zeros and poles.
+
+        This method requires :mod:`scipy` to be installed.
+
+        :param sampling_rate: the sampling rate of the signals, that shall be filtered
+        :param prewarp_frequency: a frequency in Hz, at which the frequency responses
+                                  of the discrete filter and this filter shall be
+                                  equal, or None, if the frequency axis shall not
+                                  be prewarped
+        :returns: a tuple with a two dimensional :func:`numpy.array` for each
+                  transfer function, that has one row of coefficients
+                  ``(b0, b1, b2, a0, a1, a2)`` for each section
+        :raises ValueError: if a transfer function cannot be discretized
+        :raises ImportError: if the library :mod:`scipy` is not available
+        """
+        import scipy.signal     # noqa; pylint: disable=import-outside-toplevel,unused-import; fail with a meaningful error, if scipy is not installed and the second order sections are therefore not available in sumpf._internal
+        sections = []
+        for tf in self.__transfer_functions:
+            zero_pole_gain = tf.zero_pole_gain()
+            if zero_pole_gain is None:
+                raise ValueError(f"The transfer function {tf!r} is not a rational function of the frequency variable")
+            sections.append(sumpf_internal.second_order_sections(zero_pole_gain=zero_pole_gain,
+                                                                 sampling_rate=sampling_rate,
+                                                                 prewarp_frequency=prewarp_frequency))
+        return tuple(sections)
+
+    def discretize(self, sampling_rate=48000.0, prewarp_frequency=None):
+        """Creates an object, that applies this filter to signals in the time domain.
+
+        Multiplying a filter with a :class:`~sumpf.Signal` transforms the whole
+        signal to the frequency domain, which requires memory for the full length
+        of the signal and causes the filter's response to wrap around at the end
+        of the signal. The returned object applies the filter with a cascade of
+        second order sections instead, whose state is kept between the filtered
+        blocks, so that long recordings can be processed block by block. See
+        :meth:`second_order_sections` for the requirements of the discretization.
+
+        This method requires :mod:`scipy` to be installed.
+
+        :param sampling_rate: the sampling rate of the signals, that shall be filtered
+        :param prewarp_frequency: a frequency in Hz, at which the frequency responses
+                                  of the discrete filter and this filter shall be
+                                  equal, or None, if the frequency axis shall not
+                                  be prewarped
+        :returns: a :class:`~sumpf._internal._biquad.BiquadCascade` instance
+        :raises ValueError: if a transfer function cannot be discretized
+        :raises ImportError: if the library :mod:`scipy` is not available
+        """
+        sections = self.second_order_sections(sampling_rate=sampling_rate, prewarp_frequency=prewarp_frequency)
+        return sumpf_internal.BiquadCascade(sections=sections, sampling_rate=sampling_rate)
+
+    def to_fir(self, length=1024, sampling_rate=48000.0, phase=sumpf_internal.FIRPhase.LINEAR):
+        """Designs FIR filters, whose magnitude responses approximate those of
+        this filter's transfer functions.
+
+        Other than :meth:`discretize`, this method works with all transfer functions,
+        including :attr:`~Filter.Bands` equalizers and terms with :attr:`~Filter.Exp`.
+        The magnitudes of the transfer functions are sampled with a higher resolution
+        than that of the impulse responses, which are then computed with the
+        given phase response and windowed to the given length. The returned
+        impulse responses can be applied to long signals block by block by
+        passing the result of their :meth:`~sumpf.Signal.prepare_convolution`
+        method to :meth:`~sumpf.Signal.convolve`.
+
+        The phase of the transfer functions is discarded. With a linear phase,
+        the impulse responses are symmetric, so that the filtered signal is delayed
+        by ``(length - 1) / 2`` samples. With the minimum phase, the delay is
+        as short as possible, but the group delay depends on the frequency.
+
+        If the caching of sampled transfer functions has been enabled with
+        :func:`~sumpf._internal._cache.set_filter_cache`, the designed impulse
+        responses are cached, so that they are not designed again, when the
+        same filter is converted with the same parameters. In this case, the
+        channels of the returned signal are read-only.
+
+        :param length: the number of samples of the impulse responses
+        :param sampling_rate: the sampling rate of the impulse responses
+        :param phase: a flag from the :attr:`~sumpf.Filter.fir_phases` enumeration
+        :returns: a :class:`~sumpf.Signal` with one impulse response per channel
+        """
+        cache = sumpf_internal.get_filter_cache()
+        if cache is not None:
+            key = ("fir", self.__structure(), int(length), float(sampling_rate), phase)
+            cached = cache.get(key)
+            if cached is not None:
+                return sumpf.Signal(channels=cached[1], sampling_rate=sampling_rate, labels=self.__labels)
+        design_length = sumpf_internal.fir_design_length(length)
+        magnitudes = numpy.absolute(self.__sample(resolution=sampling_rate / design_length,
+                                                  length=design_length // 2 + 1))
+        magnitudes[~numpy.isfinite(magnitudes)] = 0.0
+        channels = sumpf_internal.fir_from_magnitudes(magnitudes=magnitudes, length=length, phase=phase)
+        if cache is not None:
+            channels.flags.writeable = False
+            cache.put(key, (self.__transfer_functions, channels), channels.nbytes)
+        return sumpf.Signal(channels=channels, sampling_rate=sampling_rate, labels=self.__labels)
+
+    def __sample(self, resolution, length):
+        """Samples the transfer functions at equidistant frequencies, starting at 0Hz.
+
+        :param resolution: the frequency resolution
+        :param length: the number of samples per channel
+        :returns: a two dimensional :func:`numpy.array` of complex values
+        """
         frequencies = numpy.linspace(0.0, (length - 1) * resolution, length)
-        s = S(frequencies)
         channels = sumpf_internal.allocate_array(shape=(len(self.__transfer_functions), length), dtype=numpy.complex128)
-        for tf, c in zip(self.__transfer_functions, channels):
-            tf(s, out=c)
-        return sumpf.Spectrum(channels=channels, resolution=resolution, labels=self.__labels)
+        return self.__evaluate(S(frequencies), channels)
+
+    def __evaluate(self, s, channels):
+        """Evaluates the transfer functions and writes the results to the given array.
+        Bands terms, which share their supporting x values and interpolation flags,
+        are interpolated together in one vectorized operation.
+
+        :param s: an :class:`sumpf._data._filters._base._s.S` instance
+        :param channels: an array of complex values with one row for each transfer function
+        :returns: the channels array
+        """
+        s.share(self.__transfer_functions)     # sub-terms, which occur multiple times, are evaluated only once
+        if self.__stacks is None or not all(stack.is_valid() for stack in self.__stacks):
+            self.__stacks = terms.StackedBands.find(self.__transfer_functions)
+        stacked = set()
+        for stack in self.__stacks:
+            indices = list(stack.indices())
+            channels[indices] = stack(s)
+            stacked.update(indices)
+        for i, (tf, c) in enumerate(zip(self.__transfer_functions, channels)):
+            if i in stacked:
+                s.memorize(tf, s.fix(c))
+            else:
+                tf(s, out=c)
+        return channels
+
+    def __structure(self):
+        """Returns a hashable representation of the structure of the transfer functions,
+        that is used as a key for caching the sampled transfer functions. Since
+        the cache entries keep references to the transfer functions, structures,
+        which rely on the identity of the terms, remain unique.
+
+        :returns: a tuple
+        """
+        return tuple(tf.structure() for tf in self.__transfer_functions)
 
     #######################
     # persistence methods #
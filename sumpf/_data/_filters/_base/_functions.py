@@ -18,7 +18,7 @@
 
 import math
 
-__all__ = ("frequency_scaling", "copy_to_out")
+__all__ = ("frequency_scaling", "scale_coefficients", "copy_to_out")
 
 
 def frequency_scaling(cutoff_frequency, highpass):
@@ -34,6 +34,19 @@ def frequency_scaling(cutoff_frequency, highpass):
         return 1.0 / (2.0 * math.pi * cutoff_frequency)
 
 
+def scale_coefficients(coefficients, k):
+    """Applies the frequency scaling to the coefficients of a polynomial of a
+    normalized prototype filter.
+
+    :param coefficients: a sequence of coefficients, which are sorted from the
+                         highest to the lowest power of the frequency variable
+    :param k: the frequency scaling, as it is computed with :func:`frequency_scaling`
+    :returns: a tuple of scaled coefficients
+    """
+    degree = len(coefficients) - 1
+    return tuple(c * k ** (degree - i) for i, c in enumerate(coefficients))
+
+
 def copy_to_out(result, out):
     """A helper function, that copies a computation result into an array, that
     is passed for returning a value through call by reference.
@@ -16,6 +16,7 @@
 
 """Contains base classes for IIR filters"""
 
+import numpy
 from ._filter import Filter
 
 
@@ -68,3 +69,40 @@ class RolloffFilter(IIRFilter):
         :returns: True, if the filter is a highpass filter, False otherwise
         """
         return self.__is_highpass
+
+    @classmethod
+    def bank(cls, **parameters):
+        """Creates a filter with many channels, each of which is a filter of this
+        class, so that a whole range of filter designs, like a sweep of the cutoff
+        frequency or the order, can be created and sampled at once.
+
+        The parameters are the same as those of the class's constructor. Each
+        of them can either be a single value, which is used for all channels,
+        or a sequence with one value per channel. Channels with equal parameters
+        share the same transfer function.
+
+        :param `**parameters`: the parameters of the filters as keyword arguments
+        :returns: a :class:`~sumpf.Filter` instance
+        :raises ValueError: if the sequences of parameters have different lengths
+        """
+        parameters = {k: tuple(numpy.ravel(v).tolist()) if numpy.ndim(v) else (v,) for k, v in parameters.items()}
+        lengths = {len(v) for v in parameters.values()} - {1}
+        if len(lengths) > 1:
+            raise ValueError(f"The sequences of parameters must have the same length, not {sorted(lengths)}")
+        number_of_channels = lengths.pop() if lengths else 1
+        varying = tuple(k for k, v in parameters.items() if len(v) > 1)
+        transfer_functions = []
+        labels = []
+        designs = {}
+        for i in range(number_of_channels):
+            channel = {k: v[i] if len(v) > 1 else v[0] for k, v in parameters.items()}
+            key = tuple(sorted(channel.items()))
+            if key not in designs:
+                filter_ = cls(**channel)
+                description = ", ".join(f"{k}={channel[k]!r}" for k in varying)
+                label = f"{filter_.labels()[0]} ({description})" if description else filter_.labels()[0]
+                designs[key] = (filter_.transfer_functions()[0], label)
+            transfer_function, label = designs[key]
+            transfer_functions.append(transfer_function)
+            labels.append(label)
+        return Filter(transfer_functions=tuple(transfer_functions), labels=tuple(labels))
@@ -16,6 +16,7 @@
 
 """Contains classes, which manage the frequency variable ``s`` in filter calculations"""
 
+import collections
 import math
 import weakref
 import numpy
@@ -36,6 +37,8 @@ class S:
         self.__frequencies = frequencies
         self.__s = None
         self.__transformed = None
+        self.__shared = {}      # maps the ids of sub-terms, that occur multiple times, to the term and its structure
+        self.__results = {}     # maps the structures of the shared sub-terms to their results
 
     def __call__(self):
         """Returns the values for ``s``
@@ -77,6 +80,60 @@ class S:
             self.__transformed = TransformedS(self)
         return self.__transformed
 
+    def share(self, terms):
+        """Searches the given terms for sub-terms, that occur multiple times, so
+        that these are evaluated only once for this frequency grid. Sub-terms are
+        considered equal, if they are the same object or if they have the same
+        structure, so this also finds copies of terms, which have been created
+        by the operators, when combining filters.
+
+        :param terms: a sequence of terms, that shall be evaluated with this instance
+        """
+        counts = collections.Counter()
+        found = []
+        stack = list(terms)
+        while stack:
+            term = stack.pop()
+            if term.memoizable():
+                structure = term.structure()
+                counts[structure] += 1
+                found.append((term, structure))
+            stack.extend(term.operands())
+        self.__shared = {id(t): (t, k) for t, k in found if counts[k] > 1}
+        self.__results.clear()
+        if self.__transformed is not None:
+            self.__transformed.clear()
+
+    def structure(self, term):
+        """Returns the structure of the given term, if it occurs multiple times
+        in the terms, that have been passed to :meth:`share`.
+
+        :param term: a term
+        :returns: a hashable structure or None, if the term's result shall not be memoized
+        """
+        entry = self.__shared.get(id(term))
+        if entry is None or entry[0] is not term:
+            return None
+        return entry[1]
+
+    def recall(self, term, out=None):
+        """Returns the memoized result of the given term, if it has already been
+        evaluated for this frequency grid.
+
+        :param term: a term
+        :param out: an optional array, into which the result shall be copied
+        :returns: the result or None, if it has not been memoized
+        """
+        return _recall(self.__results, self.structure(term), out)
+
+    def memorize(self, term, result):
+        """Memoizes the result of the given term, if it occurs multiple times.
+
+        :param term: a term
+        :param result: the result of the term's evaluation
+        """
+        _memorize(self.__results, self.structure(term), result)
+
 
 class TransformedS:
     """Computes the values of ``1 / s`` for sampling a lowpass-to-highpass-transformed
@@ -91,6 +148,7 @@ class TransformedS:
         self.__origin = weakref.proxy(origin)
         self.__s = None
         self.__invalid = None
+        self.__results = {}
 
     def __call__(self):
         """Returns the values for ``1 / s``
@@ -134,3 +192,57 @@ class TransformedS:
         :returns: an :class:`sumpf._data._filters._base._s.S` instance
         """
         return self.__origin
+
+    def clear(self):
+        """Discards the memoized results of the terms."""
+        self.__results.clear()
+
+    def recall(self, term, out=None):
+        """Returns the memoized result of the given term, if it has already been
+        evaluated with ``1 / s`` for this frequency grid.
+
+        :param term: a term
+        :param out: an optional array, into which the result shall be copied
+        :returns: the result or None, if it has not been memoized
+        """
+        return _recall(self.__results, self.__origin.structure(term), out)
+
+    def memorize(self, term, result):
+        """Memoizes the result of the given term, if it occurs multiple times.
+
+        :param term: a term
+        :param result: the result of the term's evaluation
+        """
+        _memorize(self.__results, self.__origin.structure(term), result)
+
+
+def _recall(results, structure, out):
+    """A helper function, that looks up a memoized result.
+
+    :param results: a dictionary, that maps the structures of terms to their results
+    :param structure: the structure of the term or None, if it is not memoized
+    :param out: an optional array, into which the result shall be copied
+    :returns: a copy of the result or None
+    """
+    if structure is None:
+        return None
+    result = results.get(structure)
+    if result is None:
+        return None
+    elif out is None:
+        return result.copy()
+    else:
+        out[...] = result
+        return out
+
+
+def _memorize(results, structure, result):
+    """A helper function, that memoizes a copy of a result, since the result
+    array might be modified, when evaluating the other terms.
+
+    :param results: a dictionary, that maps the structures of terms to their results
+    :param structure: the structure of the term or None, if it shall not be memoized
+    :param result: the result of the term's evaluation
+    """
+    if structure is not None and structure not in results:
+        results[structure] = numpy.array(result, copy=True)
@@ -16,9 +16,73 @@
 
 """Contains the base class for terms with which the transfer functions of filters can be constructed."""
 
+import numpy
+
 __all__ = ("Term",)
 
 
+def combine_zero_pole_gains(factors, divisors=(), transform=False):
+    """A helper function, that multiplies the zero-pole-gain representations of
+    terms, as they are returned by the terms' ``_zero_pole_gain`` method.
+
+    :param factors: a sequence of zero-pole-gain representations, that shall be multiplied
+    :param divisors: a sequence of zero-pole-gain representations, by which the
+                     product of the factors shall be divided
+    :param transform: True, if the combination is computed by a term with a
+                      lowpass-to-highpass-transformation, False otherwise
+    :returns: a zero-pole-gain representation or None, if the representations
+              refer to different frequency variables or if a divisor is zero
+    """
+    gain = 1.0
+    zeros = []
+    poles = []
+    variable = None
+    for representations, divide in ((factors, False), (divisors, True)):
+        for g, z, p, t in representations:
+            if t is not None:
+                if variable is None:
+                    variable = t
+                elif variable != t:
+                    return None
+            if divide:
+                if g == 0.0:
+                    return None
+                gain /= g
+                zeros.append(p)
+                poles.append(z)
+            else:
+                gain *= g
+                zeros.append(z)
+                poles.append(p)
+    if transform and variable is not None:
+        variable = not variable
+    return (gain,
+            numpy.concatenate(zeros) if zeros else numpy.empty(0, dtype=numpy.complex128),
+            numpy.concatenate(poles) if poles else numpy.empty(0, dtype=numpy.complex128),
+            variable)
+
+
+def as_function_of_s(zero_pole_gain):
+    """A helper function, that converts a zero-pole-gain representation, whose
+    zeros and poles refer to ``1 / s``, to one, whose zeros and poles refer to ``s``.
+
+    :param zero_pole_gain: a zero-pole-gain representation as a tuple ``(gain, zeros, poles, transform)``
+    :returns: a zero-pole-gain representation, in which ``transform`` is False or None
+    """
+    gain, zeros, poles, transform = zero_pole_gain
+    if not transform:
+        return zero_pole_gain
+    # (1/s - z) = -z * (s - 1/z) / s for z != 0, and (1/s - 0) = 1 / s
+    nonzero_zeros = zeros[zeros != 0.0]
+    nonzero_poles = poles[poles != 0.0]
+    gain = gain * numpy.prod(-nonzero_zeros) / numpy.prod(-nonzero_poles)
+    order = len(poles) - len(zeros)
+    return (gain.item() if isinstance(gain, numpy.generic) else gain,
+            numpy.concatenate((1.0 / nonzero_zeros, numpy.zeros(max(order, 0), dtype=numpy.complex128))),
+            numpy.concatenate((1.0 / nonzero_poles, numpy.zeros(max(-order, 0), dtype=numpy.complex128))),
+            False)
+
+
 class Term:
     """A base class for mathematical terms, from which transfer functions can be constructed.
     All classes, that are derived from Term must implement at least the methods
@@ -56,8 +120,11 @@ class Term:
         """
         if self.transform:
             s = s.transform()
-        result = self._compute(s, out=out)
-        return s.fix(result)
+        result = s.recall(self, out=out)
+        if result is None:
+            result = s.fix(self._compute(s, out=out))
+            s.memorize(self, result)
+        return result
 
     def _compute(self, s, out):
         """An abstract method, in which sub-classes can implement their computations.
@@ -69,6 +136,33 @@ class Term:
         """
         raise NotImplementedError("This method has to be implemented in a derived class")
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure, which is
+        used to find equal sub-terms, whose results can be memoized during the
+        evaluation of a filter.
+        Terms, which return equal structures, must evaluate to the same result.
+        This default implementation relies on the identity of the term, so derived
+        classes should override it.
+
+        :returns: a hashable object
+        """
+        return (self.__class__.__name__, id(self))
+
+    def operands(self):     # pylint: disable=no-self-use; the overrides in derived classes do use self
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return ()
+
+    def memoizable(self):   # pylint: disable=no-self-use; the overrides in derived classes do use self
+        """Returns, whether it is worth memoizing the result of this term, if it
+        occurs multiple times in a filter.
+
+        :returns: True, if the result shall be memoized, False otherwise
+        """
+        return True
+
     def is_zero(self):  # pylint: disable=no-self-use; the overrides in derived classes do use self
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -79,6 +173,62 @@ class Term:
         """
         return False
 
+    def compile(self):
+        """Creates an equivalent term, that can be evaluated more efficiently.
+        Products and quotients of polynomials and constants are folded into a
+        single :class:`~sumpf._data._filters._base._terms._primitive.ZeroPoleGain`
+        term, which is evaluated in one pass without allocating temporary arrays
+        for the factors. Terms, that cannot be folded, are kept, while their
+        operands are compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        zero_pole_gain = self._zero_pole_gain()  # pylint: disable=assignment-from-none; derived classes override this method to return a zero-pole-gain representation
+        if zero_pole_gain is None:
+            return self._compile_operands()
+        else:
+            from ._primitive import ZeroPoleGain    # pylint: disable=cyclic-import,import-outside-toplevel
+            gain, zeros, poles, transform = zero_pole_gain
+            return ZeroPoleGain.factory(zeros=zeros, poles=poles, gain=gain, transform=bool(transform))
+
+    def _zero_pole_gain(self):   # pylint: disable=no-self-use; the overrides in derived classes do use self
+        """Returns a zero-pole-gain representation of the term, if it is a rational
+        function of the frequency variable. This is a helper method for :meth:`compile`.
+
+        :returns: None, if the term cannot be represented as a rational function.
+                  Otherwise a tuple ``(gain, zeros, poles, transform)``, in which
+                  ``zeros`` and ``poles`` are arrays of complex values and ``transform``
+                  specifies, if the zeros and poles refer to ``1 / s`` instead of ``s``.
+                  If the term does not depend on the frequency at all, ``transform``
+                  is None.
+        """
+        return None
+
+    def zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term as a rational function
+        of ``s = 2j * pi * f``. Other than the representation, that is used for
+        compiling terms, this also resolves lowpass-to-highpass-transformations,
+        so that products and quotients of lowpass and highpass terms can be
+        represented as well. This is used for discretizing a filter's transfer function.
+
+        :returns: None, if the term cannot be represented as a rational function.
+                  Otherwise a tuple ``(gain, zeros, poles)``, in which ``zeros``
+                  and ``poles`` are arrays of complex values.
+        """
+        zero_pole_gain = self._zero_pole_gain()  # pylint: disable=assignment-from-none; derived classes override this method to return a zero-pole-gain representation
+        if zero_pole_gain is None:
+            return None
+        return as_function_of_s(zero_pole_gain)[0:3]
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operands have been compiled.
+        This is a helper method for :meth:`compile`, that is called, if the term
+        itself cannot be folded into a zero-pole-gain representation.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return self
+
     def invert_transform(self):
         """Creates a copy of the term, with the lowpass-to-highpass-transform inverted.
 
@@ -18,8 +18,8 @@
 
 import warnings
 import numpy
-from ._base import Term
-from ._primitive import Constant
+from ._base import Term, as_function_of_s, combine_zero_pole_gains
+from ._primitive import Constant, ZeroPoleGain
 from .. import _functions as functions
 
 __all__ = ("Sum", "Difference", "Product", "Quotient")
@@ -107,6 +107,27 @@ class Sum(Term):
                                                                                       summands=self.summands,
                                                                                       transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Sum", self.transform, tuple(s.structure() for s in self.summands))
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return self.summands
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operands have been compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return Sum(summands=tuple(s.compile() for s in self.summands), transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if not isinstance(other, Sum):
@@ -220,6 +241,29 @@ class Difference(Term):
                                                  subtrahend=self.subtrahend,
                                                  transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Difference", self.transform, self.minuend.structure(), self.subtrahend.structure())
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return (self.minuend, self.subtrahend)
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operands have been compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return Difference(minuend=self.minuend.compile(),
+                          subtrahend=self.subtrahend.compile(),
+                          transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if not isinstance(other, Difference):
@@ -347,6 +391,80 @@ class Product(Term):
                                                                                     factors=self.factors,
                                                                                     transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Product", self.transform, tuple(f.structure() for f in self.factors))
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return self.factors
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term, if all factors
+        are rational functions of the same frequency variable.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)`` or None
+        """
+        if not self.factors:
+            return None
+        factors = []
+        for f in self.factors:
+            zero_pole_gain = f._zero_pole_gain()   # pylint: disable=protected-access; the method is protected to hide it from the public interface of the terms
+            if zero_pole_gain is None:
+                return None
+            factors.append(zero_pole_gain)
+        return combine_zero_pole_gains(factors, transform=self.transform)
+
+    def zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term as a rational function
+        of ``s = 2j * pi * f``, if all factors are rational functions.
+
+        :returns: a tuple ``(gain, zeros, poles)`` or None
+        """
+        if not self.factors:
+            return None
+        factors = []
+        for f in self.factors:
+            zero_pole_gain = f.zero_pole_gain()
+            if zero_pole_gain is None:
+                return None
+            factors.append(zero_pole_gain + (False,))
+        return as_function_of_s(combine_zero_pole_gains(factors, transform=self.transform))[0:3]
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the factors have been compiled.
+        The rational factors are grouped by their frequency variable, so that
+        each group can be folded into one factor.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        factors = []
+        constants = []
+        groups = {}
+        for f in self.factors:
+            zero_pole_gain = f._zero_pole_gain()   # pylint: disable=protected-access; the method is protected to hide it from the public interface of the terms
+            if zero_pole_gain is None:
+                factors.append(f.compile())
+            elif zero_pole_gain[3] is None:
+                constants.append(zero_pole_gain)
+            else:
+                groups.setdefault(zero_pole_gain[3], []).append(zero_pole_gain)
+        if groups:
+            for i, group in enumerate(groups.values()):
+                if i == 0:
+                    group = constants + group
+                gain, zeros, poles, transform = combine_zero_pole_gains(group)
+                factors.append(ZeroPoleGain.factory(zeros=zeros, poles=poles, gain=gain, transform=transform))
+        elif constants:
+            factors.append(Constant(combine_zero_pole_gains(constants)[0]))
+        return Product(factors=factors, transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if not isinstance(other, Product):
@@ -456,6 +574,56 @@ class Quotient(Term):
                                                  denominator=self.denominator,
                                                  transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Quotient", self.transform, self.numerator.structure(), self.denominator.structure())
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return (self.numerator, self.denominator)
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term, if the numerator
+        and the denominator are rational functions of the same frequency variable.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)`` or None
+        """
+        numerator = self.numerator._zero_pole_gain()       # pylint: disable=protected-access; the method is protected to hide it from the public interface of the terms
+        denominator = self.denominator._zero_pole_gain()   # pylint: disable=protected-access
+        if numerator is None or denominator is None:
+            return None
+        return combine_zero_pole_gains((numerator,), (denominator,), transform=self.transform)
+
+    def zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term as a rational function
+        of ``s = 2j * pi * f``, if the numerator and the denominator are rational functions.
+
+        :returns: a tuple ``(gain, zeros, poles)`` or None
+        """
+        numerator = self.numerator.zero_pole_gain()
+        denominator = self.denominator.zero_pole_gain()
+        if numerator is None or denominator is None:
+            return None
+        quotient = combine_zero_pole_gains((numerator + (False,),), (denominator + (False,),), transform=self.transform)
+        if quotient is None:
+            return None
+        return as_function_of_s(quotient)[0:3]
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operands have been compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return Quotient(numerator=self.numerator.compile(),
+                        denominator=self.denominator.compile(),
+                        transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``"""
         if not isinstance(other, Quotient):
@@ -17,13 +17,14 @@
 """Contains the classes for terms, that operate on the frequency variable ``s``
 rather than on other terms."""
 
+import warnings
 import numpy
 import sumpf._internal as sumpf_internal
 from ._base import Term
 from . import _binary as binary
 from .. import _functions as functions
 
-__all__ = ("Constant", "Polynomial", "Exp", "Bands")
+__all__ = ("Constant", "Polynomial", "ZeroPoleGain", "Exp", "Bands", "StackedBands")
 
 
 class Constant(Term):
@@ -86,6 +87,29 @@ class Constant(Term):
         """
         return f"Filter.{self.__class__.__name__}(value={self.value!r})"
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Constant", self.value)
+
+    def memoizable(self):
+        """Returns, whether it is worth memoizing the result of this term.
+        Constant terms are cheaper to compute than to copy.
+
+        :returns: False
+        """
+        return False
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)``
+        """
+        empty = numpy.empty(0, dtype=numpy.complex128)
+        return self.value, empty, empty, None
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if self.value == 0.0 and other.is_zero():
@@ -230,6 +254,25 @@ class Polynomial(Term):
         else:
             return True
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Polynomial", self.transform, tuple(self.coefficients))
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)`` or None, if the
+                  polynomial is zero or if its coefficients are not finite
+        """
+        coefficients = numpy.trim_zeros(numpy.asarray(self.coefficients), trim="f")
+        if len(coefficients) == 0 or not numpy.isfinite(coefficients).all():    # pylint: disable=len-as-condition; coefficients is a NumPy array, where __nonzero__ is not equivalent to len(.)
+            return None
+        zeros = numpy.roots(coefficients).astype(numpy.complex128)
+        return coefficients[0], zeros, numpy.empty(0, dtype=numpy.complex128), self.transform
+
     def __repr__(self):
         """Operator overload for using the built-in function :func:`repr` to generate
         a string representation of the term, that can be evaluated with :func:`eval`.
@@ -309,6 +352,175 @@ class Polynomial(Term):
                 "transform": self.transform}
 
 
+class ZeroPoleGain(Term):
+    """A class for defining a rational function of the frequency variable ``s``
+    by its zeros, its poles and a gain factor:
+    ``gain * (s - zeros[0]) * (s - zeros[1]) * ... / ((s - poles[0]) * (s - poles[1]) * ...)``.
+
+    Terms of this class are usually created by :meth:`~sumpf._data._filters._base._terms._base.Term.compile`,
+    which folds the products and quotients of polynomials, that are used to define
+    filters like the Butterworth filters, into a single term. Evaluating this term
+    requires only one buffer for the factors, which is reused for all zeros and poles.
+    """
+
+    @staticmethod
+    def factory(zeros=(), poles=(), gain=1.0, transform=False):  # pylint: disable=arguments-differ; this static method overrides a classmethod and does not need the cls argument
+        """A class for defining a rational function of the frequency variable ``s``
+        by its zeros, its poles and a gain factor.
+
+        This is a static factory method, that is meant to instantiate a
+        :class:`~sumpf._data._filters._base._terms._primitive.ZeroPoleGain` instance.
+        But due to optimizations, it might return an instance of another subclass
+        of :class:`~sumpf._data._filters._base._terms._base.Term`, if that is simpler
+        and more efficient.
+
+        :param zeros: a sequence of complex zeros
+        :param poles: a sequence of complex poles
+        :param gain: a factor, with which the product of the zeros and poles is scaled
+        :param transform: True, if a lowpass-to-highpass-transformation shall be
+                          performed, False otherwise
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        if gain == 0.0:
+            return Constant(0.0)
+        elif len(zeros) == 0 and len(poles) == 0:     # pylint: disable=len-as-condition; zeros and poles might be NumPy arrays, where __nonzero__ is not equivalent to len(.)
+            return Constant(gain)
+        else:
+            return ZeroPoleGain(zeros, poles, gain, transform)
+
+    def __init__(self, zeros=(), poles=(), gain=1.0, transform=False):
+        """
+        :param zeros: a sequence of complex zeros
+        :param poles: a sequence of complex poles
+        :param gain: a factor, with which the product of the zeros and poles is scaled
+        :param transform: True, if a lowpass-to-highpass-transformation shall be
+                          performed, False otherwise
+        """
+        Term.__init__(self, transform=transform)
+        self.zeros = numpy.array(zeros, dtype=numpy.complex128)
+        self.poles = numpy.array(poles, dtype=numpy.complex128)
+        self.gain = gain.item() if isinstance(gain, numpy.generic) else gain
+
+    def _compute(self, s, out=None):
+        """Implements the computation of the rational function.
+        :param s: an :class:`sumpf._data._filters._base._s.S` instance
+        :param out: an optional array of complex values, in which the result shall
+                    be stored (in order to save memory allocations)
+        :returns: the computed transfer function as an array of complex values
+        """
+        x = s()
+        if out is None:
+            out = numpy.empty(shape=numpy.shape(x), dtype=numpy.complex128)
+        out.fill(self.gain)
+        factor = numpy.empty_like(out)
+        with warnings.catch_warnings():
+            warnings.simplefilter(action="ignore", category=RuntimeWarning)
+            for z in self.zeros:
+                numpy.subtract(x, z, out=factor)
+                numpy.multiply(out, factor, out=out)
+            for p in self.poles:
+                numpy.subtract(x, p, out=factor)
+                numpy.divide(out, factor, out=out)
+        return out
+
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("ZeroPoleGain", self.transform, self.gain, tuple(self.zeros), tuple(self.poles))
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)``
+        """
+        return self.gain, self.zeros, self.poles, self.transform
+
+    def is_zero(self):
+        """Returns, whether this term evaluates to zero for all frequencies.
+        For this check, the term is not evaluated. Instead, the parameters are
+        analyzed statically, so maybe not all conditions, where the term evaluates
+        to zero are covered.
+
+        :returns: True, if the term evaluates to zero, False otherwise
+        """
+        return self.gain == 0.0
+
+    def __repr__(self):
+        """Operator overload for using the built-in function :func:`repr` to generate
+        a string representation of the term, that can be evaluated with :func:`eval`.
+
+        :returns: a potentially very long string
+        """
+        zeros = tuple(complex(z) for z in self.zeros)
+        poles = tuple(complex(p) for p in self.poles)
+        return (f"Filter.{self.__class__.__name__}("
+                f"zeros={zeros!r}, "
+                f"poles={poles!r}, "
+                f"gain={self.gain!r}, "
+                f"transform={self.transform})")
+
+    def __eq__(self, other):
+        """An operator overload for comparing two terms with ``==``."""
+        if not isinstance(other, ZeroPoleGain):
+            return False
+        elif (self.gain != other.gain or
+              not numpy.array_equal(self.zeros, other.zeros) or
+              not numpy.array_equal(self.poles, other.poles)):
+            return False
+        return super().__eq__(other)
+
+    def __invert__(self):
+        """A repurposed operator overload for inverting a terms with ``~term``.
+        The inverse of a term is ``1 / term``.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return ZeroPoleGain(zeros=self.poles, poles=self.zeros, gain=1.0 / self.gain, transform=self.transform)
+
+    def __neg__(self):
+        """An operator overload for inverting the phase of a terms with ``-term``.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return ZeroPoleGain(zeros=self.zeros, poles=self.poles, gain=-self.gain, transform=self.transform)
+
+    def __mul__(self, other):
+        """An operator overload for multiplying two terms with ``*``."""
+        if isinstance(other, Constant):
+            return ZeroPoleGain.factory(zeros=self.zeros, poles=self.poles, gain=self.gain * other.value, transform=self.transform)
+        elif isinstance(other, ZeroPoleGain) and self.transform == other.transform:
+            return ZeroPoleGain.factory(zeros=numpy.concatenate((self.zeros, other.zeros)),
+                                        poles=numpy.concatenate((self.poles, other.poles)),
+                                        gain=self.gain * other.gain,
+                                        transform=self.transform)
+        else:
+            return super().__mul__(other)
+
+    def __truediv__(self, other):
+        """An operator overload for dividing two terms with ``/``."""
+        if isinstance(other, Constant):
+            return ZeroPoleGain.factory(zeros=self.zeros, poles=self.poles, gain=self.gain / other.value, transform=self.transform)
+        elif isinstance(other, ZeroPoleGain) and self.transform == other.transform:
+            return ZeroPoleGain.factory(zeros=numpy.concatenate((self.zeros, other.poles)),
+                                        poles=numpy.concatenate((self.poles, other.zeros)),
+                                        gain=self.gain / other.gain,
+                                        transform=self.transform)
+        else:
+            return super().__truediv__(other)
+
+    def as_dict(self):
+        """Returns a dictionary serialization of this term."""
+        return {"type": "ZeroPoleGain",
+                "zeros": {"real": tuple(numpy.real(self.zeros)),
+                          "imaginary": tuple(numpy.imag(self.zeros))},
+                "poles": {"real": tuple(numpy.real(self.poles)),
+                          "imaginary": tuple(numpy.imag(self.poles))},
+                "gain": self.gain,
+                "transform": self.transform}
+
+
 class Exp(Term):
     """A class for defining an exponential function with the multiplication of
     ``s`` and a coefficient in the exponent: ``exp(c * s)``.
@@ -354,6 +566,13 @@ class Exp(Term):
         exponent = numpy.multiply(self.coefficient, s(), out=out)
         return numpy.exp(exponent, out=out)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Exp", self.transform, self.coefficient)
+
     def __repr__(self):
         """Operator overload for using the built-in function :func:`repr` to generate
         a string representation of the term, that can be evaluated with :func:`eval`.
@@ -429,6 +648,7 @@ class Bands(Term):
             self.extrapolation = sumpf_internal.Interpolations.STAIRS_LIN
         else:
             self.extrapolation = extrapolation
+        self.__prepared = None
 
     def _compute(self, s, out=None):
         """Implements the computation of the interpolation of the bands.
@@ -439,25 +659,35 @@ class Bands(Term):
         """
         f = s.frequencies()
         if isinstance(f, float):
-            if f < self.xs[0] or self.xs[-1] < f:
-                extrapolation = sumpf_internal.interpolation.get(self.extrapolation)
-                return extrapolation(x=f, xs=self.xs, ys=self.ys)  # pylint: disable=no-value-for-parameter; this function is modified by a decorator
-            else:
-                interpolation = sumpf_internal.interpolation.get(self.interpolation)
-                return interpolation(x=f, xs=self.xs, ys=self.ys)  # pylint: disable=no-value-for-parameter; this function is modified by a decorator
+            return self.__interpolator()(f)
         else:
             if out is None:
                 out = numpy.empty(shape=f.shape, dtype=numpy.complex128)
-            if self.xs.size:
-                mask = (f < self.xs[0]) | (self.xs[-1] < f)
-                extrapolation = sumpf_internal.interpolation.get(self.extrapolation)
-                out[mask] = extrapolation(x=f[mask], xs=self.xs, ys=self.ys)  # pylint: disable=no-value-for-parameter; this function is modified by a decorator
-                mask = ~mask
-                interpolation = sumpf_internal.interpolation.get(self.interpolation)
-                out[mask] = interpolation(x=f[mask], xs=self.xs, ys=self.ys)  # pylint: disable=no-value-for-parameter; this function is modified by a decorator
-            else:
-                out[:] = 0.0
-            return out
+            return self.__interpolator()(f, out=out)
+
+    def __interpolator(self):
+        """Returns an interpolator, that has analyzed the supporting points in
+        advance, so that it does not have to be done every time, when the term is
+        evaluated. The interpolator is created again, if the supporting points
+        or the interpolation flags have been replaced or modified in-place.
+
+        :returns: a :class:`~sumpf._internal.interpolation.Interpolator` instance
+        """
+        snapshot = _snapshot(self)
+        if self.__prepared is None or self.__prepared[0] != snapshot:
+            interpolator = sumpf_internal.interpolation.Interpolator(self.xs, self.ys, self.interpolation, self.extrapolation)
+            self.__prepared = (snapshot, interpolator)
+        return self.__prepared[1]
+
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Bands",
+                self.xs.dtype.str, self.xs.tobytes(),
+                self.ys.dtype.str, self.ys.tobytes(),
+                self.interpolation, self.extrapolation)
 
     def invert_transform(self):
         """Creates a copy of the term, with the lowpass-to-highpass-transform inverted.
@@ -620,3 +850,89 @@ class Bands(Term):
                 "ys": ys,
                 "interpolation": int(self.interpolation),
                 "extrapolation": int(self.extrapolation)}
+
+
+class StackedBands:
+    """Evaluates multiple :class:`~sumpf._data._filters._base._terms._primitive.Bands`
+    terms, which share their supporting x values and interpolation flags, with
+    one vectorized interpolation, rather than interpolating them one by one.
+    This is used by the filter classes to sample filter banks with many channels.
+
+    The results are identical to those of evaluating the terms individually.
+    """
+
+    @staticmethod
+    def find(terms):
+        """Searches the given terms for groups of :class:`~sumpf._data._filters._base._terms._primitive.Bands`
+        terms, that can be evaluated together.
+
+        :param terms: a sequence of terms, e.g. the transfer functions of a filter
+        :returns: a tuple of :class:`StackedBands` instances with at least two terms each
+        """
+        groups = {}
+        for i, term in enumerate(terms):
+            if isinstance(term, Bands) and term.xs.ndim == 1 and term.ys.shape == term.xs.shape:
+                key = (term.xs.dtype.str, term.xs.tobytes(),
+                       term.ys.dtype.str,
+                       term.interpolation, term.extrapolation)
+                groups.setdefault(key, []).append(i)
+        return tuple(StackedBands(indices, tuple(terms[i] for i in indices))
+                     for indices in groups.values()
+                     if len(indices) > 1)
+
+    def __init__(self, indices, terms):
+        """
+        :param indices: a sequence of the integer indices of the terms in the filter
+        :param terms: a sequence of :class:`~sumpf._data._filters._base._terms._primitive.Bands`
+                      terms with the same supporting x values and interpolation flags
+        """
+        self.__indices = tuple(indices)
+        self.__terms = tuple(terms)
+        self.__snapshots = tuple(_snapshot(t) for t in self.__terms)
+        self.__interpolator = None
+
+    def indices(self):
+        """Returns the indices of the stacked terms in the filter.
+
+        :returns: a tuple of integers
+        """
+        return self.__indices
+
+    def is_valid(self):
+        """Returns, whether the supporting points and the interpolation flags of
+        the stacked terms have remained unchanged since the stack has been created.
+        This includes in-place modifications of the supporting points' arrays.
+
+        :returns: True or False
+        """
+        return self.__snapshots == tuple(_snapshot(t) for t in self.__terms)
+
+    def __call__(self, s):
+        """Evaluates the stacked terms.
+
+        :param s: an :class:`sumpf._data._filters._base._s.S` instance
+        :returns: a :func:`numpy.array` with one row of complex values for each term
+        """
+        if self.__interpolator is None:
+            term = self.__terms[0]
+            ys = numpy.stack([t.ys for t in self.__terms])
+            self.__interpolator = sumpf_internal.interpolation.Interpolator(xs=term.xs,
+                                                                            ys=ys,
+                                                                            interpolation=term.interpolation,
+                                                                            extrapolation=term.extrapolation)
+        f = s.frequencies()
+        out = numpy.empty(shape=(len(self.__terms),) + numpy.shape(f), dtype=numpy.complex128)
+        return self.__interpolator(f, out=out)
+
+
+def _snapshot(term):
+    """Returns a hashable representation of the supporting points and the interpolation
+    flags of a :class:`Bands` term, which captures the contents of the arrays rather
+    than their identity, so that in-place modifications can be detected.
+
+    :param term: a :class:`Bands` instance
+    :returns: a tuple
+    """
+    return (term.xs.dtype.str, term.xs.shape, term.xs.tobytes(),
+            term.ys.dtype.str, term.ys.shape, term.ys.tobytes(),
+            term.interpolation, term.extrapolation)
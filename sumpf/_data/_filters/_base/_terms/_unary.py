@@ -17,7 +17,7 @@
 """Contains the classes for terms, that wrap other terms."""
 
 import numpy
-from ._base import Term
+from ._base import Term, as_function_of_s, combine_zero_pole_gains
 
 __all__ = ("Absolute", "Negative")
 
@@ -83,6 +83,27 @@ class Absolute(Term):
                                                                                 value=self.value,
                                                                                 transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Absolute", self.transform, self.value.structure())
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return (self.value,)
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operand has been compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return Absolute(value=self.value.compile(), transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if not isinstance(other, Absolute):
@@ -167,6 +188,51 @@ class Negative(Term):
                                                                                 value=self.value,
                                                                                 transform=self.transform)
 
+    def structure(self):
+        """Returns a hashable representation of the term's structure.
+
+        :returns: a tuple
+        """
+        return ("Negative", self.transform, self.value.structure())
+
+    def operands(self):
+        """Returns the terms, from which this term is composed.
+
+        :returns: a tuple of terms
+        """
+        return (self.value,)
+
+    def _zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term, if the negated
+        term is a rational function of the frequency variable.
+
+        :returns: a tuple ``(gain, zeros, poles, transform)`` or None
+        """
+        value = self.value._zero_pole_gain()    # pylint: disable=protected-access; the method is protected to hide it from the public interface of the terms
+        if value is None:
+            return None
+        gain, zeros, poles, transform = combine_zero_pole_gains((value,), transform=self.transform)
+        return -gain, zeros, poles, transform
+
+    def zero_pole_gain(self):
+        """Returns a zero-pole-gain representation of the term as a rational function
+        of ``s = 2j * pi * f``, if the negated term is a rational function.
+
+        :returns: a tuple ``(gain, zeros, poles)`` or None
+        """
+        value = self.value.zero_pole_gain()
+        if value is None:
+            return None
+        gain, zeros, poles, _ = as_function_of_s(combine_zero_pole_gains((value + (False,),), transform=self.transform))
+        return -gain, zeros, poles
+
+    def _compile_operands(self):
+        """Creates a copy of the term, in which the operand has been compiled.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        return Negative(value=self.value.compile(), transform=self.transform)
+
     def __eq__(self, other):
         """An operator overload for comparing two terms with ``==``."""
         if not isinstance(other, Negative):
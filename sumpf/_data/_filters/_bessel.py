@@ -16,27 +16,42 @@
 
 """Contains the class for a Bessel filter."""
 
+import functools
 import math
-from ._base import frequency_scaling, RolloffFilter
+from ._base import frequency_scaling, scale_coefficients, RolloffFilter
 
 __all__ = ("BesselFilter",)
 
 
-def bessel(cutoff_frequency, order, highpass):
-    """A helper function for creating the transfer function of a Bessel filter.
+@functools.lru_cache(maxsize=256)
+def bessel_prototype(order):
+    """Computes the coefficients of the denominator polynomial of a normalized
+    Bessel lowpass, so that only the frequency scaling has to be applied, when
+    a filter with the same order is created again.
 
-    :param cutoff_frequency: the cutoff frequency of the filter in Hz
     :param order: the filter order as an integer
-    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    :returns: a tuple of coefficients, which are sorted from the highest to the
+              lowest power of the frequency variable
     """
-    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
     coefficients = []
     c0 = math.factorial(2 * order) // (2 ** order * math.factorial(order))
     for i in range(order, 0, -1):
         oi = order - i
         c = math.factorial(order + oi) // (2 ** oi * math.factorial(i) * math.factorial(oi))
-        coefficients.append(c / c0 * k ** i)
+        coefficients.append(c / c0)
     coefficients.append(1.0)
+    return tuple(coefficients)
+
+
+def bessel(cutoff_frequency, order, highpass):
+    """A helper function for creating the transfer function of a Bessel filter.
+
+    :param cutoff_frequency: the cutoff frequency of the filter in Hz
+    :param order: the filter order as an integer
+    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    """
+    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
+    coefficients = list(scale_coefficients(bessel_prototype(order), k))
     return BesselFilter.Constant(1.0) / BesselFilter.Polynomial(coefficients, transform=highpass)
 
 
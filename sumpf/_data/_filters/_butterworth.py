@@ -16,31 +16,46 @@
 
 """Contains the class for a Butterworth filter."""
 
+import functools
 import math
-from ._base import frequency_scaling, RolloffFilter
+from ._base import frequency_scaling, scale_coefficients, RolloffFilter
 
 __all__ = ("ButterworthFilter",)
 
 
-def butterworth(cutoff_frequency, order, highpass):
-    """A helper function for creating the transfer function of a Butterworth filter.
+@functools.lru_cache(maxsize=256)
+def butterworth_prototype(order):
+    """Computes the coefficients of the second order factors of a normalized
+    Butterworth lowpass, so that only the frequency scaling has to be applied,
+    when a filter with the same order is created again.
 
-    :param cutoff_frequency: the cutoff frequency of the filter in Hz
     :param order: the filter order as an integer
-    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    :returns: a tuple with a tuple of coefficients for each factor, which are sorted
+              from the highest to the lowest power of the frequency variable
     """
-    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
-    k2 = k ** 2
     factors = []
     if order % 2 == 0:
         for i in range(1, order // 2 + 1):
             b1 = 2.0 * math.cos((2 * i - 1) * math.pi / (2 * order))
-            factors.append(ButterworthFilter.Polynomial((k2, b1 * k, 1.0)))
+            factors.append((1.0, b1, 1.0))
     else:
-        factors.append(ButterworthFilter.Polynomial((k, 1.0)))
+        factors.append((1.0, 1.0))
         for i in range(2, (order + 1) // 2 + 1):
             b1 = 2.0 * math.cos((i - 1) * math.pi / order)
-            factors.append(ButterworthFilter.Polynomial((k2, b1 * k, 1.0)))
+            factors.append((1.0, b1, 1.0))
+    return tuple(factors)
+
+
+def butterworth(cutoff_frequency, order, highpass):
+    """A helper function for creating the transfer function of a Butterworth filter.
+
+    :param cutoff_frequency: the cutoff frequency of the filter in Hz
+    :param order: the filter order as an integer
+    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    """
+    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
+    factors = [ButterworthFilter.Polynomial(scale_coefficients(coefficients, k))
+               for coefficients in butterworth_prototype(order)]
     return ~ButterworthFilter.Product(factors=factors, transform=highpass)
 
 
@@ -16,79 +16,117 @@
 
 """Contains the classes for Chebyshev filters."""
 
+import functools
 import math
 import cmath
-from ._base import frequency_scaling, RolloffFilter
+from ._base import frequency_scaling, scale_coefficients, RolloffFilter
 from ._butterworth import butterworth
 
 __all__ = ("Chebyshev1Filter", "Chebyshev2Filter")
 
 
-def chebyshev1(cutoff_frequency, ripple, order, highpass):
-    """A helper function for creating the transfer function of a Chebyshev Type 1 filter.
+@functools.lru_cache(maxsize=256)
+def chebyshev1_prototype(ripple, order):
+    """Computes the coefficients of the second order factors of a normalized
+    Chebyshev Type 1 lowpass, so that only the frequency scaling has to be applied,
+    when a filter with the same ripple and order is created again.
 
-    :param cutoff_frequency: the cutoff frequency of the filter in Hz
     :param ripple: the allowed pass band ripple in dB
     :param order: the filter order as an integer
-    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    :returns: a tuple with a tuple of coefficients for each factor, which are sorted
+              from the highest to the lowest power of the frequency variable
     """
-    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
-    k2 = k ** 2
     factors = []
     # pre-compute coefficients
     g = math.asinh(1.0 / math.sqrt(10.0 ** (abs(ripple) / 10.0) - 1.0)) / order
     sinhg = math.sinh(g)
     cosh2g = math.cosh(g) ** 2
-    # generate the transfer function
+    # compute the coefficients of the factors
     if order % 2 == 0:
         pb2o = math.pi / (2 * order)
         for i in range(1, order // 2 + 1):
             a2 = 1.0 / (cosh2g - (math.cos((2 * i - 1) * pb2o) ** 2))
             a1 = 2.0 * a2 * sinhg * math.cos((2 * i - 1) * pb2o)
-            factors.append(Chebyshev1Filter.Polynomial((a2 * k2, a1 * k, 1.0)))
+            factors.append((a2, a1, 1.0))
     else:
         pbo = math.pi / order
         a1 = 1.0 / sinhg
-        factors.append(Chebyshev1Filter.Polynomial((a1 * k, 1.0)))
+        factors.append((a1, 1.0))
         for i in range(2, (order + 1) // 2 + 1):
             a2 = 1.0 / (cosh2g - (math.cos((i - 1) * pbo) ** 2))
             a1 = 2.0 * a2 * sinhg * math.cos((i - 1) * pbo)
-            factors.append(Chebyshev1Filter.Polynomial((a2 * k2, a1 * k, 1.0)))
-    return ~Chebyshev1Filter.Product(factors=factors, transform=highpass)
+            factors.append((a2, a1, 1.0))
+    return tuple(factors)
 
 
-def chebyshev2(cutoff_frequency, ripple, order, highpass):
-    """A helper function for creating the transfer function of a Chebyshev Type 2 filter.
+def chebyshev1(cutoff_frequency, ripple, order, highpass):
+    """A helper function for creating the transfer function of a Chebyshev Type 1 filter.
 
     :param cutoff_frequency: the cutoff frequency of the filter in Hz
-    :param ripple: the attenuation of the ripple in the stop band in dB
+    :param ripple: the allowed pass band ripple in dB
     :param order: the filter order as an integer
     :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
     """
     k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
-    factors = []
+    factors = [Chebyshev1Filter.Polynomial(scale_coefficients(coefficients, k))
+               for coefficients in chebyshev1_prototype(ripple=ripple, order=order)]
+    return ~Chebyshev1Filter.Product(factors=factors, transform=highpass)
+
+
+@functools.lru_cache(maxsize=256)
+def chebyshev2_prototype(ripple, order):
+    """Computes the poles and zeros of a normalized Chebyshev Type 2 lowpass, so
+    that only the frequency scaling has to be applied, when a filter with the
+    same ripple and order is created again.
+
+    :param ripple: the attenuation of the ripple in the stop band in dB
+    :param order: the filter order as an integer
+    :returns: a tuple ``(a1, roots)``, where ``a1`` is the coefficient of the first
+              order factor of odd order filters or None for even order filters,
+              and ``roots`` is a tuple of ``(pole, zero)`` pairs for the second
+              order factors
+    """
     # pre-compute coefficients
     l = 10.0 ** (abs(ripple) / 20.0)
     g = math.asinh(math.sqrt(l ** 2 - 1.0)) / order
     sinhg = math.sinh(g)
     coshgj = 1j * math.cosh(g)
     pb2o = math.pi / (2 * order)
-    # generate the transfer function
+    # compute the poles and zeros
     if order % 2 == 0:
         start = 1
+        a1 = None
     else:
         start = 2
-        a1 = sinhg * k
-        factors.append(Chebyshev2Filter.Constant(1.0) / Chebyshev2Filter.Polynomial((a1, 1.0)))
+        a1 = sinhg
+    roots = []
     for i in range(start, order, 2):
-        # poles
         w = -cmath.exp(1j * i * pb2o)
-        p = 1.0 / (sinhg * w.real + coshgj * w.imag) / k
+        roots.append((1.0 / (sinhg * w.real + coshgj * w.imag), 1j / math.sin(i * pb2o)))
+    return a1, tuple(roots)
+
+
+def chebyshev2(cutoff_frequency, ripple, order, highpass):
+    """A helper function for creating the transfer function of a Chebyshev Type 2 filter.
+
+    :param cutoff_frequency: the cutoff frequency of the filter in Hz
+    :param ripple: the attenuation of the ripple in the stop band in dB
+    :param order: the filter order as an integer
+    :param highpass: True, if a lowpass-to-highpass-transformation shall be done, False otherwise
+    """
+    k = frequency_scaling(cutoff_frequency=cutoff_frequency, highpass=highpass)
+    factors = []
+    a1, roots = chebyshev2_prototype(ripple=ripple, order=order)
+    if a1 is not None:
+        factors.append(Chebyshev2Filter.Constant(1.0) / Chebyshev2Filter.Polynomial((a1 * k, 1.0)))
+    for pole, zero in roots:
+        # poles
+        p = pole / k
         a0 = abs(p) ** 2
         a1 = -2 * p.real / a0
         a2 = 1.0 / a0
         # zeros
-        z = 1j / math.sin(i * pb2o) / k
+        z = zero / k
         b0 = abs(z) ** 2
         b1 = (2 * z.real) / b0
         b2 = 1.0 / b0
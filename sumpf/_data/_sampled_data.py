@@ -16,6 +16,7 @@
 
 """Contains the base container class for sampled data (e.g. signals and spectrums)"""
 
+import copy
 import numpy
 import sumpf._internal as sumpf_internal
 
@@ -23,11 +24,18 @@ import sumpf._internal as sumpf_internal
 class SampledData:
     """Base class for data containers with channels of sampled data and labels."""
 
-    def __init__(self, channels, labels):
+    def __init__(self, channels, labels, dtype=None):
         """
         :param channels: a two-dimensional :func:`numpy.array`
         :param labels: a sequence of string labels for the channels
+        :param dtype: the dtype of the channels. If None, the channels are stored
+                      as they are, otherwise they are converted to the given dtype,
+                      if necessary.
         """
+        if dtype is not None and channels.dtype != dtype:
+            converted = sumpf_internal.allocate_array(shape=channels.shape, dtype=dtype)
+            converted[:] = channels
+            channels = converted
         self._channels = channels
         self._labels = sumpf_internal.sanitize_labels(labels=labels, number=len(channels))
         self._length = channels.shape[-1]   # the number of samples per channel
@@ -63,6 +71,25 @@ class SampledData:
                      tuple(self._channels.flat),
                      self._labels))
 
+    def __deepcopy__(self, memo):
+        """Support for the :mod:`copy` module, which copies the samples to a new
+        array, so that the copy does not share its memory with this object, even
+        if the channels are stored in a named segment of shared memory.
+
+        :param memo: the memo dictionary of the :func:`copy.deepcopy` function
+        :returns: a copy of this object
+        """
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for name, value in self.__dict__.items():
+            if name == "_channels":
+                channels = sumpf_internal.allocate_array(shape=value.shape, dtype=value.dtype)
+                channels[:] = value
+                setattr(result, name, channels)
+            else:
+                setattr(result, name, copy.deepcopy(value, memo))
+        return result
+
     ####################################
     # overloaded binary math operators #
     ####################################
@@ -158,6 +185,16 @@ class SampledData:
     # derived parameters #
     ######################
 
+    def dtype(self):
+        """Returns the dtype of the channels array. The precision of the data set's
+        samples is kept by the computations with it, so that for example the
+        Fourier transform of a signal with ``numpy.float32`` samples has ``numpy.complex64``
+        samples.
+
+        :returns: a :class:`numpy.dtype` instance
+        """
+        return self._channels.dtype
+
     def length(self):
         """Returns the number of samples per channel.
 
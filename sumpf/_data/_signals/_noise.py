@@ -16,6 +16,10 @@
 
 """Contains classes for signals with random noise."""
 
+import collections
+import concurrent.futures
+import itertools
+import math
 import numpy
 import sumpf._internal as sumpf_internal
 from ._signal import Signal
@@ -23,7 +27,10 @@ from ._signal import Signal
 __all__ = ("UniformNoise", "GaussianNoise", "PoissonNoise", "LaplaceNoise",
            "VonMisesNoise", "TriangularNoise", "GeometricNoise", "HypergeometricNoise",
            "BinomialNoise", "BetaNoise", "GammaNoise", "LogarithmicNoise",
-           "LogisticNoise", "LomaxNoise", "WaldNoise", "ChiSquareNoise")
+           "LogisticNoise", "LomaxNoise", "WaldNoise", "ChiSquareNoise",
+           "ColoredNoise", "NoiseStream")
+
+_COLORS = {0.0: "White noise", 1.0: "Pink noise", 2.0: "Brown noise", -1.0: "Blue noise", -2.0: "Violet noise"}
 
 ##############
 # Base class #
@@ -41,13 +48,14 @@ class Noise(Signal):
         """
         self.__seed = seed
         channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
-        channels[0, :] = self._function(length)
+        channels[0, :] = self._function(numpy.random.default_rng(seed), length)
         Signal.__init__(self, channels=channels, sampling_rate=sampling_rate, offset=0, labels=(label,))
 
-    def _function(self, length):
+    def _function(self, random, length):
         """An abstract method, in which derived classes shall implement the generation
         of the noise signal.
 
+        :param random: the :class:`numpy.random.Generator`, from which the samples shall be drawn
         :param length: the length of the signal as an integer number of samples
         :returns: the noise signal in a one-dimensional :func:`numpy.array`
         """
@@ -83,11 +91,10 @@ class UniformNoise(Noise):
         """
         self.__lower_boundary = lower_boundary
         self.__upper_boundary = upper_boundary
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Uniform noise")
 
-    def _function(self, length):
-        return self.__random.uniform(low=self.__lower_boundary, high=self.__upper_boundary, size=length)
+    def _function(self, random, length):
+        return random.uniform(low=self.__lower_boundary, high=self.__upper_boundary, size=length)
 
 
 class GaussianNoise(Noise):
@@ -106,11 +113,10 @@ class GaussianNoise(Noise):
         """
         self.__mean = mean
         self.__standard_deviation = standard_deviation
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Gaussian noise")
 
-    def _function(self, length):
-        return self.__random.normal(loc=self.__mean, scale=self.__standard_deviation, size=length)
+    def _function(self, random, length):
+        return random.normal(loc=self.__mean, scale=self.__standard_deviation, size=length)
 
 
 class PoissonNoise(Noise):
@@ -128,11 +134,10 @@ class PoissonNoise(Noise):
         :param length: the number of samples of the noise signal
         """
         self.__lambda = lambda_
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Poisson noise")
 
-    def _function(self, length):
-        return self.__random.poisson(lam=self.__lambda, size=length)
+    def _function(self, random, length):
+        return random.poisson(lam=self.__lambda, size=length)
 
 
 class LaplaceNoise(Noise):
@@ -152,11 +157,10 @@ class LaplaceNoise(Noise):
         """
         self.__mean = mean
         self.__decay = decay
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Laplace noise")
 
-    def _function(self, length):
-        return self.__random.laplace(loc=self.__mean, scale=self.__decay, size=length)
+    def _function(self, random, length):
+        return random.laplace(loc=self.__mean, scale=self.__decay, size=length)
 
 
 class VonMisesNoise(Noise):
@@ -175,11 +179,10 @@ class VonMisesNoise(Noise):
         """
         self.__mode = mode
         self.__dispersion = dispersion
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "von Mises noise")
 
-    def _function(self, length):
-        return self.__random.vonmises(mu=self.__mode, kappa=self.__dispersion, size=length)
+    def _function(self, random, length):
+        return random.vonmises(mu=self.__mode, kappa=self.__dispersion, size=length)
 
 
 class TriangularNoise(Noise):
@@ -205,14 +208,13 @@ class TriangularNoise(Noise):
             self.__mode = (lower_boundary + upper_boundary) / 2.0
         else:
             self.__mode = mode
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Triangular noise")
 
-    def _function(self, length):
-        return self.__random.triangular(left=self.__lower_boundary,
-                                        mode=self.__mode,
-                                        right=self.__upper_boundary,
-                                        size=length)
+    def _function(self, random, length):
+        return random.triangular(left=self.__lower_boundary,
+                                 mode=self.__mode,
+                                 right=self.__upper_boundary,
+                                 size=length)
 
 
 class GeometricNoise(Noise):
@@ -229,11 +231,10 @@ class GeometricNoise(Noise):
         :param length: the number of samples of the noise signal
         """
         self.__p = p
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Geometric noise")
 
-    def _function(self, length):
-        return self.__random.geometric(p=self.__p, size=length)
+    def _function(self, random, length):
+        return random.geometric(p=self.__p, size=length)
 
 
 class HypergeometricNoise(Noise):
@@ -259,14 +260,13 @@ class HypergeometricNoise(Noise):
         self.__acceptable = acceptable
         self.__non_acceptable = non_acceptable
         self.__draws = draws
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Hypergeometric noise")
 
-    def _function(self, length):
-        return self.__random.hypergeometric(ngood=self.__acceptable,
-                                            nbad=self.__non_acceptable,
-                                            nsample=self.__draws,
-                                            size=length)
+    def _function(self, random, length):
+        return random.hypergeometric(ngood=self.__acceptable,
+                                     nbad=self.__non_acceptable,
+                                     nsample=self.__draws,
+                                     size=length)
 
 
 class BinomialNoise(Noise):
@@ -285,11 +285,10 @@ class BinomialNoise(Noise):
         """
         self.__p = p
         self.__draws = draws
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Binomial noise")
 
-    def _function(self, length):
-        return self.__random.binomial(n=self.__draws, p=self.__p, size=length)
+    def _function(self, random, length):
+        return random.binomial(n=self.__draws, p=self.__p, size=length)
 
 
 class BetaNoise(Noise):
@@ -308,11 +307,10 @@ class BetaNoise(Noise):
         """
         self.__alpha = alpha
         self.__beta = beta
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Beta noise")
 
-    def _function(self, length):
-        return self.__random.beta(a=self.__alpha, b=self.__beta, size=length)
+    def _function(self, random, length):
+        return random.beta(a=self.__alpha, b=self.__beta, size=length)
 
 
 class GammaNoise(Noise):
@@ -331,11 +329,10 @@ class GammaNoise(Noise):
         """
         self.__shape = shape
         self.__scale = scale
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Gamma noise")
 
-    def _function(self, length):
-        return self.__random.gamma(shape=self.__shape, scale=self.__scale, size=length)
+    def _function(self, random, length):
+        return random.gamma(shape=self.__shape, scale=self.__scale, size=length)
 
 
 class LogarithmicNoise(Noise):
@@ -352,11 +349,10 @@ class LogarithmicNoise(Noise):
         :param length: the number of samples of the noise signal
         """
         self.__p = p
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Logarithmic noise")
 
-    def _function(self, length):
-        return self.__random.logseries(p=self.__p, size=length)
+    def _function(self, random, length):
+        return random.logseries(p=self.__p, size=length)
 
 
 class LogisticNoise(Noise):
@@ -375,11 +371,10 @@ class LogisticNoise(Noise):
         """
         self.__mean = mean
         self.__scale = scale
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Logistic noise")
 
-    def _function(self, length):
-        return self.__random.logistic(loc=self.__mean, scale=self.__scale, size=length)
+    def _function(self, random, length):
+        return random.logistic(loc=self.__mean, scale=self.__scale, size=length)
 
 
 class LomaxNoise(Noise):
@@ -396,11 +391,10 @@ class LomaxNoise(Noise):
         :param length: the number of samples of the noise signal
         """
         self.__shape = shape
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Lomax noise")
 
-    def _function(self, length):
-        return self.__random.pareto(a=self.__shape, size=length)
+    def _function(self, random, length):
+        return random.pareto(a=self.__shape, size=length)
 
 
 class WaldNoise(Noise):
@@ -419,11 +413,10 @@ class WaldNoise(Noise):
         """
         self.__mean = mean
         self.__scale = scale
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Wald noise")
 
-    def _function(self, length):
-        return self.__random.wald(mean=self.__mean, scale=self.__scale, size=length)
+    def _function(self, random, length):
+        return random.wald(mean=self.__mean, scale=self.__scale, size=length)
 
 
 class ChiSquareNoise(Noise):
@@ -442,9 +435,270 @@ class ChiSquareNoise(Noise):
         :param length: the number of samples of the noise signal
         """
         self.__degrees_of_freedom = degrees_of_freedom
-        self.__random = numpy.random.default_rng(seed)
         Noise.__init__(self, seed, sampling_rate, length, "Chi-square noise")
 
-    def _function(self, length):
-        return self.__random.chisquare(df=self.__degrees_of_freedom,
-                                       size=length)
+    def _function(self, random, length):
+        return random.chisquare(df=self.__degrees_of_freedom,
+                                size=length)
+
+#################
+# Colored noise #
+#################
+
+
+class ColoredNoise(Noise):
+    """A signal with noise, whose power spectral density follows a power law
+    like pink or brown noise or the magnitude of a given filter.
+
+    The noise is synthesized in the frequency domain with one inverse FFT. Its
+    spectrum has the magnitude of the power law or the filter and random phases,
+    which are drawn from a uniform distribution. The spectrum is scaled, so that
+    the noise is equivalent to white noise with a variance of one, that has been
+    filtered with the given filter or with a filter, whose magnitude follows the
+    power law and is one at 1kHz. Since the magnitude of the spectrum is not
+    random, the noise is periodic with its length. When the noise is generated
+    block by block with a :class:`~sumpf.NoiseStream`, the blocks should therefore
+    be crossfaded.
+    """
+
+    def __init__(self, exponent=1.0, filter_=None, seed=None, sampling_rate=48000.0, length=2 ** 16):
+        """
+        :param exponent: the exponent ``a`` of the power law ``1 / f ** a`` for the
+                         power spectral density, e.g. 1 for pink noise, 2 for brown
+                         noise or -1 for blue noise. The magnitude at 0Hz is zero.
+        :param filter_: an optional :class:`~sumpf.Filter` like :class:`~sumpf.Bands`,
+                        whose first transfer function defines the magnitude of
+                        the noise's spectrum. If this is given, the exponent is ignored.
+        :param seed: if seed is not None, the random number generator of the
+                     instance is seeded with the given seed, so that the generated
+                     noise signal is reproducible
+        :param sampling_rate: the sampling rate of the resulting signal in Hz as
+                              an integer or a float
+        :param length: the number of samples of the noise signal
+        """
+        self.__exponent = exponent
+        self.__filter = filter_
+        self.__sampling_rate = sampling_rate
+        self.__magnitude = (None, None)     # the length and the magnitude of the last synthesized noise
+        if filter_ is None:
+            label = _COLORS.get(exponent, "Colored noise")
+        else:
+            label = "Colored noise"
+        Noise.__init__(self, seed, sampling_rate, length, label)
+
+    def _function(self, random, length):
+        if length == 0:
+            return numpy.empty(0)
+        spectrum = self.__spectrum(length) * numpy.exp(1j * random.uniform(0.0, 2.0 * math.pi, size=length // 2 + 1))
+        # the samples at 0Hz and at the Nyquist frequency have to be real
+        real = [0, -1] if length % 2 == 0 else [0]
+        spectrum[real] = numpy.abs(spectrum[real]) * numpy.where(spectrum[real].real < 0.0, -1.0, 1.0)
+        return sumpf_internal.irfft(spectrum, n=length)
+
+    def __spectrum(self, length):
+        """Computes the magnitude of the spectrum of a noise signal of the given length.
+
+        :param length: the number of samples of the noise signal
+        :returns: a real valued array
+        """
+        cached_length, magnitude = self.__magnitude
+        if cached_length != length:
+            frequencies = numpy.fft.rfftfreq(length, 1.0 / self.__sampling_rate)
+            if self.__filter is None:
+                magnitude = numpy.zeros(len(frequencies))
+                magnitude[1:] = (frequencies[1:] / 1000.0) ** (-self.__exponent / 2.0)
+            else:
+                magnitude = numpy.abs(self.__filter(frequencies)[0])
+            magnitude *= math.sqrt(length)
+            self.__magnitude = (length, magnitude)
+        return magnitude
+
+
+###########
+# Streams #
+###########
+
+
+class NoiseStream:
+    """Generates a noise signal of arbitrary duration with an arbitrary number
+    of channels block by block.
+
+    The samples are drawn from the distribution of a given noise signal instance
+    like :class:`~sumpf.GaussianNoise`. Each block of each channel is drawn from
+    its own random number generator, which is seeded with a sub-sequence, that is
+    derived from the stream's seed like with :meth:`numpy.random.SeedSequence.spawn`.
+    This way, the channels are statistically independent and the blocks can be
+    generated in arbitrary order and in parallel threads. The generated samples
+    only depend on the seed and the block length, so that the output is identical,
+    no matter how many threads are used.
+
+    Noise, that is synthesized in the frequency domain like :class:`~sumpf.ColoredNoise`,
+    is periodic with the length of a block, so that the blocks do not continue
+    each other smoothly. For such noise, the stream can crossfade the blocks.
+    For this, each block is generated with additional samples at its end, which
+    are faded out, while the beginning of the next block is faded in. The fades
+    are power complementary, so that the variance of zero mean noise is preserved
+    during the crossfade.
+
+    For the block ``k`` of the channel ``c``, the samples are drawn from
+    ``numpy.random.default_rng(numpy.random.SeedSequence(seed).spawn(c + 1)[c].spawn(k + 1)[k])``.
+    """
+
+    def __init__(self, noise, number_of_channels=1, block_length=2 ** 16, crossfade=0, threads=1):
+        """
+        :param noise: an instance of a noise signal class like :class:`~sumpf.GaussianNoise`,
+                      which defines the distribution, the seed, the sampling rate
+                      and the label of the stream. Since only its parameters are
+                      used, it can be instantiated with a length of zero. If its
+                      seed is None, the stream is seeded with fresh entropy from
+                      the operating system.
+        :param number_of_channels: the number of independent channels, that shall be generated
+        :param block_length: the number of samples per block
+        :param crossfade: the number of samples, over which consecutive blocks
+                          are crossfaded. This must not be longer than the blocks.
+        :param threads: the number of threads, in which the channels and the upcoming
+                        blocks are generated in parallel
+        """
+        if crossfade > block_length:
+            raise ValueError(f"The crossfade ({crossfade} samples) must not be longer than the blocks ({block_length} samples)")
+        seed = noise.seed()
+        self.__noise = noise
+        self.__seed = seed if isinstance(seed, numpy.random.SeedSequence) else numpy.random.SeedSequence(seed)
+        self.__number_of_channels = number_of_channels
+        self.__block_length = block_length
+        self.__crossfade = crossfade
+        self.__threads = threads
+
+    def __iter__(self):
+        """Iterates over the blocks of the stream, starting with the first block.
+
+        :returns: an infinite iterator of :class:`~sumpf.Signal` instances
+        """
+        return self.blocks()
+
+    def block(self, index):
+        """Generates a single block of the stream.
+
+        :param index: the integer index of the block
+        :returns: a :class:`~sumpf.Signal`, whose offset is the index of the block's first sample in the stream
+        """
+        return next(self.blocks(start=index, stop=index + 1))
+
+    def blocks(self, start=0, stop=None):
+        """Generates the blocks of the stream lazily. If the stream has been created
+        with more than one thread, the upcoming blocks are generated in the background,
+        while the current block is being processed.
+
+        :param start: the integer index of the first block
+        :param stop: the index after the last block or None for an infinite sequence of blocks
+        :returns: a generator, that yields :class:`~sumpf.Signal` instances, whose
+                  offsets are the indices of their first sample in the stream
+        """
+        length, crossfade = self.__block_length, self.__crossfade
+        if crossfade and start > 0:
+            # the previous block is generated as well, because its end is crossfaded with the first block
+            segments = self.__segments(start - 1, stop)
+            previous = next(segments, None)
+            if previous is None:    # the range of blocks is empty
+                return
+        else:
+            segments = self.__segments(start, stop)
+            previous = None
+        if crossfade:
+            phase = numpy.pi / 2.0 * (numpy.arange(crossfade) + 0.5) / crossfade
+            fade_in, fade_out = numpy.sin(phase), numpy.cos(phase)
+        for index, segment in zip(itertools.count(start), segments):
+            if crossfade:
+                channels = segment[:, 0:length].copy()
+                if previous is not None:
+                    channels[:, 0:crossfade] *= fade_in
+                    channels[:, 0:crossfade] += previous[:, length:] * fade_out
+                previous = segment
+            else:
+                channels = segment
+            yield Signal(channels=channels,
+                         sampling_rate=self.__noise.sampling_rate(),
+                         offset=index * length,
+                         labels=self.__noise.labels() * self.__number_of_channels)
+
+    def seed(self):
+        """Returns the seed, with which the stream can be reproduced. If the stream
+        has been created from a noise signal, whose seed is None, this is the fresh
+        entropy, with which the stream has been seeded.
+
+        :returns: the seed object
+        """
+        return self.__seed.entropy
+
+    def sampling_rate(self):
+        """Returns the sampling rate of the stream.
+
+        :returns: the sampling rate in Hz as an integer or a float
+        """
+        return self.__noise.sampling_rate()
+
+    def number_of_channels(self):
+        """Returns the number of channels of the stream's blocks.
+
+        :returns: an integer
+        """
+        return self.__number_of_channels
+
+    def block_length(self):
+        """Returns the number of samples per block.
+
+        :returns: an integer
+        """
+        return self.__block_length
+
+    def __segments(self, start, stop):
+        """Generates the samples of the blocks including the samples for the crossfade.
+
+        :param start: the integer index of the first block
+        :param stop: the index after the last block or None for an infinite sequence of blocks
+        :returns: a generator, that yields two dimensional arrays
+        """
+        indices = itertools.count(start) if stop is None else range(start, stop)
+        shape = (self.__number_of_channels, self.__block_length + self.__crossfade)
+        if self.__threads <= 1:
+            for index in indices:
+                segment = sumpf_internal.allocate_array(shape=shape, dtype=numpy.float64)
+                for channel in range(self.__number_of_channels):
+                    self.__generate(segment, index, channel)
+                yield segment
+        else:
+            look_ahead = -(-self.__threads // self.__number_of_channels)    # the number of blocks, that have to be submitted to keep all threads busy
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.__threads) as executor:
+                pending = collections.deque()
+                for index in indices:
+                    segment = sumpf_internal.allocate_array(shape=shape, dtype=numpy.float64)
+                    futures = [executor.submit(self.__generate, segment, index, c) for c in range(self.__number_of_channels)]
+                    pending.append((segment, futures))
+                    if len(pending) > look_ahead:
+                        yield self.__finish(*pending.popleft())
+                while pending:
+                    yield self.__finish(*pending.popleft())
+
+    def __generate(self, segment, index, channel):
+        """Draws the samples of one channel of a block.
+
+        :param segment: the array, in which the samples shall be written
+        :param index: the index of the block
+        :param channel: the index of the channel
+        """
+        seed = numpy.random.SeedSequence(self.__seed.entropy,
+                                         spawn_key=self.__seed.spawn_key + (channel, index),
+                                         pool_size=self.__seed.pool_size)
+        segment[channel] = self.__noise._function(numpy.random.default_rng(seed), segment.shape[1])   # pylint: disable=protected-access; the stream uses the distribution of the noise signal instance
+
+    @staticmethod
+    def __finish(segment, futures):
+        """Waits for the threads, which generate the channels of a block.
+
+        :param segment: the array with the samples of the block
+        :param futures: the futures of the threads, that generate the block's channels
+        :returns: the array with the samples
+        """
+        for f in futures:
+            f.result()
+        return segment
@@ -73,13 +73,21 @@ class Signal(SampledData):
     * Rededicated operators (operators, for which Python has intended a different function than for what it is used in the :class:`~sumpf.Signal` class)
        * inverting the signal with ``~signal``. The inverse of a signal is computed
          as a division in the frequency domain: ``iFFT(1 / FFT(signal))``.
+
+    The precision of the signal's samples is defined by the dtype of its channels.
+    The computations with the signal keep this precision, so that for example a
+    signal with ``numpy.float32`` samples is transformed to a spectrum with ``numpy.complex64``
+    samples. Arrays and numbers, that are combined with the signal, are cast to
+    the signal's precision, while computations with two signals of different
+    precisions result in the higher precision.
     """
 
     file_formats = sumpf_internal.signal_writers.Formats    #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Signal.save` (see the :class:`sumpf._internal._signal_writers.Formats` class).
     convolution_modes = sumpf_internal.ConvolutionMode      #: an enumeration with modes for the :meth:`~sumpf.Signal.convolve` and :meth:`~sumpf.Signal.correlate` methods (see the :class:`~sumpf._internal._enums.ConvolutionMode` class).
     shift_modes = sumpf_internal.ShiftMode                  #: an enumeration with modes for the :meth:`~sumpf.Signal.shift` method (see the :class:`~sumpf._internal._enums.ShiftMode` class).
+    time_weightings = sumpf_internal.TimeWeighting          #: an enumeration with time weightings for the :meth:`~sumpf.Signal.level_vs_time` method (see the :class:`~sumpf._internal._enums.TimeWeighting` class).
 
-    def __init__(self, channels=numpy.empty(shape=(1, 0)), sampling_rate=48000.0, offset=0, labels=None):
+    def __init__(self, channels=numpy.empty(shape=(1, 0)), sampling_rate=48000.0, offset=0, labels=None, dtype=None):
         """
         :param channels: a two-dimensional :func:`numpy.array` of channels with float samples.
         :param sampling_rate: the sampling rate of the signal as a float or integer.
@@ -87,8 +95,11 @@ class Signal(SampledData):
                        the channel is delayed virtually. The offset can also be
                        negative, if the signal shall be non-causal.
         :param labels: a sequence of string labels for the channels.
+        :param dtype: an optional dtype (e.g. ``numpy.float32``), to which the
+                      channels are converted. If None, the dtype of the given
+                      channels is kept.
         """
-        SampledData.__init__(self, channels, labels)
+        SampledData.__init__(self, channels, labels, dtype)
         self.__sampling_rate = sampling_rate
         self.__offset = offset
 
@@ -142,10 +153,12 @@ class Signal(SampledData):
                                       separator=",",
                                       formatter={"all": repr},
                                       threshold=self._channels.size).replace("\n", "").replace(" ", "")
+        dtype = "" if self._channels.dtype == numpy.float64 else f", dtype={self._channels.dtype.name}"
         return (f"{self.__class__.__name__}(channels=array({channels}), "
                 f"sampling_rate={self.__sampling_rate!r}, "
                 f"offset={self.__offset}, "
-                f"labels={self._labels})")
+                f"labels={self._labels}"
+                f"{dtype})")
 
     def __eq__(self, other):
         """Operator overload for comparing this signal to another object with ``==``"""
@@ -171,7 +184,7 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=numpy.fabs(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=numpy.fabs(self._channels, out=sumpf_internal.allocate_array(self.shape(), self.__real_dtype())),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
@@ -197,7 +210,7 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape(), self.__real_dtype())),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
@@ -235,17 +248,17 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__real_dtype())
         if self._length % 2 == 0:
-            spectrum = numpy.fft.rfft(self._channels)
-            channels[:] = numpy.fft.irfft(1.0 / spectrum)
+            spectrum = sumpf_internal.rfft(self._channels)
+            channels[:] = sumpf_internal.irfft(1.0 / spectrum)
         else:
             # odd-length signals require zero padding, so that there is no sample lost in the FFT
-            padded = numpy.empty((len(self), 2 * self._length))
+            padded = numpy.empty((len(self), 2 * self._length), dtype=channels.dtype)
             padded[:, 0:self._length] = self._channels
             padded[:, self._length:] = 0.0
-            spectrum = numpy.fft.rfft(padded)
-            padded = numpy.fft.irfft(1.0 / spectrum)
+            spectrum = sumpf_internal.rfft(padded)
+            padded = sumpf_internal.irfft(1.0 / spectrum)
             channels[:] = padded[:, 0:self._length]
             channels += padded[:, self._length:]
         return Signal(channels=channels,
@@ -309,7 +322,7 @@ class Signal(SampledData):
         if length == self._length:
             return self
         else:
-            channels = sumpf_internal.allocate_array(shape=(len(self), length))
+            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=self.__real_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, 0:length]
             else:
@@ -351,7 +364,7 @@ class Signal(SampledData):
                               labels=self._labels)
         else:
             if mode == Signal.shift_modes.CROP:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self.__real_dtype())
                 if shift < 0:
                     channels[:, 0:shift] = self._channels[:, -shift:]
                     channels[:, shift:] = 0.0
@@ -359,7 +372,7 @@ class Signal(SampledData):
                     channels[:, 0:shift] = 0.0
                     channels[:, shift:] = self._channels[:, 0:-shift]
             elif mode == Signal.shift_modes.PAD:
-                channels = sumpf_internal.allocate_array(shape=(len(self), self._length + abs(shift)))
+                channels = sumpf_internal.allocate_array(shape=(len(self), self._length + abs(shift)), dtype=self.__real_dtype())
                 if shift < 0:
                     channels[:, 0:self._length] = self._channels
                     channels[:, self._length:] = 0.0
@@ -367,7 +380,7 @@ class Signal(SampledData):
                     channels[:, 0:shift] = 0.0
                     channels[:, shift:] = self._channels
             elif mode == Signal.shift_modes.CYCLE:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self.__real_dtype())
                 channels[:, 0:shift] = self._channels[:, -shift:]
                 channels[:, shift:] = self._channels[:, 0:-shift]
             return Signal(channels=channels,
@@ -418,17 +431,18 @@ class Signal(SampledData):
     def __full_fourier_transform(self):
         """Helper method for computing a full Fourier transform of this signal."""
         length = self._length // 2 + 1
+        dtype = sumpf_internal.complex_dtype(self._channels.dtype)
         if len(self._channels) == 0:                                            # pylint: disable=len-as-condition; self._channels is a numpy array, that does not evaluate to False if empty
             resolution = self.__sampling_rate / max(self._length, 1)
-            channels = sumpf_internal.allocate_array(shape=(0, length), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(0, length), dtype=dtype)
         elif self._length == 0:
             resolution = self.__sampling_rate
-            channels = sumpf_internal.allocate_array(shape=(len(self._channels), 1), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(len(self._channels), 1), dtype=dtype)
             channels[:, :] = 0.0
         else:
             resolution = self.__sampling_rate / self._length
-            channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=numpy.complex128)
-            spectrum = numpy.fft.rfft(self._channels)
+            channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=dtype)
+            spectrum = sumpf_internal.rfft(self._channels)
             if self.__offset == 0:
                 channels[:, :] = spectrum
             else:  # add a group delay for the offset
@@ -443,63 +457,70 @@ class Signal(SampledData):
         window = sumpf_internal.get_window(window, overlap, symmetric=False, sampling_rate=self.__sampling_rate)
         window_length = window.length()
         length = window_length // 2 + 1
+        dtype = sumpf_internal.complex_dtype(self._channels.dtype)
         if len(self._channels) == 0 or len(window) == 0 or window_length == 0:  # pylint: disable=len-as-condition; these are numpy arrays, that do not evaluate to False if empty
             resolution = window.sampling_rate() / max(window_length, 1)
             channels = sumpf_internal.allocate_array(shape=(max(len(self._channels), len(window)), length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=dtype)
             channels[:, :] = 0.0
         else:
             window_channels = window.channels()
             overlap = sumpf_internal.index(overlap, window_length)
             resolution = window.sampling_rate() / window_length
             channels = sumpf_internal.allocate_array(shape=(max(len(self._channels), len(window)), length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=dtype)
             channels[:, :] = 0.0
-            windowed = numpy.empty(shape=(max(len(self._channels), len(window)), window_length))
-            compensated = numpy.empty(shape=channels.shape, dtype=channels.dtype)
-            compensation_factor = (length - 1) * resolution * -2j * math.pi
-            step = window_length - overlap
-            if pad:
-                for i in range(-step, -window_length, -step):
-                    l = min(window_length + i, self._length)
-                    windowed[:, 0:-i] = 0.0
-                    windowed[:, l - i:] = 0.0
-                    numpy.multiply(self._channels[:, 0:l],
-                                   window_channels[:, -i:l - i],
-                                   out=windowed[:, -i:l - i])
-                    spectrum = numpy.fft.rfft(windowed)
-                    max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                    compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                    numpy.exp(compensation, out=compensated)
-                    compensated *= spectrum
-                    channels += compensated
-            i = 0
-            for i in range(0, self._length - window_length + 1, step):
-                numpy.multiply(self._channels[:, i:window_length + i],
-                               window_channels,
-                               out=windowed)
-                spectrum = numpy.fft.rfft(windowed)
-                max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                numpy.exp(compensation, out=compensated)
-                compensated *= spectrum
-                channels += compensated
-            if pad:
-                for i in range(i + step, self._length, step):
-                    k = self._length - i
-                    windowed[:, k:] = 0.0
-                    numpy.multiply(self._channels[:, i:],
-                                   window_channels[:, 0:k],
-                                   out=windowed[:, 0:k])
-                    spectrum = numpy.fft.rfft(windowed)
-                    max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                    compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                    numpy.exp(compensation, out=compensated)
-                    compensated *= spectrum
-                    channels += compensated
+            starts = self.__block_starts(window_length, step=window_length - overlap, pad=pad)
+            frequencies = numpy.arange(length) * (-2.0j * math.pi * resolution / self.__sampling_rate)
+            # process the blocks in chunks, so that the memory for the windowed blocks stays bounded
+            chunk_size = max(1, 2 ** 20 // (len(channels) * window_length))
+            for c in range(0, len(starts), chunk_size):
+                chunk = starts[c:c + chunk_size]
+                blocks = self.__blocks(chunk, window_length)
+                spectrums = sumpf_internal.rfft(numpy.multiply(blocks, window_channels[:, numpy.newaxis, :]))
+                ramps = numpy.exp(numpy.multiply.outer(self.__offset + chunk, frequencies))
+                channels += numpy.einsum("cbf,bf->cf", spectrums, ramps)
             channels.transpose()[:] *= sumpf_internal.scaling_factor(window, overlap)
         return channels, resolution
 
+    def __block_starts(self, window_length, step, pad):
+        """Helper method, that computes the indices of the first samples of the
+        blocks for a block-wise transform of this signal.
+
+        :param window_length: the length of a block
+        :param step: the number of samples between the beginnings of two consecutive blocks
+        :param pad: True, if the blocks, which overlap with the beginning or the
+                    end of the signal, shall be included
+        :returns: a one-dimensional array of integer indices, which are negative
+                  for blocks, that begin before the signal's first sample
+        """
+        full = numpy.arange(0, self._length - window_length + 1, step)
+        if not pad:
+            return full
+        last = full[-1] if len(full) else 0      # pylint: disable=len-as-condition; full is a numpy array, that does not evaluate to False if empty
+        return numpy.concatenate((numpy.arange(-step * ((window_length - 1) // step), 0, step),
+                                  full,
+                                  numpy.arange(last + step, self._length, step)))
+
+    def __blocks(self, starts, window_length):
+        """Helper method, that returns the blocks of this signal, which begin at
+        the given indices. Samples of the blocks, which lie outside the signal,
+        are zero.
+
+        :param starts: a one-dimensional array with the indices of the blocks' first samples
+        :param window_length: the length of a block
+        :returns: an array of the shape (number of channels, number of blocks, window length)
+        """
+        first = starts[0]
+        stop = starts[-1] + window_length
+        if first >= 0 and stop <= self._length:
+            segment = self._channels[:, first:stop]
+        else:
+            segment = numpy.zeros(shape=(len(self._channels), stop - first), dtype=self._channels.dtype)
+            segment[:, max(-first, 0):min(self._length, stop) - first] = self._channels[:, max(first, 0):stop]
+        blocks = numpy.lib.stride_tricks.sliding_window_view(segment, window_length, axis=-1)
+        return blocks[:, starts - first]
+
     def short_time_fourier_transform(self, window=4096, overlap=0.5, pad=True):
         """Computes a :class:`~sumpf.Spectrogram` from this signal.
 
@@ -549,7 +570,7 @@ class Signal(SampledData):
                                               noverlap=overlap,
                                               boundary="zeros" if pad else None,
                                               padded=pad)[2])
-        channels = sumpf_internal.allocate_array(shape=numpy.shape(stft), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=numpy.shape(stft), dtype=sumpf_internal.complex_dtype(self._channels.dtype))
         channels[:] = stft
         # deal with the offset
         resolution = self.__sampling_rate / window_length
@@ -585,11 +606,17 @@ class Signal(SampledData):
         else:
             return numpy.linalg.norm(self._channels, axis=1) / math.sqrt(self._length)
 
-    def level_vs_time(self, integration_time=1.0, pad=False):   # pylint: disable=too-many-branches; with the comments, this is relatively straight forward
+    def level_vs_time(self, integration_time=1.0, pad=False, time_weighting=sumpf_internal.TimeWeighting.RECTANGULAR, hop=1):
         """Computes a time-dependent level of the signal.
 
-        The level is computed individually for each sample with the integration
-        interval being placed symmetrically around the given sample.
+        With the default rectangular time weighting, the level is computed individually
+        for each sample with the integration interval being placed symmetrically
+        around the given sample. With the exponential time weighting, the squared
+        samples are averaged with an exponentially decaying weight, whose time
+        constant is the integration time, like in a sound level meter.
+
+        The computational effort of both time weightings grows linearly with the
+        length of the signal and does not depend on the integration time.
 
         :param integration_time: the time span in seconds, that shall be taken into
                                  account when computing the level. Common values
@@ -598,86 +625,88 @@ class Signal(SampledData):
                     in time, where the integration interval spans beyond the signal.
                     If False, the integration time is reduced for the samples at
                     the beginning and the end of the signal, so that the whole
-                    integration interval is covered by the signal.
+                    integration interval is covered by the signal. For the exponential
+                    time weighting, the average at the beginning of the signal
+                    is normalized with the sum of the weights of the samples, that
+                    have been averaged so far.
+        :param time_weighting: a flag from the :attr:`~sumpf.Signal.time_weightings`
+                               enumeration (see :class:`sumpf._internal._enums.TimeWeighting`)
+        :param hop: a positive integer. If it is larger than one, the level is only
+                    computed for every hop-th sample, so that the returned signal
+                    has a sampling rate, that is reduced by this factor. These
+                    samples are chosen, so that their indices including the signal's
+                    offset are multiples of the hop. This way, the levels of the
+                    returned signal are placed exactly at the time of their samples,
+                    even if the offset of this signal is not a multiple of the hop.
+        :returns: a :class:`~sumpf.Signal` with the levels
         """
         window_length = integration_time * self.__sampling_rate
+        first = -self.__offset % hop
+        indices = numpy.arange(first, self._length, hop)
         if window_length <= 1.0:
-            return abs(self)
-        half_window_length_float = (window_length - 1.0) / 2.0
-        half_window_length = int(math.ceil(half_window_length_float))
-        channels = sumpf_internal.allocate_array(shape=self._channels.shape)
-        if 1 + half_window_length >= self._length:
-            # if half the integration time is longer than the whole signal, the level is constant over time
-            if pad:
-                levels = numpy.linalg.norm(self._channels, axis=1) / math.sqrt(window_length)
-            else:
-                levels = self.level()
-            for c, l in zip(channels, levels):
-                c[:] = l
+            channels = numpy.abs(self._channels[:, first::hop])
+        elif time_weighting is sumpf_internal.TimeWeighting.EXPONENTIAL:
+            coefficient = math.exp(-1.0 / window_length)
+            channels = sumpf_internal.exponential_average(numpy.square(self._channels), coefficient, hop, first)
+            if not pad:
+                # normalize with the sum of the weights 1 - c ** (n + 1), because the averaging has started with zero
+                channels /= -numpy.expm1((indices + 1) * math.log(coefficient))
+            numpy.sqrt(channels, out=channels)
         else:
-            # generate a window, that does the averaging of the squared signal
-            remainder = half_window_length - half_window_length_float
-            window = numpy.full(1 + 2 * half_window_length, 1.0 / window_length)
-            if remainder:
-                corner = remainder / window_length
-                window[0] = corner
-                window[-1] = corner
+            # the integration interval consists of full samples and two fractionally weighted samples at its corners
+            half_window_length = (window_length - 1.0) / 2.0
+            full_samples = int(half_window_length)
+            remainder = half_window_length - full_samples
             square = numpy.square(self._channels)
-            if len(window) < self._length:
-                # compute the levels by convolving the squared signal with the window
-                for s, c in zip(square, channels):
-                    numpy.sqrt(numpy.convolve(s, window, mode="same"), out=c)
-                if not pad:
-                    # compute a compensation for the start and the end of the level signal, where the convolution has assumed a zero padding
-                    effective_window_lengths = numpy.linspace(1 + half_window_length_float,
-                                                              half_window_length + half_window_length_float,
-                                                              half_window_length)
-                    correction = numpy.sqrt(window_length / effective_window_lengths)
-                    channels[:, 0:half_window_length] *= correction
-                    channels[:, -half_window_length:] *= correction[::-1]
+            starts = numpy.maximum(indices - full_samples, 0)
+            stops = numpy.minimum(indices + full_samples + 1, self._length)
+            channels = sumpf_internal.window_sums(square, starts, stops)
+            left = numpy.where(indices > full_samples, remainder, 0.0)
+            right = numpy.where(indices < self._length - full_samples - 1, remainder, 0.0)
+            if remainder:
+                channels += left * numpy.take(square, numpy.maximum(indices - full_samples - 1, 0), axis=-1)
+                channels += right * numpy.take(square, numpy.minimum(indices + full_samples + 1, self._length - 1), axis=-1)
+            if pad:
+                channels /= window_length
             else:
-                # if the window is longer than the signal itself, there is no sample, that is computed with a whole integration window
-                a = (len(window) + 1 - self._length) // 2
-                b = a + self._length
-                for s, c in zip(square, channels):
-                    numpy.sqrt(numpy.convolve(s, window, mode="same")[a:b], out=c)
-                if not pad:
-                    # compute a compensation for the start and the end of the level signal, where the convolution has assumed a zero padding
-                    correction = numpy.empty(self._length)
-                    correction[0:half_window_length] = numpy.linspace(1 + half_window_length_float,
-                                                                      half_window_length + half_window_length_float,
-                                                                      half_window_length)
-                    half_correction = correction[0:(self._length + 1) // 2]
-                    numpy.clip(half_correction, a_min=0, a_max=self._length, out=half_correction)
-                    numpy.divide(window_length, half_correction, out=half_correction)
-                    numpy.sqrt(half_correction, out=half_correction)
-                    correction[self._length - 1:(self._length + 1) // 2 - 1:-1] = correction[0:self._length // 2]   # copy the first half of the correction to the second half and reverse it
-                    channels *= correction
+                channels /= (stops - starts) + left + right
+            numpy.clip(channels, a_min=0.0, a_max=None, out=channels)   # the running sums might leave tiny negative rounding errors
+            numpy.sqrt(channels, out=channels)
         return sumpf.Signal(channels=channels,
-                            sampling_rate=self.__sampling_rate,
-                            offset=self.__offset,
+                            sampling_rate=self.__sampling_rate / hop,
+                            offset=(self.__offset + first) // hop,
                             labels=self._labels)
 
-    def convolve(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED):
+    def convolve(self, other, mode=sumpf_internal.ConvolutionMode.AUTO):
         """Convolves this signal with another signal or an :func:`~numpy.array`.
 
         The convolution can be performed in different modes, which can be specified
         by passing a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
-        as the ``mode`` parameter of this method.
+        as the ``mode`` parameter of this method. By default, the mode ``AUTO``
+        computes the full convolution with the strategy, that is estimated to
+        be the fastest for the given data.
 
-        :param other: the :class:`~sumpf.Signal` or :func:`~numpy.array`, with which
-                      this signal shall be convolved
+        If ``other`` is a kernel, that has been created with :meth:`prepare_convolution`,
+        the full convolution is computed with the kernel's precomputed transform
+        and the ``mode`` parameter is ignored.
+
+        :param other: the :class:`~sumpf.Signal`, :func:`~numpy.array` or the kernel
+                      from :meth:`prepare_convolution`, with which this signal shall
+                      be convolved
         :param mode: a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
         :returns: the convolution result as a :class:`~sumpf.Signal`
         """
-        if isinstance(other, Signal):
+        if isinstance(other, sumpf_internal.ConvolutionKernel):
+            channels, offset = other.convolve(self._channels, self.__offset)
+            labels = ("Convolution",) * len(channels)
+        elif isinstance(other, Signal):
             channels, offset = self.__convolve_with_array(other=other.channels(),
                                                           other_offset=other.offset(),
                                                           function=sumpf_internal.convolution,
                                                           mode=mode)
             labels = ("Convolution",) * len(self._channels)
         else:
-            channels, offset = self.__convolve_with_array(other=other,
+            channels, offset = self.__convolve_with_array(other=numpy.asarray(other, dtype=self.__real_dtype()),
                                                           other_offset=0,
                                                           function=sumpf_internal.convolution,
                                                           mode=mode)
@@ -687,13 +716,15 @@ class Signal(SampledData):
                       offset=offset,
                       labels=labels)
 
-    def correlate(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED):
+    def correlate(self, other, mode=sumpf_internal.ConvolutionMode.AUTO):
         """Computes the cross-correlation between this signal and a given signal
         or :func:`~numpy.array`.
 
         The convolution can be performed in different modes, which can be specified
         by passing a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
-        as the ``mode`` parameter of this method.
+        as the ``mode`` parameter of this method. By default, the mode ``AUTO``
+        computes the full correlation with the strategy, that is estimated to
+        be the fastest for the given data.
 
         The resulting signal will have the same channels as a convolution of the
         reverse of this signal with the given data set. This seems to be the more
@@ -703,19 +734,27 @@ class Signal(SampledData):
         correlation results are the reverse of :mod:`numpy`'s. For the ``SAME`` mode,
         *SuMPF* uses :func:`~numpy.convolve` with the first data set reversed.
 
-        :param other: the :class:`~sumpf.Signal` or :func:`~numpy.array`, with which
-                      this signal shall be correlated
+        If ``other`` is a kernel, that has been created with :meth:`prepare_convolution`,
+        the full correlation is computed with the kernel's precomputed transform
+        and the ``mode`` parameter is ignored.
+
+        :param other: the :class:`~sumpf.Signal`, :func:`~numpy.array` or the kernel
+                      from :meth:`prepare_convolution`, with which this signal shall
+                      be correlated
         :param mode: a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
         :returns: the cross correlation result as a :class:`~sumpf.Signal`
         """
-        if isinstance(other, Signal):
+        if isinstance(other, sumpf_internal.ConvolutionKernel):
+            channels, offset = other.correlate(self._channels, self.__offset)
+            labels = ("Correlation",) * len(channels)
+        elif isinstance(other, Signal):
             channels, offset = self.__convolve_with_array(other=other.channels(),
                                                           other_offset=other.offset(),
                                                           function=sumpf_internal.correlation,
                                                           mode=mode)
             labels = ("Correlation",) * len(self._channels)
         else:
-            channels, offset = self.__convolve_with_array(other=other,
+            channels, offset = self.__convolve_with_array(other=numpy.asarray(other, dtype=self.__real_dtype()),
                                                           other_offset=0,
                                                           function=sumpf_internal.correlation,
                                                           mode=mode)
@@ -725,6 +764,24 @@ class Signal(SampledData):
                       offset=offset,
                       labels=labels)
 
+    def prepare_convolution(self, transform_length=None):
+        """Transforms this signal once, so that it can be convolved with or
+        correlated to many other signals without being transformed again.
+        This is useful for applying the same impulse response to a large batch
+        of signals. The returned kernel can be passed as the ``other`` parameter
+        to the :meth:`convolve` and :meth:`correlate` methods of other signals.
+        These compute the full convolution or correlation block-wise with the
+        overlap-add method, so that signals of any length can be processed.
+
+        :param transform_length: the length of the transforms, which must not be
+                                 shorter than this signal. If None, a length is
+                                 chosen, that is efficient for long signals.
+        :returns: a kernel object, that holds the transform of this signal
+        """
+        return sumpf_internal.ConvolutionKernel(channels=self._channels,
+                                                offset=self.__offset,
+                                                transform_length=transform_length)
+
     ####################################################
     # methods for statistical parameters of the signal #
     ####################################################
@@ -805,17 +862,20 @@ class Signal(SampledData):
     #######################
 
     @staticmethod
-    def load(path):
+    def load(path, dtype=None):
         """A static method to load a :class:`~sumpf.Signal` instance from a file.
 
         :param path: the path to the file.
+        :param dtype: the dtype of the loaded signal's channels (e.g. ``numpy.float32``)
+                      or None, if the precision of the file shall be used
         :raises ValueError: if the file cannot be read (e.g. because the library
                             for the file's format is missing)
         :returns: the loaded :class:`~sumpf.Signal`
         """
         return sumpf_internal.read_file(path=path,
                                         readers=sumpf_internal.signal_readers.readers,
-                                        reader_base_class=sumpf_internal.signal_readers.Reader)
+                                        reader_base_class=sumpf_internal.signal_readers.Reader,
+                                        dtype=dtype)
 
     def save(self, path, file_format=file_formats.AUTO):
         """Saves the signal to a file. The file will be created if it does not exist.
@@ -887,13 +947,13 @@ class Signal(SampledData):
         :param label: the string label for the computed channels
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=function(other, self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=function(other, self._channels, out=sumpf_internal.allocate_array(self.shape(), self.__real_dtype())),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
 
     def __algebra_function_signals_overlap(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__real_dtype(other))
         function(self._channels, other.channels(), out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -901,7 +961,7 @@ class Signal(SampledData):
                       labels=(label,) * len(self))
 
     def __algebra_function_self_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=other.shape())
+        channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=self.__real_dtype(other))
         function(self._channels[0], other.channels(), out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -909,7 +969,7 @@ class Signal(SampledData):
                       labels=(label,) * len(other))
 
     def __algebra_function_other_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__real_dtype(other))
         function(self._channels, other.channels()[0], out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -923,7 +983,7 @@ class Signal(SampledData):
         length = stop - start
         channelcount = max(len(self), len(other))
         shape = (channelcount, length)
-        channels = sumpf_internal.allocate_array(shape)
+        channels = sumpf_internal.allocate_array(shape, dtype=self.__real_dtype(other))
         # copy the two signals
         channels[:] = 0.0
         channels[0:len(self), self.__offset - start:self.__offset + self._length - start] = self._channels
@@ -967,7 +1027,7 @@ class Signal(SampledData):
                       labels=(label,) * channelcount)
 
     def __algebra_function_different_type(self, other, function):
-        channels = sumpf_internal.allocate_array(self.shape())
+        channels = sumpf_internal.allocate_array(self.shape(), self.__real_dtype())
         try:
             function(self._channels, other, out=channels)
         except TypeError:
@@ -1000,6 +1060,14 @@ class Signal(SampledData):
                                               offsets=(self.__offset, other_offset))
 
     def __convolve_with_scalar(self, other):
-        channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+        channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self.__real_dtype())
         numpy.multiply(self._channels, other, out=channels)
         return channels, self.__offset
+
+    def __real_dtype(self, other=None):
+        """Returns the floating point dtype for the samples of a signal, that is
+        computed from this signal and optionally another signal."""
+        if other is None:
+            return sumpf_internal.real_dtype(self._channels.dtype)
+        else:
+            return sumpf_internal.real_dtype(numpy.result_type(self._channels, other.channels()))
@@ -34,36 +34,61 @@ __all__ = ("LinearSweep", "InverseLinearSweep", "ExponentialSweep", "InverseExpo
 ####################
 
 
+_CHUNK_LENGTH = 2 ** 16     # the number of samples, that are computed at once, so that the temporary arrays remain small
+
+
 def general_sweep_parameters(interval, sampling_rate, length):
     """A helper function that computes parameters, that are used by the sweep classes."""
     start, stop = sumpf_internal.index(interval, length)
     sweep_offset = start / sampling_rate
     sweep_length = stop - start
     sweep_duration = sweep_length / sampling_rate
-    t = numpy.linspace(-sweep_offset, (length - 1) / sampling_rate - sweep_offset, length)  # the time values for the samples
-    return start, stop, t, sweep_duration, sweep_offset
+    return start, stop, sweep_duration, sweep_offset
+
+
+def time_samples(begin, length, start, sampling_rate):
+    """A helper function that computes the time values for a chunk of samples
+    of a sweep, relative to the sample, at which the sweep's interval begins.
+    The times are computed from integer sample indices, so that the chunks continue
+    each other exactly.
+    """
+    t = numpy.arange(begin - start, begin - start + length, dtype=numpy.float64)
+    t /= sampling_rate
+    return t
+
+
+def synthesize(samples, channel, begin=0):
+    """A helper function that computes the samples of a sweep chunk by chunk.
+
+    :param samples: a function, that takes an array, to which the samples shall
+                    be written, and the index of the first sample in the sweep
+    :param channel: the array, that shall be filled with the samples
+    :param begin: the index of the channel's first sample in the sweep
+    """
+    for i in range(0, len(channel), _CHUNK_LENGTH):
+        samples(channel[i:i + _CHUNK_LENGTH], begin + i)
 
 
 def linear_sweep_parameters(start_frequency, stop_frequency, interval, sampling_rate, length):
     """A helper function that computes parameters, that are used by both the
     LinearSweep and the InverseLinearSweep classes.
     """
-    start, stop, t, sweep_duration, sweep_offset = general_sweep_parameters(interval, sampling_rate, length)
+    start, stop, sweep_duration, sweep_offset = general_sweep_parameters(interval, sampling_rate, length)
     k = (stop_frequency - start_frequency) / sweep_duration
     a = 2.0 * math.pi * start_frequency
     b = math.pi * k
-    return start, stop, t, sweep_duration, sweep_offset, a, b, k
+    return start, stop, sweep_duration, sweep_offset, a, b, k
 
 
 def exponential_sweep_parameters(start_frequency, stop_frequency, interval, sampling_rate, length):
     """A helper function that computes parameters, that are used by both the
     ExponentialSweep and the InverseExponentialSweep classes.
     """
-    start, stop, t, sweep_duration, sweep_offset = general_sweep_parameters(interval, sampling_rate, length)
+    start, stop, sweep_duration, sweep_offset = general_sweep_parameters(interval, sampling_rate, length)
     frequency_ratio = stop_frequency / start_frequency
     l = sweep_duration / math.log(frequency_ratio)
     a = 2.0 * math.pi * start_frequency * l
-    return start, stop, t, sweep_duration, sweep_offset, l, a
+    return start, stop, sweep_duration, sweep_offset, l, a
 
 
 def apply_delay(channels, sampling_rate, delay, out):
@@ -71,10 +96,10 @@ def apply_delay(channels, sampling_rate, delay, out):
     with ``exp(2j * pi * f * delay)`` in the frequency domain
     """
     if channels.size:
-        spectrum = numpy.fft.rfft(channels)
+        spectrum = sumpf_internal.rfft(channels)
         f = numpy.linspace(0.0, sampling_rate / 2.0, spectrum.shape[-1])
         spectrum *= numpy.exp(2j * math.pi * f * delay)
-        signal = numpy.fft.irfft(spectrum, n=channels.shape[-1])
+        signal = sumpf_internal.irfft(spectrum, n=channels.shape[-1])
         out[:, 0:signal.shape[1]] = signal[:, 0:out.shape[1]]
     else:
         out[:] = channels[:]
@@ -95,10 +120,10 @@ class Sweep(Signal):
                        the channel is delayed virtually. The offset can also be
                        negative, if the signal shall be non-causal.
         :param function: a function, that takes a point in time as a float in seconds
-                         and computes the instantaneous frequency of the sweep
-                         at that point in time.
+                         or multiple points in time as an array and computes the
+                         instantaneous frequency of the sweep at these points in time.
         """
-        a, b = (function(0.0), function(len(channels[0]) / sampling_rate))
+        a, b = (float(function(0.0)), float(function(len(channels[0]) / sampling_rate)))
         if a <= b:
             Signal.__init__(self,
                             channels=channels,
@@ -142,10 +167,61 @@ class Sweep(Signal):
         :returns: a float frequency or an array of frequencies
         """
         if isinstance(t, collections.abc.Iterable):
-            f = numpy.vectorize(self.__function)
-            return f(t)
+            return self.__function(numpy.asarray(t, dtype=numpy.float64))
         else:
-            return self.__function(t)
+            return float(self.__function(t))
+
+    @classmethod
+    def blocks(cls, start_frequency=20.0, stop_frequency=20000.0, phase=0.0,
+               interval=(0, 1.0), sampling_rate=48000.0, length=2 ** 16, block_length=2 ** 16):
+        """Generates the sweep block by block, without allocating the memory for
+        the whole sweep. This is useful for very long sweeps, which can be played
+        back or processed in blocks.
+
+        The parameters are the same as for the constructor of the respective sweep
+        class. Since each sample is computed from its index in the sweep, the
+        blocks continue each other with a continuous phase and their concatenation
+        is equal to the sweep, that is created with the constructor.
+
+        :param start_frequency: the start frequency in Hz
+        :param stop_frequency: the stop frequency in Hz
+        :param phase: a phase offset in radians
+        :param interval: a tuple, list or array of two numbers, that specify the
+                         indices of the samples, at which the start and the stop
+                         frequencies shall be excited (see the constructor)
+        :param sampling_rate: the sampling rate of the sweep in Hz
+        :param length: the number of samples of the whole sweep
+        :param block_length: the number of samples per block. The last block
+                             is shorter, if the sweep's length is not an integer
+                             multiple of the block length.
+        :returns: a generator, that yields :class:`~sumpf.Signal` instances, whose
+                  offsets are those of the respective samples in the whole sweep
+        """
+        samples, offset, function = cls._synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        label = "Sweep" if function(0.0) <= function(length / sampling_rate) else "Inverse sweep"
+        for begin in range(0, length, block_length):
+            channels = sumpf_internal.allocate_array(shape=(1, min(block_length, length - begin)), dtype=numpy.float64)
+            synthesize(samples, channels[0], begin)
+            yield Signal(channels=channels, sampling_rate=sampling_rate, offset=offset + begin, labels=(label,))
+
+    @staticmethod
+    def _synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        """An abstract method, in which derived classes shall implement the computation
+        of the sweep's samples.
+
+        :param start_frequency: the start frequency in Hz
+        :param stop_frequency: the stop frequency in Hz
+        :param phase: a phase offset in radians
+        :param interval: the interval parameter of the sweep
+        :param sampling_rate: the sampling rate of the sweep in Hz
+        :param length: the number of samples of the whole sweep
+        :returns: a tuple ``(samples, offset, function)``, where ``samples`` is a
+                  function, that takes an array, to which a chunk of samples shall
+                  be written, and the index of the chunk's first sample in the sweep,
+                  ``offset`` is the offset of the sweep and ``function`` computes
+                  the instantaneous frequency for an array of points in time
+        """
+        raise NotImplementedError("This method has to be implemented in a derived class")
 
 
 class BaseExponentialSweep(Sweep):
@@ -166,6 +242,27 @@ class BaseExponentialSweep(Sweep):
         Sweep.__init__(self, channels=channels, sampling_rate=sampling_rate, offset=offset, function=function)
         self.__l = l
 
+    @classmethod
+    def _synthesizer(cls, start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        """Implements the computation of the sweep's samples by means of :meth:`_exponential_synthesizer`.
+        See :meth:`~sumpf._data._signals._sweep.Sweep._synthesizer` for the parameters
+        and the returned tuple.
+        """
+        samples, offset, function, _ = cls._exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        return samples, offset, function
+
+    @staticmethod
+    def _exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        """An abstract method, in which derived classes shall implement the computation
+        of the sweep's samples. It takes the same parameters as
+        :meth:`~sumpf._data._signals._sweep.Sweep._synthesizer`, but it also returns
+        the sweep rate, which the constructors need for cutting out the harmonic
+        impulse responses, so that the sweep's parameters are only computed once.
+
+        :returns: a tuple ``(samples, offset, function, l)``, where ``l`` is the sweep rate
+        """
+        raise NotImplementedError("This method has to be implemented in a derived class")
+
     def harmonic_impulse_response(self, impulse_response, harmonic, length=None):
         """Cuts out the impulse response of the given harmonic from an impulse
         response of a system, that has been measured with this sweep.
@@ -183,24 +280,8 @@ class BaseExponentialSweep(Sweep):
                        automatically and it will vary for the different orders
                        of harmonics.
         """
-        offset = impulse_response.offset()
         sampling_rate = impulse_response.sampling_rate()
-        # cut out the harmonic impulse response from the signal
-        if harmonic == 1:
-            channels = impulse_response.channels()[:, -offset:]
-            remaining_delay = None
-        else:
-            delay = math.log(harmonic) * self.__l
-            shift = math.ceil(delay * sampling_rate)
-            start = -int(shift) - offset
-            remaining_delay = shift / sampling_rate - delay
-            if harmonic == 2:
-                stop = -offset
-            else:
-                stop = -int(math.floor(math.log(harmonic - 1) * self.__l * sampling_rate)) - offset
-            if stop == 0 or (start < 0 and stop >= 0):  # pylint: disable=chained-comparison; can't see what's wrong with this
-                stop = None
-            channels = impulse_response.channels()[:, start:stop]
+        channels, remaining_delay = self.__cut_out(impulse_response, harmonic)
         # zero-pad or crop the impulse response, so it has the desired length
         if length is not None:
             channel_count, harmonic_length = channels.shape
@@ -236,6 +317,95 @@ class BaseExponentialSweep(Sweep):
                       offset=0,
                       labels=[f"{l} ({h} harmonic)" for l in impulse_response.labels()])
 
+    def harmonic_impulse_responses(self, impulse_response, orders, length=None):
+        """Cuts out the impulse responses of multiple harmonics from an impulse
+        response of a system, that has been measured with this sweep.
+
+        Other than calling :meth:`harmonic_impulse_response` for each harmonic,
+        this method shifts the harmonic impulse responses by their fractional
+        delays with one forward and one inverse Fourier transform of the stacked
+        impulse responses. Only if some of the cut out impulse responses are
+        longer than the given length, they are transformed separately, because
+        the fractional delay is applied before cropping them.
+
+        The results are equal to those of :meth:`harmonic_impulse_response` with
+        the same length. If no length is given, all harmonic impulse responses
+        are delayed and padded to the length of the longest one, so that they can
+        differ slightly from those, that :meth:`harmonic_impulse_response` returns
+        without a length, because the fractional delay is applied to a shorter
+        impulse response there.
+
+        :param impulse_response: the :class:`~sumpf.Signal` instance with the
+                                 complete impulse response of the system. The
+                                 signal's offset shall point to the beginning
+                                 of the linear impulse response.
+        :param orders: a sequence of integer orders of the harmonics, that shall
+                       be cut out, e.g. ``range(1, 6)``
+        :param length: the integer length, that all harmonic impulse responses
+                       shall have. This will be achieved by cropping or zero
+                       padding. If this is None, the length of the longest cut
+                       out impulse response is used.
+        :returns: a :class:`~sumpf.Signal` with one channel for each channel of the
+                  given impulse response and each order. The harmonics of the first
+                  channel come first, followed by those of the second channel and so on.
+        """
+        sampling_rate = impulse_response.sampling_rate()
+        orders = list(orders)
+        cut_outs = [self.__cut_out(impulse_response, h) for h in orders]
+        if length is None:
+            length = max((c.shape[1] for c, _ in cut_outs), default=0)
+        channels = sumpf_internal.allocate_array(shape=(len(impulse_response), len(orders), length))
+        groups = {}     # maps the lengths of the Fourier transforms to the indices of the harmonics, that have to be delayed
+        for i, (c, remaining_delay) in enumerate(cut_outs):
+            if remaining_delay is None:
+                cropped = min(c.shape[1], length)
+                channels[:, i, 0:cropped] = c[:, 0:cropped]
+                channels[:, i, cropped:] = 0.0
+            else:
+                groups.setdefault(max(c.shape[1], length), []).append(i)
+        for transform_length, delayed in groups.items():
+            # apply the fractional delays to all stacked harmonics at once
+            stacked = numpy.zeros(shape=(len(impulse_response), len(delayed), transform_length))
+            for j, i in enumerate(delayed):
+                c = cut_outs[i][0]
+                stacked[:, j, 0:c.shape[1]] = c
+            spectrum = sumpf_internal.rfft(stacked)
+            f = numpy.linspace(0.0, sampling_rate / 2.0, spectrum.shape[-1])
+            delays = numpy.array([cut_outs[i][1] for i in delayed])
+            spectrum *= numpy.exp(2j * math.pi * numpy.outer(delays, f))
+            channels[:, delayed] = sumpf_internal.irfft(spectrum, n=transform_length)[..., 0:length]
+        labels = [f"{l} ({sumpf_internal.counting_number(h)} harmonic)" for l in impulse_response.labels() for h in orders]
+        return Signal(channels=channels.reshape(len(impulse_response) * len(orders), length),
+                      sampling_rate=sampling_rate,
+                      offset=0,
+                      labels=labels)
+
+    def __cut_out(self, impulse_response, harmonic):
+        """Cuts out the samples of a harmonic's impulse response.
+
+        :param impulse_response: the :class:`~sumpf.Signal` with the complete impulse response
+        :param harmonic: the integer order of the harmonic
+        :returns: a tuple ``(channels, remaining_delay)``, where ``channels`` is
+                  a view of the impulse response's channels and ``remaining_delay``
+                  is the fractional delay in seconds, by which the harmonic's
+                  impulse response has to be shifted, or None for the linear part
+        """
+        offset = impulse_response.offset()
+        sampling_rate = impulse_response.sampling_rate()
+        if harmonic == 1:
+            return impulse_response.channels()[:, -offset:], None
+        delay = math.log(harmonic) * self.__l
+        shift = math.ceil(delay * sampling_rate)
+        start = -int(shift) - offset
+        remaining_delay = shift / sampling_rate - delay
+        if harmonic == 2:
+            stop = -offset
+        else:
+            stop = -int(math.floor(math.log(harmonic - 1) * self.__l * sampling_rate)) - offset
+        if stop == 0 or (start < 0 and stop >= 0):  # pylint: disable=chained-comparison; can't see what's wrong with this
+            stop = None
+        return impulse_response.channels()[:, start:stop], remaining_delay
+
 ################
 # linear sweep #
 ################
@@ -265,28 +435,36 @@ class LinearSweep(Sweep):
                               an integer or a float
         :param length: the number of samples of the sweep
         """
-        # allocate shared memory for the channels
         channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
-        # generate the sweep
-        _, _, t, _, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
-                                                                    stop_frequency=stop_frequency,
-                                                                    interval=interval,
-                                                                    sampling_rate=sampling_rate,
-                                                                    length=length)
-        if length <= 8192 or not numexpr:   # for short sweeps NumExpr is slower than NumPy
-            array = t * t
-            array *= b
-            array += a * t
-            array += phase
-            numpy.sin(array, out=channels[0, :])
-        else:
-            numexpr.evaluate(ex="sin(phase + a * t + b * (t**2))", out=channels[0, :], optimization="moderate")
-        # store the values and parameters
-        Sweep.__init__(self,
-                       channels=channels,
-                       sampling_rate=sampling_rate,
-                       offset=0,
-                       function=lambda tau: start_frequency + k * (tau - sweep_offset))
+        samples, offset, function = self._synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        synthesize(samples, channels[0])
+        Sweep.__init__(self, channels=channels, sampling_rate=sampling_rate, offset=offset, function=function)
+
+    @staticmethod
+    def _synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        start, _, _, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
+                                                                     stop_frequency=stop_frequency,
+                                                                     interval=interval,
+                                                                     sampling_rate=sampling_rate,
+                                                                     length=length)
+
+        use_numexpr = numexpr and length > 8192    # for short sweeps NumExpr is slower than NumPy
+
+        def samples(out, begin):
+            t = time_samples(begin, len(out), start, sampling_rate)
+            if not use_numexpr:
+                array = t * t
+                array *= b
+                array += a * t
+                array += phase
+                numpy.sin(array, out=out)
+            else:
+                numexpr.evaluate(ex="sin(phase + a * t + b * (t**2))",
+                                 local_dict={"phase": phase, "a": a, "b": b, "t": t},
+                                 out=out,
+                                 optimization="moderate")
+
+        return samples, 0, lambda tau: start_frequency + k * (tau - sweep_offset)
 
 
 class InverseLinearSweep(Sweep):
@@ -300,10 +478,11 @@ class InverseLinearSweep(Sweep):
     start frequency at the end.
 
     The offset of this sweep is chosen to work with a non-circular convolution
-    (convolution modes ``FULL`` or ``SPECTRUM_PADDED``). When performing a circular
-    convolution (convolution mode ``SPECTRUM``), the resulting impulse response
-    will be fully non-causal. In this case, it is recommended to set either the
-    inverse sweep's offset or the impulse response's offset to 0 by calling their
+    (convolution modes ``FULL``, ``SPECTRUM_PADDED``, ``OVERLAP_ADD`` or ``OVERLAP_SAVE``).
+    When performing a circular convolution (convolution mode ``SPECTRUM``), the
+    resulting impulse response will be fully non-causal. In this case, it is
+    recommended to set either the inverse sweep's offset or the impulse response's
+    offset to 0 by calling their
     :meth:`~sumpf.InverseLinearSweep.shift` method with parameter ``None``.
     """
 
@@ -328,32 +507,40 @@ class InverseLinearSweep(Sweep):
                               an integer or a float
         :param length: the number of samples of the sweep
         """
-        # allocate shared memory for the channels
         channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
-        # generate the sweep
-        start, stop, t, T, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
-                                                                           stop_frequency=stop_frequency,
-                                                                           interval=interval,
-                                                                           sampling_rate=sampling_rate,
-                                                                           length=length)
-        t *= -1.0
-        t += T
+        samples, offset, function = self._synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        synthesize(samples, channels[0])
+        Sweep.__init__(self, channels=channels, sampling_rate=sampling_rate, offset=offset, function=function)
+
+    @staticmethod
+    def _synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        start, stop, T, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
+                                                                        stop_frequency=stop_frequency,
+                                                                        interval=interval,
+                                                                        sampling_rate=sampling_rate,
+                                                                        length=length)
         s = 2.0 / (stop - start)    # a scaling factor, so that the convolution of the sweep and the inverse sweep results in a unit impulse
-        if length <= 8192 or not numexpr:   # for short sweeps NumExpr is slower than NumPy
-            array = t * t
-            array *= b
-            array += a * t
-            array += phase + 0.0
-            numpy.sin(array, out=channels[0, :])
-            channels *= s
-        else:
-            numexpr.evaluate(ex="s * sin(phase + a * t + b * (t**2))", out=channels[0, :], optimization="moderate")
-        # store the values and parameters
-        Sweep.__init__(self,
-                       channels=channels,
-                       sampling_rate=sampling_rate,
-                       offset=-stop - start,
-                       function=lambda tau: stop_frequency - k * (tau - sweep_offset))
+
+        use_numexpr = numexpr and length > 8192    # for short sweeps NumExpr is slower than NumPy
+
+        def samples(out, begin):
+            t = time_samples(begin, len(out), start, sampling_rate)
+            t *= -1.0
+            t += T
+            if not use_numexpr:
+                array = t * t
+                array *= b
+                array += a * t
+                array += phase + 0.0
+                numpy.sin(array, out=out)
+                out *= s
+            else:
+                numexpr.evaluate(ex="s * sin(phase + a * t + b * (t**2))",
+                                 local_dict={"s": s, "phase": phase, "a": a, "b": b, "t": t},
+                                 out=out,
+                                 optimization="moderate")
+
+        return samples, -stop - start, lambda tau: stop_frequency - k * (tau - sweep_offset)
 
 ######################
 # exponential sweeps #
@@ -384,31 +571,43 @@ class ExponentialSweep(BaseExponentialSweep):
                               an integer or a float
         :param length: the number of samples of the sweep
         """
-        # allocate shared memory for the channels
         channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
-        # generate the sweep
-        _, _, t, _, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
-                                                                      stop_frequency,
-                                                                      interval,
-                                                                      sampling_rate,
-                                                                      length)
-        if length <= 8192 or not numexpr:   # for short sweeps NumExpr is slower than NumPy
-            array = t
-            array /= l
-            numpy.expm1(array, out=array)
-            array *= a
-            array += phase
-            numpy.sin(array, out=channels[0, :])
-        else:
-            numexpr.evaluate(ex="sin(a * expm1(t / l) + phase)", out=channels[0, :], optimization="moderate")
-        # store the values and parameters
+        samples, offset, function, l = self._exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        synthesize(samples, channels[0])
         BaseExponentialSweep.__init__(self,
                                       channels=channels,
                                       sampling_rate=sampling_rate,
-                                      offset=0,
-                                      function=lambda tau: start_frequency * math.exp((tau - sweep_offset) / l),
+                                      offset=offset,
+                                      function=function,
                                       l=l)
 
+    @staticmethod
+    def _exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        start, _, _, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
+                                                                       stop_frequency,
+                                                                       interval,
+                                                                       sampling_rate,
+                                                                       length)
+
+        use_numexpr = numexpr and length > 8192    # for short sweeps NumExpr is slower than NumPy
+
+        def samples(out, begin):
+            t = time_samples(begin, len(out), start, sampling_rate)
+            if not use_numexpr:
+                array = t
+                array /= l
+                numpy.expm1(array, out=array)
+                array *= a
+                array += phase
+                numpy.sin(array, out=out)
+            else:
+                numexpr.evaluate(ex="sin(a * expm1(t / l) + phase)",
+                                 local_dict={"a": a, "l": l, "phase": phase, "t": t},
+                                 out=out,
+                                 optimization="moderate")
+
+        return samples, 0, lambda tau: start_frequency * numpy.exp((tau - sweep_offset) / l), l
+
 
 class InverseExponentialSweep(BaseExponentialSweep):
     """Creates an inverse for an exponential sweep.
@@ -421,10 +620,11 @@ class InverseExponentialSweep(BaseExponentialSweep):
     start frequency at the end.
 
     The offset of this sweep is chosen to work with a non-circular convolution
-    (convolution modes ``FULL`` or ``SPECTRUM_PADDED``). When performing a circular
-    convolution (convolution mode ``SPECTRUM``), the resulting impulse response
-    will be fully non-causal. In this case, it is recommended to set either the
-    inverse sweep's offset or the impulse response's offset to 0 by calling their
+    (convolution modes ``FULL``, ``SPECTRUM_PADDED``, ``OVERLAP_ADD`` or ``OVERLAP_SAVE``).
+    When performing a circular convolution (convolution mode ``SPECTRUM``), the
+    resulting impulse response will be fully non-causal. In this case, it is
+    recommended to set either the inverse sweep's offset or the impulse response's
+    offset to 0 by calling their
     :meth:`~sumpf.InverseExponentialSweep.shift` method with parameter ``None``.
     """
 
@@ -456,36 +656,48 @@ class InverseExponentialSweep(BaseExponentialSweep):
                               an integer or a float
         :param length: the number of samples of the inverse sweep
         """
-        # allocate shared memory for the channels
         channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
-        # generate the sweep
-        start, stop, t, T, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
-                                                                             stop_frequency,
-                                                                             interval,
-                                                                             sampling_rate,
-                                                                             length)
-        s = 2.0 * start_frequency / l / (stop_frequency - start_frequency) / sampling_rate      # a scaling factor, so that the convolution of the sweep and the inverse sweep results in a unit impulse
-        if length <= 8192 or not numexpr:   # for short sweeps NumExpr is slower than NumPy
-            exponent = numpy.subtract(T, t, out=t)
-            exponent /= l
-            # compute the envelope
-            envelope = numpy.exp(exponent)
-            envelope *= s
-            # compute the sweep
-            sweep = numpy.expm1(exponent, out=exponent)
-            sweep *= a
-            sweep += phase
-            numpy.sin(sweep, out=sweep)
-            # combine the envelope and the sweep
-            numpy.multiply(envelope, sweep, out=channels[0, :])
-        else:
-            envelope = "s * exp((T-t) / l)"
-            sweep = "sin(a * expm1((T-t) / l) + phase)"
-            numexpr.evaluate(ex=f"{envelope} * {sweep}", out=channels[0, :], optimization="moderate")
-        # store the values and parameters
+        samples, offset, function, l = self._exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length)
+        synthesize(samples, channels[0])
         BaseExponentialSweep.__init__(self,
                                       channels=channels,
                                       sampling_rate=sampling_rate,
-                                      offset=-stop - start,
-                                      function=lambda tau: stop_frequency * math.exp((-tau + sweep_offset) / l),
+                                      offset=offset,
+                                      function=function,
                                       l=l)
+
+    @staticmethod
+    def _exponential_synthesizer(start_frequency, stop_frequency, phase, interval, sampling_rate, length):
+        start, stop, T, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
+                                                                          stop_frequency,
+                                                                          interval,
+                                                                          sampling_rate,
+                                                                          length)
+        s = 2.0 * start_frequency / l / (stop_frequency - start_frequency) / sampling_rate      # a scaling factor, so that the convolution of the sweep and the inverse sweep results in a unit impulse
+
+        use_numexpr = numexpr and length > 8192    # for short sweeps NumExpr is slower than NumPy
+
+        def samples(out, begin):
+            t = time_samples(begin, len(out), start, sampling_rate)
+            if not use_numexpr:
+                exponent = numpy.subtract(T, t, out=t)
+                exponent /= l
+                # compute the envelope
+                envelope = numpy.exp(exponent)
+                envelope *= s
+                # compute the sweep
+                sweep = numpy.expm1(exponent, out=exponent)
+                sweep *= a
+                sweep += phase
+                numpy.sin(sweep, out=sweep)
+                # combine the envelope and the sweep
+                numpy.multiply(envelope, sweep, out=out)
+            else:
+                envelope = "s * exp((T-t) / l)"
+                sweep = "sin(a * expm1((T-t) / l) + phase)"
+                numexpr.evaluate(ex=f"{envelope} * {sweep}",
+                                 local_dict={"s": s, "T": T, "l": l, "a": a, "phase": phase, "t": t},
+                                 out=out,
+                                 optimization="moderate")
+
+        return samples, -stop - start, lambda tau: stop_frequency * numpy.exp((-tau + sweep_offset) / l), l
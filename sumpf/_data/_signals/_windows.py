@@ -105,10 +105,8 @@ class Window(Signal):
                              to the frequency domain.
         :returns: the bandwidth as a float in Hz
         """
-        padded_channel = numpy.empty(oversampling * self._length)
-        padded_channel[0:self._length] = self._channels[0]
-        padded_channel[self._length:] = 0.0
-        spectrum = numpy.fft.rfft(padded_channel)
+        padded_length = sumpf_internal.fast_length(oversampling * self._length)
+        spectrum = sumpf_internal.rfft(self._channels[0], n=padded_length)
         magnitude = numpy.abs(spectrum)
         threshold = magnitude[0] / math.sqrt(2.0)
         i = 0
@@ -119,7 +117,7 @@ class Window(Signal):
         y2 = abs(m)
         y1 = abs(magnitude[i])
         frequency_bin = 2.0 * (i + (threshold - y1) / (y2 - y1))
-        resolution = 1.0 / self.duration() / oversampling
+        resolution = self.sampling_rate() / padded_length
         return frequency_bin * resolution
 
     def scalloping_loss(self):
@@ -136,10 +134,7 @@ class Window(Signal):
         :returns: the scalloping loss as a float factor
         """
         # append zeros to the window to double the frequency resolution of the spectrum
-        padded_channel = numpy.empty(2 * self._length)
-        padded_channel[0:self._length] = self._channels[0]
-        padded_channel[self._length:] = 0.0
-        spectrum = numpy.fft.rfft(padded_channel)
+        spectrum = sumpf_internal.rfft(self._channels[0], n=2 * self._length)
         # due to the doubled frequency resolution, the amplitude error at the
         # 0.5-frequency bins in the original resolution is now the ratio between
         # the first and the second bin
@@ -71,6 +71,13 @@ class Spectrogram(SampledData):
          arrays, tuples or lists. Broadcasting is done like in :mod:`numpy` (e.g.
          adding a single-channel spectrogram to a multi-channel one, will add the channel
          of the first spectrogram to each of the second.)
+
+    The precision of the spectrogram's samples is defined by the dtype of its
+    channels. The computations with the spectrogram keep this precision, so that
+    for example a spectrogram with ``numpy.complex64`` samples is transformed to
+    a signal with ``numpy.float32`` samples. Arrays and numbers, that are combined
+    with the spectrogram, are cast to the spectrogram's precision, while computations
+    with other data sets of different precisions result in the higher precision.
     """
     file_formats = sumpf_internal.spectrogram_writers.Formats   #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Spectrogram.save` (see the :class:`sumpf._internal._spectrogram_writers.Formats` class).
     shift_modes = sumpf_internal.ShiftMode                      #: an enumeration with modes for the :meth:`~sumpf.Spectrogram.shift` method (see the :class:`~sumpf._internal._enums.ShiftMode` class).
@@ -80,7 +87,8 @@ class Spectrogram(SampledData):
                  resolution=1.0,
                  sampling_rate=48000.0,
                  offset=0,
-                 labels=None):
+                 labels=None,
+                 dtype=None):
         """
         :param channels: a three-dimensional :func:`numpy.array` of channels with complex samples
         :param resolution: the resolution of the spectrogram's frequency bins as a float
@@ -89,8 +97,11 @@ class Spectrogram(SampledData):
                        the channel is delayed virtually. The offset can also be
                        negative, if the spectrogram shall be non-causal.
         :param labels: a sequence of string labels for the channels
+        :param dtype: an optional dtype (e.g. ``numpy.complex64``), to which the
+                      channels are converted. If None, the dtype of the given
+                      channels is kept.
         """
-        SampledData.__init__(self, channels, labels)
+        SampledData.__init__(self, channels, labels, dtype)
         self.__resolution = resolution
         self.__sampling_rate = sampling_rate
         self.__offset = offset
@@ -148,11 +159,13 @@ class Spectrogram(SampledData):
                                       separator=",",
                                       formatter={"all": repr},
                                       threshold=self._channels.size).replace("\n", "").replace(" ", "")
+        dtype = "" if self._channels.dtype == numpy.complex128 else f", dtype={self._channels.dtype.name}"
         return (f"{self.__class__.__name__}(channels=array({channels}), "
                 f"resolution={self.__resolution}, "
                 f"sampling_rate={self.__sampling_rate!r}, "
                 f"offset={self.__offset}, "
-                f"labels={self._labels})")
+                f"labels={self._labels}"
+                f"{dtype})")
 
     def __eq__(self, other):
         """Operator overload for comparing this spectrogram to another object with ``==``"""
@@ -180,7 +193,8 @@ class Spectrogram(SampledData):
 
         :returns: a :class:`sumpf.Spectrogram` instance
         """
-        return Spectrogram(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        channels = sumpf_internal.allocate_array(self.shape(), sumpf_internal.real_dtype(self._channels.dtype))
+        return Spectrogram(channels=numpy.absolute(self._channels, out=channels),
                            resolution=self.__resolution,
                            sampling_rate=self.__sampling_rate,
                            offset=self.__offset,
@@ -191,7 +205,7 @@ class Spectrogram(SampledData):
 
         :returns: a :class:`sumpf.Spectrogram` instance
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype())
         numpy.negative(self._channels, out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -315,7 +329,7 @@ class Spectrogram(SampledData):
             return self
         else:
             channels = sumpf_internal.allocate_array(shape=(len(self), self.__frequencies, length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=self.__complex_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, :, 0:length]
             else:
@@ -360,7 +374,7 @@ class Spectrogram(SampledData):
                                    labels=self._labels)
         else:
             if mode == Spectrogram.shift_modes.CROP:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self.__complex_dtype())
                 if shift < 0:
                     channels[:, :, 0:shift] = self._channels[:, :, -shift:]
                     channels[:, :, shift:] = 0.0
@@ -371,7 +385,7 @@ class Spectrogram(SampledData):
                 channels = sumpf_internal.allocate_array(shape=(len(self),
                                                                 self.__frequencies,
                                                                 self._length + abs(shift)),
-                                                         dtype=numpy.complex128)
+                                                         dtype=self.__complex_dtype())
                 if shift < 0:
                     channels[:, :, 0:self._length] = self._channels
                     channels[:, :, self._length:] = 0.0
@@ -379,7 +393,7 @@ class Spectrogram(SampledData):
                     channels[:, :, 0:shift] = 0.0
                     channels[:, :, shift:] = self._channels
             elif mode == Spectrogram.shift_modes.CYCLE:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self.__complex_dtype())
                 channels[:, :, 0:shift] = self._channels[:, :, -shift:]
                 channels[:, :, shift:] = self._channels[:, :, 0:-shift]
             return Spectrogram(channels=channels,
@@ -393,7 +407,7 @@ class Spectrogram(SampledData):
 
         :returns: a :class:`sumpf.Spectrogram`
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype())
         numpy.conjugate(self._channels, out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -449,7 +463,7 @@ class Spectrogram(SampledData):
                                                 nperseg=window_length,
                                                 noverlap=overlap,
                                                 boundary=pad)[1])
-        channels = sumpf_internal.allocate_array(shape=numpy.shape(istft))
+        channels = sumpf_internal.allocate_array(shape=numpy.shape(istft), dtype=sumpf_internal.real_dtype(self._channels.dtype))
         channels[:] = istft
         # return the spectrogram
         return sumpf.Signal(channels=channels,
@@ -462,15 +476,18 @@ class Spectrogram(SampledData):
     #######################
 
     @staticmethod
-    def load(path):
+    def load(path, dtype=None):
         """A static method to load a :class:`~sumpf.Spectrogram` instance from a file.
 
         :param path: the path to the file.
+        :param dtype: the dtype of the loaded spectrogram's channels (e.g. ``numpy.complex64``)
+                      or None, if the precision of the file shall be used
         :returns: the loaded :class:`~sumpf.Spectrogram`
         """
         return sumpf_internal.read_file(path=path,
                                         readers=sumpf_internal.spectrogram_readers.readers,
-                                        reader_base_class=sumpf_internal.spectrogram_readers.Reader)
+                                        reader_base_class=sumpf_internal.spectrogram_readers.Reader,
+                                        dtype=dtype)
 
     def save(self, path, file_format=file_formats.AUTO):
         """Saves the spectrogram to a file. The file will be created if it does
@@ -538,7 +555,7 @@ class Spectrogram(SampledData):
         elif isinstance(other, sumpf.Spectrum):
             return self.__algebra_function_spectrum_right(other, function, other_pivot, label)
         else:
-            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype())
             try:
                 function(other, self._channels, out=channels)
             except TypeError:
@@ -586,7 +603,7 @@ class Spectrogram(SampledData):
                                                                         label)
 
     def __algebra_function_overlaps(self, self_channels, other_channels, shape, function, label):
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other_channels))
         function(self_channels, other_channels, out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -598,7 +615,7 @@ class Spectrogram(SampledData):
         self_length = len(self)
         other_length = len(other)
         if self_length > other_length:
-            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype(other.channels()))
             function(self.channels()[0:other_length], other.channels(), out=channels[0:other_length])
             if other_pivot is None:
                 channels[other_length:] = self.channels()[other_length:]
@@ -606,7 +623,7 @@ class Spectrogram(SampledData):
                 function(self.channels()[other_length:], other_pivot, out=channels[other_length:])
             labels = (label,) * self_length
         else:
-            channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=self.__complex_dtype(other.channels()))
             function(self.channels(), other.channels()[0:self_length], out=channels[0:self_length])
             if other_pivot is None:
                 channels[self_length:] = other.channels()[self_length:]
@@ -627,7 +644,7 @@ class Spectrogram(SampledData):
         frequencies = max(self.__frequencies, other.number_of_frequencies())
         channel_count = max(len(self), len(other))
         shape = (channel_count, frequencies, length)
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other.channels()))
         # compute a few indices to make the slicing more readable
         sc = len(self)
         sf = self.__frequencies
@@ -836,7 +853,7 @@ class Spectrogram(SampledData):
                                                                                               label)
 
     def __algebra_function_signal_spectrum_overlaps(self, a_channels, b_channels, shape, transpose, function, label):
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=sumpf_internal.complex_dtype(numpy.result_type(a_channels, b_channels)))
         function(a_channels, b_channels, out=channels.transpose(transpose))
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -853,7 +870,7 @@ class Spectrogram(SampledData):
         self_length = len(self)
         other_length = len(other)
         if self_length > other_length:
-            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype(other.channels()))
             function(self.channels()[0:other_length].transpose(transpose),
                      other.channels(),
                      out=channels[0:other_length].transpose(transpose))
@@ -864,7 +881,7 @@ class Spectrogram(SampledData):
             labels = (label,) * self_length
         else:
             shape = (len(other), self.__frequencies, self._length)
-            channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other.channels()))
             function(self.channels().transpose(transpose),
                      other.channels()[0:self_length],
                      out=channels[0:self_length].transpose(transpose))
@@ -890,7 +907,7 @@ class Spectrogram(SampledData):
         self_length = len(self)
         other_length = len(other)
         if self_length > other_length:
-            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype(other.channels()))
             function(other.channels(),
                      self.channels()[0:other_length].transpose(transpose),
                      out=channels[0:other_length].transpose(transpose))
@@ -903,7 +920,7 @@ class Spectrogram(SampledData):
             labels = (label,) * self_length
         else:
             shape = (len(other), self.__frequencies, self._length)
-            channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other.channels()))
             function(other.channels()[0:self_length],
                      self.channels().transpose(transpose),
                      out=channels[0:self_length].transpose(transpose))
@@ -928,7 +945,7 @@ class Spectrogram(SampledData):
         length = stop - start
         channel_count = max(len(self), len(other))
         shape = (channel_count, self.__frequencies, length)
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other.channels()))
         transposed = channels.transpose((1, 0, 2))
         # compute a few indices to make the slicing more readable
         sc = len(self)
@@ -988,7 +1005,7 @@ class Spectrogram(SampledData):
         length = stop - start
         channel_count = max(len(self), len(other))
         shape = (channel_count, self.__frequencies, length)
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=self.__complex_dtype(other.channels()))
         transposed = channels.transpose((1, 0, 2))
         # compute a few indices to make the slicing more readable
         sc = len(self)
@@ -1043,7 +1060,7 @@ class Spectrogram(SampledData):
     # algebra with other types of data
 
     def __algebra_function_different_type(self, other, function):
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype())
         try:
             function(self._channels, other, out=channels)
         except TypeError:
@@ -1054,3 +1071,11 @@ class Spectrogram(SampledData):
                                sampling_rate=self.__sampling_rate,
                                offset=self.__offset,
                                labels=self._labels)
+
+    def __complex_dtype(self, other_channels=None):
+        """Returns the complex dtype for the samples of a spectrogram, that is computed
+        from this spectrogram and optionally the channels of another data set."""
+        if other_channels is None:
+            return sumpf_internal.complex_dtype(self._channels.dtype)
+        else:
+            return sumpf_internal.complex_dtype(numpy.result_type(self._channels, other_channels))
@@ -72,17 +72,27 @@ class Spectrum(SampledData):
     * Rededicated operators (operators, for which Python has intended a different function than for what it is used in the :class:`~sumpf.Spectrum` class)
        * inverting the spectrum with ``~spectrum``. The inverse of a spectrum is
          simply ``1 / spectrum``.
+
+    The precision of the spectrum's samples is defined by the dtype of its channels.
+    The computations with the spectrum keep this precision, so that for example a
+    spectrum with ``numpy.complex64`` samples is transformed to a signal with ``numpy.float32``
+    samples. Arrays and numbers, that are combined with the spectrum, are cast to
+    the spectrum's precision, while computations with two spectrums of different
+    precisions result in the higher precision.
     """
 
     file_formats = sumpf_internal.spectrum_writers.Formats    #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Spectrum.save` (see the :class:`sumpf._internal._spectrum_writers.Formats` class).
 
-    def __init__(self, channels=numpy.empty(shape=(1, 0)), resolution=1.0, labels=None):
+    def __init__(self, channels=numpy.empty(shape=(1, 0)), resolution=1.0, labels=None, dtype=None):
         """
         :param channels: a two-dimensional :func:`numpy.array` of channels with complex samples
         :param resolution: the frequency resolution of the spectrum as a float
         :param labels: a sequence of string labels for the channels
+        :param dtype: an optional dtype (e.g. ``numpy.complex64``), to which the
+                      channels are converted. If None, the dtype of the given
+                      channels is kept.
         """
-        SampledData.__init__(self, channels, labels)
+        SampledData.__init__(self, channels, labels, dtype)
         self.__resolution = resolution
 
     ###########################################
@@ -127,9 +137,11 @@ class Spectrum(SampledData):
                                       separator=",",
                                       formatter={"all": repr},
                                       threshold=self._channels.size).replace("\n", "").replace(" ", "")
+        dtype = "" if self._channels.dtype == numpy.complex128 else f", dtype={self._channels.dtype.name}"
         return (f"{self.__class__.__name__}(channels=array({channels}), "
                 f"resolution={self.__resolution!r}, "
-                f"labels={self._labels})")
+                f"labels={self._labels}"
+                f"{dtype})")
 
     def __eq__(self, other):
         """Operator overload for comparing this spectrum to another object with ``==``"""
@@ -153,7 +165,8 @@ class Spectrum(SampledData):
 
         :returns: a :class:`~sumpf.Spectrum` instance
         """
-        return Spectrum(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        channels = sumpf_internal.allocate_array(self.shape(), sumpf_internal.real_dtype(self._channels.dtype))
+        return Spectrum(channels=numpy.absolute(self._channels, out=channels),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -163,7 +176,7 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         return Spectrum(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape(),
-                                                                                                  numpy.complex128)),
+                                                                                                  self.__complex_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -185,21 +198,22 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         if isinstance(other, Spectrum):
+            dtype = self.__complex_dtype(other)
             if len(self) == 1:
-                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=dtype)
                 function(self._channels[0], other.channels(), out=channels)
             elif len(other) == 1:
-                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
                 function(self._channels, other.channels()[0], out=channels)
             elif len(self) < len(other):
-                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=dtype)
                 function(self._channels, other.channels()[0:len(self)], out=channels[0:len(self)])
                 if other_pivot is None:
                     channels[len(self):] = other.channels()[len(self):]
                 else:
                     function(other_pivot, other.channels()[len(self):], out=channels[len(self):])
             else:
-                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
                 function(self._channels[0:len(other)], other.channels(), out=channels[0:len(other)])
                 channels[len(other):] = self._channels[len(other):]
             return Spectrum(channels=channels, resolution=self.__resolution, labels=(label,) * len(channels))
@@ -209,7 +223,7 @@ class Spectrum(SampledData):
             try:
                 return Spectrum(channels=function(self._channels,
                                                   other,
-                                                  out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                                  out=sumpf_internal.allocate_array(self.shape(), self.__complex_dtype())),
                                 resolution=self.__resolution,
                                 labels=self._labels)
             except TypeError:
@@ -229,7 +243,7 @@ class Spectrum(SampledData):
         """
         return Spectrum(channels=function(other,
                                           self._channels,
-                                          out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                          out=sumpf_internal.allocate_array(self.shape(), self.__complex_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -245,7 +259,7 @@ class Spectrum(SampledData):
         """
         return Spectrum(channels=numpy.divide(1.0,
                                               self._channels,
-                                              out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                              out=sumpf_internal.allocate_array(self.shape(), self.__complex_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -324,7 +338,7 @@ class Spectrum(SampledData):
         if length == self._length:
             return self
         else:
-            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=self.__complex_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, 0:length]
             else:
@@ -339,7 +353,7 @@ class Spectrum(SampledData):
 
         :returns: a :class:`~sumpf.Spectrum`
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self.__complex_dtype())
         numpy.conjugate(self._channels, out=channels)
         return Spectrum(channels=channels, resolution=self.__resolution, labels=self._labels)
 
@@ -353,14 +367,14 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Signal` instance
         """
         if self._length == 0:
-            return sumpf.Signal(channels=numpy.empty(shape=(len(self), 0)),
+            return sumpf.Signal(channels=numpy.empty(shape=(len(self), 0), dtype=sumpf_internal.real_dtype(self._channels.dtype)),
                                 sampling_rate=0.0,
                                 offset=0,
                                 labels=self._labels)
         length = max(1, (self._length - 1) * 2)
         sampling_rate = self.__resolution * length
-        channels = sumpf_internal.allocate_array(shape=(len(self._channels), length))
-        channels[:, :] = numpy.fft.irfft(self._channels, n=length)
+        channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=sumpf_internal.real_dtype(self._channels.dtype))
+        channels[:, :] = sumpf_internal.irfft(self._channels, n=length)
         return sumpf.Signal(channels=channels,
                             sampling_rate=sampling_rate,
                             offset=0,
@@ -391,15 +405,18 @@ class Spectrum(SampledData):
     #######################
 
     @staticmethod
-    def load(path):
+    def load(path, dtype=None):
         """A static method to load a :class:`~sumpf.Spectrum` instance from a file.
 
         :param path: the path to the file.
+        :param dtype: the dtype of the loaded spectrum's channels (e.g. ``numpy.complex64``)
+                      or None, if the precision of the file shall be used
         :returns: the loaded :class:`~sumpf.Spectrum`
         """
         return sumpf_internal.read_file(path=path,
                                         readers=sumpf_internal.spectrum_readers.readers,
-                                        reader_base_class=sumpf_internal.spectrum_readers.Reader)
+                                        reader_base_class=sumpf_internal.spectrum_readers.Reader,
+                                        dtype=dtype)
 
     def save(self, path, file_format=file_formats.AUTO):
         """Saves the spectrum to a file. The file will be created if it does not
@@ -418,3 +435,15 @@ class Spectrum(SampledData):
                                            writer_base_class=sumpf_internal.spectrum_writers.Writer)
         writer(self, path)
         return self
+
+    ########################################################################
+    # private helper methods for implementing math related functionalities #
+    ########################################################################
+
+    def __complex_dtype(self, other=None):
+        """Returns the complex dtype for the samples of a spectrum, that is computed
+        from this spectrum and optionally another spectrum."""
+        if other is None:
+            return sumpf_internal.complex_dtype(self._channels.dtype)
+        else:
+            return sumpf_internal.complex_dtype(numpy.result_type(self._channels, other.channels()))
@@ -18,12 +18,22 @@
 
 from ._persistence import *
 
+from ._allocation import *
+from ._averaging import *
+from ._cache import *
 from ._convolution import *
 from ._enums import *
+from ._fft import *
+from ._fir import *
 from ._indexing import *
 from ._functions import *
 from ._text import *
 
+try:
+    from ._biquad import *
+except ImportError:
+    pass
+
 from . import _interpolation as interpolation
 
 from .._data._filters._base import _terms as filter_terms
@@ -0,0 +1,525 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the allocators, with which the arrays for the channels of the data
+containers are allocated."""
+
+import collections
+import collections.abc
+import ctypes
+import math
+from multiprocessing import shared_memory, sharedctypes
+import sys
+import threading
+import weakref
+import numpy
+from ._enums import AllocationPolicy
+
+__all__ = ("Allocator", "SharedMemoryAllocator", "NumpyAllocator", "PoolAllocator",
+           "NamedSharedMemoryAllocator", "SharedMemoryHandle", "SharedContainer",
+           "shared_memory_handle", "share", "transfer_ownership",
+           "get_allocator", "set_allocator")
+
+
+class Allocator:
+    """Base class for allocators.
+
+    Derived classes have to implement the :meth:`~sumpf._internal._allocation.Allocator.allocate_block`
+    method, which returns a writable, flat buffer with the requested number of
+    bytes. Classes, that allocate the arrays differently, can also override the
+    :meth:`~sumpf._internal._allocation.Allocator.allocate` method directly.
+    Instances of such classes can be passed to :func:`~sumpf._internal._allocation.set_allocator`
+    in order to supply a custom arena for the arrays of *SuMPF*'s data containers.
+    """
+
+    def allocate(self, shape, dtype=numpy.float64):
+        """Allocates an uninitialized array with the given shape and dtype.
+
+        :param shape: the shape of the requested array
+        :param dtype: the dtype of the numbers, that are stored in the array
+        :returns: a :func:`numpy.array`
+        """
+        dtype = numpy.dtype(dtype)
+        count = int(numpy.prod(shape))
+        block = self.allocate_block(count * dtype.itemsize)
+        return numpy.frombuffer(block, dtype=dtype, count=count).reshape(shape)
+
+    def allocate_block(self, size):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param size: the number of bytes, that shall be allocated
+        :returns: an object, that supports the buffer protocol and that is writable
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+
+class SharedMemoryAllocator(Allocator):
+    """Allocates every array in its own block of shared memory, so that the array
+    can be accessed from child processes, which are forked after the allocation.
+    """
+
+    def allocate_block(self, size):
+        """Allocates a flat block of shared memory.
+
+        :param size: the number of bytes, that shall be allocated
+        :returns: a :func:`multiprocessing.sharedctypes.RawArray`
+        """
+        doubles = -(-size // ctypes.sizeof(ctypes.c_double))   # the memory is allocated as an array of doubles, which guarantees the alignment for all numeric dtypes
+        return sharedctypes.RawArray(ctypes.c_double, doubles)
+
+
+class NumpyAllocator(Allocator):
+    """Allocates the arrays in the process's private memory with :func:`numpy.empty`."""
+
+    def allocate(self, shape, dtype=numpy.float64):
+        """Allocates an uninitialized array with the given shape and dtype.
+
+        :param shape: the shape of the requested array
+        :param dtype: the dtype of the numbers, that are stored in the array
+        :returns: a :func:`numpy.array`
+        """
+        return numpy.empty(shape=shape, dtype=dtype)
+
+    def allocate_block(self, size):
+        """Allocates a flat block of memory.
+
+        :param size: the number of bytes, that shall be allocated
+        :returns: a :func:`numpy.array` of bytes
+        """
+        return numpy.empty(size, dtype=numpy.uint8)
+
+
+class PoolAllocator(Allocator):
+    """Maintains a pool of memory blocks, which are sorted into size classes.
+
+    When an array is requested, a released block of the matching size class is
+    reused, if one is available. Otherwise, a new block is allocated by the backend
+    allocator. The block is returned to the pool automatically, when the array
+    and all views of it have been garbage collected.
+
+    The size classes are spaced by an eighth of an octave, so that less than 12.5%
+    of a block's memory is wasted.
+    """
+
+    def __init__(self, backend=None, max_cached_bytes=2 ** 28, minimum_block_size=256):
+        """
+        :param backend: the :class:`~sumpf._internal._allocation.Allocator`, that
+                        allocates new blocks. Defaults to a :class:`~sumpf._internal._allocation.SharedMemoryAllocator`.
+        :param max_cached_bytes: the maximum number of bytes, that are kept in the
+                                 pool for later reuse. Released blocks, that would
+                                 exceed this limit, are freed.
+        :param minimum_block_size: the size of the smallest size class in bytes
+        """
+        self.__backend = SharedMemoryAllocator() if backend is None else backend
+        self.__max_cached_bytes = max_cached_bytes
+        self.__minimum_block_size = minimum_block_size
+        self.__free = collections.defaultdict(list)
+        self.__cached_bytes = 0
+        self.__lock = threading.Lock()
+        self.__statistics = {"allocations": 0, "reuses": 0}
+
+    def allocate(self, shape, dtype=numpy.float64):
+        """Allocates an uninitialized array with the given shape and dtype.
+
+        :param shape: the shape of the requested array
+        :param dtype: the dtype of the numbers, that are stored in the array
+        :returns: a :func:`numpy.array`
+        """
+        dtype = numpy.dtype(dtype)
+        shape = tuple(shape) if isinstance(shape, collections.abc.Iterable) else (shape,)
+        size = self.size_class(math.prod(shape) * dtype.itemsize)
+        block, address = self.__take(size)
+        lease = _Lease(block, address, shape, dtype)
+        weakref.finalize(lease, self.__release, size, block, address)
+        return numpy.asarray(lease)
+
+    def allocate_block(self, size):
+        """Allocates a flat block of memory from the pool. Other than the arrays,
+        that are returned by :meth:`~sumpf._internal._allocation.PoolAllocator.allocate`,
+        the returned block is not returned to the pool automatically.
+
+        :param size: the number of bytes, that shall be allocated
+        :returns: an object, that supports the buffer protocol and that is writable
+        """
+        return self.__take(self.size_class(size))[0]
+
+    def size_class(self, size):
+        """Computes the size of the block, in which an array with the given number
+        of bytes is stored.
+
+        :param size: the number of bytes of the array
+        :returns: the number of bytes of the block
+        """
+        if size <= self.__minimum_block_size:
+            return self.__minimum_block_size
+        step = 1 << max(0, (size - 1).bit_length() - 4)
+        return -(-size // step) * step
+
+    def cached_bytes(self):
+        """Returns the number of bytes, that are currently kept in the pool for reuse.
+
+        :returns: an integer
+        """
+        return self.__cached_bytes
+
+    def statistics(self):
+        """Returns how many blocks have been allocated by the backend and how
+        many blocks have been reused from the pool.
+
+        :returns: a dictionary with the keys ``"allocations"`` and ``"reuses"``
+        """
+        with self.__lock:
+            return dict(self.__statistics)
+
+    def clear(self):
+        """Frees all blocks, that are kept in the pool for reuse.
+
+        :returns: self
+        """
+        with self.__lock:
+            self.__free.clear()
+            self.__cached_bytes = 0
+        return self
+
+    def __take(self, size):
+        """Returns a free block of the given size class or allocates a new one
+        as a tuple of the block and the address of its memory."""
+        with self.__lock:
+            blocks = self.__free.get(size)
+            if blocks:
+                self.__cached_bytes -= size
+                self.__statistics["reuses"] += 1
+                return blocks.pop()
+            self.__statistics["allocations"] += 1
+        block = self.__backend.allocate_block(size)
+        return block, numpy.frombuffer(block, dtype=numpy.uint8).ctypes.data
+
+    def __release(self, size, block, address):
+        """Returns a block to the pool, when the array, that was stored in it, has been garbage collected."""
+        with self.__lock:
+            if self.__cached_bytes + size <= self.__max_cached_bytes:
+                self.__free[size].append((block, address))
+                self.__cached_bytes += size
+
+
+class _Lease:
+    """Helper class, that exposes a block from a :class:`~sumpf._internal._allocation.PoolAllocator`
+    as an array. The lease becomes the base object of the array and of all its
+    views, so it is garbage collected not before all of them have been deleted.
+    """
+
+    def __init__(self, block, address, shape, dtype):
+        """
+        :param block: the block of memory, in which the array is stored
+        :param address: the address of the block's memory
+        :param shape: the shape of the array
+        :param dtype: the dtype of the array as :class:`numpy.dtype` instance
+        """
+        self.block = block
+        self.__array_interface__ = {"shape": shape,
+                                    "typestr": dtype.str,
+                                    "descr": dtype.descr,
+                                    "data": (address, False),
+                                    "version": 3}
+
+
+class NamedSharedMemoryAllocator(Allocator):
+    """Allocates every array in its own named segment of shared memory (see
+    :class:`multiprocessing.shared_memory.SharedMemory`).
+
+    Data containers, whose channels are stored in such a segment, are pickled
+    with their samples like any other data container, so that saving or copying
+    them does not depend on the lifetime of the segment. For passing them to
+    another process without copying their samples, they have to be wrapped with
+    :func:`~sumpf._internal._allocation.share`. Such a wrapper is pickled as a
+    :class:`~sumpf._internal._allocation.SharedMemoryHandle` with the name of
+    the segment, the layout of the array and the metadata of the container. When
+    unpickled, for example in the worker process of a :class:`concurrent.futures.ProcessPoolExecutor`,
+    the segment is attached again and the data container is restored without
+    the wrapper.
+
+    The ownership of the segments follows these rules:
+
+    * The process, which has allocated the segment, owns it. The segment is unlinked,
+      when the array and all of its views have been garbage collected in the
+      owning process. Therefore, the owning process has to keep the data container
+      alive, until all other processes have attached to the segment.
+    * Processes, which attach to the segment by unpickling a shared data container, do
+      not own it. They only close their mapping of the segment, when they no
+      longer need it.
+    * The ownership can be handed over to another process with :func:`~sumpf._internal._allocation.transfer_ownership`
+      (e.g. when a worker process returns its results). The next pickled handle
+      of the segment then carries the ownership, and the process, which unpickles
+      it, becomes responsible for unlinking the segment.
+    * Segments, that have been leaked, for example, because a process crashed
+      before unlinking them, are unlinked by :mod:`multiprocessing`'s resource
+      tracker, when the program exits.
+    """
+
+    def allocate(self, shape, dtype=numpy.float64):
+        """Allocates an uninitialized array with the given shape and dtype.
+
+        :param shape: the shape of the requested array
+        :param dtype: the dtype of the numbers, that are stored in the array
+        :returns: a :func:`numpy.array`
+        """
+        dtype = numpy.dtype(dtype)
+        shape = tuple(shape) if isinstance(shape, collections.abc.Iterable) else (shape,)
+        segment = self.allocate_block(math.prod(shape) * dtype.itemsize)
+        return _SegmentLease(segment=segment, owner=True).array(offset=0, shape=shape, strides=None, dtype=dtype)
+
+    def allocate_block(self, size):
+        """Creates a new named segment of shared memory.
+
+        :param size: the number of bytes, that shall be allocated
+        :returns: a :class:`multiprocessing.shared_memory.SharedMemory` instance
+        """
+        return shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+
+class SharedMemoryHandle:
+    """A picklable reference to an array in a named segment of shared memory.
+    Instances of this class are created by :func:`~sumpf._internal._allocation.shared_memory_handle`.
+    """
+
+    def __init__(self, name, offset, shape, strides, dtype, owner=False):
+        """
+        :param name: the name of the shared memory segment
+        :param offset: the offset of the array's first element from the start of the segment in bytes
+        :param shape: the shape of the array
+        :param strides: the strides of the array
+        :param dtype: the dtype of the array
+        :param owner: True, if the process, which attaches the segment, shall become
+                      responsible for unlinking it, False otherwise
+        """
+        self.name = name
+        self.offset = offset
+        self.shape = shape
+        self.strides = strides
+        self.dtype = dtype
+        self.owner = owner
+
+    def __repr__(self):
+        """Operator overload for using the built-in function :func:`repr` to generate a string representation of the handle."""
+        return (f"{self.__class__.__name__}(name={self.name!r}, offset={self.offset!r}, shape={self.shape!r}, "
+                f"strides={self.strides!r}, dtype={self.dtype!r}, owner={self.owner!r})")
+
+    def attach(self):
+        """Attaches the shared memory segment and returns the array, which is
+        referenced by this handle, without copying it.
+
+        :returns: a :func:`numpy.array`
+        """
+        if sys.version_info >= (3, 13):
+            segment = shared_memory.SharedMemory(name=self.name, track=False)   # pylint: disable=unexpected-keyword-arg; the parameter has been added in Python 3.13
+        else:
+            segment = shared_memory.SharedMemory(name=self.name)
+        lease = _SegmentLease(segment=segment, owner=self.owner)
+        return lease.array(offset=self.offset, shape=self.shape, strides=self.strides, dtype=numpy.dtype(self.dtype))
+
+
+def shared_memory_handle(array):
+    """Returns a picklable handle for an array, which is stored in a named segment
+    of shared memory, that has been allocated by a :class:`~sumpf._internal._allocation.NamedSharedMemoryAllocator`.
+
+    :param array: a :func:`numpy.array`
+    :returns: a :class:`~sumpf._internal._allocation.SharedMemoryHandle` or None,
+              if the array is not stored in a named segment of shared memory
+    """
+    lease = _find_lease(array)
+    if lease is None:
+        return None
+    owner = lease.transferring
+    lease.transferring = False
+    return SharedMemoryHandle(name=lease.segment.name,
+                              offset=array.__array_interface__["data"][0] - lease.address,
+                              shape=array.shape,
+                              strides=array.strides,
+                              dtype=array.dtype.str,
+                              owner=owner)
+
+
+def share(data):
+    """Wraps a data container, whose channels are stored in a named segment of
+    shared memory, so that it is pickled as a handle to that segment instead of
+    its samples. This is meant for passing data containers to other processes,
+    for example as the arguments or the results of the tasks in a :class:`concurrent.futures.ProcessPoolExecutor`.
+    Unpickling the wrapper returns the data container, whose channels are stored
+    in the same segment as those of the given container (see :class:`~sumpf._internal._allocation.NamedSharedMemoryAllocator`).
+
+    :param data: a data container like a :class:`~sumpf.Signal`, whose channels
+                 have been allocated by a :class:`~sumpf._internal._allocation.NamedSharedMemoryAllocator`
+    :returns: a :class:`~sumpf._internal._allocation.SharedContainer` instance
+    :raises ValueError: if the channels are not stored in a named segment of shared memory
+    """
+    if _find_lease(data.channels()) is None:
+        raise ValueError("The channels of the data container are not stored in a named shared memory segment")
+    return SharedContainer(data)
+
+
+class SharedContainer:
+    """A wrapper for a data container, that is pickled as a handle to the named
+    segment of shared memory, in which its channels are stored. Instances of this
+    class are created by :func:`~sumpf._internal._allocation.share`.
+    """
+
+    def __init__(self, data):
+        """
+        :param data: the wrapped data container
+        """
+        self.data = data
+
+    def __reduce__(self):
+        """Support for the :mod:`pickle` module, which pickles the handle to the
+        segment and the metadata of the data container, so that the data container
+        is restored, when it is unpickled.
+
+        :returns: a tuple ``(callable, arguments)``
+        """
+        state = self.data.__dict__.copy()
+        state["_channels"] = shared_memory_handle(self.data.channels())
+        return _attach_container, (type(self.data), state)
+
+
+def _attach_container(cls, state):
+    """Restores a data container, that has been pickled by a :class:`~sumpf._internal._allocation.SharedContainer`.
+
+    :param cls: the class of the data container
+    :param state: the attribute dictionary of the data container, in which the
+                  channels have been replaced by a :class:`~sumpf._internal._allocation.SharedMemoryHandle`
+    :returns: the data container
+    """
+    data = cls.__new__(cls)
+    data.__dict__.update(state, _channels=state["_channels"].attach())
+    return data
+
+
+def transfer_ownership(array):
+    """Hands the ownership of the named shared memory segment, in which the given
+    array is stored, over to the process, which unpickles the next handle of the
+    segment. After calling this function, the current process will no longer
+    unlink the segment.
+
+    :param array: a :func:`numpy.array`, that has been allocated by a :class:`~sumpf._internal._allocation.NamedSharedMemoryAllocator`
+    :raises ValueError: if the array is not stored in a named segment of shared memory,
+                        that is owned by the current process
+    """
+    lease = _find_lease(array)
+    if lease is None or not lease.owner:
+        raise ValueError("The array is not stored in a named shared memory segment, that is owned by this process")
+    lease.owner = False
+    lease.transferring = True
+
+
+class _SegmentLease:
+    """Helper class, that exposes a named segment of shared memory as an array.
+    Similar to the :class:`~sumpf._internal._allocation._Lease` class, the lease
+    becomes the base object of the array and of all its views. When it is garbage
+    collected, the segment is closed and, if the current process owns it, unlinked.
+    """
+
+    def __init__(self, segment, owner):
+        """
+        :param segment: a :class:`multiprocessing.shared_memory.SharedMemory` instance
+        :param owner: True, if the current process shall unlink the segment, False otherwise
+        """
+        self.segment = segment
+        self.address = numpy.frombuffer(segment.buf, dtype=numpy.uint8).ctypes.data
+        self.owner = owner
+        self.transferring = False
+        weakref.finalize(self, _SegmentLease.release, segment, self.__dict__)
+
+    def array(self, offset, shape, strides, dtype):
+        """Creates an array, that is stored in the segment.
+
+        :param offset: the offset of the array's first element from the start of the segment in bytes
+        :param shape: the shape of the array
+        :param strides: the strides of the array or None for a contiguous array
+        :param dtype: the dtype of the array as :class:`numpy.dtype` instance
+        :returns: a :func:`numpy.array`
+        """
+        self.__array_interface__ = {"shape": tuple(shape),
+                                    "typestr": dtype.str,
+                                    "descr": dtype.descr,
+                                    "data": (self.address + offset, False),
+                                    "strides": None if strides is None else tuple(strides),
+                                    "version": 3}
+        return numpy.asarray(self)
+
+    @staticmethod
+    def release(segment, state):
+        """Closes the segment and unlinks it, if the current process owns it.
+
+        :param segment: the :class:`multiprocessing.shared_memory.SharedMemory` instance
+        :param state: the attribute dictionary of the lease, which is checked for the ownership
+        """
+        segment.close()
+        if state["owner"]:
+            try:
+                segment.unlink()
+            except FileNotFoundError:   # the segment has already been unlinked by another process
+                pass
+
+
+def _find_lease(array):
+    """Searches the base objects of the given array for a lease of a named shared memory segment.
+
+    :param array: a :func:`numpy.array`
+    :returns: a :class:`~sumpf._internal._allocation._SegmentLease` or None
+    """
+    base = array
+    while base is not None:
+        if isinstance(base, _SegmentLease):
+            return base
+        base = getattr(base, "base", None)
+    return None
+
+
+_policies = {AllocationPolicy.SHARED_MEMORY: SharedMemoryAllocator,
+             AllocationPolicy.NUMPY: NumpyAllocator,
+             AllocationPolicy.POOLED_SHARED_MEMORY: lambda: PoolAllocator(backend=SharedMemoryAllocator()),
+             AllocationPolicy.POOLED_NUMPY: lambda: PoolAllocator(backend=NumpyAllocator()),
+             AllocationPolicy.NAMED_SHARED_MEMORY: NamedSharedMemoryAllocator}
+
+_allocator = SharedMemoryAllocator()
+
+
+def get_allocator():
+    """Returns the allocator, which is currently used by :func:`~sumpf._internal._functions.allocate_array`.
+
+    :returns: an :class:`~sumpf._internal._allocation.Allocator` instance
+    """
+    return _allocator
+
+
+def set_allocator(allocator):
+    """Sets the allocator, that shall be used by :func:`~sumpf._internal._functions.allocate_array`.
+
+    :param allocator: either a flag from the :class:`~sumpf._internal._enums.AllocationPolicy`
+                      enumeration or an instance of a class, that is derived from
+                      :class:`~sumpf._internal._allocation.Allocator` (e.g. an arena,
+                      that is supplied by the caller)
+    :returns: the previously used allocator, so it can be restored later
+    """
+    global _allocator   # pylint: disable=global-statement; the allocator is a process wide setting
+    previous = _allocator
+    if isinstance(allocator, AllocationPolicy):
+        _allocator = _policies[allocator]()
+    elif isinstance(allocator, Allocator):
+        _allocator = allocator
+    else:
+        raise ValueError(f"Unsupported allocator: {allocator!r}")
+    return previous
@@ -0,0 +1,110 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains functions for averaging sequences of samples, whose computational
+effort grows linearly with the length of the sequence and does not depend on
+the length of the averaging window.
+"""
+
+import math
+import numpy
+
+__all__ = ("window_sums", "exponential_average")
+
+_MAXIMUM_EXPONENT = 64.0        # the exponential weights within a block of the exponential average are limited to e**64
+_MAXIMUM_BLOCK_LENGTH = 2 ** 16  # limits the size of the temporary arrays of the exponential average
+
+
+def window_sums(values, starts, stops):
+    """Computes the sums of the values in the given windows along the last axis
+    of the given array.
+
+    The sums are computed from cumulative sums, so that the computational effort
+    does not depend on the length of the windows. To prevent the rounding errors
+    of the cumulative sums from growing with the length of the array, the cumulative
+    sums are restarted at blocks, whose length is the length of the longest window.
+
+    :param values: an array of samples
+    :param starts: an integer array with the index of the first sample of each window
+    :param stops: an integer array with the index after the last sample of each window
+    :returns: an array, which has the shape of the values array, except for the
+              last axis, whose length is the number of windows
+    """
+    length = values.shape[-1]
+    block_length = max(int(numpy.max(stops - starts, initial=1)), 1)
+    blocks = -(-length // block_length)
+    cumulated = numpy.zeros(shape=values.shape[0:-1] + (blocks * block_length,), dtype=values.dtype)
+    cumulated[..., 0:length] = values
+    blockwise = cumulated.reshape(values.shape[0:-1] + (blocks, block_length))
+    numpy.cumsum(blockwise, axis=-1, out=blockwise)
+    start_blocks = starts // block_length
+    result = _partial_sum(cumulated, stops, block_length)
+    result -= _partial_sum(cumulated, starts, block_length)
+    crossing = stops // block_length != start_blocks
+    result += numpy.where(crossing, numpy.take(blockwise[..., -1], numpy.minimum(start_blocks, blocks - 1), axis=-1), 0.0)
+    return result
+
+
+def exponential_average(values, coefficient, step=1, first=0):
+    """Computes the exponential average ``y[n] = c * y[n-1] + (1 - c) * x[n]``
+    along the last axis of the given array, with ``y[-1] = 0``.
+
+    The recursion is evaluated block-wise with cumulative sums of exponentially
+    weighted samples, so that only the states at the ends of the blocks have to
+    be computed in a loop.
+
+    :param values: an array of non-negative samples, such as squared signal samples
+    :param coefficient: the coefficient ``c``, which has to be between 0 and 1
+    :param step: an integer, of which only every step-th sample of the average
+                 shall be returned
+    :param first: the integer index of the first sample of the average, that
+                  shall be returned
+    :returns: an array, which has the shape of the values array, except for the
+              last axis, which contains only every step-th sample, starting with
+              the sample at the index ``first``
+    """
+    length = values.shape[-1]
+    indices = numpy.arange(first, length, step)
+    result = numpy.empty(shape=values.shape[0:-1] + (len(indices),), dtype=values.dtype)
+    block_length = int(min(max(_MAXIMUM_EXPONENT / -math.log(coefficient), 1.0), _MAXIMUM_BLOCK_LENGTH))
+    exponents = numpy.arange(block_length)
+    growing = coefficient ** -exponents
+    decaying = coefficient ** exponents
+    state = numpy.zeros(shape=values.shape[0:-1] + (1,), dtype=values.dtype)
+    for start in range(0, length, block_length):
+        block = values[..., start:start + block_length]
+        size = block.shape[-1]
+        averaged = numpy.cumsum(block * growing[0:size], axis=-1)
+        averaged *= 1.0 - coefficient
+        averaged += coefficient * state
+        averaged *= decaying[0:size]
+        state = averaged[..., -1:]
+        begin, end = numpy.searchsorted(indices, (start, start + size))
+        result[..., begin:end] = averaged[..., indices[begin:end] - start]
+    return result
+
+
+def _partial_sum(cumulated, positions, block_length):
+    """Looks up the sums of the samples from the beginning of the block to the
+    given positions in the block-wise cumulative sums.
+
+    :param cumulated: the array with the block-wise cumulative sums
+    :param positions: an integer array with the positions, up to which (exclusively) the samples shall be summed up
+    :param block_length: the length of the blocks
+    :returns: an array with the partial sums
+    """
+    sums = numpy.take(cumulated, numpy.maximum(positions - 1, 0), axis=-1)
+    return numpy.where(positions % block_length == 0, 0.0, sums)
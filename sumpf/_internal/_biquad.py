@@ -0,0 +1,146 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains helpers for filtering signals in the time domain with cascades of
+second order sections (biquads)."""
+
+import math
+import numpy
+import scipy.signal
+from ._functions import allocate_array, real_dtype
+
+__all__ = ("second_order_sections", "BiquadCascade")
+
+
+def second_order_sections(zero_pole_gain, sampling_rate, prewarp_frequency=None):
+    """Discretizes a rational transfer function with the bilinear transform and
+    factorizes the result into second order sections.
+
+    Real valued sections cannot have a complex gain, so a complex gain is replaced
+    by its magnitude. The phase response of the discrete filter is then only
+    determined by the zeros and poles, which differs from the phase of the given
+    transfer function by the constant angle of the gain.
+
+    :param zero_pole_gain: a tuple ``(gain, zeros, poles)``, that defines the
+                           transfer function as a rational function of ``s = 2j * pi * f``
+    :param sampling_rate: the sampling rate of the discrete filter
+    :param prewarp_frequency: a frequency in Hz, at which the frequency response
+                              of the discrete filter shall match that of the analog
+                              filter exactly, or None, if the frequency axis shall
+                              not be prewarped
+    :returns: a two dimensional :func:`numpy.array` with one row of coefficients
+              ``(b0, b1, b2, a0, a1, a2)`` per section
+    """
+    gain, zeros, poles = zero_pole_gain
+    if prewarp_frequency is None:
+        factor = 2.0 * sampling_rate
+    elif 0.0 < prewarp_frequency < sampling_rate / 2.0:
+        omega = 2.0 * math.pi * prewarp_frequency
+        factor = omega / math.tan(omega / (2.0 * sampling_rate))
+    else:
+        raise ValueError(f"The prewarp frequency ({prewarp_frequency}Hz) must be between 0Hz and "
+                         f"the Nyquist frequency ({sampling_rate / 2.0}Hz)")
+    if abs(numpy.imag(gain)) > 1e-9 * abs(gain):    # allow for the rounding errors from multiplying complex conjugate roots
+        gain = abs(gain)
+    else:
+        gain = numpy.real(gain)
+    if len(zeros) > len(poles):
+        raise ValueError("The transfer function must not have more zeros than poles")
+    zeros, poles, gain = scipy.signal.bilinear_zpk(zeros, poles, gain, fs=factor / 2.0)
+    return scipy.signal.zpk2sos(zeros, poles, gain)
+
+
+class BiquadCascade:
+    """Filters signals in the time domain with a cascade of second order sections
+    (biquads) for each channel. The state of the filters is kept between the
+    calls of :meth:`filter`, so that long signals can be filtered block by block
+    with a constant memory consumption and the same result as if they had been
+    filtered in one piece.
+
+    Instances of this class are usually created with :meth:`sumpf.Filter.discretize`.
+    """
+
+    def __init__(self, sections, sampling_rate=48000.0):
+        """
+        :param sections: a sequence with one two dimensional array of second order
+                         sections for each channel of the filter, as it is
+                         returned by :func:`second_order_sections`
+        :param sampling_rate: the sampling rate, for which the sections have been computed
+        """
+        self.__sections = tuple(numpy.array(s, dtype=numpy.float64) for s in sections)
+        self.__sampling_rate = sampling_rate
+        self.__states = None
+
+    def __len__(self):
+        """Returns the number of channels of the filter.
+
+        :returns: an integer
+        """
+        return len(self.__sections)
+
+    def sections(self):
+        """Returns the second order sections of the filter's channels.
+
+        :returns: a tuple of two dimensional arrays
+        """
+        return self.__sections
+
+    def sampling_rate(self):
+        """Returns the sampling rate, for which the sections have been computed.
+
+        :returns: a float
+        """
+        return self.__sampling_rate
+
+    def reset(self):
+        """Resets the state of the filters, so that the next call of :meth:`filter`
+        starts with a fresh signal.
+        """
+        self.__states = None
+
+    def filter(self, channels):
+        """Filters the given channels and keeps the state of the filters for filtering
+        the next block of the signal.
+
+        If the filter has only one channel, it is applied to all channels of the
+        signal. If the signal has only one channel, it is filtered with each channel
+        of the filter. Otherwise the numbers of channels have to be equal.
+
+        :param channels: a two dimensional :func:`numpy.array` with the samples of the signal
+        :returns: a two dimensional :func:`numpy.array` with the filtered samples
+        """
+        number_of_channels = len(channels)
+        if len(self) == 1:
+            groups = ((self.__sections[0], slice(0, number_of_channels), slice(0, number_of_channels)),)
+        elif number_of_channels == 1:
+            groups = tuple((s, slice(0, 1), slice(i, i + 1)) for i, s in enumerate(self.__sections))
+        elif number_of_channels == len(self):
+            groups = tuple((s, slice(i, i + 1), slice(i, i + 1)) for i, s in enumerate(self.__sections))
+        else:
+            raise ValueError(f"A filter with {len(self)} channels cannot be applied to a signal with {number_of_channels} channels")
+        if self.__states is None:
+            self.__states = [numpy.zeros(shape=(len(s), o.stop - o.start, 2)) for s, _, o in groups]
+        elif any(z.shape[1] != o.stop - o.start for z, (_, _, o) in zip(self.__states, groups)):
+            raise ValueError("The number of channels has changed since the previous block. "
+                             "Call reset() before filtering a new signal.")
+        result = allocate_array(shape=(max(len(self), number_of_channels), channels.shape[1]),
+                                dtype=real_dtype(channels.dtype))
+        for i, (sections, input_selection, output_selection) in enumerate(groups):
+            result[output_selection], self.__states[i] = scipy.signal.sosfilt(sections,
+                                                                              channels[input_selection],
+                                                                              axis=-1,
+                                                                              zi=self.__states[i])
+        return result
@@ -0,0 +1,138 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a cache with a size limit, that is used to store sampled transfer functions of filters."""
+
+import collections
+import threading
+
+__all__ = ("LRUCache", "get_filter_cache", "set_filter_cache")
+
+
+class LRUCache:
+    """A least-recently-used cache, which discards the entries, that have not been
+    accessed for the longest time, when the size of its entries exceeds a limit.
+    The sizes of the entries are specified in bytes, when they are added to the
+    cache. Accessing the cache is thread safe.
+    """
+
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        """
+        :param max_bytes: the maximum size of all entries in bytes
+        """
+        self.__max_bytes = max_bytes
+        self.__bytes = 0
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """Returns the number of entries in the cache.
+
+        :returns: an integer
+        """
+        return len(self.__entries)
+
+    def max_bytes(self):
+        """Returns the maximum size of all entries in bytes.
+
+        :returns: an integer
+        """
+        return self.__max_bytes
+
+    def bytes(self):
+        """Returns the size of all entries in bytes.
+
+        :returns: an integer
+        """
+        return self.__bytes
+
+    def get(self, key):
+        """Looks up an entry and marks it as recently used.
+
+        :param key: a hashable key
+        :returns: the cached value or None, if the key is not in the cache
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Adds an entry to the cache and discards the least recently used entries,
+        until the size of all entries is within the limit. Values, which are
+        larger than the limit themselves, are not stored.
+
+        :param key: a hashable key
+        :param value: the value, that shall be cached
+        :param size: the size of the value in bytes
+        :returns: True, if the value has been stored, False otherwise
+        """
+        if size > self.__max_bytes:
+            return False
+        with self.__lock:
+            previous = self.__entries.pop(key, None)
+            if previous is not None:
+                self.__bytes -= previous[1]
+            self.__entries[key] = (value, size)
+            self.__bytes += size
+            while self.__bytes > self.__max_bytes:
+                _, (_, discarded) = self.__entries.popitem(last=False)
+                self.__bytes -= discarded
+        return True
+
+    def clear(self):
+        """Discards all entries from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+
+_filter_cache = None
+
+
+def get_filter_cache():
+    """Returns the cache, in which the sampled transfer functions of filters are
+    stored, when calling :meth:`sumpf.Filter.spectrum` or calling a :class:`sumpf.Filter`
+    with an array of frequencies.
+
+    :returns: an :class:`~sumpf._internal._cache.LRUCache` instance or None, if
+              the caching is disabled
+    """
+    return _filter_cache
+
+
+def set_filter_cache(cache):
+    """Enables or disables the caching of sampled filter transfer functions.
+    The caching is disabled by default. With a cache, the transfer functions of
+    filters, that are applied to many spectrums of the same resolution and length,
+    are evaluated only once. The cached arrays are read-only.
+
+    :param cache: an :class:`~sumpf._internal._cache.LRUCache` instance, an integer
+                  with the maximum size of a new cache in bytes or None to disable
+                  the caching
+    :returns: the previously used cache, so it can be restored later
+    """
+    global _filter_cache    # pylint: disable=global-statement; the filter cache is a process wide setting
+    previous = _filter_cache
+    if cache is None or isinstance(cache, LRUCache):
+        _filter_cache = cache
+    elif isinstance(cache, int):
+        _filter_cache = LRUCache(max_bytes=cache)
+    else:
+        raise ValueError(f"Unsupported filter cache: {cache!r}")
+    return previous
@@ -16,11 +16,15 @@
 
 """Contains helper classes for the computation of convolutions and correlations."""
 
+import math
+import timeit
 import numpy
-from ._functions import allocate_array
+from ._fft import fast_length, irfft, rfft
+from ._functions import allocate_array, real_dtype
 from ._enums import ConvolutionMode
 
-__all__ = ("convolution", "correlation")
+__all__ = ("convolution", "correlation", "mimo_convolution", "ConvolutionKernel",
+           "ConvolutionCostModel", "get_convolution_cost_model", "set_convolution_cost_model")
 
 
 class Convolution:
@@ -60,9 +64,8 @@ class FullConvolution(Convolution):
         :param offsets: a tuple with the offsets of the signals, from which the given data is taken
         """
         mc, ml = matrix.shape
-        channels = allocate_array(shape=(mc, ml + len(vector) - 1))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.convolve(c, vector, mode="full")
+        channels = allocate_array(shape=(mc, ml + len(vector) - 1), dtype=_dtype(matrix, vector))
+        direct_convolution(matrix, vector[numpy.newaxis, :], "full", channels)
         return channels, sum(offsets)
 
     @staticmethod
@@ -74,9 +77,9 @@ class FullConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), al + bl - 1))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.convolve(c, d, mode="full")
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, al + bl - 1), dtype=_dtype(a, b))
+        direct_convolution(a[0:c], b[0:c], "full", channels)
         return channels, sum(offsets)
 
 
@@ -94,9 +97,8 @@ class SameConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, max(ml, vl)))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.convolve(c, vector, mode="same")
+        channels = allocate_array(shape=(mc, max(ml, vl)), dtype=_dtype(matrix, vector))
+        direct_convolution(matrix, vector[numpy.newaxis, :], "same", channels)
         return channels, sum(offsets) + (min(ml, vl) - 1) // 2
 
     @staticmethod
@@ -108,9 +110,9 @@ class SameConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), max(al, bl)))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.convolve(c, d, mode="same")
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, max(al, bl)), dtype=_dtype(a, b))
+        direct_convolution(a[0:c], b[0:c], "same", channels)
         return channels, sum(offsets) + (min(al, bl) - 1) // 2
 
 
@@ -128,9 +130,8 @@ class ValidConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, abs(ml - vl) + 1))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.convolve(c, vector, mode="valid")
+        channels = allocate_array(shape=(mc, abs(ml - vl) + 1), dtype=_dtype(matrix, vector))
+        direct_convolution(matrix, vector[numpy.newaxis, :], "valid", channels)
         return channels, sum(offsets) + (min(ml, vl) - 1)
 
     @staticmethod
@@ -142,9 +143,9 @@ class ValidConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), abs(al - bl) + 1))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.convolve(c, d, mode="valid")
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, abs(al - bl) + 1), dtype=_dtype(a, b))
+        direct_convolution(a[0:c], b[0:c], "valid", channels)
         return channels, sum(offsets) + (min(al, bl) - 1)
 
 
@@ -170,10 +171,10 @@ class SpectrumConvolution(Convolution):
         if vl < pl:
             vector = pad_vector(vector, vl, pl)
         # compute the convolution
-        ms = numpy.fft.rfft(matrix)
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix)
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, 0:rl]
         return channels, sum(offsets)
 
     @staticmethod
@@ -194,10 +195,10 @@ class SpectrumConvolution(Convolution):
         if bl < pl:
             b = pad_matrix(b, bl, c, pl)
         # compute the convolution
-        as_ = numpy.fft.rfft(a[0:c])
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c])
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, 0:rl]
         return channels, sum(offsets)
 
 
@@ -216,16 +217,18 @@ class SpectrumPaddedConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        rl = ml + vl - 1                        # result length
-        pl = rl + 1 if rl % 2 == 1 else rl + 2  # padded length
+        rl = ml + vl - 1        # result length
+        pl = fast_length(rl)    # padded length
+        if 0 in (ml, vl):
+            return _zeros(shape=(mc, rl), dtype=_dtype(matrix, vector)), sum(offsets)
         # pad the arrays
         matrix = pad_matrix(matrix, ml, mc, pl)
         vector = pad_vector(vector, vl, pl)
         # compute the convolution
-        ms = numpy.fft.rfft(matrix)
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix)
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs, n=pl)[:, 0:rl]
         return channels, sum(offsets)
 
     @staticmethod
@@ -238,19 +241,77 @@ class SpectrumPaddedConvolution(Convolution):
         ac, al = a.shape
         bc, bl = b.shape
         c = min(ac, bc)
-        rl = al + bl - 1                        # result length
-        pl = rl + 1 if rl % 2 == 1 else rl + 2  # padded length
+        rl = al + bl - 1        # result length
+        pl = fast_length(rl)    # padded length
+        if 0 in (al, bl):
+            return _zeros(shape=(c, rl), dtype=_dtype(a, b)), sum(offsets)
         # pad the arrays
         a = pad_matrix(a, al, c, pl)
         b = pad_matrix(b, bl, c, pl)
         # compute the convolution
-        as_ = numpy.fft.rfft(a[0:c])
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c])
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        channels[:] = irfft(as_ * bs, n=pl)[:, 0:rl]
         return channels, sum(offsets)
 
 
+class OverlapAddConvolution(Convolution):
+    """A helper class, that computes convolutions block-wise in the frequency
+    domain with the overlap-add method. The longer operand is split into blocks,
+    which are convolved with the shorter operand individually, so that the memory,
+    that is needed for the transforms, is proportional to the block size rather
+    than to the length of the result.
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        return overlap_add(matrix, vector[numpy.newaxis, :]), sum(offsets)
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        c = min(len(a), len(b))
+        return overlap_add(a[0:c], b[0:c]), sum(offsets)
+
+
+class OverlapSaveConvolution(Convolution):
+    """A helper class, that computes convolutions block-wise in the frequency
+    domain with the overlap-save method. The result is computed in blocks, for
+    which overlapping segments of the longer operand are convolved circularly
+    with the shorter operand, while the samples, that are corrupted by the
+    circular convolution, are discarded.
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        return overlap_save(matrix, vector[numpy.newaxis, :]), sum(offsets)
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        c = min(len(a), len(b))
+        return overlap_save(a[0:c], b[0:c]), sum(offsets)
+
+
 class FullCorrelation:
     """A helper class, that computes correlations with :mod:`numpy`'s :func:`~numpy.correlate`
     function in ``full`` mode.
@@ -264,9 +325,8 @@ class FullCorrelation:
         :param offsets: a tuple with the offsets of the signals, from which the given data is taken
         """
         mc, ml = matrix.shape
-        channels = allocate_array(shape=(mc, ml + len(vector) - 1))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.correlate(c, vector, mode="full")[::-1]
+        channels = allocate_array(shape=(mc, ml + len(vector) - 1), dtype=_dtype(matrix, vector))
+        direct_correlation(matrix, vector[numpy.newaxis, :], "full", channels)
         return channels, offsets[1] - offsets[0] - ml + 1
 
     @staticmethod
@@ -278,9 +338,8 @@ class FullCorrelation:
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, ml + vl - 1))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.correlate(vector, c, mode="full")[::-1]
+        channels = allocate_array(shape=(mc, ml + vl - 1), dtype=_dtype(matrix, vector))
+        direct_correlation(vector[numpy.newaxis, :], matrix, "full", channels)
         return channels, offsets[1] - offsets[0] - vl + 1
 
     @staticmethod
@@ -292,9 +351,9 @@ class FullCorrelation:
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), al + bl - 1))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.correlate(c, d, mode="full")[::-1]
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, al + bl - 1), dtype=_dtype(a, b))
+        direct_correlation(a[0:c], b[0:c], "full", channels)
         return channels, offsets[1] - offsets[0] - al + 1
 
 
@@ -313,9 +372,8 @@ class SameCorrelation:
         mc, ml = matrix.shape
         vl = len(vector)
         rl = max(ml, vl)
-        channels = allocate_array(shape=(mc, rl))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.convolve(c[::-1], vector, mode="same")
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        direct_convolution(matrix[:, ::-1], vector[numpy.newaxis, :], "same", channels)
         return channels, offsets[1] - offsets[0] + vl - rl - min(ml, vl) // 2
 
     @staticmethod
@@ -328,10 +386,8 @@ class SameCorrelation:
         vl = len(vector)
         mc, ml = matrix.shape
         rl = max(ml, vl)
-        channels = allocate_array(shape=(mc, rl))
-        vector = vector[::-1]
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.convolve(vector, c, mode="same")
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        direct_convolution(vector[numpy.newaxis, ::-1], matrix, "same", channels)
         return channels, offsets[1] - offsets[0] + ml - rl - min(vl, ml) // 2
 
     @staticmethod
@@ -344,9 +400,9 @@ class SameCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         rl = max(al, bl)
-        channels = allocate_array(shape=(min(ac, bc), rl))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.convolve(c[::-1], d, mode="same")
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        direct_convolution(a[0:c, ::-1], b[0:c], "same", channels)
         return channels, offsets[1] - offsets[0] + bl - rl - min(al, bl) // 2
 
 
@@ -365,9 +421,8 @@ class ValidCorrelation:
         mc, ml = matrix.shape
         vl = len(vector)
         rl = abs(ml - vl) + 1
-        channels = allocate_array(shape=(mc, rl))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.correlate(c, vector, mode="valid")[::-1]
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        direct_correlation(matrix, vector[numpy.newaxis, :], "valid", channels)
         return channels, offsets[1] - offsets[0] - (ml - vl + rl) // 2
 
     @staticmethod
@@ -380,9 +435,8 @@ class ValidCorrelation:
         vl = len(vector)
         mc, ml = matrix.shape
         rl = abs(vl - ml) + 1
-        channels = allocate_array(shape=(mc, rl))
-        for c, channel in zip(matrix, channels):
-            channel[:] = numpy.correlate(vector, c, mode="valid")[::-1]
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        direct_correlation(vector[numpy.newaxis, :], matrix, "valid", channels)
         return channels, offsets[1] - offsets[0] - (vl - ml + rl) // 2
 
     @staticmethod
@@ -395,9 +449,9 @@ class ValidCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         rl = abs(al - bl) + 1
-        channels = allocate_array(shape=(min(ac, bc), rl))
-        for c, d, channel in zip(a, b, channels):
-            channel[:] = numpy.correlate(c, d, mode="valid")[::-1]
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        direct_correlation(a[0:c], b[0:c], "valid", channels)
         return channels, offsets[1] - offsets[0] - (al - bl + rl) // 2
 
 
@@ -428,10 +482,10 @@ class SpectrumCorrelation:
         else:
             vector = cycle_vector(vector, vl, -1)
         # compute the correlation
-        ms = numpy.fft.rfft(matrix).conjugate()
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, -rl:]
+        ms = rfft(matrix).conjugate()
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, -rl:]
         return channels, offsets[1] - offsets[0] - ml + 1
 
     @staticmethod
@@ -456,10 +510,10 @@ class SpectrumCorrelation:
         else:
             matrix = cycle_matrix(matrix, vl, mc, -1)
         # compute the correlation
-        vs = numpy.fft.rfft(vector).conjugate()
-        ms = numpy.fft.rfft(matrix)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(vs * ms)[:, -rl:]
+        vs = rfft(vector).conjugate()
+        ms = rfft(matrix)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(vs * ms)[:, -rl:]
         return channels, offsets[1] - offsets[0] - vl + 1
 
     @staticmethod
@@ -485,10 +539,10 @@ class SpectrumCorrelation:
         else:
             b = cycle_matrix(b, bl, c, -1)
         # compute the correlation
-        as_ = numpy.fft.rfft(a[0:c]).conjugate()
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, -rl:]
+        as_ = rfft(a[0:c]).conjugate()
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, -rl:]
         return channels, offsets[1] - offsets[0] - al + 1
 
 
@@ -507,20 +561,18 @@ class SpectrumPaddedCorrelation:
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        rl = ml + vl - 1    # result length
+        rl = ml + vl - 1        # result length
+        pl = fast_length(rl)    # padded length
+        if 0 in (ml, vl):
+            return _zeros(shape=(mc, rl), dtype=_dtype(matrix, vector)), offsets[1] - offsets[0] - ml + 1
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            matrix = pad_and_shift_matrix(matrix, ml, mc, pl, 1)
-        else:
-            pl = rl + 2
-            matrix = pad_and_shift_matrix(matrix, ml, mc, pl, 2)
+        matrix = pad_and_shift_matrix(matrix, ml, mc, pl, pl - rl)
         vector = shift_vector(vector, vl, pl)
         # compute the correlation
-        ms = numpy.fft.rfft(matrix).conjugate()
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix).conjugate()
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs, n=pl)[:, 0:rl]
         return channels, offsets[1] - offsets[0] - ml + 1
 
     @staticmethod
@@ -532,20 +584,18 @@ class SpectrumPaddedCorrelation:
         """
         vl = len(vector)
         mc, ml = matrix.shape
-        rl = ml + vl - 1    # result length
+        rl = ml + vl - 1        # result length
+        pl = fast_length(rl)    # padded length
+        if 0 in (ml, vl):
+            return _zeros(shape=(mc, rl), dtype=_dtype(matrix, vector)), offsets[1] - offsets[0] - vl + 1
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            vector = pad_and_shift_vector(vector, vl, pl, 1)
-        else:
-            pl = rl + 2
-            vector = pad_and_shift_vector(vector, vl, pl, 2)
+        vector = pad_and_shift_vector(vector, vl, pl, pl - rl)
         matrix = shift_matrix(matrix, ml, mc, pl)
         # compute the correlation
-        vs = numpy.fft.rfft(vector).conjugate()
-        ms = numpy.fft.rfft(matrix)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(vs * ms)[:, 0:rl]
+        vs = rfft(vector).conjugate()
+        ms = rfft(matrix)
+        channels = allocate_array(shape=(mc, rl), dtype=_dtype(matrix, vector))
+        channels[:] = irfft(vs * ms, n=pl)[:, 0:rl]
         return channels, offsets[1] - offsets[0] - vl + 1
 
     @staticmethod
@@ -558,38 +608,662 @@ class SpectrumPaddedCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         c = min(ac, bc)
-        rl = al + bl - 1    # result length
+        rl = al + bl - 1        # result length
+        pl = fast_length(rl)    # padded length
+        if 0 in (al, bl):
+            return _zeros(shape=(c, rl), dtype=_dtype(a, b)), offsets[1] - offsets[0] - al + 1
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            a = pad_and_shift_matrix(a, al, c, pl, 1)
-        else:
-            pl = rl + 2
-            a = pad_and_shift_matrix(a, al, c, pl, 2)
+        a = pad_and_shift_matrix(a, al, c, pl, pl - rl)
         b = shift_matrix(b, bl, c, pl)
         # compute the correlation
-        as_ = numpy.fft.rfft(a[0:c]).conjugate()
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c]).conjugate()
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=_dtype(a, b))
+        channels[:] = irfft(as_ * bs, n=pl)[:, 0:rl]
         return channels, offsets[1] - offsets[0] - al + 1
 
 
+class OverlapAddCorrelation:
+    """A helper class, that computes correlations as block-wise convolutions with
+    the reversed first operand, using the overlap-add method (see
+    :class:`~sumpf._internal._convolution.OverlapAddConvolution`).
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        channels = overlap_add(matrix[:, ::-1], vector[numpy.newaxis, :])
+        return channels, offsets[1] - offsets[0] - matrix.shape[1] + 1
+
+    @staticmethod
+    def with_vector2(vector, matrix, offsets):
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        channels = overlap_add(vector[numpy.newaxis, ::-1], matrix)
+        return channels, offsets[1] - offsets[0] - len(vector) + 1
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        c = min(len(a), len(b))
+        channels = overlap_add(a[0:c, ::-1], b[0:c])
+        return channels, offsets[1] - offsets[0] - a.shape[1] + 1
+
+
+class OverlapSaveCorrelation:
+    """A helper class, that computes correlations as block-wise convolutions with
+    the reversed first operand, using the overlap-save method (see
+    :class:`~sumpf._internal._convolution.OverlapSaveConvolution`).
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        channels = overlap_save(matrix[:, ::-1], vector[numpy.newaxis, :])
+        return channels, offsets[1] - offsets[0] - matrix.shape[1] + 1
+
+    @staticmethod
+    def with_vector2(vector, matrix, offsets):
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        channels = overlap_save(vector[numpy.newaxis, ::-1], matrix)
+        return channels, offsets[1] - offsets[0] - len(vector) + 1
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        c = min(len(a), len(b))
+        channels = overlap_save(a[0:c, ::-1], b[0:c])
+        return channels, offsets[1] - offsets[0] - a.shape[1] + 1
+
+
+class AutoConvolution(Convolution):
+    """A helper class, that estimates the computation time of the convolution
+    strategies with the current :class:`~sumpf._internal._convolution.ConvolutionCostModel`
+    and delegates the computation to the fastest of the modes ``FULL``,
+    ``SPECTRUM_PADDED`` and ``OVERLAP_ADD``, which all compute the same result.
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mode = _auto_mode(len(matrix), matrix.shape[1], len(vector))
+        return convolution[mode].with_vector(matrix, vector, offsets)
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mode = _auto_mode(min(len(a), len(b)), a.shape[1], b.shape[1])
+        return convolution[mode].with_matrix(a, b, offsets)
+
+
+class AutoCorrelation:
+    """A helper class, that delegates the computation of a correlation to the
+    fastest of the modes ``FULL``, ``SPECTRUM_PADDED`` and ``OVERLAP_ADD`` (see
+    :class:`~sumpf._internal._convolution.AutoConvolution`).
+    """
+
+    @staticmethod
+    def with_vector(matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mode = _auto_mode(len(matrix), matrix.shape[1], len(vector))
+        return correlation[mode].with_vector(matrix, vector, offsets)
+
+    @staticmethod
+    def with_vector2(vector, matrix, offsets):
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mode = _auto_mode(len(matrix), len(vector), matrix.shape[1])
+        return correlation[mode].with_vector2(vector, matrix, offsets)
+
+    @staticmethod
+    def with_matrix(a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mode = _auto_mode(min(len(a), len(b)), a.shape[1], b.shape[1])
+        return correlation[mode].with_matrix(a, b, offsets)
+
+
+def _auto_mode(channels, length1, length2):
+    """A helper function, that chooses the mode for the ``AUTO`` convolution or
+    correlation. The zero result for an empty array is computed by the ``SPECTRUM_PADDED``
+    mode, so that the direct convolution does not fail.
+    """
+    if 0 in (length1, length2):
+        return ConvolutionMode.SPECTRUM_PADDED
+    return _cost_model.choose(channels, length1, length2)
+
+
 convolution = {ConvolutionMode.FULL: FullConvolution,
                ConvolutionMode.SAME: SameConvolution,
                ConvolutionMode.VALID: ValidConvolution,
                ConvolutionMode.SPECTRUM: SpectrumConvolution,
-               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedConvolution}
+               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedConvolution,
+               ConvolutionMode.OVERLAP_ADD: OverlapAddConvolution,
+               ConvolutionMode.OVERLAP_SAVE: OverlapSaveConvolution,
+               ConvolutionMode.AUTO: AutoConvolution}
 correlation = {ConvolutionMode.FULL: FullCorrelation,
                ConvolutionMode.SAME: SameCorrelation,
                ConvolutionMode.VALID: ValidCorrelation,
                ConvolutionMode.SPECTRUM: SpectrumCorrelation,
-               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedCorrelation}
+               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedCorrelation,
+               ConvolutionMode.OVERLAP_ADD: OverlapAddCorrelation,
+               ConvolutionMode.OVERLAP_SAVE: OverlapSaveCorrelation,
+               ConvolutionMode.AUTO: AutoCorrelation}
+
+
+def mimo_convolution(inputs, impulse_responses):
+    """Convolves multiple input channels with a matrix of impulse responses and
+    sums the convolution results for each output. Each input and each impulse
+    response is transformed to the frequency domain only once. The products are
+    accumulated in the frequency domain, so that only one inverse transform per
+    output is necessary.
+
+    :param inputs: a two dimensional :func:`numpy.array` with one row per input
+    :param impulse_responses: a three dimensional :func:`numpy.array`, in which
+                              the first index selects the input, the second index
+                              selects the output and the third index selects the
+                              sample of the impulse response
+    :returns: a two dimensional :func:`numpy.array` with one row per output, whose
+              length is the sum of the lengths of the inputs and the impulse
+              responses minus one
+    """
+    number_of_inputs, input_length = inputs.shape
+    _, number_of_outputs, response_length = impulse_responses.shape
+    if len(impulse_responses) != number_of_inputs:
+        raise ValueError(f"The number of inputs ({number_of_inputs}) does not match the "
+                         f"number of rows of the impulse response matrix ({len(impulse_responses)})")
+    rl = input_length + response_length - 1     # result length
+    pl = fast_length(rl)                        # padded length
+    input_spectrums = rfft(inputs, n=pl)
+    response_spectrums = rfft(impulse_responses, n=pl)
+    channels = allocate_array(shape=(number_of_outputs, rl), dtype=_dtype(inputs, impulse_responses))
+    for o, channel in enumerate(channels):
+        accumulated = numpy.einsum("if,if->f", input_spectrums, response_spectrums[:, o])
+        channel[:] = irfft(accumulated, n=pl)[0:rl]
+    return channels
+
+
+class ConvolutionKernel:
+    """Holds the transform of an impulse response, so that it can be convolved
+    with many signals without transforming it again. The convolutions are computed
+    block-wise with the overlap-add method, so that signals of any length can
+    be convolved with the kernel, while the block size is defined by the fixed
+    transform length of the kernel.
+
+    Instances of this class are usually created with :meth:`sumpf.Signal.prepare_convolution`
+    and passed to :meth:`sumpf.Signal.convolve` or :meth:`sumpf.Signal.correlate`.
+    """
+
+    def __init__(self, channels, offset=0, transform_length=None):
+        """
+        :param channels: a two dimensional :func:`numpy.array` with the impulse responses
+        :param offset: the offset of the impulse responses in samples
+        :param transform_length: the length of the transforms. It must not be
+                                 shorter than the impulse responses. The longer
+                                 the transforms, the fewer blocks are needed for
+                                 long signals, but the more work is wasted for
+                                 short signals. If None, a length is chosen,
+                                 that is efficient for long signals.
+        """
+        number_of_channels, length = channels.shape
+        if transform_length is None:
+            transform_length = block_length(length, max(2 ** 24, length))
+        elif transform_length < length:
+            raise ValueError(f"The transform length ({transform_length}) must not be shorter than the kernel ({length})")
+        self.__length = length
+        self.__number_of_channels = number_of_channels
+        self.__offset = offset
+        self.__transform_length = transform_length
+        self.__dtype = channels.dtype
+        self.__spectrum = rfft(channels, n=transform_length)
+
+    def __len__(self):
+        """Returns the number of channels of the kernel.
+
+        :returns: an integer
+        """
+        return self.__number_of_channels
+
+    def length(self):
+        """Returns the length of the kernel's impulse responses.
+
+        :returns: an integer
+        """
+        return self.__length
+
+    def offset(self):
+        """Returns the offset of the kernel's impulse responses.
+
+        :returns: an integer
+        """
+        return self.__offset
+
+    def transform_length(self):
+        """Returns the length of the transforms, which are computed for each block.
+
+        :returns: an integer
+        """
+        return self.__transform_length
+
+    def convolve(self, channels, offset):
+        """Convolves the given channels with the kernel. If either the channels
+        or the kernel have only one channel, it is convolved with all channels
+        of the other. Otherwise, the number of channels of the result is the
+        minimum of both.
+
+        :param channels: a two dimensional :func:`numpy.array`
+        :param offset: the offset of the given channels
+        :returns: a tuple with a two dimensional :func:`numpy.array` with the
+                  convolution result and the offset of the result
+        """
+        return self.__convolve(channels), offset + self.__offset
+
+    def correlate(self, channels, offset):
+        """Correlates the given channels with the kernel, which is equivalent to
+        convolving the kernel with the reversed channels. The channels are handled
+        like in :meth:`~sumpf._internal._convolution.ConvolutionKernel.convolve`.
+
+        :param channels: a two dimensional :func:`numpy.array`, which shall be correlated with the kernel
+        :param offset: the offset of the given channels
+        :returns: a tuple with a two dimensional :func:`numpy.array` with the
+                  correlation result and the offset of the result
+        """
+        return self.__convolve(channels[:, ::-1]), self.__offset - offset - channels.shape[1] + 1
+
+    def __convolve(self, channels):
+        """Selects the channels and the transformed kernels, that shall be convolved,
+        and computes the convolution."""
+        if len(channels) == 1 or self.__number_of_channels == 1:
+            number_of_channels = max(len(channels), self.__number_of_channels)
+            spectrum = self.__spectrum
+        else:
+            number_of_channels = min(len(channels), self.__number_of_channels)
+            channels = channels[0:number_of_channels]
+            spectrum = self.__spectrum[0:number_of_channels]
+        result = allocate_array(shape=(number_of_channels, channels.shape[1] + self.__length - 1),
+                                dtype=real_dtype(numpy.result_type(channels.dtype, self.__dtype)))
+        _overlap_add(channels, spectrum, self.__length, self.__transform_length, result)
+        return result
+
+
+class ConvolutionCostModel:
+    """Estimates the computation time of the strategies, with which a convolution
+    or a correlation can be computed, from the shapes of the operands. This is
+    used by the ``AUTO`` mode of :class:`~sumpf._internal._enums.ConvolutionMode`
+    to select the fastest strategy.
+
+    The estimates are based on a few coefficients, which depend on the machine.
+    The default coefficients have been obtained with :meth:`~sumpf._internal._convolution.ConvolutionCostModel.calibrate`
+    on a single core of a desktop computer. For a better selection, the model
+    can be calibrated on the target machine and made the default with
+    :func:`~sumpf._internal._convolution.set_convolution_cost_model`.
+    """
+
+    def __init__(self, direct=2.0e-10, direct_call=2.5e-6, transform=1.0e-9, transform_call=8.0e-6):
+        """
+        :param direct: the time in seconds for one multiply-accumulate operation
+                       of a direct convolution with :func:`numpy.convolve`
+        :param direct_call: the constant time in seconds for calling :func:`numpy.convolve`
+                            for one channel
+        :param transform: the time in seconds per ``n * log2(n)`` for the fast
+                          Fourier transform of ``n`` real valued samples
+        :param transform_call: the constant time in seconds for calling a transform
+                               function, which is also used as an estimate for the
+                               overhead of processing a block in the overlap-add method
+        """
+        self.direct = direct
+        self.direct_call = direct_call
+        self.transform = transform
+        self.transform_call = transform_call
+
+    def costs(self, channels, length1, length2):
+        """Estimates the computation times of the strategies for convolving or
+        correlating operands of the given lengths.
+
+        :param channels: the number of channels in the result
+        :param length1: the length of the first operand
+        :param length2: the length of the second operand
+        :returns: a dictionary, that maps the flags of the modes ``FULL``,
+                  ``SPECTRUM_PADDED`` and ``OVERLAP_ADD`` from the
+                  :class:`~sumpf._internal._enums.ConvolutionMode` enumeration
+                  to the estimated time in seconds
+        """
+        kernel_length = min(length1, length2)
+        signal_length = max(length1, length2)
+        full = channels * (self.direct * length1 * length2 + self.direct_call)
+        padded = 3 * self.__transform(channels, fast_length(length1 + length2 - 1))
+        block = block_length(kernel_length, signal_length)
+        blocks = -(-signal_length // (block - kernel_length + 1))      # ceil division
+        if blocks == 1:
+            overlap_add_cost = padded
+        else:
+            overlap_add_cost = (2 * blocks + 1) * self.__transform(channels, block) + blocks * self.transform_call
+        return {ConvolutionMode.FULL: full,
+                ConvolutionMode.SPECTRUM_PADDED: padded,
+                ConvolutionMode.OVERLAP_ADD: overlap_add_cost}
+
+    def choose(self, channels, length1, length2):
+        """Returns the flag of the strategy with the lowest estimated computation time.
+
+        :param channels: the number of channels in the result
+        :param length1: the length of the first operand
+        :param length2: the length of the second operand
+        :returns: a flag from the :class:`~sumpf._internal._enums.ConvolutionMode` enumeration
+        """
+        costs = self.costs(channels, length1, length2)
+        return min(costs, key=costs.get)
+
+    def explain(self, channels, length1, length2):
+        """Returns a human readable explanation of the strategy, that is chosen for
+        operands with the given lengths, which lists the estimated computation
+        times of all strategies.
+
+        :param channels: the number of channels in the result
+        :param length1: the length of the first operand
+        :param length2: the length of the second operand
+        :returns: a string
+        """
+        costs = self.costs(channels, length1, length2)
+        chosen = min(costs, key=costs.get)
+        lines = [f"convolving {channels} channel(s) of {length1} and {length2} samples with {chosen.name}:"]
+        for mode, cost in sorted(costs.items(), key=lambda item: item[1]):
+            marker = "*" if mode is chosen else " "
+            lines.append(f"{marker} {mode.name:<16} {cost * 1e3:12.4f} ms")
+        return "\n".join(lines)
+
+    @staticmethod
+    def calibrate(repeat=5):
+        """Measures the coefficients of the cost model on the current machine with
+        a few short micro-benchmarks. This takes about a second.
+
+        :param repeat: the number of repetitions of each benchmark, of which the fastest is taken
+        :returns: a :class:`~sumpf._internal._convolution.ConvolutionCostModel` instance
+        """
+        a = numpy.random.default_rng(0).standard_normal(2 ** 14)
+        b = a[0:2 ** 8]
+        tiny = a[0:2]
+
+        def measure(function, number):
+            return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+        direct_call = measure(lambda: numpy.convolve(tiny, tiny), 1000)
+        direct = (measure(lambda: numpy.convolve(a, b), 10) - direct_call) / (len(a) * len(b))
+        transform_call = measure(lambda: irfft(rfft(tiny)), 1000) / 2
+        transform = (measure(lambda: irfft(rfft(a)), 10) / 2 - transform_call) / (len(a) * math.log2(len(a)))
+        return ConvolutionCostModel(direct=max(direct, 1e-12),
+                                    direct_call=direct_call,
+                                    transform=max(transform, 1e-12),
+                                    transform_call=transform_call)
+
+    def __transform(self, channels, length):
+        """Estimates the computation time of transforming the given number of channels."""
+        return self.transform * channels * length * math.log2(max(length, 2)) + self.transform_call
+
+
+_cost_model = ConvolutionCostModel()
+
+
+def get_convolution_cost_model():
+    """Returns the cost model, with which the strategy for the ``AUTO`` convolution mode is selected.
+
+    :returns: a :class:`~sumpf._internal._convolution.ConvolutionCostModel` instance
+    """
+    return _cost_model
+
+
+def set_convolution_cost_model(model):
+    """Sets the cost model, with which the strategy for the ``AUTO`` convolution
+    mode shall be selected. This is useful to replace the default model with
+    one, that has been calibrated on the current machine, e.g. with
+    ``set_convolution_cost_model(ConvolutionCostModel.calibrate())``.
+
+    :param model: a :class:`~sumpf._internal._convolution.ConvolutionCostModel` instance
+    :returns: the previously used cost model, so it can be restored later
+    """
+    global _cost_model  # pylint: disable=global-statement; the cost model is a process wide setting
+    previous = _cost_model
+    _cost_model = model
+    return previous
+
+
+def _dtype(a, b):
+    """A helper function, that returns the dtype for the result of a convolution
+    or a correlation of the two given arrays."""
+    return real_dtype(numpy.result_type(a, b))
+
+
+def _zeros(shape, dtype):
+    """A helper function, that returns the result of a convolution or a correlation
+    with an empty array."""
+    result = allocate_array(shape=shape, dtype=dtype)
+    result[:] = 0.0
+    return result
+
+
+def direct_convolution(a, b, mode, out):
+    """A helper function, that convolves the rows of two two dimensional arrays
+    like :func:`numpy.convolve` and writes the result into the given output array.
+    Arrays with only one row are broadcast to the number of rows of the other array.
+
+    For many short rows, the convolutions of all rows are computed with one
+    batched matrix multiplication, which avoids the overhead of calling
+    :func:`numpy.convolve` for each row. Otherwise, :func:`numpy.convolve` is
+    faster, so it is called for each row.
+
+    :param a: a two dimensional :func:`numpy.array`
+    :param b: a two dimensional :func:`numpy.array`
+    :param mode: the mode of the convolution as a string ``"full"``, ``"same"`` or ``"valid"``
+    :param out: a two dimensional :func:`numpy.array` for the result
+    """
+    if _batched(a, b, out):
+        _batched_convolution(a, b, mode, out)
+    else:
+        rows = len(out)
+        for c, d, channel in zip(numpy.broadcast_to(a, (rows, a.shape[1])),
+                                 numpy.broadcast_to(b, (rows, b.shape[1])),
+                                 out):
+            channel[:] = numpy.convolve(c, d, mode=mode)
+
+
+def direct_correlation(a, b, mode, out):
+    """A helper function, that correlates the rows of two two dimensional arrays
+    like the reversed result of :func:`numpy.correlate` and writes the result
+    into the given output array. Arrays with only one row are broadcast to the
+    number of rows of the other array. Like :func:`~sumpf._internal._convolution.direct_convolution`,
+    this function computes many short correlations in one batch.
+
+    :param a: a two dimensional :func:`numpy.array`
+    :param b: a two dimensional :func:`numpy.array`
+    :param mode: the mode of the correlation as a string ``"full"`` or ``"valid"``
+    :param out: a two dimensional :func:`numpy.array` for the result
+    """
+    if _batched(a, b, out):
+        _batched_convolution(a[:, ::-1], b, mode, out)
+    else:
+        rows = len(out)
+        for c, d, channel in zip(numpy.broadcast_to(a, (rows, a.shape[1])),
+                                 numpy.broadcast_to(b, (rows, b.shape[1])),
+                                 out):
+            channel[:] = numpy.correlate(c, d, mode=mode)[::-1]
+
+
+def _batched(a, b, out):
+    """A helper function, that decides, if the direct convolution of the rows of
+    the given arrays shall be computed in one batch. This is faster for many rows,
+    if the number of multiply-accumulate operations per row is small."""
+    rows, length = out.shape
+    return rows >= 16 and length * min(a.shape[1], b.shape[1]) <= 1024
+
+
+def _batched_convolution(a, b, mode, out):
+    """A helper function, that computes the convolutions of all rows of the given
+    arrays with one matrix multiplication of the sliding windows over the longer
+    rows with the reversed shorter rows."""
+    if a.shape[1] >= b.shape[1]:
+        signal, kernel = a, b
+    else:
+        signal, kernel = b, a
+    sl = signal.shape[1]
+    kl = kernel.shape[1]
+    if mode == "full":
+        start = 0
+    elif mode == "same":
+        start = (kl - 1) // 2
+    else:
+        start = kl - 1
+    padded = numpy.zeros(shape=(len(signal), sl + 2 * (kl - 1)), dtype=signal.dtype)
+    padded[:, kl - 1:kl - 1 + sl] = signal
+    windows = numpy.lib.stride_tricks.sliding_window_view(padded, kl, axis=1)[:, start:start + out.shape[1]]
+    numpy.matmul(windows, kernel[:, ::-1, numpy.newaxis], out=out[:, :, numpy.newaxis])
+
+
+def block_length(kernel_length, signal_length):
+    """A helper function, that returns the transform length for a block-wise
+    convolution of a signal with a kernel. The candidates are fast transform
+    lengths from twice the kernel length up to the length, with which the whole
+    signal can be convolved in one transform. The length, for which the estimated
+    computation time of all blocks is lowest, is chosen. Besides the operations
+    of the transforms, the estimate includes a constant overhead per block, so
+    that short kernels are not convolved in a large number of tiny blocks.
+
+    :param kernel_length: the length of the shorter operand
+    :param signal_length: the length of the longer operand, that is split into blocks
+    :returns: the transform length as an integer
+    """
+    overhead = 20000    # the overhead of processing a block in the unit of one operation in the transform
+    maximum = fast_length(signal_length + kernel_length - 1)
+    best_length, best_cost = maximum, maximum * numpy.log2(max(maximum, 2)) + overhead
+    length = fast_length(2 * kernel_length)
+    while length < maximum:
+        blocks = -(-signal_length // (length - kernel_length + 1))     # ceil division
+        cost = blocks * (length * numpy.log2(length) + overhead)
+        if cost < best_cost:
+            best_length, best_cost = length, cost
+        length = fast_length(2 * length)
+    return best_length
+
+
+def _kernel_first(a, b):
+    """A helper function, that sorts the operands of a convolution, so that the
+    shorter one, which is used as the kernel, comes first."""
+    if a.shape[1] <= b.shape[1]:
+        return a, b
+    return b, a
+
+
+def overlap_add(a, b):
+    """A helper function, that computes the full convolution of the rows of two
+    two dimensional arrays with the overlap-add method. Arrays with only one row
+    are broadcast to the number of rows of the other array.
+
+    :param a: a two dimensional :func:`numpy.array`
+    :param b: a two dimensional :func:`numpy.array`
+    :returns: a two dimensional :func:`numpy.array` with the convolution result
+    """
+    kernel, signal = _kernel_first(a, b)
+    kl = kernel.shape[1]
+    sl = signal.shape[1]
+    pl = block_length(kl, sl)           # padded length of the blocks
+    channels = allocate_array(shape=(max(len(a), len(b)), sl + kl - 1), dtype=_dtype(a, b))
+    _overlap_add(signal, rfft(kernel, n=pl), kl, pl, channels)
+    return channels
+
+
+def _overlap_add(signal, kernel_spectrum, kernel_length, transform_length, out):
+    """A helper function, that convolves the rows of the signal block-wise with
+    a kernel, whose spectrum has already been computed, and writes the result
+    to the given output array.
+
+    :param signal: a two dimensional :func:`numpy.array`
+    :param kernel_spectrum: the transform of the kernel with ``transform_length`` samples
+    :param kernel_length: the length of the kernel in the time domain
+    :param transform_length: the length of the transforms, which must not be
+                             shorter than the kernel
+    :param out: a two dimensional :func:`numpy.array` for the result
+    """
+    sl = signal.shape[1]
+    bl = transform_length - kernel_length + 1   # block length
+    out[:] = 0.0
+    for start in range(0, sl, bl):
+        block = signal[:, start:start + bl]
+        stop = start + block.shape[1] + kernel_length - 1
+        out[:, start:stop] += irfft(rfft(block, n=transform_length) * kernel_spectrum, n=transform_length)[:, 0:stop - start]
+
+
+def overlap_save(a, b):
+    """A helper function, that computes the full convolution of the rows of two
+    two dimensional arrays with the overlap-save method. Arrays with only one row
+    are broadcast to the number of rows of the other array.
+
+    :param a: a two dimensional :func:`numpy.array`
+    :param b: a two dimensional :func:`numpy.array`
+    :returns: a two dimensional :func:`numpy.array` with the convolution result
+    """
+    kernel, signal = _kernel_first(a, b)
+    kl = kernel.shape[1]
+    sl = signal.shape[1]
+    rl = sl + kl - 1                    # result length
+    pl = block_length(kl, sl)           # padded length of the segments
+    bl = pl - kl + 1                    # number of valid samples per segment
+    ks = rfft(kernel, n=pl)
+    channels = allocate_array(shape=(max(len(a), len(b)), rl), dtype=_dtype(a, b))
+    segment = numpy.empty(shape=(len(signal), pl), dtype=signal.dtype)
+    for start in range(0, rl, bl):
+        # copy the samples from start - kl + 1 to start + bl into the segment and pad it with zeros
+        first = start - kl + 1
+        begin = max(first, 0)
+        end = min(start + bl, sl)
+        segment[:] = 0.0
+        segment[:, begin - first:end - first] = signal[:, begin:end]
+        stop = min(start + bl, rl)
+        channels[:, start:stop] = irfft(rfft(segment) * ks, n=pl)[:, kl - 1:kl - 1 + stop - start]
+    return channels
 
 
 def pad_vector(vector, vector_length, padded_length):
     """A helper function for padding a one dimensional array with zeros."""
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:vector_length] = vector
     result[vector_length:] = 0.0
     return result
@@ -597,7 +1271,7 @@ def pad_vector(vector, vector_length, padded_length):
 
 def shift_vector(vector, vector_length, padded_length):
     """A helper function for padding a one dimensional array with zeros."""
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:-vector_length] = 0.0
     result[-vector_length:] = vector
     return result
@@ -606,7 +1280,7 @@ def shift_vector(vector, vector_length, padded_length):
 def pad_and_shift_vector(vector, vector_length, padded_length, shift):
     """A helper function for padding a one dimensional array with zeros."""
     vector_length1 = vector_length + shift
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:shift] = 0.0
     result[shift:vector_length1] = vector
     result[vector_length1:] = 0.0
@@ -615,7 +1289,7 @@ def pad_and_shift_vector(vector, vector_length, padded_length, shift):
 
 def cycle_vector(vector, vector_length, shift):
     """A helper function for cyclic shifting a one dimensional array."""
-    result = numpy.empty(vector_length)
+    result = numpy.empty(vector_length, dtype=vector.dtype)
     result[0:shift] = vector[-shift:]
     result[shift:] = vector[0:-shift]
     return result
@@ -626,7 +1300,7 @@ def pad_and_cycle_vector(vector, vector_length, padded_length, shift):
     This function must only be used for negative shifts. For correct handling of
     positive shifts, see the pad_and_shift_vector function.
     """
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     if vector_length > shift:
         vector_length1 = vector_length + shift
         result[0:vector_length1] = vector[-shift:]
@@ -642,7 +1316,7 @@ def shift_and_cycle_vector(vector, vector_length, padded_length, shift):
     This function must only be used for positive shifts. For correct handling of
     negative shifts, see the pad_and_shift_vector function.
     """
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:shift] = vector[-shift:]
     if vector_length > shift:
         vector_length1 = vector_length - shift
@@ -655,7 +1329,7 @@ def shift_and_cycle_vector(vector, vector_length, padded_length, shift):
 
 def pad_matrix(matrix, matrix_length, rows, padded_length):
     """A helper function for padding a two dimensional array with zeros."""
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:matrix_length] = matrix[0:rows]
     result[:, matrix_length:] = 0.0
     return result
@@ -663,7 +1337,7 @@ def pad_matrix(matrix, matrix_length, rows, padded_length):
 
 def shift_matrix(matrix, matrix_length, rows, padded_length):
     """A helper function for padding a two dimensional array with zeros."""
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:-matrix_length] = 0.0
     result[:, -matrix_length:] = matrix[0:rows]
     return result
@@ -672,7 +1346,7 @@ def shift_matrix(matrix, matrix_length, rows, padded_length):
 def pad_and_shift_matrix(matrix, matrix_length, rows, padded_length, shift):
     """A helper function for padding a two dimensional array with zeros."""
     matrix_length1 = matrix_length + shift
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:shift] = 0.0
     result[:, shift:matrix_length1] = matrix[0:rows]
     result[:, matrix_length1:] = 0.0
@@ -681,7 +1355,7 @@ def pad_and_shift_matrix(matrix, matrix_length, rows, padded_length, shift):
 
 def cycle_matrix(matrix, matrix_length, rows, shift):
     """A helper function for cyclic shifting a two dimensional array."""
-    result = numpy.empty(shape=(rows, matrix_length))
+    result = numpy.empty(shape=(rows, matrix_length), dtype=matrix.dtype)
     result[:, 0:shift] = matrix[0:rows, -shift:]
     result[:, shift:] = matrix[0:rows, 0:-shift]
     return result
@@ -692,7 +1366,7 @@ def pad_and_cycle_matrix(matrix, matrix_length, rows, padded_length, shift):
     This function must only be used for negative shifts. For correct handling of
     positive shifts, see the pad_and_shift_matrix function.
     """
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     if matrix_length > shift:
         matrix_length1 = matrix_length + shift
         result[:, 0:matrix_length1] = matrix[0:rows, -shift:]
@@ -708,7 +1382,7 @@ def shift_and_cycle_matrix(matrix, matrix_length, rows, padded_length, shift):
     This function must only be used for positive shifts. For correct handling of
     negative shifts, see the pad_and_shift_matrix function.
     """
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:shift] = matrix[0:rows, -shift:]
     if matrix_length > shift:
         matrix_length1 = matrix_length - shift
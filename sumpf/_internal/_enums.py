@@ -18,13 +18,58 @@
 
 import enum
 
-__all__ = ("ConvolutionMode",
+__all__ = ("AllocationPolicy",
+           "ConvolutionMode",
+           "FIRPhase",
+           "FFTLibrary",
            "MergeMode",
            "ShiftMode",
+           "TimeWeighting",
            "NuttallWindows", "FlatTopWindows",
            "Interpolations")
 
 
+class AllocationPolicy(enum.Enum):
+    """An enumeration of flags, which define how the arrays for the channels of
+    *SuMPF*'s data containers shall be allocated (see :func:`~sumpf._internal._allocation.set_allocator`):
+
+    * ``SHARED_MEMORY`` allocates each array in its own block of shared memory,
+      so that the array can be accessed by forked child processes. This is the
+      default.
+    * ``NUMPY`` allocates the arrays in the process's private memory with :func:`numpy.empty`.
+    * ``POOLED_SHARED_MEMORY`` maintains a pool of shared memory blocks, which
+      are reused, when the arrays, that were stored in them, have been released.
+    * ``POOLED_NUMPY`` maintains a pool of private memory blocks, which are reused,
+      when the arrays, that were stored in them, have been released.
+    * ``NAMED_SHARED_MEMORY`` allocates each array in its own named segment of
+      shared memory (see :mod:`multiprocessing.shared_memory`). Data containers
+      with such arrays can be wrapped with :func:`~sumpf._internal._allocation.share`,
+      so that they are pickled as a handle to the segment and passed to the worker
+      processes of a process pool without copying their samples (see :class:`~sumpf._internal._allocation.NamedSharedMemoryAllocator`).
+    """
+    SHARED_MEMORY = enum.auto()
+    NUMPY = enum.auto()
+    POOLED_SHARED_MEMORY = enum.auto()
+    POOLED_NUMPY = enum.auto()
+    NAMED_SHARED_MEMORY = enum.auto()
+
+
+class FFTLibrary(enum.Enum):
+    """An enumeration of flags for the libraries, with which the fast Fourier
+    transforms can be computed (see :func:`~sumpf._internal._fft.set_fft_backend`):
+
+    * ``NUMPY`` uses the single threaded functions from :mod:`numpy.fft`. This
+      is the default.
+    * ``SCIPY`` uses the functions from :mod:`scipy.fft`, which transform the
+      channels of multi-channel data in parallel on all available cores.
+    * ``PYFFTW`` uses the *FFTW* library through the :mod:`pyfftw` package with
+      all available cores.
+    """
+    NUMPY = enum.auto()
+    SCIPY = enum.auto()
+    PYFFTW = enum.auto()
+
+
 class ConvolutionMode(enum.Enum):
     """An enumeration of flags, which define a mode, in which a convolution or
     a correlation shall be computed:
@@ -38,12 +83,46 @@ class ConvolutionMode(enum.Enum):
     * ``SPECTRUM_PADDED`` also a multiplication in the frequency domain, but the
       zero padding of both signals will be long enough to avoid the effects of
       circular convolution/correlation.
+    * ``OVERLAP_ADD`` computes the same result as ``FULL`` block-wise in the
+      frequency domain with the overlap-add method. The longer signal is split
+      into blocks, whose size is chosen according to the length of the shorter
+      signal, so that the memory for the transforms does not grow with the
+      length of the longer signal. This is efficient for convolving long signals
+      with short impulse responses.
+    * ``OVERLAP_SAVE`` computes the same result as ``OVERLAP_ADD`` with the
+      overlap-save method, which transforms overlapping segments of the longer
+      signal and discards the samples, that are corrupted by the circular
+      convolution/correlation.
+    * ``AUTO`` computes the same result as ``FULL`` with the strategy, whose
+      computation time is estimated to be the lowest for the lengths and the
+      number of channels of the given signals. The candidates are the direct
+      computation of ``FULL``, the single transform of ``SPECTRUM_PADDED`` and
+      the block-wise transforms of ``OVERLAP_ADD``. The estimate is computed
+      with a :class:`~sumpf._internal._convolution.ConvolutionCostModel`, which
+      can also explain its choice.
     """
     FULL = enum.auto()
     SAME = enum.auto()
     VALID = enum.auto()
     SPECTRUM = enum.auto()
     SPECTRUM_PADDED = enum.auto()
+    OVERLAP_ADD = enum.auto()
+    OVERLAP_SAVE = enum.auto()
+    AUTO = enum.auto()
+
+
+class FIRPhase(enum.Enum):
+    """An enumeration of flags, which define the phase response of the FIR filters,
+    that are designed with :meth:`sumpf.Filter.to_fir`:
+
+    * ``LINEAR`` creates a symmetric impulse response, whose phase is linear, so
+      that all frequencies are delayed by half the length of the impulse response.
+    * ``MINIMUM`` creates an impulse response with the minimum phase, that is
+      possible for the filter's magnitude, so that the energy is concentrated at
+      the beginning of the impulse response and the delay is as short as possible.
+    """
+    LINEAR = enum.auto()
+    MINIMUM = enum.auto()
 
 
 class MergeMode(enum.Enum):
@@ -85,6 +164,23 @@ class ShiftMode(enum.Enum):
     CYCLE = enum.auto()
 
 
+class TimeWeighting(enum.Enum):
+    """An enumeration of flags, that define how the squared samples are averaged
+    by the :meth:`~sumpf.Signal.level_vs_time` method:
+
+    * ``RECTANGULAR`` averages the squared samples in an integration interval,
+      that is placed symmetrically around the respective sample.
+    * ``EXPONENTIAL`` averages the squared samples with an exponentially decaying
+      weight, whose time constant is the integration time. This is the time weighting
+      of sound level meters according to IEC 61672-1, which is called *Fast* for
+      a time constant of 0.125s and *Slow* for a time constant of 1s. Unlike the
+      rectangular averaging, this averaging is causal, so that the level of a
+      sample only depends on the samples before it.
+    """
+    RECTANGULAR = enum.auto()
+    EXPONENTIAL = enum.auto()
+
+
 class NuttallWindows(enum.Enum):
     """This enumeration defines flags to specify the variant of Nuttall window,
     when instantiating the :class:`~sumpf.NuttallWindow` class.
@@ -0,0 +1,309 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the backends, with which *SuMPF* computes fast Fourier transforms,
+and the functions, that dispatch the transforms to the selected backend."""
+
+import contextlib
+import os
+import numpy
+from ._enums import FFTLibrary
+
+__all__ = ("FFTBackend", "NumpyFFTBackend", "ScipyFFTBackend", "PyFFTWBackend",
+           "rfft", "irfft", "fast_length",
+           "get_fft_backend", "set_fft_backend", "fft_backend")
+
+
+class FFTBackend:
+    """Base class for the backends, that compute the fast Fourier transforms.
+
+    Derived classes have to implement the :meth:`~sumpf._internal._fft.FFTBackend.rfft`
+    and :meth:`~sumpf._internal._fft.FFTBackend.irfft` methods. They can override
+    :meth:`~sumpf._internal._fft.FFTBackend.next_fast_len`, if their library
+    provides a function for finding transform lengths, for which it is especially fast.
+    """
+
+    def __init__(self, workers=None):
+        """
+        :param workers: the default number of threads for parallelizing the transforms
+                        of multiple channels. None and 1 mean single threaded, while
+                        -1 uses all available cores. Backends, that do not support
+                        multithreading, ignore this parameter.
+        """
+        self.workers = workers
+
+    def rfft(self, a, n=None, axis=-1, workers=None):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param a: the real valued input array
+        :param n: the length of the transform. The input is zero padded or cropped
+                  to this length. If None, the length of the input along ``axis`` is used.
+        :param axis: the axis, along which the transform shall be computed
+        :param workers: the number of threads or None to use the backend's default
+        :returns: a complex :func:`numpy.array` with ``n // 2 + 1`` samples along ``axis``
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+    def irfft(self, a, n=None, axis=-1, workers=None):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param a: the complex input array with the non-negative frequencies of a spectrum
+        :param n: the length of the output. If None, ``2 * (m - 1)`` is used, where
+                  ``m`` is the length of the input along ``axis``.
+        :param axis: the axis, along which the transform shall be computed
+        :param workers: the number of threads or None to use the backend's default
+        :returns: a real valued :func:`numpy.array` with ``n`` samples along ``axis``
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+    def next_fast_len(self, target):
+        """Returns the smallest length, that is greater than or equal to ``target``
+        and for which the transform of real valued data is fast. This default
+        implementation searches for the next number, which has no other prime
+        factors than 2, 3, 5, 7 and 11.
+
+        :param target: the minimum length as an integer
+        :returns: an integer
+        """
+        length = max(int(target), 1)
+        while True:
+            remainder = length
+            for factor in (2, 3, 5, 7, 11):
+                while remainder % factor == 0:
+                    remainder //= factor
+            if remainder == 1:
+                return length
+            length += 1
+
+    def _workers(self, workers):
+        """Protected helper method, that returns the number of workers for a transform.
+
+        :param workers: the number of workers, that has been passed to a transform, or None
+        :returns: the given number of workers or the backend's default
+        """
+        return self.workers if workers is None else workers
+
+
+class NumpyFFTBackend(FFTBackend):
+    """Computes the transforms with the functions from :mod:`numpy.fft`. These
+    are single threaded, so the ``workers`` parameter is ignored. This is the default.
+    """
+
+    def rfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`numpy.fft.rfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.rfft` for the parameters.
+        """
+        return numpy.fft.rfft(a, n=n, axis=axis)
+
+    def irfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`numpy.fft.irfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.irfft` for the parameters.
+        """
+        return numpy.fft.irfft(a, n=n, axis=axis)
+
+
+class ScipyFFTBackend(FFTBackend):
+    """Computes the transforms with the functions from :mod:`scipy.fft`, which
+    can transform multiple channels in parallel threads.
+
+    This backend requires :mod:`scipy` to be installed.
+    """
+
+    def __init__(self, workers=-1):
+        """
+        :param workers: the default number of threads, see :class:`~sumpf._internal._fft.FFTBackend`.
+                        By default, all available cores are used.
+        """
+        import scipy.fft    # noqa; pylint: disable=import-outside-toplevel,unused-import; fail early, if scipy is not installed
+        FFTBackend.__init__(self, workers=workers)
+
+    def rfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`scipy.fft.rfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.rfft` for the parameters.
+        """
+        import scipy.fft    # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if scipy is not installed
+        return scipy.fft.rfft(a, n=n, axis=axis, workers=self._workers(workers))
+
+    def irfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`scipy.fft.irfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.irfft` for the parameters.
+        """
+        import scipy.fft    # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if scipy is not installed
+        return scipy.fft.irfft(a, n=n, axis=axis, workers=self._workers(workers))
+
+    def next_fast_len(self, target):
+        """Returns the result of :func:`scipy.fft.next_fast_len` for real valued data.
+
+        :param target: the minimum length as an integer
+        :returns: an integer
+        """
+        import scipy.fft    # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if scipy is not installed
+        return scipy.fft.next_fast_len(max(int(target), 1), real=True)
+
+
+class PyFFTWBackend(FFTBackend):
+    """Computes the transforms with the :mod:`numpy.fft` compatible interface
+    of the `pyFFTW <https://github.com/pyFFTW/pyFFTW>`_ package, which wraps
+    the *FFTW* library. The plans, that *FFTW* creates for the transforms, are
+    cached, so that repeated transforms of the same shape are fast.
+
+    This backend requires :mod:`pyfftw` to be installed.
+    """
+
+    def __init__(self, workers=-1):
+        """
+        :param workers: the default number of threads, see :class:`~sumpf._internal._fft.FFTBackend`.
+                        By default, all available cores are used.
+        """
+        import pyfftw.interfaces.cache  # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if pyfftw is not installed
+        pyfftw.interfaces.cache.enable()
+        FFTBackend.__init__(self, workers=workers)
+
+    def rfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`pyfftw.interfaces.numpy_fft.rfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.rfft` for the parameters.
+        """
+        import pyfftw.interfaces.numpy_fft  # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if pyfftw is not installed
+        return pyfftw.interfaces.numpy_fft.rfft(a, n=n, axis=axis, threads=self.__threads(workers))
+
+    def irfft(self, a, n=None, axis=-1, workers=None):
+        """Computes the transform with :func:`pyfftw.interfaces.numpy_fft.irfft`.
+        See :meth:`~sumpf._internal._fft.FFTBackend.irfft` for the parameters.
+        """
+        import pyfftw.interfaces.numpy_fft  # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if pyfftw is not installed
+        return pyfftw.interfaces.numpy_fft.irfft(a, n=n, axis=axis, threads=self.__threads(workers))
+
+    def next_fast_len(self, target):
+        """Returns the result of :func:`pyfftw.next_fast_len`.
+
+        :param target: the minimum length as an integer
+        :returns: an integer
+        """
+        import pyfftw   # pylint: disable=import-outside-toplevel; having this as a top-level import would make this module unavailable, if pyfftw is not installed
+        return pyfftw.next_fast_len(max(int(target), 1))
+
+    def __threads(self, workers):
+        """Converts the number of workers to the number of threads, that is accepted by pyfftw."""
+        workers = self._workers(workers)
+        if workers is None:
+            return 1
+        elif workers < 0:
+            return max(1, (os.cpu_count() or 1) + 1 + workers)
+        return workers
+
+
+################################
+# selection of the FFT backend #
+################################
+
+_libraries = {FFTLibrary.NUMPY: NumpyFFTBackend,
+              FFTLibrary.SCIPY: ScipyFFTBackend,
+              FFTLibrary.PYFFTW: PyFFTWBackend}
+
+_backend = NumpyFFTBackend()
+
+
+def get_fft_backend():
+    """Returns the backend, which is currently used for the fast Fourier transforms.
+
+    :returns: an :class:`~sumpf._internal._fft.FFTBackend` instance
+    """
+    return _backend
+
+
+def set_fft_backend(backend):
+    """Sets the backend, that shall be used for the fast Fourier transforms.
+
+    :param backend: either a flag from the :class:`~sumpf._internal._enums.FFTLibrary`
+                    enumeration or an instance of a class, that is derived from
+                    :class:`~sumpf._internal._fft.FFTBackend` (e.g. a :class:`~sumpf._internal._fft.ScipyFFTBackend`
+                    with a specific number of workers)
+    :returns: the previously used backend, so it can be restored later
+    """
+    global _backend     # pylint: disable=global-statement; the FFT backend is a process wide setting
+    previous = _backend
+    if isinstance(backend, FFTLibrary):
+        _backend = _libraries[backend]()
+    elif isinstance(backend, FFTBackend):
+        _backend = backend
+    else:
+        raise ValueError(f"Unsupported FFT backend: {backend!r}")
+    return previous
+
+
+@contextlib.contextmanager
+def fft_backend(backend):
+    """A context manager, that uses the given backend for the fast Fourier transforms,
+    which are computed inside its ``with`` block, and restores the previous backend
+    afterwards.
+
+    :param backend: a flag or an instance, as it is accepted by :func:`~sumpf._internal._fft.set_fft_backend`
+    """
+    previous = set_fft_backend(backend)
+    try:
+        yield get_fft_backend()
+    finally:
+        set_fft_backend(previous)
+
+
+#########################
+# dispatching functions #
+#########################
+
+
+def rfft(a, n=None, axis=-1, workers=None, backend=None):
+    """Computes the fast Fourier transform of real valued data.
+
+    :param a: the real valued input array
+    :param n: the length of the transform or None to use the length of the input along ``axis``
+    :param axis: the axis, along which the transform shall be computed
+    :param workers: the number of threads for this transform or None to use the backend's default
+    :param backend: an :class:`~sumpf._internal._fft.FFTBackend` instance for this
+                    transform or None to use the backend, that has been set with
+                    :func:`~sumpf._internal._fft.set_fft_backend`
+    :returns: a complex :func:`numpy.array`
+    """
+    return (backend or _backend).rfft(a, n=n, axis=axis, workers=workers)
+
+
+def irfft(a, n=None, axis=-1, workers=None, backend=None):
+    """Computes the inverse fast Fourier transform to real valued data.
+
+    :param a: the complex input array with the non-negative frequencies of a spectrum
+    :param n: the length of the output or None for ``2 * (m - 1)``, where ``m``
+              is the length of the input along ``axis``
+    :param axis: the axis, along which the transform shall be computed
+    :param workers: the number of threads for this transform or None to use the backend's default
+    :param backend: an :class:`~sumpf._internal._fft.FFTBackend` instance for this
+                    transform or None to use the backend, that has been set with
+                    :func:`~sumpf._internal._fft.set_fft_backend`
+    :returns: a real valued :func:`numpy.array`
+    """
+    return (backend or _backend).irfft(a, n=n, axis=axis, workers=workers)
+
+
+def fast_length(target, backend=None):
+    """Returns the smallest transform length, that is greater than or equal to
+    ``target`` and for which the given or the selected backend is fast. This
+    is useful for transforms, where the data is zero padded anyway, like the
+    computation of linear convolutions in the frequency domain.
+
+    :param target: the minimum length as an integer
+    :param backend: an :class:`~sumpf._internal._fft.FFTBackend` instance or None
+                    to use the backend, that has been set with :func:`~sumpf._internal._fft.set_fft_backend`
+    :returns: an integer
+    """
+    return (backend or _backend).next_fast_len(target)
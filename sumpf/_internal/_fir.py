@@ -0,0 +1,70 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains helper functions for the design of FIR filters."""
+
+import math
+import numpy
+from ._enums import FIRPhase
+from ._fft import irfft, rfft
+
+__all__ = ("fir_design_length", "fir_from_magnitudes")
+
+_FLOOR = 1e-6   # the lower limit of the magnitudes for the minimum phase design, relative to their maximum
+
+
+def fir_design_length(length):
+    """Returns the length of the transforms, with which an FIR filter of the given
+    length is designed. The transfer function is sampled with a higher resolution,
+    than the impulse response can represent, to reduce the time domain aliasing
+    of the sampled transfer function.
+
+    :param length: the number of samples of the impulse response
+    :returns: an integer power of two
+    """
+    return 2 ** math.ceil(math.log2(max(8 * length, 16)))
+
+
+def fir_from_magnitudes(magnitudes, length, phase=FIRPhase.LINEAR):
+    """Computes windowed impulse responses, whose frequency responses approximate
+    the given magnitudes.
+
+    :param magnitudes: a two dimensional array with one row of magnitudes for
+                       each impulse response. The magnitudes are sampled equidistantly
+                       from 0Hz to the Nyquist frequency, so that each row has
+                       ``fir_design_length(length) // 2 + 1`` samples.
+    :param length: the number of samples of the impulse responses
+    :param phase: a flag from the :class:`~sumpf._internal._enums.FIRPhase` enumeration
+    :returns: a two dimensional :func:`numpy.array` with one impulse response per row
+    """
+    transform_length = 2 * (magnitudes.shape[-1] - 1)
+    if phase is FIRPhase.LINEAR:
+        # delay the zero phase impulse response by half of its length, so that it is centered in the window
+        delay = numpy.exp(numpy.linspace(0.0, -0.5j * math.pi * (length - 1), magnitudes.shape[-1]))
+        impulse_responses = irfft(magnitudes * delay, n=transform_length)[:, 0:length]
+        impulse_responses *= numpy.hanning(length + 2)[1:-1]
+    elif phase is FIRPhase.MINIMUM:
+        # compute the minimum phase with the folded real cepstrum. The magnitudes are limited
+        # relative to their maximum, because the cepstrum of the logarithm of zeros would alias
+        floor = numpy.maximum(_FLOOR * magnitudes.max(axis=-1, keepdims=True), numpy.finfo(numpy.float64).tiny)
+        cepstrum = irfft(numpy.log(numpy.maximum(magnitudes, floor)), n=transform_length)
+        cepstrum[:, 1:transform_length // 2] *= 2.0
+        cepstrum[:, transform_length // 2 + 1:] = 0.0
+        impulse_responses = irfft(numpy.exp(rfft(cepstrum)), n=transform_length)[:, 0:length]
+        impulse_responses *= numpy.hanning(2 * length + 1)[length:-1]
+    else:
+        raise ValueError(f"Unknown phase: {phase}")
+    return impulse_responses
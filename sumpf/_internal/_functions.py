@@ -17,30 +17,59 @@
 """Contains helper functions for common functionalities."""
 
 import collections
-import ctypes
-from multiprocessing import sharedctypes
 import numpy
 import sumpf
+from ._allocation import get_allocator
 from ._indexing import index
 
-__all__ = ("allocate_array", "get_window", "sanitize_labels", "scaling_factor")
+__all__ = ("allocate_array", "real_dtype", "complex_dtype", "get_window", "sanitize_labels", "scaling_factor")
 
 
 def allocate_array(shape, dtype=numpy.float64):
-    """Allocates a :func:`numpy.array` with the given shape and the given dtype in the shared memory.
+    """Allocates an uninitialized :func:`numpy.array` with the given shape and the
+    given dtype. By default, the array is allocated in the shared memory, but this
+    can be changed with :func:`~sumpf._internal._allocation.set_allocator`.
 
     :param shape: the shape of the requested array
-    :param dtype: the dtype of the numbers, that are stored in the array (defaults to ``numpy.float64``
+    :param dtype: the dtype of the numbers, that are stored in the array (defaults to ``numpy.float64``)
     :returns: a :func:`numpy.array`
     """
-    # compute the required memory
-    factor = numpy.dtype(dtype).itemsize // numpy.dtype(numpy.float64).itemsize
-    size = factor * int(numpy.prod(shape))
-    # allocate a flat array in the shared memory
-    flat_array = sharedctypes.RawArray(ctypes.c_double, size)
-    # cast the array into a NumPy array with the desired shape and dtype
-    shaped_array = numpy.frombuffer(flat_array, dtype=dtype).reshape(shape)
-    return shaped_array
+    return get_allocator().allocate(shape, dtype)
+
+
+def real_dtype(dtype):
+    """Returns the floating point dtype, that has the same precision as the given
+    dtype. This is for example the dtype of the samples of a signal, that is
+    computed from a spectrum with the given dtype.
+
+    Complex dtypes are mapped to the floating point dtype of their real part,
+    while integer and boolean dtypes are mapped to ``numpy.float64``.
+
+    :param dtype: a :mod:`numpy` dtype
+    :returns: a :class:`numpy.dtype` instance
+    """
+    dtype = numpy.dtype(dtype)
+    if dtype.kind == "c":
+        return numpy.empty(0, dtype=dtype).real.dtype
+    elif dtype.kind == "f":
+        return dtype
+    else:
+        return numpy.dtype(numpy.float64)
+
+
+def complex_dtype(dtype):
+    """Returns the complex dtype, that has the same precision as the given dtype.
+    This is for example the dtype of the samples of a spectrum, that is computed
+    from a signal with the given dtype.
+
+    Floating point dtypes are mapped to the complex dtype, whose real and imaginary
+    parts have the same precision, while integer and boolean dtypes are mapped
+    to ``numpy.complex128``.
+
+    :param dtype: a :mod:`numpy` dtype
+    :returns: a :class:`numpy.dtype` instance
+    """
+    return numpy.result_type(real_dtype(dtype), numpy.complex64)
 
 
 def get_window(window, overlap, symmetric=True, sampling_rate=48000.0):
@@ -20,7 +20,7 @@ import functools
 import numpy
 from ._enums import Interpolations
 
-__all__ = ("get", "zero", "one", "linear", "logarithmic", "log_x", "log_y", "stairs_lin", "stairs_log")
+__all__ = ("get", "zero", "one", "linear", "logarithmic", "log_x", "log_y", "stairs_lin", "stairs_log", "Interpolator")
 
 
 def get(flag):
@@ -76,14 +76,34 @@ def interpolation(func):
             return numpy.empty(0)
         else:
             result = func(x, xs, ys, scalar=False)
-            for i, x_i in enumerate(x):
-                if x_i in xs:
-                    result[i] = ys[xs == x_i][0]
+            _restore_supporting_points(x, xs, ys, result)
             return result
 
     return f
 
 
+def _restore_supporting_points(x, xs, ys, result, sorter=None):
+    """A helper function, that replaces the interpolated values at the supporting
+    points with the exact function values. If an x value occurs multiple times in
+    the supporting points, the function value of its first occurrence is used.
+
+    :param x: an array of x values, where the function has been evaluated
+    :param xs: an array of x values of the supporting points
+    :param ys: an array of function values of the supporting points, whose last
+               dimension has the same length as the xs array
+    :param result: the array of interpolated values, which is modified in place
+    :param sorter: an optional array of indices, that sort ``xs`` stably, or None,
+                   if this shall be computed by this function
+    """
+    if len(xs) == 0:     # pylint: disable=len-as-condition; xs might be a NumPy array, where __nonzero__ is not equivalent to len(.)
+        return
+    if sorter is None:
+        sorter = numpy.argsort(xs, kind="stable")
+    indices = sorter[numpy.minimum(numpy.searchsorted(xs, x, sorter=sorter), len(xs) - 1)]
+    mask = xs[indices] == x
+    result[..., mask] = ys[..., indices[mask]]
+
+
 @interpolation
 def zero(x, xs, ys, scalar):    # pylint: disable=unused-argument; all interpolation functions shall have the same interface
     """An interpolation, that fills the unknown values with zeros.
@@ -247,13 +267,20 @@ def _stairs_lin(x, xs, ys):
     Other than in the other interpolation functions, this helper function expects
     x to be an array every time.
     """
+    return ys[_stairs_indices(x, xs)]
+
+
+def _stairs_indices(x, xs):
+    """A helper function, that returns the indices of the supporting points, whose
+    function values are selected by the linear stairs interpolation.
+    """
     i = numpy.searchsorted(xs, x)
-    i[i >= len(ys)] -= 1
+    i[i >= len(xs)] -= 1
     left = x - xs[numpy.maximum(i - 1, 0)]
     right = x - xs[i]
     mask = (numpy.fabs(left) < numpy.fabs(right))
     i[mask] -= 1
-    return ys[i]
+    return i
 
 
 @interpolation
@@ -307,10 +334,174 @@ def stairs_log(x, xs, ys, scalar):
             else:
                 return _stairs_lin(numpy.log2(numpy.array((x,))), numpy.log2(xs), ys)[0]
     else:
-        result = _stairs_lin(numpy.log2(x), numpy.log2(xs), ys)    # the actual base of the logarithm does not matter, but the log2 function proved to be twice as fast as log or log10
-        mask = (x < minimum)
-        result[mask] = ys[xs == minimum][0]
-        maximum = xs.max()
-        mask = (x > maximum)
-        result[mask] = ys[xs == maximum][0]
+        return _stairs_log(x, xs, numpy.log2(xs), ys)    # the actual base of the logarithm does not matter, but the log2 function proved to be twice as fast as log or log10
+
+
+def _stairs_log(x, xs, log_xs, ys):
+    """A helper function, that implements the logarithmic stairs interpolation
+    for an array of x values, so that the logarithms of the supporting points
+    can be computed in advance.
+    """
+    return ys[_stairs_log_indices(x, xs, log_xs)]
+
+
+def _stairs_log_indices(x, xs, log_xs):
+    """A helper function, that returns the indices of the supporting points, whose
+    function values are selected by the logarithmic stairs interpolation.
+    """
+    i = _stairs_indices(numpy.log2(x), log_xs)
+    i[x < xs.min()] = numpy.flatnonzero(xs == xs.min())[0]
+    i[x > xs.max()] = numpy.flatnonzero(xs == xs.max())[0]
+    return i
+
+
+def _linear_weights(x, xs):
+    """A helper function, that computes the indices of the two supporting points,
+    between which the given x values are interpolated linearly, and the weights
+    of the second point. Beyond the supporting points, the weights extrapolate
+    the straight line through the two nearest supporting points.
+
+    :param x: an array of x values
+    :param xs: an array of at least two x values of the supporting points in ascending order
+    :returns: a tuple ``(left, right, weights)`` of arrays
+    """
+    right = numpy.clip(numpy.searchsorted(xs, x, side="right"), 1, len(xs) - 1)
+    left = right - 1
+    weights = (x - xs[left]) / (xs[right] - xs[left])
+    return left, right, weights
+
+
+class Interpolator:
+    """Evaluates a function, that is defined by supporting points, an interpolation
+    between them and an extrapolation beyond them, for many arrays of x values.
+
+    Other than the interpolation functions of this module, an instance of this
+    class analyzes the supporting points only once. It computes the logarithms
+    of the supporting points, which are needed by the logarithmic interpolations,
+    and the order of the x values for finding the samples, which fall exactly on
+    a supporting point, in advance. This is used by the :class:`~sumpf.Bands`
+    filters, which are often sampled repeatedly with the same supporting points.
+
+    The function values can also be given as a two dimensional array with one
+    row for each of many functions, that share the same x values of the supporting
+    points. In this case, the positions of the x values relative to the supporting
+    points and the interpolation weights are computed only once for all functions.
+    The results for each function are the same as if it had been evaluated
+    with its own instance of this class.
+
+    The supporting points must not be modified after the instance has been created.
+    """
+
+    def __init__(self, xs, ys, interpolation, extrapolation):
+        """
+        :param xs: an array of x values of the supporting points in ascending order
+        :param ys: an array of function values of the supporting points, whose
+                   last dimension has the same length as the xs array
+        :param interpolation: a flag from the :class:`~sumpf._internal._enums.Interpolations`
+                              enumeration for the function values between the supporting points
+        :param extrapolation: a flag from the :class:`~sumpf._internal._enums.Interpolations`
+                              enumeration for the function values beyond the supporting points
+        """
+        self.xs = xs
+        self.ys = ys
+        self.__interpolation = Interpolations(interpolation)
+        self.__extrapolation = Interpolations(extrapolation)
+        self.__sorter = numpy.argsort(xs, kind="stable")
+        self.__log_xs = None
+        self.__log_ys = None
+
+    def __call__(self, x, out=None):
+        """Evaluates the function for the given x values.
+
+        :param x: an array or a scalar value, where the function shall be evaluated
+        :param out: an optional array, in which the result shall be stored
+        :returns: the function values as an array or a scalar, depending on x
+                  being an array or a number. If the function values of the supporting
+                  points are two dimensional, the result has an additional first
+                  dimension for the functions.
+        """
+        if numpy.ndim(x) == 0 and numpy.ndim(self.ys) == 1:
+            if x < self.xs[0] or self.xs[-1] < x:
+                return get(self.__extrapolation)(x=x, xs=self.xs, ys=self.ys)   # pylint: disable=no-value-for-parameter; this function is modified by a decorator
+            else:
+                return get(self.__interpolation)(x=x, xs=self.xs, ys=self.ys)   # pylint: disable=no-value-for-parameter
+        shape = numpy.shape(self.ys)[0:-1] + numpy.shape(x)
+        if out is None:
+            out = numpy.empty(shape=shape, dtype=numpy.result_type(self.ys, numpy.float64))
+        if len(self.xs) == 0:    # pylint: disable=len-as-condition; xs might be a NumPy array, where __nonzero__ is not equivalent to len(.)
+            out[...] = 0.0
+            return out
+        elif numpy.size(x) == 0:
+            return out
+        x = numpy.ravel(x)
+        result = numpy.reshape(out, numpy.shape(self.ys)[0:-1] + x.shape)     # usually a view on the output array, in which x is flattened
+        outside = (x < self.xs[0]) | (self.xs[-1] < x)
+        if outside.any():
+            inside = ~outside
+            result[..., outside] = self.__evaluate(self.__extrapolation, x[outside])
+            if inside.any():
+                result[..., inside] = self.__evaluate(self.__interpolation, x[inside])
+        else:
+            result[...] = self.__evaluate(self.__interpolation, x)
+        _restore_supporting_points(x, self.xs, self.ys, result, sorter=self.__sorter)
+        if not numpy.shares_memory(result, out):
+            out[...] = numpy.reshape(result, shape)
+        return out
+
+    def __evaluate(self, flag, x):  # pylint: disable=too-many-return-statements; this is basically a switch statement
+        """Computes the interpolation or extrapolation with the given flag for
+        a flat array of x values, where the function values at the supporting points
+        have not yet been restored.
+        """
+        if flag is Interpolations.ZERO:
+            return numpy.zeros(numpy.shape(self.ys)[0:-1] + x.shape, dtype=self.ys.dtype)
+        elif flag is Interpolations.ONE:
+            return numpy.ones(numpy.shape(self.ys)[0:-1] + x.shape, dtype=self.ys.dtype)
+        elif flag is Interpolations.LINEAR:
+            return self.__linear(x, self.xs, self.ys)
+        elif flag is Interpolations.LOGARITHMIC:
+            return numpy.exp2(self.__linear(numpy.log2(x), self.__logarithmic_xs(), self.__logarithmic_ys()))
+        elif flag is Interpolations.LOG_X:
+            return self.__linear(numpy.log2(x), self.__logarithmic_xs(), self.ys)
+        elif flag is Interpolations.LOG_Y:
+            return numpy.exp2(self.__linear(x, self.xs, self.__logarithmic_ys()))
+        elif flag is Interpolations.STAIRS_LIN:
+            return self.ys[..., _stairs_indices(x, self.xs)]
+        elif flag is Interpolations.STAIRS_LOG:
+            return self.ys[..., _stairs_log_indices(x, self.xs, self.__logarithmic_xs())]
+        else:
+            raise ValueError(f"Unknown interpolation flag: {flag}. See sumpf.Bands.interpolations for available flags.")
+
+    @staticmethod
+    @numpy.errstate(invalid="ignore", divide="ignore")
+    def __linear(x, xs, ys):
+        """Interpolates or extrapolates linearly between the supporting points."""
+        if len(xs) == 1:
+            return numpy.repeat(ys[..., 0:1], len(x), axis=-1)
+        left, right, weights = _linear_weights(x, xs)
+        y_left, y_right = ys[..., left], ys[..., right]
+        result = y_left + weights * (y_right - y_left)
+        invalid = ~numpy.isfinite(result)
+        if invalid.any():
+            # infinite supporting points, such as the logarithm of a supporting point
+            # at 0Hz or of a zero function value, are handled like in numpy.interp,
+            # which retries from the right supporting point and falls back to equal
+            # function values. Extrapolations with an infinite slope are undefined.
+            slope = (y_right - y_left) / (xs[right] - xs[left])
+            retry = slope * (x - xs[right]) + y_right
+            retry = numpy.where(numpy.isnan(retry) & (y_left == y_right), y_left, retry)
+            result = numpy.where(numpy.isnan(result), retry, result)
+            result = numpy.where(numpy.isinf(slope) & ((weights < 0.0) | (weights > 1.0)), numpy.nan, result)
         return result
+
+    def __logarithmic_xs(self):
+        """Returns the cached logarithms of the x values of the supporting points."""
+        if self.__log_xs is None:
+            self.__log_xs = numpy.log2(self.xs)
+        return self.__log_xs
+
+    def __logarithmic_ys(self):
+        """Returns the cached logarithms of the function values of the supporting points."""
+        if self.__log_ys is None:
+            self.__log_ys = numpy.log2(self.ys)
+        return self.__log_ys
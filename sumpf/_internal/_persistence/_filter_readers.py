@@ -49,6 +49,7 @@ def term_from_dict(dictionary):
              "Quotient": sumpf.Filter.Quotient,
              "Constant": sumpf.Filter.Constant,
              "Polynomial": sumpf.Filter.Polynomial,
+             "ZeroPoleGain": sumpf.Filter.ZeroPoleGain,
              "Exp": sumpf.Filter.Exp,
              "Bands": sumpf.Filter.Bands,
              "Absolute": sumpf.Filter.Absolute,
@@ -21,7 +21,7 @@ import os
 __all__ = ("read_file", "get_writer")
 
 
-def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-many-branches; this function is spaghetti code, but the sequence of read attempts is easy to follow
+def read_file(path, readers, reader_base_class, **kwargs):  # noqa; pylint: disable=too-many-branches; this function is spaghetti code, but the sequence of read attempts is easy to follow
     """A helper function, that implements the basic algorithm for reading data
     sets from a file. The algorithm goes through the following steps:
 
@@ -39,6 +39,8 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
                     the given file, that reader will be added to the dictionary.
     :param reader_base_class: the base class for the readers. This function iterates
                               over sub-classes of this class in the steps 2. and 3..
+    :param `**kwargs`: additional keyword arguments, that are passed to the readers
+                       (e.g. the ``dtype`` of the loaded data set)
     :returns: the loaded data set
     """
     exception = None
@@ -51,7 +53,7 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
     # try to open the file with an already instantiated reader
     for reader in readers_list:
         try:
-            result = reader(path)
+            result = reader(path, **kwargs)
         except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
             exception = e if exception is None else exception
         else:
@@ -66,7 +68,7 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
             else:
                 readers_list.append(reader)
                 try:
-                    result = reader(path)
+                    result = reader(path, **kwargs)
                 except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
                     exception = e if exception is None else exception
                 else:
@@ -80,7 +82,7 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
                 continue
             else:
                 try:
-                    result = reader(path)
+                    result = reader(path, **kwargs)
                 except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
                     exception = e if exception is None else exception
                 else:
@@ -32,20 +32,29 @@ __all__ = ("readers", "Reader")
 readers = {}    # maps file extensions to reader instances, that can be used for future loading of a signal
 
 
-def from_dict(dictionary):
-    """Deserializes a signal from a dictionary."""
+def from_dict(dictionary, dtype=None):
+    """Deserializes a signal from a dictionary.
+
+    :param dictionary: the dictionary with the signal's data
+    :param dtype: the dtype of the signal's channels or None, if the dtype of the
+                  stored channels shall be kept
+    :returns: the deserialized signal
+    """
     if "channels" in dictionary:
-        channels = allocate_array(shape=numpy.shape(dictionary["channels"]))
-        channels[:, :] = dictionary["channels"]
+        stored = dictionary["channels"]
+        if dtype is None:
+            dtype = stored.dtype if isinstance(stored, numpy.ndarray) and stored.dtype.kind == "f" else numpy.float64
+        channels = allocate_array(shape=numpy.shape(stored), dtype=dtype)
+        channels[:, :] = stored
     else:
-        channels = numpy.empty(shape=(1, 0))
+        channels = numpy.empty(shape=(1, 0), dtype=dtype)
     return sumpf.Signal(channels=channels,
                         sampling_rate=dictionary.get("sampling_rate", 48000.0),
                         offset=dictionary.get("offset", 0),
                         labels=dictionary.get("labels", ()))
 
 
-def from_rows(time_column, data_rows, labels):
+def from_rows(time_column, data_rows, labels, dtype=None):
     """Deserializes a signal from tabular data.
 
     :param time_column: a vector with time values, that correspond to the rows
@@ -53,6 +62,7 @@ def from_rows(time_column, data_rows, labels):
     :param data_rows: a matrix, where the rows contain a sample for each channel
                       of the signal.
     :param labels: the labels for the channels or an empty tuple.
+    :param dtype: the dtype of the signal's channels or None for ``numpy.float64``
     :returns: the deserialized signal
     """
     if len(data_rows) and len(data_rows[0]):    # pylint: disable=len-as-condition; data_rows can be a NumPy array
@@ -71,7 +81,7 @@ def from_rows(time_column, data_rows, labels):
             sorted_data_rows = data_rows
         else:
             sorted_data_rows = [[e for _, e in sorted(zip(time_column, data_row))] for data_row in data_rows]
-        channels = allocate_array(shape=numpy.shape(sorted_data_rows))
+        channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=numpy.float64 if dtype is None else dtype)
         channels[:] = sorted_data_rows
         if len(labels) < len(channels):
             labels = tuple(labels) + ("",) * (len(channels) - len(labels))
@@ -79,15 +89,16 @@ def from_rows(time_column, data_rows, labels):
             labels = labels[0:len(channels)]
         return sumpf.Signal(channels=channels, sampling_rate=sampling_rate, offset=offset, labels=labels)
     else:
-        return sumpf.Signal()
+        return sumpf.Signal(dtype=dtype)
 
 
 class Reader:
     """Base class for readers, that load :class:`~sumpf.Signal` instances from a file.
 
     Derived classes must implement the ``__call__`` method, that accepts the path to
-    the file and returns the loaded signal. If anything goes wrong, the method
-    shall raise an error (instead of returning None).
+    the file and an optional dtype for the loaded channels and returns the loaded
+    signal. If anything goes wrong, the method shall raise an error (instead of
+    returning None).
     """
 
 
@@ -97,10 +108,12 @@ class CsvReader(Reader):
     """
     extensions = (".csv",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         with open(path, newline="") as f:
@@ -120,42 +133,48 @@ class CsvReader(Reader):
                 rows.append([float(c) for c in row[1:]])
             return from_rows(time_column=time_samples,
                              data_rows=numpy.transpose(rows),
-                             labels=labels)
+                             labels=labels,
+                             dtype=dtype)
 
 
 class JsonReader(Reader):
     """Reads a JSON representation of a signal from a file."""
     extensions = (".json", ".js")
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         with open(path) as f:
-            return from_dict(json.load(f))
+            return from_dict(json.load(f), dtype)
 
 
 class NumpyReader(Reader):
     """Reads a signal from a :mod:`numpy` file."""
     extensions = (".npz", ".npy")
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         try:
             with numpy.load(path) as data:
-                return from_dict(data)
+                return from_dict(data, dtype)
         except AttributeError:  # npy files cannot be opened with a context manager
             array = numpy.load(path)
             filename = os.path.split(path)[-1]
             return from_rows(time_column=array[0],
                              data_rows=array[1:],
-                             labels=[f"{filename} {i}" for i in range(1, array.shape[0])])
+                             labels=[f"{filename} {i}" for i in range(1, array.shape[0])],
+                             dtype=dtype)
 
 
 class PickleReader(Reader):
@@ -170,16 +189,24 @@ class PickleReader(Reader):
     """
     extensions = (".pickle",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         with open(path, "rb") as f:
             result = pickle.load(f)
             assert isinstance(result, sumpf.Signal)
-            return result
+            if dtype is None or result.dtype() == dtype:
+                return result
+            return sumpf.Signal(channels=result.channels(),
+                                sampling_rate=result.sampling_rate(),
+                                offset=result.offset(),
+                                labels=result.labels(),
+                                dtype=dtype)
 
 
 class StandardLibraryReader:
@@ -198,10 +225,12 @@ class StandardLibraryReader:
         self.__sample_width_mapping = sample_width_mapping
         self.__endianness = endianness
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         path = str(path)  # the wave and aifc modules cannot deal with pathlib objects (at least not in Python 3.9)
@@ -211,7 +240,8 @@ class StandardLibraryReader:
             number_of_samples = f.getnframes()
             sample_mask = self.__sample_width_mapping[f.getsampwidth()]
             signed = sample_mask.islower()  # specifies, if the integers in the file are signed or not
-            channels = allocate_array(shape=(number_of_channels, number_of_samples))
+            channels = allocate_array(shape=(number_of_channels, number_of_samples),
+                                      dtype=numpy.float64 if dtype is None else dtype)
             total_chunk_size = (number_of_channels * chunk_size)
             mask = f"{self.__endianness}{total_chunk_size}{sample_mask}"
             factor = 1.0 / (2 ** (8 * f.getsampwidth() - 1))    # maps the maximum value of the integers from the file to 1.0
@@ -269,16 +299,20 @@ class SoundfileReader(Reader):
     def __init__(self):
         import soundfile  # noqa; pylint: disable=unused-import,import-outside-toplevel; this shall raise an ImportError, if the soundfile library cannot be imported
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param dtype: the dtype of the loaded signal's channels or None, if the
+                      precision of the file shall be used
         :returns: a :class:`~sumpf.Signal` instance
         """
         import soundfile  # pylint: disable=import-outside-toplevel; having this as a top-level import would make all writers unavailable, if the soundfile library is not installed
         with soundfile.SoundFile(path) as f:
-            channels = allocate_array(shape=(f.channels, f.frames))
-            channels.transpose()[:] = f.read().reshape((f.frames, f.channels))
+            dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+            channels = allocate_array(shape=(f.channels, f.frames), dtype=dtype)
+            read_dtype = "float32" if dtype == numpy.float32 else "float64"    # soundfile can decode the samples directly to single precision
+            channels.transpose()[:] = f.read(dtype=read_dtype).reshape((f.frames, f.channels))
             filename = os.path.split(path)[-1]
             return sumpf.Signal(channels=channels,
                                 sampling_rate=float(f.samplerate),
@@ -20,16 +20,24 @@ import json
 import pickle
 import numpy
 import sumpf
-from .._functions import allocate_array
+from .._functions import allocate_array, complex_dtype
 
 __all__ = ("readers", "Reader")
 
 readers = {}    # maps file extensions to reader instances, that can be used for future loading of a spectrogram
 
 
-def from_dict(channels, dictionary):
-    """Deserializes a spectrogram from a dictionary."""
+def from_dict(channels, dictionary, dtype=None):
+    """Deserializes a spectrogram from a dictionary.
+
+    :param channels: the channels of the spectrogram
+    :param dictionary: the dictionary with the other parameters of the spectrogram
+    :param dtype: the dtype of the spectrogram's channels or None, if the dtype of
+                  the given channels shall be kept
+    :returns: the deserialized spectrogram
+    """
     return sumpf.Spectrogram(channels=channels,
+                             dtype=dtype,
                              resolution=dictionary.get("resolution", 1.0),
                              sampling_rate=dictionary.get("sampling_rate", 48000.0),
                              offset=dictionary.get("offset", 0),
@@ -41,8 +49,9 @@ class Reader:
     a file.
 
     Derived classes must implement the ``__call__`` method, that accepts the path to
-    the file and returns the loaded spectrum. If anything goes wrong, the method
-    shall raise an error (instead of returning None).
+    the file and an optional dtype for the loaded channels and returns the loaded
+    spectrogram. If anything goes wrong, the method shall raise an error (instead of
+    returning None).
     """
 
 
@@ -50,10 +59,12 @@ class JsonReader(Reader):
     """Reads a JSON representation of a spectrogram from a file."""
     extensions = (".json", ".js")
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrogram` from the given path.
 
         :param path: the path of the file, from which the spectrogram shall be loaded
+        :param dtype: the dtype of the loaded spectrogram's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrogram` instance
         """
         with open(path) as f:
@@ -80,23 +91,26 @@ class JsonReader(Reader):
                     channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
             else:
                 channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
-            return from_dict(channels, data)
+            return from_dict(channels, data, dtype)
 
 
 class NumpyReader(Reader):
     """Reads a spectrum from a :mod:`numpy` file."""
     extensions = (".npz",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with numpy.load(path) as data:
-            channels = allocate_array(shape=data["channels"].shape, dtype=numpy.complex128)
-            channels[:] = data["channels"]
-            return from_dict(channels, data)
+            stored = data["channels"]
+            channels = allocate_array(shape=stored.shape, dtype=complex_dtype(stored.dtype) if dtype is None else dtype)
+            channels[:] = stored
+            return from_dict(channels, data, dtype)
 
 
 class PickleReader(Reader):
@@ -111,13 +125,20 @@ class PickleReader(Reader):
     """
     extensions = (".pickle",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with open(path, "rb") as f:
             result = pickle.load(f)
             assert isinstance(result, sumpf.Spectrogram)
-            return result
+            if dtype is None or result.dtype() == dtype:
+                return result
+            return from_dict(result.channels(), {"resolution": result.resolution(),
+                                                 "sampling_rate": result.sampling_rate(),
+                                                 "offset": result.offset(),
+                                                 "labels": result.labels()}, dtype)
@@ -22,21 +22,29 @@ import os
 import pickle
 import numpy
 import sumpf
-from .._functions import allocate_array
+from .._functions import allocate_array, complex_dtype
 
 __all__ = ("readers", "Reader")
 
 readers = {}    # maps file extensions to reader instances, that can be used for future loading of a spectrum
 
 
-def from_dict(channels, dictionary):
-    """Deserializes a spectrum from a dictionary."""
+def from_dict(channels, dictionary, dtype=None):
+    """Deserializes a spectrum from a dictionary.
+
+    :param channels: the channels of the spectrum
+    :param dictionary: the dictionary with the other parameters of the spectrum
+    :param dtype: the dtype of the spectrum's channels or None, if the dtype of
+                  the given channels shall be kept
+    :returns: the deserialized spectrum
+    """
     return sumpf.Spectrum(channels=channels,
+                          dtype=dtype,
                           resolution=dictionary.get("resolution", 1.0),
                           labels=dictionary.get("labels", ()))
 
 
-def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-many-branches; the branches are not too complicated in this one
+def from_rows(frequency_column, data_rows, labels, dtype=None):     # pylint: disable=too-many-branches; the branches are not too complicated in this one
     """Deserializes a spectrum from tabular data.
 
     :param frequency_column: a vector with frequency values, that correspond to
@@ -44,6 +52,7 @@ def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-ma
     :param data_rows: a matrix, where the rows contain a complex sample for each
                       channel of the spectrum.
     :param labels: the labels for the channels or an empty tuple.
+    :param dtype: the dtype of the spectrum's channels or None for ``numpy.complex128``
     :returns: the deserialized spectrum
     """
     if len(data_rows) and len(data_rows[0]):    # pylint: disable=len-as-condition; data_rows can be a NumPy array
@@ -66,16 +75,17 @@ def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-ma
         else:
             sorted_data_rows = [[e for _, e in sorted(zip(frequency_column, data_row))] for data_row in data_rows]
         # create the channels
+        dtype = numpy.complex128 if dtype is None else dtype
         if offset == 0:
-            channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=numpy.complex128)
+            channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=dtype)
             channels[:] = sorted_data_rows
         elif offset < 0:
             channels = allocate_array(shape=numpy.subtract(numpy.shape(sorted_data_rows), (0, offset)),
-                                      dtype=numpy.complex128)
+                                      dtype=dtype)
             channels[:] = sorted_data_rows[:, offset:]
         else:
             channels = allocate_array(shape=numpy.add(numpy.shape(sorted_data_rows), (0, offset)),
-                                      dtype=numpy.complex128)
+                                      dtype=dtype)
             channels[:, 0:offset] = 0.0 + 0j
             channels[:, offset:] = sorted_data_rows[:]
         # extend the labels if necessary
@@ -86,7 +96,7 @@ def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-ma
         # create the Spectrum instance
         return sumpf.Spectrum(channels=channels, resolution=resolution, labels=labels)
     else:
-        return sumpf.Spectrum()
+        return sumpf.Spectrum(dtype=dtype)
 
 
 class Reader:
@@ -94,8 +104,9 @@ class Reader:
     a file.
 
     Derived classes must implement the ``__call__`` method, that accepts the path to
-    the file and returns the loaded spectrum. If anything goes wrong, the method
-    shall raise an error (instead of returning None).
+    the file and an optional dtype for the loaded channels and returns the loaded
+    spectrum. If anything goes wrong, the method shall raise an error (instead of
+    returning None).
     """
 
 
@@ -105,10 +116,12 @@ class CsvReader(Reader):
     """
     extensions = (".csv",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with open(path, newline="") as f:
@@ -129,17 +142,20 @@ class CsvReader(Reader):
                 rows.append([complex(c) for c in row[1:]])
             return from_rows(frequency_column=frequency_samples,
                              data_rows=numpy.transpose(rows),
-                             labels=labels)
+                             labels=labels,
+                             dtype=dtype)
 
 
 class JsonReader(Reader):
     """Reads a JSON representation of a spectrum from a file."""
     extensions = (".json", ".js")
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with open(path) as f:
@@ -159,30 +175,34 @@ class JsonReader(Reader):
                     channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
             else:
                 channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
-            return from_dict(channels, data)
+            return from_dict(channels, data, dtype)
 
 
 class NumpyReader(Reader):
     """Reads a spectrum from a :mod:`numpy` file."""
     extensions = (".npz", ".npy")
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         try:
             with numpy.load(path) as data:
-                channels = allocate_array(shape=data["channels"].shape, dtype=numpy.complex128)
-                channels[:] = data["channels"]
-                return from_dict(channels, data)
+                stored = data["channels"]
+                channels = allocate_array(shape=stored.shape, dtype=complex_dtype(stored.dtype) if dtype is None else dtype)
+                channels[:] = stored
+                return from_dict(channels, data, dtype)
         except AttributeError:  # npy files cannot be opened with a context manager
             array = numpy.load(path)
             filename = os.path.split(path)[-1]
             return from_rows(frequency_column=array[0].real,
                              data_rows=array[1:],
-                             labels=[f"{filename} {i}" for i in range(1, array.shape[0])])
+                             labels=[f"{filename} {i}" for i in range(1, array.shape[0])],
+                             dtype=dtype)
 
 
 class PickleReader(Reader):
@@ -197,13 +217,17 @@ class PickleReader(Reader):
     """
     extensions = (".pickle",)
 
-    def __call__(self, path):
+    def __call__(self, path, dtype=None):
         """Attempts to load a :class:`~sumpf.Spectrum` from the given path.
 
         :param path: the path of the file, from which the spectrum shall be loaded
+        :param dtype: the dtype of the loaded spectrum's channels or None, if
+                      the precision of the file shall be used
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with open(path, "rb") as f:
             result = pickle.load(f)
             assert isinstance(result, sumpf.Spectrum)
-            return result
+            if dtype is None or result.dtype() == dtype:
+                return result
+            return from_dict(result.channels(), {"resolution": result.resolution(), "labels": result.labels()}, dtype)
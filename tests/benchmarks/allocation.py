@@ -0,0 +1,46 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compares the run time of the allocators for the arrays of the data containers.
+
+Run it with ``python3 tests/benchmarks/allocation.py`` or ``make benchmark``.
+"""
+
+import gc
+import os
+import sys
+import timeit
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.split(__file__)[0], "..", "..")))
+    import sumpf._internal as sumpf_internal
+
+    allocators = {"shared memory": sumpf_internal.SharedMemoryAllocator(),
+                  "numpy": sumpf_internal.NumpyAllocator(),
+                  "pooled shared memory": sumpf_internal.PoolAllocator(backend=sumpf_internal.SharedMemoryAllocator()),
+                  "pooled numpy": sumpf_internal.PoolAllocator(backend=sumpf_internal.NumpyAllocator())}
+    print(f"{'length':>10}" + "".join(f"{name:>22}" for name in allocators))
+    for exponent in range(4, 25, 4):
+        length = 2 ** exponent
+        number = max(10, 2 ** 20 // length)
+        times = []
+        for allocator in allocators.values():
+            def allocate(allocator=allocator, length=length):
+                array = allocator.allocate(shape=(2, length))
+                array[:, 0] = 0.0
+            gc.collect()
+            times.append(min(timeit.repeat(allocate, number=number, repeat=5)) / number)
+        print(f"{length:>10}" + "".join(f"{t * 1e6:>20.2f}µs" for t in times))
@@ -0,0 +1,55 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Calibrates the cost model for the ``AUTO`` convolution mode and compares the
+run time of the convolution modes with the mode, that the model chooses.
+
+Run it with ``python3 tests/benchmarks/convolution.py`` or ``make benchmark``.
+The printed coefficients can be used to update the defaults of the
+:class:`~sumpf._internal._convolution.ConvolutionCostModel` class.
+"""
+
+import os
+import sys
+import timeit
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.split(__file__)[0], "..", "..")))
+    import numpy
+    import sumpf._internal as sumpf_internal
+
+    model = sumpf_internal.ConvolutionCostModel.calibrate()
+    print("calibrated coefficients:")
+    for name, value in vars(model).items():
+        print(f"    {name} = {value:.3e}")
+    print()
+    modes = (sumpf_internal.ConvolutionMode.FULL,
+             sumpf_internal.ConvolutionMode.SPECTRUM_PADDED,
+             sumpf_internal.ConvolutionMode.OVERLAP_ADD)
+    print(f"{'channels':>10}{'length1':>10}{'length2':>10}" + "".join(f"{m.name:>18}" for m in modes) + f"{'chosen':>18}")
+    random = numpy.random.default_rng(0)
+    for channels, length1, length2 in ((1, 100, 16), (1, 2 ** 16, 16), (1, 2 ** 16, 2 ** 10),
+                                       (1, 2 ** 16, 2 ** 16), (1, 2 ** 20, 2 ** 8), (1, 2 ** 20, 2 ** 12),
+                                       (8, 2 ** 12, 2 ** 12), (8, 2 ** 18, 2 ** 12), (64, 2 ** 16, 2 ** 8)):
+        a = random.standard_normal((channels, length1))
+        b = random.standard_normal(length2)
+        number = max(1, 2 ** 20 // (channels * length1))
+        times = []
+        for mode in modes:
+            function = sumpf_internal.convolution[mode].with_vector
+            times.append(min(timeit.repeat(lambda f=function: f(a, b, (0, 0)), number=number, repeat=3)) / number)
+        chosen = model.choose(channels, length1, length2)
+        print(f"{channels:>10}{length1:>10}{length2:>10}" + "".join(f"{t * 1e3:>16.3f}ms" for t in times) + f"{chosen.name:>18}")
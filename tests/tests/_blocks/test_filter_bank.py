@@ -0,0 +1,79 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the FractionalOctaveFilterBank class"""
+
+import math
+import numpy
+import pytest
+import connectors
+import sumpf
+
+
+@pytest.mark.parametrize("fraction, sampling_rate, number_of_bands, first, last", [(1, 48000.0, 11, 15.85, 15849.0),
+                                                                                   (3, 48000.0, 31, 19.95, 19953.0),
+                                                                                   (3, 16000.0, 26, 19.95, 6310.0),
+                                                                                   (2, 48000.0, 21, 18.84, 18836.0)])
+def test_center_frequencies(fraction, sampling_rate, number_of_bands, first, last):
+    """Tests the mid-band frequencies of the filter bank."""
+    pytest.importorskip("scipy")
+    signal = sumpf.Signal(channels=numpy.zeros(shape=(1, 100)), sampling_rate=sampling_rate)
+    frequencies = sumpf.FractionalOctaveFilterBank(signal=signal, fraction=fraction).center_frequencies()
+    assert len(frequencies) == number_of_bands
+    assert frequencies[0] == pytest.approx(first, rel=1e-3)
+    assert frequencies[-1] == pytest.approx(last, rel=1e-3)
+    assert numpy.diff(numpy.log2(frequencies)) == pytest.approx(numpy.full(number_of_bands - 1, math.log2(10.0 ** 0.3) / fraction))
+
+
+@pytest.mark.parametrize("frequency", [31.62, 251.2, 1000.0, 12589.0])
+def test_sine(frequency):
+    """Tests the levels and the band signals for a sine wave in the middle of a band."""
+    pytest.importorskip("scipy")
+    sine = sumpf.SineWave(frequency=frequency, sampling_rate=48000.0, length=3 * 48000)
+    signal = sumpf.Merge([sine, sine * 0.5]).output()
+    bank = sumpf.FractionalOctaveFilterBank(signal=signal)
+    index = numpy.argmin(numpy.abs(bank.center_frequencies() - frequency))
+    number_of_bands = len(bank.center_frequencies())
+    # levels
+    levels = bank.output_levels()
+    assert isinstance(levels, sumpf.Bands)
+    assert len(levels) == 2
+    for channel, amplitude in zip(levels.transfer_functions(), (1.0, 0.5)):
+        assert channel.xs == pytest.approx(bank.center_frequencies())
+        assert channel.ys[index] == pytest.approx(amplitude / math.sqrt(2.0), rel=0.02)
+        assert (numpy.delete(channel.ys, index) < amplitude * 0.2).all()
+    # band signals
+    bands = bank.output_signal()
+    assert bands.shape() == (2 * number_of_bands, signal.length())
+    assert bands.sampling_rate() == signal.sampling_rate()
+    assert bands.labels()[index] == f"Sine {bank.center_frequencies()[index]:.5g}Hz"
+    steady = bands[:, signal.length() // 3:]
+    assert steady.level()[index] == pytest.approx(1.0 / math.sqrt(2.0), rel=0.02)
+    assert steady.level()[number_of_bands + index] == pytest.approx(0.5 / math.sqrt(2.0), rel=0.02)
+
+
+def test_connectors():
+    """Tests the connection of the filter bank in a processing chain."""
+    pytest.importorskip("scipy")
+    bank = sumpf.FractionalOctaveFilterBank(fraction=1)
+    pass_through = connectors.blocks.PassThrough().input.connect(bank.output_levels)
+    bank.set_signal(sumpf.SineWave(frequency=1000.0, length=48000))
+    assert len(pass_through.output().transfer_functions()[0].xs) == 11
+    bank.set_fraction(3)
+    bank.set_lowest_frequency(900.0)
+    bank.set_highest_frequency(1100.0)
+    bank.set_order(4)
+    assert pass_through.output().transfer_functions()[0].xs == pytest.approx([1000.0])
@@ -0,0 +1,74 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the MIMOConvolution class"""
+
+import hypothesis
+import numpy
+import pytest
+import connectors
+import sumpf
+import tests
+
+
+def test_errors():
+    """Tests the errors, that are raised for missing or mismatching impulse responses."""
+    signal = sumpf.Signal(channels=numpy.ones(shape=(2, 10)))
+    with pytest.raises(RuntimeError):
+        sumpf.MIMOConvolution(signal=signal).output()
+    with pytest.raises(ValueError):
+        sumpf.MIMOConvolution(signal=signal, impulse_responses=[signal]).output()
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  impulse_responses=hypothesis.strategies.lists(tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                                                                min_size=5, max_size=5),
+                  offsets=hypothesis.strategies.lists(hypothesis.strategies.integers(min_value=-100, max_value=100),
+                                                      min_size=5, max_size=5))
+def test_against_single_convolutions(signal, impulse_responses, offsets):
+    """Compares the result of the MIMO convolution with the sum of the convolutions
+    of each input with each impulse response."""
+    # limit the offset differences of the impulse responses, because they are aligned in one array
+    impulse_responses = [sumpf.Signal(channels=ir.channels(), offset=o) for ir, o in zip(impulse_responses, offsets)]
+    impulse_responses = impulse_responses[0:len(signal)]
+    result = sumpf.MIMOConvolution(signal=signal, impulse_responses=impulse_responses).output()
+    # compute the reference
+    number_of_outputs = max(len(ir) for ir in impulse_responses)
+    offset = min(signal.offset() + ir.offset() for ir in impulse_responses)
+    length = max(signal.offset() + ir.offset() + signal.length() + ir.length() - 1 for ir in impulse_responses) - offset
+    reference = numpy.zeros(shape=(number_of_outputs, length))
+    for channel, ir in zip(signal.channels(), impulse_responses):
+        for output, response in zip(reference, ir.channels()):
+            start = signal.offset() + ir.offset() - offset
+            output[start:start + len(channel) + len(response) - 1] += numpy.convolve(channel, response)
+    # compare the result
+    assert result.sampling_rate() == signal.sampling_rate()
+    assert result.offset() == offset
+    assert result.labels() == ("Convolution",) * number_of_outputs
+    assert result.channels() == pytest.approx(reference, abs=1e-12 * (1.0 + min(signal.length(), length)))
+
+
+def test_connectors():
+    """Tests the usage of the MIMO convolution in a processing network."""
+    impulse_responses = [sumpf.Signal(channels=numpy.array([[1.0, 0.0], [0.0, 2.0]])),
+                         sumpf.Signal(channels=numpy.array([[0.0, 3.0], [4.0, 0.0]]))]
+    signal = sumpf.Signal(channels=numpy.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]))
+    mimo = sumpf.MIMOConvolution()
+    sink = connectors.blocks.PassThrough()
+    mimo.output.connect(sink.input)
+    mimo.set_impulse_responses(impulse_responses)
+    mimo.set_signal(signal)
+    assert sink.output().channels() == pytest.approx(numpy.array([[1.0, 0.0, 3.0, 0.0], [0.0, 6.0, 0.0, 0.0]]))
@@ -0,0 +1,89 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the SoundLevelMeter class"""
+
+import math
+import numpy
+import pytest
+import connectors
+import sumpf
+
+
+@pytest.mark.parametrize("frequency, a_weighting, c_weighting", [(1000.0, 0.0, 0.0),
+                                                                 (100.0, -19.15, -0.3),
+                                                                 (31.5, -39.53, -2.95)])
+def test_sine(frequency, a_weighting, c_weighting):
+    """Tests the levels of a sine wave with an amplitude of 1Pa."""
+    pytest.importorskip("scipy")
+    signal = sumpf.SineWave(frequency=frequency, sampling_rate=48000.0, length=5 * 48000)
+    meter = sumpf.SoundLevelMeter(signal=signal, interval=0.5)
+    level = 20.0 * math.log10(1.0 / math.sqrt(2.0) / 20e-6)
+    for output in (meter.output_fast(), meter.output_slow(), meter.output_leq()):
+        assert output.shape() == (1, 10)
+        assert output.sampling_rate() == 2.0
+        assert output.offset() == 0
+        assert output.channels()[0, -1] == pytest.approx(level + a_weighting, abs=0.3)
+    assert meter.output_fast().labels() == ("Sine Fast",)
+    assert (meter.output_leq().channels()[0, 1:] == pytest.approx(level + a_weighting, abs=0.3))
+    assert (meter.output_peak().channels()[0, 1:] == pytest.approx(level + c_weighting + 20.0 * math.log10(math.sqrt(2.0)), abs=0.3))
+    # the slow time weighting needs longer to settle
+    assert meter.output_slow().channels()[0, 0] < meter.output_fast().channels()[0, 0] < level + a_weighting
+    # without frequency weighting
+    meter = sumpf.SoundLevelMeter(signal=signal, frequency_weighting=None, peak_weighting=None, interval=0.5)
+    assert meter.output_leq().channels()[0, 1:] == pytest.approx(level, abs=1e-3)
+    assert meter.output_peak().channels()[0, 1:] == pytest.approx(level + 20.0 * math.log10(math.sqrt(2.0)), abs=1e-3)
+
+
+def test_blocks():
+    """Tests, that measuring a signal block by block yields the same result as measuring it at once."""
+    pytest.importorskip("scipy")
+    channels = numpy.random.default_rng(1).normal(size=(2, 3 * 8000))
+    signal = sumpf.Signal(channels=channels, sampling_rate=8000.0, labels=("one", "two"))
+    reference = sumpf.SoundLevelMeter(signal=signal, interval=0.1)
+    meter = sumpf.SoundLevelMeter(interval=0.1)
+    outputs = []
+    start = 0
+    for length in (100, 7, 0, 750, 4000, 12000, 143, 7000):
+        meter.set_signal(signal[:, start:start + length])
+        outputs.append((meter.output_fast(), meter.output_slow(), meter.output_leq(), meter.output_peak()))
+        start += length
+    assert start == signal.length()
+    assert [o[0].offset() for o in outputs] == [0, 0, 0, 0, 1, 6, 21, 21]
+    for i, output in enumerate((reference.output_fast(), reference.output_slow(), reference.output_leq(), reference.output_peak())):
+        assert output.shape() == (2, 30)
+        assert output.labels()[0].startswith("one ")
+        concatenated = numpy.concatenate([o[i].channels() for o in outputs], axis=1)
+        assert concatenated == pytest.approx(output.channels())
+    # a new measurement
+    with pytest.raises(ValueError):
+        meter.set_signal(signal[0])
+    meter.reset()
+    meter.set_signal(signal[0])
+    assert meter.output_leq().channels() == pytest.approx(reference.output_leq().channels()[0:1])
+
+
+def test_connectors():
+    """Tests the connection of the sound level meter in a processing chain."""
+    pytest.importorskip("scipy")
+    meter = sumpf.SoundLevelMeter(interval=0.25)
+    assert meter.output_leq().shape() == (1, 0)
+    pass_through = connectors.blocks.PassThrough().input.connect(meter.output_leq)
+    signal = sumpf.SineWave(length=24000)
+    meter.set_signal(signal)
+    meter.set_signal(signal)
+    assert pass_through.output().shape() == (1, 2)
+    assert pass_through.output().offset() == 2
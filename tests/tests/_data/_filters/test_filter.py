@@ -25,6 +25,7 @@ import pytest
 import sumpf
 import sumpf._internal as sumpf_internal
 import sumpf._data._filters._base._terms as terms
+from sumpf._data._filters._base import S
 import tests
 
 ###########################################
@@ -588,3 +589,317 @@ def test_constructor_parameters(parameters, frequency):
 #######################
 
 # the "spectrum"-method is already tested in test_call
+
+
+@pytest.mark.filterwarnings("ignore:'where' used without 'out'")
+@pytest.mark.parametrize("filter_", [sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=8, highpass=False),
+                                     sumpf.ButterworthFilter(cutoff_frequency=500.0, order=7, highpass=True),
+                                     sumpf.Chebyshev1Filter(cutoff_frequency=2000.0, order=6, ripple=3.0, highpass=True),
+                                     sumpf.Chebyshev2Filter(cutoff_frequency=2000.0, order=5, ripple=40.0, highpass=False),
+                                     sumpf.BesselFilter(cutoff_frequency=100.0, order=5, highpass=False),
+                                     sumpf.BesselFilter(cutoff_frequency=1000.0, order=4, highpass=True),
+                                     sumpf.AWeighting(),
+                                     sumpf.CWeighting(),
+                                     sumpf.ButterworthFilter(order=3) * sumpf.ButterworthFilter(cutoff_frequency=100.0, order=2, highpass=True),
+                                     sumpf.ButterworthFilter(order=2) + sumpf.Filter(transfer_functions=(sumpf.Filter.Exp(-1e-3),))])
+def test_compile(filter_):
+    """Compares the spectrum of compiled filters with that of the original filters."""
+    compiled = filter_.compile()
+    assert isinstance(compiled, sumpf.Filter)
+    assert compiled.labels() == filter_.labels()
+    reference = filter_.spectrum(resolution=1.0, length=24001)
+    spectrum = compiled.spectrum(resolution=1.0, length=24001)
+    assert spectrum.channels() == pytest.approx(reference.channels(), rel=1e-9, abs=1e-15)
+    assert compiled(1000.0) == pytest.approx(filter_(1000.0), rel=1e-9)
+
+
+def test_compile_terms():
+    """Checks which terms are folded into zero-pole-gain terms by the compilation."""
+    lowpass = sumpf.ButterworthFilter(order=4).compile()
+    highpass = sumpf.ButterworthFilter(order=4, highpass=True).compile()
+    assert isinstance(lowpass.transfer_functions()[0], terms.ZeroPoleGain)
+    assert not lowpass.transfer_functions()[0].transform
+    assert len(lowpass.transfer_functions()[0].poles) == 4
+    assert isinstance(highpass.transfer_functions()[0], terms.ZeroPoleGain)
+    assert highpass.transfer_functions()[0].transform
+    # factors, that depend on different frequency variables, are grouped
+    bandpass = (sumpf.ButterworthFilter(order=4) * sumpf.ButterworthFilter(order=2, highpass=True) * 2.0).compile()
+    transfer_function = bandpass.transfer_functions()[0]
+    assert isinstance(transfer_function, terms.Product)
+    assert len(transfer_function.factors) == 2
+    assert all(isinstance(f, terms.ZeroPoleGain) for f in transfer_function.factors)
+    # terms, that are not rational functions, are kept
+    exp = sumpf.Filter.Exp(coefficient=0.5)
+    bands = sumpf.Filter.Bands(xs=(1.0, 2.0), ys=(3.0, 4.0),
+                               interpolation=sumpf.Bands.interpolations.LINEAR,
+                               extrapolation=sumpf.Bands.interpolations.STAIRS_LIN)
+    assert exp.compile() == exp
+    assert bands.compile() == bands
+    compiled = (exp + sumpf.Filter.Polynomial((2.0, 1.0)) / sumpf.Filter.Polynomial((1.0, 3.0))).compile()
+    assert isinstance(compiled, terms.Sum)
+    assert compiled.summands[0] == exp
+    assert isinstance(compiled.summands[1], terms.ZeroPoleGain)
+    # constant terms are folded into constants
+    assert (sumpf.Filter.Constant(2.0) / sumpf.Filter.Constant(4.0)).compile() == sumpf.Filter.Constant(0.5)
+
+
+@pytest.mark.filterwarnings("ignore:overflow", "ignore:invalid value", "ignore:divide by zero")
+@hypothesis.given(filter_=tests.strategies.filters(),
+                  resolution=tests.strategies.resolutions,
+                  length=tests.strategies.short_lengths)
+def test_memoization(filter_, resolution, length):
+    """Checks that evaluating sub-terms, which occur multiple times, only once does not change the result."""
+    frequencies = numpy.arange(1, length + 1) * resolution     # omit 0Hz, where the result depends on the lowpass-to-highpass-transforms of the other channels
+    reference = filter_(frequencies)
+    doubled = sumpf.Filter(transfer_functions=filter_.transfer_functions() * 2)
+    result = doubled(frequencies)
+    for r in (result[0:len(filter_)], result[len(filter_):]):
+        for a, b in zip(r, reference):
+            numpy.testing.assert_array_equal(a, b)
+
+
+def test_memoized_sub_terms():
+    """Checks that the sub-terms, which occur multiple times in a filter, are memoized."""
+    lowpass = sumpf.ButterworthFilter(order=4).transfer_functions()[0]
+    copy = sumpf.ButterworthFilter(order=4).transfer_functions()[0]
+    delay = sumpf.Filter.Exp(coefficient=-1e-3)
+    transfer_functions = (lowpass * delay, copy * sumpf.Filter.Constant(2.0), sumpf.Filter.Polynomial((1.0, 2.0)))
+    s = S(numpy.linspace(0.0, 24000.0, 1025))
+    s.share(transfer_functions)
+    assert s.structure(lowpass) is not None
+    assert s.structure(copy) == s.structure(lowpass)
+    assert s.structure(delay) is None
+    assert s.structure(transfer_functions[2]) is None
+    assert s.recall(lowpass) is None
+    result = lowpass(s)
+    recalled = s.recall(copy)
+    assert recalled is not result
+    assert (recalled == result).all()
+    filter_ = sumpf.Filter(transfer_functions=transfer_functions)
+    spectrum = filter_.spectrum()
+    for c, tf in zip(spectrum.channels(), transfer_functions):
+        assert (c == sumpf.Filter(transfer_functions=(tf,)).spectrum().channels()[0]).all()
+
+
+@pytest.mark.filterwarnings("ignore:'where' used without 'out'")
+def test_cached_spectrum():
+    """Tests the caching of the sampled transfer functions."""
+    filter_ = sumpf.ButterworthFilter(order=3) * sumpf.ButterworthFilter(cutoff_frequency=100.0, order=2, highpass=True)
+    frequencies = numpy.linspace(0.0, 20000.0, 100)
+    reference_spectrum = filter_.spectrum(resolution=2.0, length=100)
+    reference_samples = filter_(frequencies)
+    previous = sumpf_internal.set_filter_cache(sumpf_internal.LRUCache(max_bytes=2 ** 20))
+    try:
+        cache = sumpf_internal.get_filter_cache()
+        spectrum = filter_.spectrum(resolution=2.0, length=100)
+        assert spectrum == reference_spectrum
+        assert not spectrum.channels().flags.writeable
+        assert len(cache) == 1
+        # the spectrum of an equal filter is taken from the cache
+        copy = sumpf.ButterworthFilter(order=3) * sumpf.ButterworthFilter(cutoff_frequency=100.0, order=2, highpass=True)
+        assert copy.spectrum(resolution=2.0, length=100).channels() is spectrum.channels()
+        assert len(cache) == 1
+        # different parameters or filters create new entries
+        assert filter_.spectrum(resolution=2.0, length=101).length() == 101
+        assert (filter_ * 2.0).spectrum(resolution=2.0, length=100) == reference_spectrum * 2.0
+        assert len(cache) == 3
+        # sampling the filter with an array of frequencies
+        samples = filter_(frequencies)
+        assert filter_(frequencies) is samples
+        for s, r in zip(samples, reference_samples):
+            assert (s == r).all()
+            assert not s.flags.writeable
+        # applying the filter to a signal uses the cached spectrum
+        signal = sumpf.Signal(channels=numpy.ones(shape=(2, 198)))
+        assert filter_ * signal == filter_ * signal
+    finally:
+        sumpf_internal.set_filter_cache(previous)
+
+
+@pytest.mark.parametrize("interpolation", [sumpf.Bands.interpolations.LINEAR,
+                                           sumpf.Bands.interpolations.LOGARITHMIC,
+                                           sumpf.Bands.interpolations.STAIRS_LOG])
+def test_stacked_bands(interpolation):
+    """Tests, that the stacked evaluation of bands terms with the same supporting
+    points returns the same results as the evaluation of the individual terms."""
+    xs = numpy.geomspace(20.0, 20000.0, 31)
+    ys = numpy.random.default_rng(42).uniform(0.1, 10.0, size=(5, len(xs)))
+    bands = [sumpf.Filter.Bands(xs=xs, ys=y, interpolation=interpolation, extrapolation=interpolation) for y in ys]
+    other = sumpf.Filter.Bands(xs=xs[::2], ys=ys[0, ::2], interpolation=interpolation, extrapolation=interpolation)
+    highpass = terms.Polynomial(coefficients=(1.0, 0.0), transform=True) / terms.Polynomial(coefficients=(1.0, 1.0), transform=True)
+    transfer_functions = (bands[0], other, bands[1], highpass, bands[2], bands[3], bands[3] * highpass, bands[4])
+    filter_ = sumpf.Filter(transfer_functions=transfer_functions)
+    assert len(terms.StackedBands.find(transfer_functions)) == 1
+    assert terms.StackedBands.find(transfer_functions)[0].indices() == (0, 2, 4, 5, 7)
+    frequencies = numpy.linspace(0.0, 24000.0, 1001)
+    spectrum = filter_.spectrum(resolution=24.0, length=1001)
+    samples = filter_(frequencies)
+    # compare with the evaluation of the terms one by one
+    s = S(frequencies)
+    s.share(transfer_functions)
+    for tf, c, r in zip(transfer_functions, spectrum.channels(), samples):
+        reference = tf(s)
+        assert (c == reference).all()
+        assert (r == reference).all()
+    # replacing the supporting points of a term invalidates the stacked evaluation
+    bands[2].ys = ys[2] * 2.0
+    assert filter_(frequencies)[4] == pytest.approx(2.0 * samples[4], rel=1e-12)
+    # so does modifying the supporting points in-place
+    bands[3].ys[:] *= 2.0
+    assert filter_(frequencies)[5] == pytest.approx(2.0 * samples[5], rel=1e-12)
+    single = sumpf.Filter(transfer_functions=(bands[3],))
+    reference = single(frequencies[1:])[0]     # exclude 0Hz, where logarithmic extrapolation is infinite
+    bands[3].ys[:] *= 2.0
+    assert single(frequencies[1:])[0] == pytest.approx(2.0 * reference, rel=1e-12)
+
+
+@pytest.mark.parametrize("filter_", [sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=4),
+                                     sumpf.ButterworthFilter(cutoff_frequency=200.0, order=3, highpass=True),
+                                     sumpf.ButterworthFilter(cutoff_frequency=5000.0, order=5) * sumpf.BesselFilter(cutoff_frequency=100.0, order=2, highpass=True),
+                                     -sumpf.Chebyshev1Filter(cutoff_frequency=300.0, order=3, highpass=True) / sumpf.ButterworthFilter(cutoff_frequency=30.0, order=2),
+                                     sumpf.CWeighting()])
+def test_zero_pole_gain(filter_):
+    """Compares the zero-pole-gain representation in terms of ``s`` with the original transfer function."""
+    frequencies = numpy.arange(1.0, 20000.0, 10.0)
+    reference = filter_(frequencies)[0]
+    gain, zeros, poles = filter_.transfer_functions()[0].zero_pole_gain()
+    result = terms.ZeroPoleGain(zeros=zeros, poles=poles, gain=gain)(S(frequencies))
+    assert result == pytest.approx(reference, rel=1e-9, abs=1e-12 * max(abs(reference)))
+    assert filter_.transfer_functions()[0].invert_transform().zero_pole_gain() is not None
+    assert sumpf.Filter.Exp(coefficient=0.5).zero_pole_gain() is None
+    assert (sumpf.Filter.Polynomial((1.0, 2.0)) * sumpf.Filter.Exp(coefficient=0.5)).zero_pole_gain() is None
+
+
+def test_discretize_availability():
+    """Tests, that the discretization of filters fails with an ImportError, if scipy is not available."""
+    filter_ = sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=4)
+    try:
+        import scipy.signal     # noqa; pylint: disable=unused-import,import-outside-toplevel; this shall raise an ImportError, if scipy cannot be imported
+    except ImportError:
+        with pytest.raises(ImportError):
+            filter_.second_order_sections()
+        with pytest.raises(ImportError):
+            filter_.discretize()
+    else:
+        assert len(filter_.second_order_sections()) == 1
+        assert filter_.discretize() is not None
+
+
+def test_discretize():
+    """Tests the discretization of filters into second order sections and the filtering in the time domain."""
+    pytest.importorskip("scipy")
+    sampling_rate = 48000.0
+    lowpass = sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=4)
+    highpass = sumpf.ButterworthFilter(cutoff_frequency=100.0, order=3, highpass=True)
+    # the frequency response of the discrete filter
+    sections, = lowpass.second_order_sections(sampling_rate=sampling_rate, prewarp_frequency=1000.0)
+    assert sections.shape == (2, 6)
+    z = numpy.exp(2j * numpy.pi * numpy.array([100.0, 1000.0]) / sampling_rate)
+    response = numpy.prod([(b0 + b1 / z + b2 / z ** 2) / (a0 + a1 / z + a2 / z ** 2) for b0, b1, b2, a0, a1, a2 in sections], axis=0)
+    assert abs(response[1]) == pytest.approx(abs(lowpass(1000.0)[0]))
+    assert abs(response[0]) == pytest.approx(abs(lowpass(100.0)[0]), rel=1e-4)
+    # filtering block by block yields the same result as filtering the whole signal
+    bandpass = lowpass * highpass
+    channels = numpy.random.default_rng(1).standard_normal((3, 5000))
+    cascade = bandpass.discretize(sampling_rate=sampling_rate)
+    assert len(cascade) == 1
+    assert cascade.sampling_rate() == sampling_rate
+    assert len(cascade.sections()[0]) == 4
+    reference = cascade.filter(channels)
+    cascade.reset()
+    blocks = [cascade.filter(channels[:, i:i + 700]) for i in range(0, 5000, 700)]
+    assert numpy.concatenate(blocks, axis=1) == pytest.approx(reference, rel=1e-12, abs=1e-12)
+    with pytest.raises(ValueError):
+        cascade.filter(channels[0:2])
+    # a long impulse response of the discrete filter is close to that of the analog filter
+    cascade.reset()
+    impulse = numpy.zeros((1, 48000))
+    impulse[0, 0] = 1.0
+    discrete = sumpf.Signal(channels=cascade.filter(impulse), sampling_rate=sampling_rate)
+    spectrum = discrete.fourier_transform()
+    for frequency in (200.0, 500.0, 1000.0):
+        assert abs(spectrum.channels()[0, int(frequency)]) == pytest.approx(abs(bandpass(frequency)[0]), abs=1e-2)   # the bilinear transform slightly warps the frequency axis
+    # multiple channels
+    cascade = sumpf.Filter(transfer_functions=(lowpass.transfer_functions()[0], highpass.transfer_functions()[0])).discretize()
+    assert cascade.filter(channels[0:1]).shape == (2, 5000)
+    cascade.reset()
+    result = cascade.filter(channels[0:2].astype(numpy.float32))
+    assert result.dtype == numpy.float32
+    with pytest.raises(ValueError):
+        cascade.filter(channels)
+    # weighting filters, which are normalized with a complex gain
+    for weighting in (sumpf.AWeighting(), sumpf.CWeighting()):
+        sections, = weighting.second_order_sections(sampling_rate=sampling_rate, prewarp_frequency=1000.0)
+        response = numpy.prod([(b0 + b1 / z + b2 / z ** 2) / (a0 + a1 / z + a2 / z ** 2) for b0, b1, b2, a0, a1, a2 in sections], axis=0)
+        assert numpy.absolute(response) == pytest.approx(numpy.absolute(weighting(numpy.array([100.0, 1000.0]))[0]), rel=3e-3)   # the bilinear transform slightly warps the frequency axis
+    # filters, that cannot be discretized
+    with pytest.raises(ValueError):
+        lowpass.second_order_sections(sampling_rate=sampling_rate, prewarp_frequency=30000.0)
+    with pytest.raises(ValueError):
+        sumpf.Filter(transfer_functions=(sumpf.Filter.Exp(coefficient=0.5),)).second_order_sections()
+    with pytest.raises(ValueError):
+        sumpf.DerivativeFilter().second_order_sections()
+
+
+def test_to_fir():
+    """Tests the design of FIR filters from filters."""
+    sampling_rate = 48000.0
+    bands = sumpf.Filter.Bands(xs=(100.0, 1000.0, 10000.0), ys=(1.0, 0.25, 2.0),
+                               interpolation=sumpf.Bands.interpolations.LOGARITHMIC,
+                               extrapolation=sumpf.Bands.interpolations.STAIRS_LIN)
+    filter_ = sumpf.Filter(transfer_functions=(sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=4).transfer_functions()[0],
+                                               bands * sumpf.Filter.Exp(coefficient=-0.001)),
+                           labels=("lowpass", "equalizer"))
+    frequencies = numpy.array([300.0, 1000.0, 3000.0, 10000.0])
+    reference = numpy.absolute(filter_(frequencies))
+    linear = filter_.to_fir(length=1024, sampling_rate=sampling_rate)
+    minimum = filter_.to_fir(length=1024, sampling_rate=sampling_rate, phase=sumpf.Filter.fir_phases.MINIMUM)
+    for impulse_responses in (linear, minimum):
+        assert impulse_responses.shape() == (2, 1024)
+        assert impulse_responses.sampling_rate() == sampling_rate
+        assert impulse_responses.labels() == ("lowpass", "equalizer")
+        spectrum = numpy.absolute(numpy.fft.rfft(impulse_responses.channels(), n=48000))
+        assert spectrum[:, frequencies.astype(int)] == pytest.approx(reference, rel=3e-2, abs=1e-3)
+    # the linear phase impulse responses are symmetric, while the energy of the minimum phase impulse responses is concentrated at the beginning
+    assert linear.channels() == pytest.approx(linear.channels()[:, ::-1])
+    energy = numpy.cumsum(minimum.channels() ** 2, axis=1)
+    assert (energy[:, 100] > 0.99 * energy[:, -1]).all()
+    # filters, whose magnitude is zero at some frequencies
+    frequencies = numpy.array([1000.0, 2000.0, 3000.0, 10000.0])
+    for weighting in (sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=4, highpass=True), sumpf.AWeighting()):
+        reference = 20.0 * numpy.log10(numpy.absolute(weighting(frequencies)[0]))
+        for phase in sumpf.Filter.fir_phases:
+            impulse_response = weighting.to_fir(length=1024, sampling_rate=sampling_rate, phase=phase).channels()[0]
+            spectrum = numpy.absolute(numpy.fft.rfft(impulse_response, n=48000))
+            assert 20.0 * numpy.log10(spectrum[frequencies.astype(int)]) == pytest.approx(reference, abs=0.1)
+    # caching the designed filters
+    previous = sumpf_internal.set_filter_cache(sumpf_internal.LRUCache())
+    try:
+        cached = filter_.to_fir(length=1024, sampling_rate=sampling_rate)
+        assert cached == linear
+        assert not cached.channels().flags.writeable
+        assert filter_.to_fir(length=1024, sampling_rate=sampling_rate).channels() is cached.channels()
+        assert filter_.to_fir(length=1024, sampling_rate=sampling_rate, phase=sumpf.Filter.fir_phases.MINIMUM) == minimum
+        assert len(sumpf_internal.get_filter_cache()) == 2
+    finally:
+        sumpf_internal.set_filter_cache(previous)
+
+
+@pytest.mark.parametrize("filter_class", [sumpf.ButterworthFilter, sumpf.BesselFilter, sumpf.Chebyshev1Filter, sumpf.Chebyshev2Filter])
+def test_bank(filter_class):
+    """Tests the creation of a bank of filters with a sweep of the cutoff frequency."""
+    cutoff_frequencies = numpy.geomspace(100.0, 10000.0, 5)
+    bank = filter_class.bank(cutoff_frequency=cutoff_frequencies, order=[4], highpass=True)
+    assert len(bank) == 5
+    for c, tf, label in zip(cutoff_frequencies, bank.transfer_functions(), bank.labels()):
+        reference = filter_class(cutoff_frequency=c, order=4, highpass=True)
+        assert tf == reference.transfer_functions()[0]
+        assert label == f"{reference.labels()[0]} (cutoff_frequency={float(c)!r})"
+    # equal parameters share the same transfer function
+    bank = filter_class.bank(order=(2, 3, 2))
+    assert bank.transfer_functions()[0] is bank.transfer_functions()[2]
+    assert bank.transfer_functions()[1] == filter_class(order=3).transfer_functions()[0]
+    assert filter_class.bank() == sumpf.Filter(transfer_functions=filter_class().transfer_functions(),
+                                               labels=filter_class().labels())
+    with pytest.raises(ValueError):
+        filter_class.bank(cutoff_frequency=(100.0, 200.0), order=(1, 2, 3))
@@ -111,6 +111,26 @@ def test_interval():
     assert sweep3[:, 0.1:-0.1].channels() == pytest.approx(sweep4.channels())
 
 
+@pytest.mark.parametrize("cls", [sumpf.ExponentialSweep, sumpf.InverseExponentialSweep])
+@pytest.mark.parametrize("length, block_length", [(10, 3), (1000, 1000), (1000, 333), (100000, 8192)])
+def test_blocks(cls, length, block_length):
+    """Tests, that generating a sweep block by block yields the same samples as the constructor."""
+    parameters = {"start_frequency": 30.0, "stop_frequency": 15000.0, "phase": 0.4, "interval": (0.1, -0.1), "sampling_rate": 44100.0, "length": length}
+    blocks = list(cls.blocks(block_length=block_length, **parameters))
+    assert len(blocks) == -(-length // block_length)
+    sweep = cls(**parameters)
+    assert (numpy.concatenate([b.channels() for b in blocks], axis=1) == sweep.channels()).all()
+    for i, block in enumerate(blocks):
+        assert block.sampling_rate() == sweep.sampling_rate()
+        assert block.offset() == sweep.offset() + i * block_length
+        assert block.labels() == sweep.labels()
+    # the instantaneous frequency can be computed for an array of points in time
+    times = sweep.time_samples()
+    frequencies = sweep.instantaneous_frequency(times)
+    assert isinstance(frequencies, numpy.ndarray)
+    assert frequencies[::100] == pytest.approx([sweep.instantaneous_frequency(t) for t in times[::100]])
+
+
 def test_harmonic_impulse_response():
     """Does some trivial tests with the harmonic_impulse_response method"""
     # create a sweep, an inverse sweep and a distorted version of the sweep
@@ -149,6 +169,28 @@ def test_harmonic_impulse_response():
     assert max_indices.mean() * spectrum.resolution() == pytest.approx(1000.0, rel=8e-3)    # the maximums should be around 1000Hz
 
 
+@pytest.mark.parametrize("length", [None, 1000, 2 ** 14])
+def test_harmonic_impulse_responses(length):
+    """Compares the batched cutting out of harmonic impulse responses with cutting them out one by one."""
+    sweep = sumpf.ExponentialSweep(start_frequency=20.0, stop_frequency=7800.0, sampling_rate=48000, length=2 ** 14)
+    inverse = sumpf.InverseExponentialSweep(start_frequency=20.0, stop_frequency=7800.0, sampling_rate=48000, length=2 ** 14)   # pylint: disable=line-too-long
+    distorted = 0.5 * sweep ** 3 - 0.6 * sweep ** 2 + 0.1 * sweep + 0.02
+    response = sumpf.Merge([distorted, 0.3 * distorted]).output()
+    impulse_response = response.convolve(inverse, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED)
+    orders = (1, 2, 3, 5)
+    harmonics = sweep.harmonic_impulse_responses(impulse_response=impulse_response, orders=orders, length=length)
+    if length is None:  # the harmonics are compared to references of the same length, since the fractional delays depend on the length
+        length = sweep.harmonic_impulse_response(impulse_response=impulse_response, harmonic=1).length()
+    assert harmonics.shape() == (2 * len(orders), length)
+    assert harmonics.sampling_rate() == impulse_response.sampling_rate()
+    assert harmonics.offset() == 0
+    for i, order in enumerate(orders):
+        reference = sweep.harmonic_impulse_response(impulse_response=impulse_response, harmonic=order, length=length)
+        for c in range(2):
+            assert harmonics.labels()[c * len(orders) + i] == reference.labels()[c]
+            assert harmonics.channels()[c * len(orders) + i] == pytest.approx(reference.channels()[c], abs=1e-12)
+
+
 @pytest.mark.skip("this benchmark might fail depending on the system's load")
 def test_benchmark():
     """Tests if SuMPF's implementation is faster than a pure NumPy implementation"""
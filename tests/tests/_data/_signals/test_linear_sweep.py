@@ -119,6 +119,26 @@ def test_interval():
     assert sweep3[:, 0.1:-0.1].channels() == pytest.approx(sweep4.channels())
 
 
+@pytest.mark.parametrize("cls", [sumpf.LinearSweep, sumpf.InverseLinearSweep])
+@pytest.mark.parametrize("length, block_length", [(10, 3), (1000, 1000), (1000, 333), (100000, 8192)])
+def test_blocks(cls, length, block_length):
+    """Tests, that generating a sweep block by block yields the same samples as the constructor."""
+    parameters = {"start_frequency": 30.0, "stop_frequency": 15000.0, "phase": 0.4, "interval": (0.1, -0.1), "sampling_rate": 44100.0, "length": length}
+    blocks = list(cls.blocks(block_length=block_length, **parameters))
+    assert len(blocks) == -(-length // block_length)
+    sweep = cls(**parameters)
+    assert (numpy.concatenate([b.channels() for b in blocks], axis=1) == sweep.channels()).all()
+    for i, block in enumerate(blocks):
+        assert block.sampling_rate() == sweep.sampling_rate()
+        assert block.offset() == sweep.offset() + i * block_length
+        assert block.labels() == sweep.labels()
+    # the instantaneous frequency can be computed for an array of points in time
+    times = sweep.time_samples()
+    frequencies = sweep.instantaneous_frequency(times)
+    assert isinstance(frequencies, numpy.ndarray)
+    assert frequencies[::100] == pytest.approx([sweep.instantaneous_frequency(t) for t in times[::100]])
+
+
 @pytest.mark.skip("this benchmark might fail depending on the system's load")
 def test_benchmark():
     """Tests if SuMPF's implementation is faster than a pure NumPy implementation"""
@@ -18,6 +18,7 @@
 
 import hypothesis
 import numpy
+import pytest
 import sumpf
 import tests
 
@@ -335,3 +336,97 @@ def test_chi_square_noise(degrees_of_freedom, seed, sampling_rate, length):
                       sampling_rate=sampling_rate,
                       length=length,
                       label="Chi-square noise")
+
+
+@pytest.mark.parametrize("exponent, label", [(0.0, "White noise"), (1.0, "Pink noise"), (2.0, "Brown noise"), (-1.0, "Blue noise"), (0.5, "Colored noise")])
+@pytest.mark.parametrize("length", [0, 1, 1000, 1001])
+def test_colored_noise(exponent, label, length):
+    """Tests the synthesis of noise, whose power spectral density follows a power law."""
+    noise = sumpf.ColoredNoise(exponent=exponent, seed=7, sampling_rate=8000.0, length=length)
+    assert noise.shape() == (1, length)
+    assert noise.labels() == (label,)
+    assert noise.seed() == 7
+    assert noise == sumpf.ColoredNoise(exponent=exponent, seed=7, sampling_rate=8000.0, length=length)
+    if length:
+        frequencies = numpy.fft.rfftfreq(length, 1.0 / 8000.0)
+        magnitude = numpy.abs(numpy.fft.rfft(noise.channels()[0])) / numpy.sqrt(length)
+        assert magnitude[0] == pytest.approx(0.0, abs=1e-12)
+        assert magnitude[1:] == pytest.approx((frequencies[1:] / 1000.0) ** (-exponent / 2.0))
+    if exponent == 0.0 and length > 1:
+        assert numpy.std(noise.channels()) == pytest.approx(1.0, rel=0.01)
+
+
+def test_filtered_colored_noise():
+    """Tests the synthesis of noise, whose magnitude spectrum is defined by a filter."""
+    filter_ = sumpf.Bands({100.0: 2.0, 1000.0: 0.5})
+    noise = sumpf.ColoredNoise(filter_=filter_, seed=3, sampling_rate=4000.0, length=4000)
+    assert noise.labels() == ("Colored noise",)
+    spectrum = numpy.fft.rfft(noise.channels()[0]) / numpy.sqrt(noise.length())
+    assert numpy.abs(spectrum) == pytest.approx(numpy.abs(filter_(numpy.fft.rfftfreq(4000, 1.0 / 4000.0))[0]))
+    phases = numpy.angle(spectrum[1:-1])
+    assert numpy.std(numpy.diff(phases)) > 1.0   # the phases are random
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_noise_stream_crossfade(threads):
+    """Tests the crossfading of the blocks of a stream of colored noise."""
+    noise = sumpf.ColoredNoise(exponent=2.0, seed=11, length=0)
+    stream = sumpf.NoiseStream(noise, number_of_channels=2, block_length=100, crossfade=20, threads=threads)
+    blocks = list(stream.blocks(stop=4))
+    segments = [[noise._function(numpy.random.default_rng(numpy.random.SeedSequence(11, spawn_key=(c, k))), 120)  # pylint: disable=protected-access
+                 for c in range(2)] for k in range(4)]
+    phase = numpy.pi / 2.0 * (numpy.arange(20) + 0.5) / 20
+    for k, block in enumerate(blocks):
+        assert block.shape() == (2, 100)
+        for channel, segment, previous in zip(block.channels(), segments[k], segments[k - 1]):
+            assert channel[20:] == pytest.approx(segment[20:100])
+            if k == 0:
+                assert channel[0:20] == pytest.approx(segment[0:20])
+            else:
+                assert channel[0:20] == pytest.approx(segment[0:20] * numpy.sin(phase) + previous[100:] * numpy.cos(phase))
+    # random access to the blocks
+    assert stream.block(2) == blocks[2]
+    assert list(stream.blocks(start=1, stop=3)) == blocks[1:3]
+    assert list(stream.blocks(start=3, stop=2)) == []
+    assert list(stream.blocks(start=3, stop=3)) == []
+    with pytest.raises(ValueError):
+        sumpf.NoiseStream(noise, block_length=100, crossfade=101)
+
+
+@hypothesis.given(seed=hypothesis.strategies.integers(min_value=0),
+                  number_of_channels=hypothesis.strategies.integers(min_value=1, max_value=4),
+                  block_length=hypothesis.strategies.integers(min_value=0, max_value=100),
+                  threads=hypothesis.strategies.integers(min_value=1, max_value=5))
+def test_noise_stream(seed, number_of_channels, block_length, threads):
+    """Tests the generation of noise signals block by block."""
+    noise = sumpf.LaplaceNoise(mean=2.0, decay=0.5, seed=seed, sampling_rate=44100.0, length=0)
+    stream = sumpf.NoiseStream(noise, number_of_channels=number_of_channels, block_length=block_length, threads=threads)
+    assert stream.seed() == seed
+    assert stream.sampling_rate() == 44100.0
+    assert stream.number_of_channels() == number_of_channels
+    assert stream.block_length() == block_length
+    blocks = list(stream.blocks(start=0, stop=3))
+    for index, block in enumerate(blocks):
+        assert block.shape() == (number_of_channels, block_length)
+        assert block.sampling_rate() == 44100.0
+        assert block.offset() == index * block_length
+        assert block.labels() == ("Laplace noise",) * number_of_channels
+        for c, channel in enumerate(block.channels()):
+            sequence = numpy.random.SeedSequence(seed).spawn(c + 1)[c].spawn(index + 1)[index]
+            reference = numpy.random.default_rng(sequence).laplace(2.0, 0.5, block_length)
+            assert (channel == reference).all()
+    # the output does not depend on the order or the number of threads, in which the blocks are generated
+    single = sumpf.NoiseStream(noise, number_of_channels=number_of_channels, block_length=block_length)
+    assert single.block(2) == blocks[2]
+    assert next(iter(single)) == blocks[0]
+    assert [b.offset() for _, b in zip(range(5), stream)] == [i * block_length for i in range(5)]
+
+
+def test_noise_stream_without_seed():
+    """Tests, that a stream of a noise signal without a seed is reproducible from the stream's seed."""
+    stream = sumpf.NoiseStream(sumpf.GaussianNoise(length=0), number_of_channels=2, block_length=64)
+    assert stream.seed() is not None
+    assert stream.block(3) == stream.block(3)
+    reproduction = sumpf.NoiseStream(sumpf.GaussianNoise(seed=stream.seed(), length=0), number_of_channels=2, block_length=64)
+    assert reproduction.block(3) == stream.block(3)
+    assert (stream.block(3).channels()[0] != stream.block(3).channels()[1]).all()
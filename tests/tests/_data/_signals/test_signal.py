@@ -787,6 +787,24 @@ def test_block_wise_fourier_transform_window_functions(signal):
         assert spectrum[i] == signal[i].fourier_transform(window=window[i], overlap=0.3)
 
 
+def test_block_wise_fourier_transform_with_many_blocks():
+    """tests the block-wise Fourier transform of a signal, that is transformed in
+    multiple chunks of blocks, by comparing it to a block by block computation."""
+    window = sumpf.HannWindow(length=1024, symmetric=False)
+    signal = sumpf.Signal(channels=numpy.random.default_rng(0).standard_normal((4, 307 * 512 + 100)),
+                          sampling_rate=48000.0,
+                          offset=-17)
+    spectrum = signal.fourier_transform(window=window, overlap=0.5, pad=False)
+    reference = numpy.zeros(shape=spectrum.shape(), dtype=numpy.complex128)
+    for i in range(0, signal.length() - window.length() + 1, 512):
+        block = sumpf.Signal(channels=signal.channels()[:, i:i + window.length()] * window.channels(),
+                             sampling_rate=signal.sampling_rate(),
+                             offset=signal.offset() + i)
+        reference += block.fourier_transform().channels()
+    reference *= sumpf_internal.scaling_factor(window, 512)
+    assert spectrum.channels() == pytest.approx(reference)
+
+
 @hypothesis.given(signal=tests.strategies.signals(min_channels=1, max_length=2 ** 12))
 def test_block_wise_fourier_transform_rectangular_window(signal):
     """tests, that a rectangular window, that covers the full signal gives the same
@@ -937,6 +955,61 @@ def test_level_vs_time(signal, integration_time, pad):
     result = signal.level_vs_time(integration_time, pad)
     assert tests.compare_signals_approx(result, reference)
 
+
+@pytest.mark.parametrize("integration_time", [1.5, 2.0, 4.2, 7.0, 30.0, 250.0])
+@pytest.mark.parametrize("pad", [False, True])
+def test_level_vs_time_integration_times(integration_time, pad):
+    """Tests the level_vs_time method with integration intervals, that span several
+    samples or the whole signal, and with a reduced output sampling rate."""
+    signal = sumpf.Signal(channels=numpy.random.default_rng(3).normal(size=(2, 100)), sampling_rate=1.0, offset=9)
+    half_window_length = (integration_time - 1.0) / 2.0
+    full_samples = int(half_window_length)
+    remainder = half_window_length - full_samples
+    square = numpy.pad(numpy.square(signal.channels()), ((0, 0), (full_samples + 1, full_samples + 1)))
+    weights = numpy.pad(numpy.ones(signal.length()), full_samples + 1)
+    window = numpy.array([remainder] + [1.0] * (2 * full_samples + 1) + [remainder])
+    reference = numpy.empty(signal.shape())
+    for i in range(signal.length()):
+        reference[:, i] = square[:, i:i + len(window)] @ window
+        reference[:, i] /= integration_time if pad else weights[i:i + len(window)] @ window
+    result = signal.level_vs_time(integration_time, pad)
+    assert result.channels() == pytest.approx(numpy.sqrt(reference))
+    decimated = signal.level_vs_time(integration_time, pad, hop=3)
+    assert decimated.sampling_rate() == 1.0 / 3.0
+    assert decimated.offset() == 3
+    assert decimated.channels() == pytest.approx(result.channels()[:, ::3])
+    # the decimated levels are placed at the times of their samples, even if the offset is not a multiple of the hop
+    shifted = sumpf.Signal(channels=signal.channels(), sampling_rate=1.0, offset=10)
+    decimated = shifted.level_vs_time(integration_time, pad, hop=3)
+    assert decimated.offset() == 4
+    assert decimated.channels() == pytest.approx(result.channels()[:, 2::3])
+
+
+@pytest.mark.parametrize("pad", [False, True])
+def test_level_vs_time_exponential(pad):
+    """Tests the level_vs_time method with an exponential time weighting."""
+    channels = numpy.random.default_rng(4).normal(size=(2, 3000))
+    signal = sumpf.Signal(channels=channels, sampling_rate=1000.0)
+    coefficient = math.exp(-1.0 / (0.125 * signal.sampling_rate()))
+    reference = numpy.empty(signal.shape())
+    state = numpy.zeros(len(signal))
+    for i, s in enumerate(numpy.square(channels.transpose())):
+        state = coefficient * state + (1.0 - coefficient) * s
+        reference[:, i] = state if pad else state / (1.0 - coefficient ** (i + 1))
+    result = signal.level_vs_time(0.125, pad, sumpf.Signal.time_weightings.EXPONENTIAL)
+    assert result.channels() == pytest.approx(numpy.sqrt(reference))
+    decimated = signal.level_vs_time(0.125, pad, sumpf.Signal.time_weightings.EXPONENTIAL, hop=125)
+    assert decimated.shape() == (2, 24)
+    assert decimated.sampling_rate() == 8.0
+    assert decimated.channels() == pytest.approx(result.channels()[:, ::125])
+    shifted = sumpf.Signal(channels=channels, sampling_rate=1000.0, offset=-100)
+    decimated = shifted.level_vs_time(0.125, pad, sumpf.Signal.time_weightings.EXPONENTIAL, hop=125)
+    assert decimated.offset() == 0
+    assert decimated.channels() == pytest.approx(result.channels()[:, 100::125])
+    # the exponential average of a steady signal converges to its level
+    sine = sumpf.SineWave(sampling_rate=8000.0, length=16000)
+    assert sine.level_vs_time(0.125, pad, sumpf.Signal.time_weightings.EXPONENTIAL).channels()[0, -1] == pytest.approx(1.0 / math.sqrt(2.0), rel=1e-2)
+
 ####################################################
 # methods for statistical parameters of the signal #
 ####################################################
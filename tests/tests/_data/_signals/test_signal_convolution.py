@@ -20,6 +20,7 @@ import numpy
 import hypothesis
 import pytest
 import sumpf
+import sumpf._internal as sumpf_internal
 import tests
 
 
@@ -120,13 +121,23 @@ def test_convolve_with_multiple_channels(signal1, signal2, mode):   # pylint: di
         assert array_convolution.offset() == signal1.offset()
     elif mode == sumpf.Signal.convolution_modes.SPECTRUM_PADDED:
         length = signal1.length() + signal2.length() - 1
-        padded1 = signal1[0:number_of_channels].pad(length + 2 if length % 2 == 0 else length + 1)
-        padded2 = signal2[0:number_of_channels].pad(length + 2 if length % 2 == 0 else length + 1)
-        spectrum1 = padded1.shift(None).fourier_transform()
-        spectrum2 = padded2.shift(None).fourier_transform()
-        reference = (spectrum1 * spectrum2).inverse_fourier_transform()[:, 0:length]
-        assert (signal_convolution.channels() == reference.channels()).all()
-        assert (array_convolution.channels() == reference.channels()).all()
+        padded_length = sumpf_internal.fast_length(length)
+        spectrum1 = numpy.fft.rfft(signal1.channels()[0:number_of_channels], n=padded_length)
+        spectrum2 = numpy.fft.rfft(signal2.channels()[0:number_of_channels], n=padded_length)
+        reference = numpy.fft.irfft(spectrum1 * spectrum2, n=padded_length)[:, 0:length]
+        assert (signal_convolution.channels() == reference).all()
+        assert (array_convolution.channels() == reference).all()
+        assert signal_convolution.offset() == signal1.offset() + signal2.offset()
+        assert array_convolution.offset() == signal1.offset()
+    elif mode in (sumpf.Signal.convolution_modes.OVERLAP_ADD,
+                  sumpf.Signal.convolution_modes.OVERLAP_SAVE,
+                  sumpf.Signal.convolution_modes.AUTO):
+        reference = numpy.empty(shape=(number_of_channels, signal1.length() + signal2.length() - 1))
+        for r, a, b in zip(reference, signal1.channels(), signal2.channels()):
+            r[:] = numpy.convolve(a, b, mode="full")
+        tolerance = _block_tolerance(signal1, signal2)
+        assert signal_convolution.channels() == pytest.approx(reference, abs=tolerance)
+        assert array_convolution.channels() == pytest.approx(reference, abs=tolerance)
         assert signal_convolution.offset() == signal1.offset() + signal2.offset()
         assert array_convolution.offset() == signal1.offset()
     else:
@@ -165,6 +176,19 @@ def test_convolve_spectrum_padded(signal1, signal2):
     assert padded.channels() == pytest.approx(full.channels())
 
 
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=2000),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=100),
+                  mode=hypothesis.strategies.sampled_from((sumpf.Signal.convolution_modes.OVERLAP_ADD,
+                                                           sumpf.Signal.convolution_modes.OVERLAP_SAVE)))
+def test_convolve_block_wise(signal1, signal2, mode):
+    """Compares NumPy's full convolution with the block-wise convolutions of long signals with short kernels."""
+    for a, b in ((signal1, signal2), (signal2, signal1)):
+        block_wise = a.convolve(b, mode=mode)
+        full = a.convolve(b, mode=sumpf.Signal.convolution_modes.FULL)
+        assert block_wise.offset() == full.offset()
+        assert block_wise.channels() == pytest.approx(full.channels(), abs=_block_tolerance(a, b))
+
+
 @hypothesis.given(signal=tests.strategies.signals(),
                   number=hypothesis.strategies.floats(min_value=-1e100, max_value=1e100),
                   mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
@@ -276,18 +300,25 @@ def test_correlate_with_multiple_channels(signal1, signal2, mode):  # noqa: C901
         assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
     elif mode == sumpf.Signal.convolution_modes.SPECTRUM_PADDED:
         length = signal1.length() + signal2.length() - 1
-        if length % 2 == 0:
-            padded_length = length + 2
-            padded1 = signal1[0:number_of_channels].shift(2, sumpf.Signal.shift_modes.PAD).pad(padded_length)
-        else:
-            padded_length = length + 1
-            padded1 = signal1[0:number_of_channels].shift(1, sumpf.Signal.shift_modes.PAD).pad(padded_length)
+        padded_length = sumpf_internal.fast_length(length)
+        padded1 = signal1[0:number_of_channels].shift(padded_length - length, sumpf.Signal.shift_modes.PAD).pad(padded_length)
         padded2 = signal2[0:number_of_channels].shift(padded_length - signal2.length(), sumpf.Signal.shift_modes.PAD)
-        spectrum1 = padded1.shift(None).fourier_transform().conjugate()
-        spectrum2 = padded2.shift(None).fourier_transform()
-        reference = (spectrum1 * spectrum2).inverse_fourier_transform()[:, 0:length]
-        assert (signal_correlation.channels() == reference.channels()).all()
-        assert (array_correlation.channels() == reference.channels()).all()
+        spectrum1 = numpy.fft.rfft(padded1.channels()).conjugate()
+        spectrum2 = numpy.fft.rfft(padded2.channels())
+        reference = numpy.fft.irfft(spectrum1 * spectrum2, n=padded_length)[:, 0:length]
+        assert (signal_correlation.channels() == reference).all()
+        assert (array_correlation.channels() == reference).all()
+        assert signal_correlation.offset() == signal2.offset() - signal1.offset() - signal1.length() + 1
+        assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
+    elif mode in (sumpf.Signal.convolution_modes.OVERLAP_ADD,
+                  sumpf.Signal.convolution_modes.OVERLAP_SAVE,
+                  sumpf.Signal.convolution_modes.AUTO):
+        reference = numpy.empty(shape=(number_of_channels, signal1.length() + signal2.length() - 1))
+        for r, a, b in zip(reference, signal1.channels(), signal2.channels()):
+            r[:] = numpy.correlate(a, b, mode="full")[::-1]
+        tolerance = _block_tolerance(signal1, signal2)
+        assert signal_correlation.channels() == pytest.approx(reference, abs=tolerance)
+        assert array_correlation.channels() == pytest.approx(reference, abs=tolerance)
         assert signal_correlation.offset() == signal2.offset() - signal1.offset() - signal1.length() + 1
         assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
     else:
@@ -327,6 +358,19 @@ def test_correlate_spectrum_padded(signal1, signal2):
     assert padded.channels() == pytest.approx(full.channels())
 
 
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=2000),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=100),
+                  mode=hypothesis.strategies.sampled_from((sumpf.Signal.convolution_modes.OVERLAP_ADD,
+                                                           sumpf.Signal.convolution_modes.OVERLAP_SAVE)))
+def test_correlate_block_wise(signal1, signal2, mode):
+    """Compares NumPy's full correlation with the block-wise correlations of long signals with short kernels."""
+    for a, b in ((signal1, signal2), (signal2, signal1)):
+        block_wise = a.correlate(b, mode=mode)
+        full = a.correlate(b, mode=sumpf.Signal.convolution_modes.FULL)
+        assert block_wise.offset() == full.offset()
+        assert block_wise.channels() == pytest.approx(full.channels(), abs=_block_tolerance(a, b))
+
+
 @hypothesis.given(signal1=tests.strategies.signals(min_value=-10.0, max_value=10.0),
                   signal2=tests.strategies.signals(min_value=-10.0, max_value=10.0),
                   mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
@@ -335,3 +379,59 @@ def test_correlation_as_convolution_with_reverse(signal1, signal2, mode):
     correlation = signal1.correlate(signal2, mode)
     convolution = reversed(signal1).convolve(signal2, mode)
     assert correlation.channels() == pytest.approx(convolution.channels())
+
+
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=2000),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0, max_length=100),
+                  transform_length=hypothesis.strategies.one_of(hypothesis.strategies.none(),
+                                                                hypothesis.strategies.integers(min_value=100, max_value=300)))
+def test_prepared_convolution(signal1, signal2, transform_length):
+    """Compares the convolutions and correlations with a prepared kernel to the full convolution and correlation."""
+    kernel = signal2.prepare_convolution(transform_length)
+    assert len(kernel) == len(signal2)
+    assert kernel.length() == signal2.length()
+    assert kernel.offset() == signal2.offset()
+    if transform_length is not None:
+        assert kernel.transform_length() == transform_length
+    tolerance = _block_tolerance(signal1, signal2)
+    for method, label in ((sumpf.Signal.convolve, "Convolution"), (sumpf.Signal.correlate, "Correlation")):
+        prepared = method(signal1, kernel)
+        full = method(signal1, signal2, mode=sumpf.Signal.convolution_modes.FULL)
+        assert prepared.sampling_rate() == signal1.sampling_rate()
+        assert prepared.offset() == full.offset()
+        assert prepared.labels() == (label,) * len(full)
+        assert prepared.channels() == pytest.approx(full.channels(), abs=tolerance)
+    # a signal, that is shorter than the kernel
+    short = signal1[:, 0:1]
+    assert short.convolve(kernel).channels() == pytest.approx(short.convolve(signal2, mode=sumpf.Signal.convolution_modes.FULL).channels(), abs=tolerance)
+
+
+def test_prepared_convolution_errors():
+    """Checks that a kernel cannot be prepared with a transform length, that is shorter than the kernel."""
+    signal = sumpf.Signal(channels=numpy.ones(shape=(2, 10)))
+    with pytest.raises(ValueError):
+        signal.prepare_convolution(transform_length=9)
+    assert signal.prepare_convolution(transform_length=10).transform_length() == 10
+
+
+@pytest.mark.parametrize("mode", [sumpf.Signal.convolution_modes.SPECTRUM_PADDED, sumpf.Signal.convolution_modes.AUTO])
+def test_empty_signals(mode):
+    """Checks that convolving or correlating with an empty signal yields zeros."""
+    empty = sumpf.Signal(channels=numpy.empty(shape=(1, 0)), offset=3)
+    signal = sumpf.Signal(channels=numpy.ones(shape=(1, 5)), offset=7)
+    for a, b in ((empty, signal), (signal, empty)):
+        for result, offset in ((a.convolve(b, mode=mode), 10),
+                               (a.correlate(b, mode=mode), b.offset() - a.offset() - a.length() + 1)):
+            assert result.shape() == (1, 4)
+            assert result.offset() == offset
+            assert (result.channels() == 0.0).all()
+        assert a.convolve(b.channels()[0], mode=mode).shape() == (1, 4)
+        assert a.correlate(b.channels()[0], mode=mode).shape() == (1, 4)
+
+
+def _block_tolerance(signal1, signal2):
+    """Returns the absolute tolerance for the comparison of a block-wise computed
+    convolution or correlation with a reference, which scales with the magnitude
+    of the convolved signals."""
+    magnitude = numpy.abs(signal1.channels()).max() * numpy.abs(signal2.channels()).max()
+    return 1e-12 * (1.0 + magnitude * min(signal1.length(), signal2.length()))
@@ -0,0 +1,122 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests, that the precision of the samples is kept through the computations
+with signals, spectrums and spectrograms."""
+
+import os
+import tempfile
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+
+
+def test_dtype_functions():
+    """Tests the functions, that map a dtype to its real and complex counterpart."""
+    for dtype, real, complex_ in ((numpy.float32, numpy.float32, numpy.complex64),
+                                  (numpy.float64, numpy.float64, numpy.complex128),
+                                  (numpy.complex64, numpy.float32, numpy.complex64),
+                                  (numpy.complex128, numpy.float64, numpy.complex128),
+                                  (numpy.int16, numpy.float64, numpy.complex128),
+                                  (numpy.bool_, numpy.float64, numpy.complex128)):
+        assert sumpf_internal.real_dtype(dtype) == real
+        assert sumpf_internal.complex_dtype(dtype) == complex_
+
+
+def test_default_precision():
+    """Tests, that the default precision is double precision."""
+    signal = sumpf.Signal(channels=numpy.array([[1, 2, 3, 4]]))
+    assert signal.dtype() == numpy.int64 or signal.dtype() == numpy.int_
+    assert sumpf.Signal().dtype() == numpy.float64
+    assert signal.fourier_transform().dtype() == numpy.complex128
+    assert (signal * 1.5).dtype() == numpy.float64
+
+
+@pytest.mark.parametrize("real, complex_", [(numpy.float32, numpy.complex64), (numpy.float64, numpy.complex128)])
+def test_signal_precision(real, complex_):
+    """Tests, that the operations of a signal keep its precision."""
+    channels = numpy.random.default_rng(0).standard_normal((2, 64))
+    signal = sumpf.Signal(channels=channels, sampling_rate=48000.0, dtype=real)
+    assert signal.dtype() == real
+    assert signal.channels().dtype == real
+    numpy.testing.assert_allclose(signal.channels(), channels, rtol=1e-6)
+    # algebra
+    for result in (signal + signal, signal - 1.0, 2.0 * signal, signal / 3.0, signal ** 2,
+                   signal * channels, 1.0 + signal, -signal, abs(signal)):
+        assert result.dtype() == real
+    # other operations
+    for result in (signal.shift(3), signal.pad(100), signal.convolve(signal), signal.correlate(signal),
+                   signal.convolve(channels[0]), signal[:, 1:20]):
+        assert result.dtype() == real
+    # transforms
+    spectrum = signal.fourier_transform()
+    assert spectrum.dtype() == complex_
+    assert spectrum.inverse_fourier_transform().dtype() == real
+    assert abs(spectrum).dtype() == real
+    for result in (spectrum * spectrum, spectrum + 1.0j, 1.0 / spectrum, spectrum * channels[:, 0:33]):
+        assert result.dtype() == complex_
+
+
+@pytest.mark.parametrize("real, complex_", [(numpy.float32, numpy.complex64), (numpy.float64, numpy.complex128)])
+def test_spectrogram_precision(real, complex_):
+    """Tests, that the operations of a spectrogram keep its precision."""
+    signal = sumpf.Signal(channels=numpy.random.default_rng(1).standard_normal((1, 256)), dtype=real)
+    spectrogram = signal.short_time_fourier_transform(window=32)
+    assert spectrogram.dtype() == complex_
+    for result in (spectrogram * spectrogram, spectrogram + 1.0, 2.0 * spectrogram):
+        assert result.dtype() == complex_
+    assert abs(spectrogram).dtype() == real
+    assert spectrogram.inverse_short_time_fourier_transform(window=32).dtype() == real
+
+
+def test_mixed_precision():
+    """Tests, that combining data sets of different precision results in the higher precision."""
+    single = sumpf.Signal(channels=numpy.ones((1, 8)), dtype=numpy.float32)
+    double = sumpf.Signal(channels=numpy.ones((1, 8)))
+    assert (single + double).dtype() == numpy.float64
+    assert (double * single).dtype() == numpy.float64
+    assert (single.fourier_transform() * double.fourier_transform()).dtype() == numpy.complex128
+    assert sumpf.Merge([single, single]).output().dtype() == numpy.float32
+    assert sumpf.Merge([single, double]).output().dtype() == numpy.float64
+
+
+def test_persistence_precision():
+    """Tests, that the precision is kept, when saving and loading data sets, and
+    that the precision can be specified, when loading data sets."""
+    signal = sumpf.Signal(channels=numpy.random.default_rng(2).standard_normal((2, 512)), dtype=numpy.float32)
+    spectrum = signal.fourier_transform()
+    spectrogram = signal.short_time_fourier_transform(window=64)
+    with tempfile.TemporaryDirectory() as d:
+        for data, file_format, single, double in ((signal, sumpf.Signal.file_formats.NUMPY_NPZ, numpy.float32, numpy.float64),                # pylint: disable=line-too-long
+                                                  (signal, sumpf.Signal.file_formats.PYTHON_PICKLE, numpy.float32, numpy.float64),            # pylint: disable=line-too-long
+                                                  (spectrum, sumpf.Spectrum.file_formats.NUMPY_NPZ, numpy.complex64, numpy.complex128),       # pylint: disable=line-too-long
+                                                  (spectrum, sumpf.Spectrum.file_formats.PYTHON_PICKLE, numpy.complex64, numpy.complex128),   # pylint: disable=line-too-long
+                                                  (spectrogram, sumpf.Spectrogram.file_formats.NUMPY_NPZ, numpy.complex64, numpy.complex128)):  # pylint: disable=line-too-long
+            path = os.path.join(d, "data")
+            data.save(path, file_format)
+            loaded = type(data).load(path)
+            assert loaded.dtype() == single
+            assert (loaded.channels() == data.channels()).all()
+            loaded = type(data).load(path, dtype=double)
+            assert loaded.dtype() == double
+            assert (loaded.channels() == data.channels()).all()
+            os.remove(path)
+        # a double precision text file can be loaded in single precision
+        path = os.path.join(d, "signal.csv")
+        signal.save(path, sumpf.Signal.file_formats.TEXT_CSV)
+        assert sumpf.Signal.load(path).dtype() == numpy.float64
+        assert sumpf.Signal.load(path, dtype=numpy.float32).dtype() == numpy.float32
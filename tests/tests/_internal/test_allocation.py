@@ -0,0 +1,183 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the allocators for the arrays of the data containers"""
+
+import concurrent.futures
+import copy
+import gc
+from multiprocessing import shared_memory
+import pickle
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+
+_dtypes = (numpy.float32, numpy.float64, numpy.complex64, numpy.complex128, numpy.int16)
+_shapes = hypothesis.strategies.lists(elements=hypothesis.strategies.integers(min_value=0, max_value=64),
+                                      min_size=1, max_size=3)
+
+
+@pytest.mark.parametrize("policy", list(sumpf_internal.AllocationPolicy))
+@hypothesis.given(shape=_shapes, dtype=hypothesis.strategies.sampled_from(_dtypes))
+def test_allocate_array(policy, shape, dtype):
+    """Tests if all allocation policies return writable arrays with the requested shape and dtype."""
+    previous = sumpf_internal.set_allocator(policy)
+    try:
+        array = sumpf_internal.allocate_array(shape=tuple(shape), dtype=dtype)
+        assert array.shape == tuple(shape)
+        assert array.dtype == dtype
+        array[:] = 3
+        assert (array == 3).all()
+    finally:
+        sumpf_internal.set_allocator(previous)
+
+
+def test_pool_reuse():
+    """Tests if the pool allocator reuses released blocks and if it respects the size limit."""
+    pool = sumpf_internal.PoolAllocator(backend=sumpf_internal.NumpyAllocator(), max_cached_bytes=2 ** 16)
+    a = pool.allocate(shape=(2, 1000))
+    view = a[1, 10:20]
+    del a
+    gc.collect()
+    assert pool.cached_bytes() == 0     # the view keeps the block alive
+    del view
+    gc.collect()
+    assert pool.cached_bytes() == pool.size_class(2 * 1000 * 8)
+    b = pool.allocate(shape=(1990,))    # falls into the same size class
+    assert pool.statistics() == {"allocations": 1, "reuses": 1}
+    assert pool.cached_bytes() == 0
+    del b
+    gc.collect()
+    large = pool.allocate(shape=(2 ** 14,))
+    del large
+    gc.collect()
+    assert pool.cached_bytes() == pool.size_class(2000 * 8)    # the large block exceeds the limit of cached bytes
+    pool.clear()
+    assert pool.cached_bytes() == 0
+
+
+@hypothesis.given(size=hypothesis.strategies.integers(min_value=0, max_value=2 ** 30))
+def test_size_classes(size):
+    """Tests that the size classes are large enough and do not waste too much memory."""
+    pool = sumpf_internal.PoolAllocator()
+    size_class = pool.size_class(size)
+    assert size_class >= size
+    assert size_class <= max(256, size * 1.125)
+    assert pool.size_class(size_class) == size_class
+
+
+def test_containers_with_pool():
+    """Tests if the data containers work with a pool allocator."""
+    previous = sumpf_internal.set_allocator(sumpf_internal.AllocationPolicy.POOLED_SHARED_MEMORY)
+    try:
+        signal = sumpf.Signal(channels=numpy.array([[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]]))
+        for _ in range(3):
+            padded = signal.pad(6)
+            assert (padded.channels()[:, 0:4] == signal.channels()).all()
+            assert (padded.channels()[:, 4:] == 0.0).all()
+            spectrum = (signal * 2.0).fourier_transform()
+            assert spectrum.inverse_fourier_transform().channels() == pytest.approx(2.0 * signal.channels())
+            del padded, spectrum
+            gc.collect()
+        assert sumpf_internal.get_allocator().statistics()["reuses"] > 0
+    finally:
+        sumpf_internal.set_allocator(previous)
+
+
+def test_invalid_allocator():
+    """Tests that an invalid allocator raises an error."""
+    with pytest.raises(ValueError):
+        sumpf_internal.set_allocator("numpy")
+
+
+def _scale_in_worker(signal):
+    """Helper function for the process pool test, that scales the given signal
+    in-place and returns a new signal, which is stored in shared memory as well."""
+    sumpf_internal.set_allocator(sumpf_internal.AllocationPolicy.NAMED_SHARED_MEMORY)
+    signal.channels()[:] *= 2.0
+    channels = sumpf_internal.allocate_array(shape=signal.shape())
+    channels[:] = signal.channels() + 1.0
+    result = sumpf.Signal(channels=channels, sampling_rate=signal.sampling_rate(), labels=("result",))
+    sumpf_internal.transfer_ownership(channels)
+    return sumpf_internal.share(result)
+
+
+def test_named_shared_memory_pickle():
+    """Tests if data containers, whose channels are stored in named shared memory, are pickled without copying."""
+    previous = sumpf_internal.set_allocator(sumpf_internal.AllocationPolicy.NAMED_SHARED_MEMORY)
+    try:
+        channels = sumpf_internal.allocate_array(shape=(2, 2 ** 16))
+        channels[:] = numpy.arange(2 ** 16)
+        for data in (sumpf.Signal(channels=channels, sampling_rate=44100.0, offset=3, labels=("a", "b")),
+                     sumpf.Spectrum(channels=channels, resolution=2.0, labels=("c",))):
+            dump = pickle.dumps(sumpf_internal.share(data))
+            assert len(dump) < 1000
+            loaded = pickle.loads(dump)
+            assert type(loaded) is type(data)   # pylint: disable=unidiomatic-typecheck; the exact type shall be restored
+            assert loaded == data
+            assert repr(loaded) == repr(data)
+            loaded.channels()[1, 0] = -1.0  # both containers share the same memory
+            assert data.channels()[1, 0] == -1.0
+            view = data[1, 2:7]
+            loaded_view = pickle.loads(pickle.dumps(sumpf_internal.share(view)))
+            assert (loaded_view.channels() == view.channels()).all()
+            # without the wrapper, the samples are pickled and copied
+            for copied in (pickle.loads(pickle.dumps(data)), copy.deepcopy(data)):
+                assert copied == data
+                assert not numpy.shares_memory(copied.channels(), data.channels())
+                copied.channels()[1, 0] = -2.0
+                assert data.channels()[1, 0] == -1.0
+            assert len(pickle.dumps(data)) > channels.nbytes
+        handle = sumpf_internal.shared_memory_handle(channels)
+        assert handle.name
+        del channels, data, loaded, view, loaded_view
+        gc.collect()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.name)
+    finally:
+        sumpf_internal.set_allocator(previous)
+
+
+def test_named_shared_memory_process_pool():
+    """Tests the handoff of data containers in named shared memory to and from the workers of a process pool."""
+    previous = sumpf_internal.set_allocator(sumpf_internal.AllocationPolicy.NAMED_SHARED_MEMORY)
+    try:
+        channels = sumpf_internal.allocate_array(shape=(1, 1000))
+        channels[:] = 1.0
+        signal = sumpf.Signal(channels=channels, sampling_rate=1000.0)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(_scale_in_worker, sumpf_internal.share(signal)).result()
+        assert (signal.channels() == 2.0).all()     # the worker has modified the shared memory
+        assert (result.channels() == 3.0).all()
+        assert result.labels() == ("result",)
+        handle = sumpf_internal.shared_memory_handle(result.channels())
+        del result
+        gc.collect()
+        with pytest.raises(FileNotFoundError):      # the ownership has been transferred to this process
+            shared_memory.SharedMemory(name=handle.name)
+    finally:
+        sumpf_internal.set_allocator(previous)
+
+
+def test_transfer_ownership_errors():
+    """Tests that the ownership can only be transferred for arrays in owned segments of named shared memory."""
+    with pytest.raises(ValueError):
+        sumpf_internal.transfer_ownership(numpy.empty(3))
+    assert sumpf_internal.shared_memory_handle(numpy.empty(3)) is None
+    with pytest.raises(ValueError):
+        sumpf_internal.share(sumpf.Signal())
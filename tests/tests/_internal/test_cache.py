@@ -0,0 +1,65 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the least-recently-used cache."""
+
+import numpy
+import pytest
+import sumpf._internal as sumpf_internal
+
+
+def test_lru_cache():
+    """Tests the size limit and the order, in which entries are discarded."""
+    cache = sumpf_internal.LRUCache(max_bytes=100)
+    assert cache.max_bytes() == 100
+    assert cache.get("a") is None
+    assert cache.put("a", 1, 40)
+    assert cache.put("b", 2, 40)
+    assert len(cache) == 2
+    assert cache.bytes() == 80
+    assert cache.get("a") == 1         # "a" is now more recently used than "b"
+    assert cache.put("c", 3, 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.bytes() == 80
+    assert cache.put("a", 4, 10)        # replacing an entry updates its size
+    assert cache.get("a") == 4
+    assert cache.bytes() == 50
+    assert not cache.put("d", 5, 101)   # entries, that exceed the limit, are not stored
+    assert cache.get("d") is None
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.bytes() == 0
+
+
+def test_filter_cache_setting():
+    """Tests enabling and disabling the filter cache."""
+    previous = sumpf_internal.set_filter_cache(1024)
+    try:
+        cache = sumpf_internal.get_filter_cache()
+        assert isinstance(cache, sumpf_internal.LRUCache)
+        assert cache.max_bytes() == 1024
+        other = sumpf_internal.LRUCache()
+        assert sumpf_internal.set_filter_cache(other) is cache
+        assert sumpf_internal.get_filter_cache() is other
+        assert sumpf_internal.set_filter_cache(None) is other
+        assert sumpf_internal.get_filter_cache() is None
+        with pytest.raises(ValueError):
+            sumpf_internal.set_filter_cache(numpy.zeros(3))
+    finally:
+        sumpf_internal.set_filter_cache(previous)
@@ -0,0 +1,113 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the cost model for the automatic selection of the convolution strategy"""
+
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+
+modes = sumpf_internal.ConvolutionMode
+
+
+def test_choices():
+    """Tests the choices of the default cost model for some typical cases."""
+    model = sumpf_internal.ConvolutionCostModel()
+    assert model.choose(1, 48000, 16) is modes.FULL
+    assert model.choose(1, 16, 48000) is modes.FULL
+    assert model.choose(1, 2 ** 16, 2 ** 16) is modes.SPECTRUM_PADDED
+    assert model.choose(64, 2 * 3600 * 48000, 4096) is modes.OVERLAP_ADD
+
+
+@hypothesis.given(channels=hypothesis.strategies.integers(min_value=1, max_value=128),
+                  length1=hypothesis.strategies.integers(min_value=1, max_value=2 ** 24),
+                  length2=hypothesis.strategies.integers(min_value=1, max_value=2 ** 24))
+def test_costs(channels, length1, length2):
+    """Tests if the costs are positive and independent of the order of the operands,
+    and if the explanation names the chosen strategy."""
+    model = sumpf_internal.get_convolution_cost_model()
+    costs = model.costs(channels, length1, length2)
+    assert set(costs) == {modes.FULL, modes.SPECTRUM_PADDED, modes.OVERLAP_ADD}
+    assert min(costs.values()) > 0.0
+    assert costs == pytest.approx(model.costs(channels, length2, length1))
+    chosen = model.choose(channels, length1, length2)
+    assert costs[chosen] == min(costs.values())
+    explanation = model.explain(channels, length1, length2)
+    assert chosen.name in explanation.split("\n")[0]
+    assert f"* {chosen.name}" in explanation
+
+
+def test_calibration():
+    """Tests if the calibration yields a usable cost model and if it can be set as the default."""
+    model = sumpf_internal.ConvolutionCostModel.calibrate(repeat=1)
+    assert model.direct > 0.0
+    assert model.direct_call > 0.0
+    assert model.transform > 0.0
+    assert model.transform_call > 0.0
+    default = sumpf_internal.get_convolution_cost_model()
+    previous = sumpf_internal.set_convolution_cost_model(model)
+    try:
+        assert previous is default
+        assert sumpf_internal.get_convolution_cost_model() is model
+    finally:
+        sumpf_internal.set_convolution_cost_model(previous)
+    assert sumpf_internal.get_convolution_cost_model() is default
+
+
+@pytest.mark.parametrize("mode", [modes.FULL, modes.SPECTRUM_PADDED, modes.OVERLAP_ADD])
+def test_auto_follows_cost_model(mode):
+    """Tests if the AUTO mode uses the strategy, that is chosen by the cost model."""
+    costs = {m: 1.0 for m in (modes.FULL, modes.SPECTRUM_PADDED, modes.OVERLAP_ADD)}
+    costs[mode] = 0.0
+
+    class CostModel(sumpf_internal.ConvolutionCostModel):
+        def costs(self, channels, length1, length2):
+            return costs
+
+    signal1 = sumpf.Signal(channels=numpy.random.default_rng(1).standard_normal((2, 300)))
+    signal2 = sumpf.Signal(channels=numpy.random.default_rng(2).standard_normal((1, 20)))
+    previous = sumpf_internal.set_convolution_cost_model(CostModel())
+    try:
+        assert signal1.convolve(signal2, modes.AUTO) == signal1.convolve(signal2, mode)
+        assert signal1.correlate(signal2, modes.AUTO) == signal1.correlate(signal2, mode)
+        assert signal2.correlate(signal1, modes.AUTO) == signal2.correlate(signal1, mode)
+    finally:
+        sumpf_internal.set_convolution_cost_model(previous)
+
+
+@hypothesis.given(rows=hypothesis.strategies.sampled_from([(1, 1), (3, 3), (1, 20), (20, 1), (20, 20), (64, 64)]),
+                  length1=hypothesis.strategies.integers(min_value=1, max_value=40),
+                  length2=hypothesis.strategies.integers(min_value=1, max_value=40),
+                  mode=hypothesis.strategies.sampled_from(["full", "same", "valid"]))
+def test_direct_convolution(rows, length1, length2, mode):
+    """Compares the batched and the row-wise direct convolution and correlation with NumPy's functions."""
+    random = numpy.random.default_rng(length1 * length2)
+    a = random.standard_normal((rows[0], length1))
+    b = random.standard_normal((rows[1], length2))
+    number_of_rows = max(rows)
+    broadcast_a = numpy.broadcast_to(a, (number_of_rows, length1))
+    broadcast_b = numpy.broadcast_to(b, (number_of_rows, length2))
+    reference = numpy.array([numpy.convolve(c, d, mode=mode) for c, d in zip(broadcast_a, broadcast_b)])
+    result = numpy.empty(reference.shape)
+    sumpf_internal._convolution.direct_convolution(a, b, mode, out=result)   # pylint: disable=protected-access
+    assert result == pytest.approx(reference)
+    if mode != "same":
+        reference = numpy.array([numpy.correlate(c, d, mode=mode)[::-1] for c, d in zip(broadcast_a, broadcast_b)])
+        result = numpy.empty(reference.shape)
+        sumpf_internal._convolution.direct_correlation(a, b, mode, out=result)   # pylint: disable=protected-access
+        assert result == pytest.approx(reference)
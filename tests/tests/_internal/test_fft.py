@@ -0,0 +1,123 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2021 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the backends for the fast Fourier transforms"""
+
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+import tests
+
+
+def _backends():
+    """Returns instances of the FFT backends, whose libraries are installed."""
+    backends = [sumpf_internal.NumpyFFTBackend()]
+    try:
+        backends.append(sumpf_internal.ScipyFFTBackend())
+        backends.append(sumpf_internal.ScipyFFTBackend(workers=2))
+    except ImportError:
+        pass
+    try:
+        backends.append(sumpf_internal.PyFFTWBackend())
+    except ImportError:
+        pass
+    return backends
+
+
+@pytest.mark.parametrize("backend", _backends())
+@hypothesis.given(channels=hypothesis.strategies.integers(min_value=1, max_value=5),
+                  length=hypothesis.strategies.integers(min_value=1, max_value=300),
+                  n=hypothesis.strategies.one_of(hypothesis.strategies.none(),
+                                                 hypothesis.strategies.integers(min_value=1, max_value=400)))
+def test_transforms(backend, channels, length, n):
+    """Compares the transforms of the backends with those from :mod:`numpy.fft`."""
+    data = numpy.random.default_rng(length).standard_normal((channels, length))
+    spectrum = sumpf_internal.rfft(data, n=n, backend=backend)
+    assert spectrum == pytest.approx(numpy.fft.rfft(data, n=n))
+    n = length if n is None else n
+    signal = sumpf_internal.irfft(spectrum, n=n, backend=backend)
+    assert signal == pytest.approx(numpy.fft.irfft(numpy.fft.rfft(data, n=n), n=n))
+
+
+@pytest.mark.parametrize("backend", _backends())
+@hypothesis.given(target=hypothesis.strategies.integers(min_value=-2, max_value=100000))
+def test_fast_length(backend, target):
+    """Tests if the fast lengths are not shorter than the target and only have small prime factors."""
+    length = sumpf_internal.fast_length(target, backend=backend)
+    assert length >= max(target, 1)
+    for factor in (2, 3, 5, 7, 11, 13):
+        while length % factor == 0:
+            length //= factor
+    assert length == 1
+
+
+def test_default_fast_length():
+    """Tests the search for fast lengths in the base class with some known values."""
+    backend = sumpf_internal.NumpyFFTBackend()
+    assert [backend.next_fast_len(n) for n in (1, 13, 17, 97, 1000, 1025)] == [1, 14, 18, 98, 1000, 1029]
+
+
+def test_set_fft_backend():
+    """Tests the selection of the backend with the flags and instances."""
+    pytest.importorskip("scipy")
+    default = sumpf_internal.get_fft_backend()
+    assert isinstance(default, sumpf_internal.NumpyFFTBackend)
+    previous = sumpf_internal.set_fft_backend(sumpf_internal.FFTLibrary.SCIPY)
+    try:
+        assert previous is default
+        assert isinstance(sumpf_internal.get_fft_backend(), sumpf_internal.ScipyFFTBackend)
+        assert sumpf_internal.get_fft_backend().workers == -1
+        backend = sumpf_internal.ScipyFFTBackend(workers=3)
+        sumpf_internal.set_fft_backend(backend)
+        assert sumpf_internal.get_fft_backend() is backend
+        with pytest.raises(ValueError):
+            sumpf_internal.set_fft_backend("scipy")
+        assert sumpf_internal.get_fft_backend() is backend
+    finally:
+        sumpf_internal.set_fft_backend(previous)
+    assert sumpf_internal.get_fft_backend() is default
+
+
+def test_fft_backend_context():
+    """Tests if the context manager restores the previous backend, also in case of an error."""
+    pytest.importorskip("scipy")
+    default = sumpf_internal.get_fft_backend()
+    with sumpf_internal.fft_backend(sumpf_internal.FFTLibrary.SCIPY) as backend:
+        assert isinstance(backend, sumpf_internal.ScipyFFTBackend)
+        assert sumpf_internal.get_fft_backend() is backend
+    assert sumpf_internal.get_fft_backend() is default
+    with pytest.raises(RuntimeError):
+        with sumpf_internal.fft_backend(sumpf_internal.ScipyFFTBackend()):
+            raise RuntimeError()
+    assert sumpf_internal.get_fft_backend() is default
+
+
+@hypothesis.given(signal1=tests.strategies.signals(max_channels=4, max_length=500, min_value=-1e3, max_value=1e3),
+                  signal2=tests.strategies.signals(max_channels=4, max_length=500, min_value=-1e3, max_value=1e3),
+                  mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
+def test_convolution_with_backends(signal1, signal2, mode):
+    """Tests if the convolutions and correlations are independent of the FFT backend."""
+    pytest.importorskip("scipy")
+    convolution = signal1.convolve(signal2, mode)
+    correlation = signal1.correlate(signal2, mode)
+    with sumpf_internal.fft_backend(sumpf_internal.ScipyFFTBackend(workers=2)):
+        for reference, result in ((convolution, signal1.convolve(signal2, mode)),
+                                  (correlation, signal1.correlate(signal2, mode))):
+            assert result.offset() == reference.offset()
+            tolerance = 1e-9 * (1.0 + numpy.abs(reference.channels()).max(initial=0.0))
+            assert result.channels() == pytest.approx(reference.channels(), abs=tolerance)
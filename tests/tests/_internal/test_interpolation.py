@@ -195,3 +195,64 @@ def test_extrapolation(xs, ys, interpolation, delta_x):  # noqa: C901; the funct
         assert func(x1, xs, ys) == ys[1]
     else:
         raise ValueError(f"Unknown interpolation: {interpolation}.")
+
+
+@hypothesis.given(interpolation=hypothesis.strategies.sampled_from(sumpf_internal.Interpolations),
+                  extrapolation=hypothesis.strategies.sampled_from(sumpf_internal.Interpolations),
+                  xs=hypothesis.strategies.lists(elements=hypothesis.strategies.integers(min_value=0, max_value=10 ** 5), min_size=1, max_size=2 ** 6, unique=True),  # pylint: disable=line-too-long
+                  ys=hypothesis.extra.numpy.arrays(dtype=numpy.float64, shape=(3, 2 ** 6), elements=hypothesis.strategies.floats(min_value=1e-3, max_value=1e3)),     # pylint: disable=line-too-long
+                  x=hypothesis.strategies.lists(elements=hypothesis.strategies.floats(min_value=0.5, max_value=2e5), min_size=0, max_size=2 ** 8))                    # pylint: disable=line-too-long
+def test_interpolator(interpolation, extrapolation, xs, ys, x):
+    """Tests if the prepared interpolator returns the same results as the interpolation functions."""
+    xs = numpy.array(sorted(xs), dtype=numpy.float64)
+    ys = ys[:, 0:len(xs)]
+    x = numpy.array(x + [xs[0], xs[-1]])
+    outside = (x < xs[0]) | (xs[-1] < x)
+    # evaluate each function separately
+    for y in ys:
+        reference = numpy.empty(len(x))
+        reference[outside] = sumpf_internal.interpolation.get(extrapolation)(x[outside], xs, y)
+        reference[~outside] = sumpf_internal.interpolation.get(interpolation)(x[~outside], xs, y)
+        interpolator = sumpf_internal.interpolation.Interpolator(xs, y, interpolation, extrapolation)
+        for _ in range(2):  # the second evaluation uses the cached logarithms of the supporting points
+            result = interpolator(x)
+            assert result == pytest.approx(reference, rel=1e-9, abs=1e-9)
+            assert (result[numpy.isin(x, xs)] == y[numpy.searchsorted(xs, x[numpy.isin(x, xs)])]).all()
+        assert (interpolator(x.reshape(1, len(x))) == result.reshape(1, len(x))).all()
+        assert interpolator(numpy.empty(0)).shape == (0,)
+        for i, s in enumerate(x):
+            assert interpolator(float(s)) == pytest.approx(result[i], rel=1e-9, abs=1e-9)
+    # evaluate the functions at once
+    interpolator = sumpf_internal.interpolation.Interpolator(xs, ys, interpolation, extrapolation)
+    stacked = interpolator(x)
+    assert stacked.shape == (len(ys), len(x))
+    for y, s in zip(ys, stacked):
+        assert (sumpf_internal.interpolation.Interpolator(xs, y, interpolation, extrapolation)(x) == s).all()
+    out = numpy.empty((len(ys), 1, len(x)))
+    assert interpolator(x.reshape(1, len(x)), out=out) is out
+    assert (out[:, 0] == stacked).all()
+
+
+@pytest.mark.filterwarnings("ignore:divide by zero")
+@pytest.mark.parametrize("interpolation", sumpf_internal.Interpolations)
+def test_interpolator_zero_frequency(interpolation):
+    """Tests the prepared interpolator with a supporting point at 0Hz, whose logarithm is infinite."""
+    xs = numpy.array([0.0, 100.0, 1000.0])
+    ys = numpy.array([[1.0, 2.0, 3.0], [0.5, 0.5, 4.0]])
+    x = numpy.array([0.0, 10.0, 50.0, 100.0, 500.0, 1000.0])
+    interpolator = sumpf_internal.interpolation.Interpolator(xs, ys, interpolation, sumpf_internal.Interpolations.ZERO)
+    result = interpolator(x)
+    assert not numpy.isnan(result).any()
+    for y, r in zip(ys, result):
+        assert r == pytest.approx(sumpf_internal.interpolation.get(interpolation)(x, xs, y))
+        assert interpolator(10.0)[0] == pytest.approx(result[0, 1])
+
+
+def test_unsorted_supporting_points():
+    """Tests if the exact values are restored at unsorted and duplicate supporting points."""
+    xs = numpy.array([3.0, 1.0, 2.0, 1.0])
+    ys = numpy.array([30.0, 10.0, 20.0, 11.0])
+    x = numpy.array([0.5, 1.0, 1.5, 2.0, 3.0, 3.5])
+    result = sumpf_internal.interpolation.zero(x, xs, ys)
+    assert list(result) == [0.0, 10.0, 0.0, 20.0, 30.0, 0.0]
+    assert sumpf_internal.interpolation.zero(1.0, xs, ys) == 10.0
@@ -182,9 +182,25 @@ def spectrogram_parameters(min_channels=1, max_channels=5,
 ##########
 
 
+def _zero_pole_gain_factory(roots, number_of_zeros, gain, transform):
+    """A helper function, that splits a sequence of unique roots into zeros and
+    poles, because the rounding errors of evaluating a zero and a pole, that cancel
+    each other out, are too large for comparing the results with a computed reference.
+    """
+    return sumpf.Filter.ZeroPoleGain(zeros=roots[0:number_of_zeros],
+                                     poles=roots[number_of_zeros:],
+                                     gain=gain,
+                                     transform=transform)
+
+
 _polynomial = st.builds(sumpf.Filter.Polynomial,
                         coefficients=st.lists(elements=st.floats(min_value=-1e6, max_value=1e6), max_size=6),
                         transform=st.booleans())
+_zero_pole_gain = st.builds(_zero_pole_gain_factory,
+                            roots=st.lists(elements=st.complex_numbers(max_magnitude=1e6), max_size=8, unique=True),
+                            number_of_zeros=st.integers(min_value=0, max_value=4),
+                            gain=st.floats(min_value=-1e6, max_value=1e6),
+                            transform=st.booleans())
 _exp = st.builds(sumpf.Filter.Exp,
                  coefficient=st.floats(min_value=-1e3, max_value=1e3),  # it is necessary to set a lower bound to avoid a value of -inf
                  transform=st.booleans())
@@ -208,7 +224,7 @@ _quotient = st.builds(sumpf.Filter.Quotient,
                       denominator=st.one_of(_polynomial, _exp),
                       transform=st.booleans())
 _product = st.builds(sumpf.Filter.Product,
-                     factors=st.lists(elements=st.one_of(_polynomial, _exp, _quotient)),
+                     factors=st.lists(elements=st.one_of(_polynomial, _zero_pole_gain, _exp, _quotient)),
                      transform=st.booleans())
 _sum = st.builds(sumpf.Filter.Sum,
                  summands=st.lists(elements=st.one_of(_polynomial, _exp, _quotient, _product)),
@@ -223,7 +239,7 @@ _absolute = st.builds(sumpf.Filter.Absolute,
 _negative = st.builds(sumpf.Filter.Negative,
                       value=st.one_of(_polynomial, _exp, _quotient, _product, _sum, _difference, _absolute),
                       transform=st.booleans())
-terms = st.one_of(_polynomial, _exp, _bands0, _bands1, _bands5,
+terms = st.one_of(_polynomial, _zero_pole_gain, _exp, _bands0, _bands1, _bands5,
                   _quotient, _product, _sum, _difference,
                   _absolute, _negative)
 